@@ -0,0 +1,368 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Fingerprints of deployed fixture baselines, matched against the
+            live model and VCS state to reuse, patch or redeploy them
+"""
+import hashlib
+import json
+from cluster_common import parse_all_group_states
+from model_snapshot import ModelSnapshot
+from model_xml import parse_options
+from test_constants import PLAN_COMPLETE
+
+# Fingerprints of the deployed baselines, keyed by clustered service path
+FINGERPRINT_FILE = '/var/tmp/vcs_testware_baselines.json'
+
+REUSE = 'reuse'
+PATCH = 'patch'
+REDEPLOY = 'redeploy'
+
+# Fixture key, model item type and the fixture key holding the model path
+FIXTURE_ITEMS = (('vcs-clustered-service', 'vcs-clustered-service', 'vpath'),
+                 ('service', 'service', 'destination'),
+                 ('ha-service-config', 'ha-service-config', 'vpath'),
+                 ('vip', 'vip', 'vpath'),
+                 ('vcs_trigger', 'vcs-trigger', 'vpath'))
+
+# Properties that cannot be changed without redeploying the service group
+STRUCTURAL_PROPERTIES = {
+    'vcs-clustered-service': ('name', 'active', 'standby', 'node_list'),
+    'service': ('service_name',),
+}
+
+# Item types that can be created or removed below a deployed clustered
+# service with a plan
+PATCHABLE_ITEMS = ('ha-service-config', 'vip', 'vcs-trigger')
+
+
+def expected_items(fixtures):
+    """
+    Return the model items the fixtures create as a dictionary of the
+    model path to the item type and the properties set on the item.
+    The options string is used as it also holds the item changes that
+    were not applied to the options dictionary.
+    """
+    items = {}
+    for key, item_type, path_key in FIXTURE_ITEMS:
+        for item in fixtures.get(key, []):
+            properties = parse_options(item.get('options_string'))
+            items[item[path_key]] = (item_type, properties)
+    return items
+
+
+def fingerprint(fixtures):
+    """
+    Return the sha1 hex digest of the model items, packages and LITP
+    default values of the fixtures. Fixtures that create the same
+    deployment have the same fingerprint.
+    """
+    canonical = json.dumps({
+        'items': expected_items(fixtures),
+        'packages': sorted(fixtures.get('packages', [])),
+        'defaults': fixtures.get('litp_default_values', {}),
+    }, sort_keys=True)
+    return hashlib.sha1(canonical).hexdigest()
+
+
+def packages_fingerprint(fixtures):
+    """
+    Return the sha1 hex digest of the packages and LITP default values of
+    the fixtures, the part of a baseline the model items do not show.
+    """
+    canonical = json.dumps({
+        'packages': sorted(fixtures.get('packages', [])),
+        'defaults': fixtures.get('litp_default_values', {}),
+    }, sort_keys=True)
+    return hashlib.sha1(canonical).hexdigest()
+
+
+def options_string(properties):
+    """
+    Return the options string of the properties in the key="value" format.
+    """
+    return ' '.join('{0}="{1}"'.format(key, value)
+                    for key, value in sorted(properties.items()))
+
+
+def parse_group_states(lines):
+    """
+    Return the output of hagrp -state as a dictionary of the service
+    group name to a dictionary of the system name to the group state,
+    the first state of the value without its | markers.
+    """
+    return dict((group, dict((system, value.strip('|').split('|')[0])
+                             for system, value in systems.items()))
+                for group, systems in parse_all_group_states(lines).items())
+
+
+class BaselineMatch(object):
+    """
+    The result of comparing fixtures with the deployment. The decision is
+    REUSE when nothing has to change, PATCH when the differences can be
+    fixed with property updates, PATCHABLE_ITEMS created or removed and a
+    plan, and REDEPLOY otherwise.
+    """
+
+    def __init__(self, fixture_fingerprint):
+        self.fingerprint = fixture_fingerprint
+        self.deployed = []
+        self.missing = []
+        self.changed = []
+        self.not_applied = []
+        self.not_online = []
+        self.foreign = []
+        self.to_create = []
+        self.to_remove = []
+        self.extra = []
+
+    @property
+    def decision(self):
+        """
+        Return REUSE, PATCH or REDEPLOY.
+        """
+        if self.missing or self.not_online or self.foreign or self.extra or \
+                any(structural for _, _, _, _, structural in self.changed):
+            return REDEPLOY
+        if self.changed or self.not_applied or self.to_create or \
+                self.to_remove:
+            return PATCH
+        return REUSE
+
+    def updates(self):
+        """
+        Return a dictionary of the model path to the properties that have
+        to be updated to patch the deployment.
+        """
+        updates = {}
+        for path, prop, expected, _, _ in self.changed:
+            updates.setdefault(path, {})[prop] = expected
+        return updates
+
+    def summary(self):
+        """
+        Return a one line description of the match.
+        """
+        return 'Baseline {0}: {1} ({2} missing, {3} changed, ' \
+            '{4} not applied, {5} not online, {6} deployed from other ' \
+            'packages, {7} to create, {8} to remove, {9} unexpected)'.format(
+                self.fingerprint[:12], self.decision, len(self.missing),
+                len(self.changed), len(self.not_applied),
+                len(self.not_online), len(self.foreign),
+                len(self.to_create), len(self.to_remove), len(self.extra))
+
+
+def match_baseline(fixtures, snapshot, group_states, records, group_name):
+    """
+    Compare the fixtures with the deployment.
+
+    Args:
+        fixtures (dict): Fixtures returned by load_fixtures.
+        snapshot (ModelSnapshot): Model subtree holding the cluster.
+        group_states (dict): Service group states from parse_group_states.
+        records (dict): Packages fingerprints stored on the MS by
+            clustered service path.
+        group_name (callable): Returns the VCS group name of a clustered
+            service from its name property.
+
+    Returns:
+        BaselineMatch
+    """
+    result = BaselineMatch(fingerprint(fixtures))
+    items = expected_items(fixtures)
+    services = [path for path, (item_type, _) in items.items()
+                if item_type == 'vcs-clustered-service']
+    for path, (item_type, properties) in sorted(items.items()):
+        item = snapshot.by_path.get(path)
+        if item is None or not item.is_type(item_type, include_refs=True):
+            if item is None and item_type in PATCHABLE_ITEMS and any(
+                    path.startswith(service + '/') and service in snapshot
+                    for service in services):
+                result.to_create.append((path, item_type, properties))
+            else:
+                result.missing.append(path)
+            continue
+        if item.state != 'Applied':
+            result.not_applied.append(path)
+        actual = snapshot.props(path)
+        for prop, expected in sorted(properties.items()):
+            if actual.get(prop) != expected:
+                structural = prop in STRUCTURAL_PROPERTIES.get(item_type, ())
+                result.changed.append((path, prop, expected,
+                                       actual.get(prop), structural))
+        if item_type != 'vcs-clustered-service':
+            continue
+        result.deployed.append(path)
+        for child_type in set(itype for _, itype, _ in FIXTURE_ITEMS) - \
+                set(['vcs-clustered-service']):
+            for child in snapshot.find(path, child_type, include_refs=True):
+                if child in items:
+                    continue
+                if child_type in PATCHABLE_ITEMS:
+                    result.to_remove.append(child)
+                else:
+                    result.extra.append(child)
+        recorded = records.get(path)
+        if recorded is not None and \
+                recorded != packages_fingerprint(fixtures):
+            result.foreign.append(path)
+        name = group_name(properties.get('name', item.item_id))
+        online = [system for system, state in
+                  group_states.get(name, {}).items() if state == 'ONLINE']
+        if len(online) < int(properties.get('active', 1)):
+            result.not_online.append(name)
+    result.to_remove.sort()
+    result.extra.sort()
+    return result
+
+
+def read_ms_records(test, ms_node, path):
+    """
+    Return the JSON records stored in the file on the MS, or an empty
+    dictionary if there are none.
+    """
+    stdout, _, ret_code = test.run_command(
+        ms_node, '/bin/cat {0}'.format(path), su_root=True)
+    if ret_code != 0 or not stdout:
+        return {}
+    try:
+        return json.loads('\n'.join(stdout))
+    except ValueError:
+        return {}
+
+
+def write_ms_records(test, ms_node, path, records):
+    """
+    Store the records as JSON in the file on the MS.
+    """
+    _, stderr, ret_code = test.run_command(
+        ms_node, "/bin/echo '{0}' > {1}".format(
+            json.dumps(records, sort_keys=True), path), su_root=True)
+    test.assertEqual(0, ret_code)
+    test.assertEqual([], stderr)
+
+
+class BaselineMixin(object):
+    """
+    Mixin for GenericTest subclasses that deploys fixtures only when the
+    same baseline is not already deployed and online, and records the
+    packages fingerprint of every deployed baseline on the MS.
+    """
+
+    def read_baseline_records(self, ms_node):
+        """
+        Return the packages fingerprints stored on the MS by clustered
+        service path.
+        """
+        return read_ms_records(self, ms_node, FINGERPRINT_FILE)
+
+    def record_baseline(self, ms_node, fixtures):
+        """
+        Store the packages fingerprint of the fixtures on the MS against
+        all the clustered services they deploy.
+        """
+        records = self.read_baseline_records(ms_node)
+        digest = packages_fingerprint(fixtures)
+        for service in fixtures['vcs-clustered-service']:
+            records[service['vpath']] = digest
+        write_ms_records(self, ms_node, FINGERPRINT_FILE, records)
+
+    def match_deployed_baseline(self, ms_node, fixtures, cluster_url=None):
+        """
+        Compare the fixtures with the model and the VCS state of the
+        cluster and return the BaselineMatch.
+        """
+        cluster_url = cluster_url or self.vcs_cluster_url
+        cluster_id = cluster_url.split('/')[-1]
+        snapshot = ModelSnapshot.from_test(self, ms_node,
+                                           cluster_url + '/services')
+        group_states = {}
+        nodes = self.get_managed_node_filenames()
+        if snapshot.by_path and nodes:
+            stdout, _, ret_code = self.run_command(
+                nodes[0], self.vcs.get_hagrp_cmd('-state'), su_root=True)
+            if ret_code == 0:
+                group_states = parse_group_states(stdout)
+        return match_baseline(
+            fixtures, snapshot, group_states,
+            self.read_baseline_records(ms_node),
+            lambda name: self.vcs.generate_clustered_service_name(
+                name, cluster_id))
+
+    def remove_baseline_items(self, ms_node, fixtures, match,
+                              timeout_mins=20):
+        """
+        Remove the clustered services of the fixtures that are deployed,
+        and the software services and packages of the fixtures that are in
+        the model, so that apply_cs_and_apps_sg can create them again. The
+        clustered services are removed first with their own plan, as their
+        applications and packages are references to the software items,
+        which must not be removed while they are still referenced.
+
+        Returns:
+            list. The removed model paths.
+        """
+        paths = list(match.deployed)
+        for path in paths:
+            self.execute_cli_remove_cmd(ms_node, path, add_to_cleanup=False)
+        if paths:
+            self._run_baseline_plan(ms_node, timeout_mins, False)
+        software = ModelSnapshot.from_test(self, ms_node, '/software')
+        for service in fixtures.get('service', []):
+            for path in (service.get('package_vpath'), service.get('vpath')):
+                if path in software:
+                    self.execute_cli_remove_cmd(ms_node, path,
+                                                add_to_cleanup=False)
+                    paths.append(path)
+        self.log('info', 'Removed {0} items of the baseline before '
+                 'redeploying it'.format(len(paths)))
+        return paths
+
+    def _run_baseline_plan(self, ms_node, timeout_mins, add_to_cleanup):
+        """
+        Create and run a plan and wait for it to complete.
+        """
+        self.run_and_check_plan(ms_node, PLAN_COMPLETE, timeout_mins,
+                                add_to_cleanup=add_to_cleanup)
+
+    def deploy_baseline(self, ms_node, fixtures, rpm_src_dir,
+                        timeout_mins=20, add_to_cleanup=False):
+        """
+        Deploy the fixtures unless they are already deployed and online.
+        Differences in non structural properties and in PATCHABLE_ITEMS
+        are patched with updates, creates and removes and a plan. Anything
+        else is redeployed: the items of the fixtures already in the model
+        are removed and the fixtures are deployed with apply_cs_and_apps_sg.
+
+        Returns:
+            BaselineMatch. The match that decided how the fixtures were
+            deployed.
+        """
+        match = self.match_deployed_baseline(ms_node, fixtures)
+        self.log('info', match.summary())
+        if match.decision == REUSE:
+            return match
+        if match.decision == PATCH:
+            for path, item_type, properties in match.to_create:
+                self.execute_cli_create_cmd(ms_node, path, item_type,
+                                            props=options_string(properties),
+                                            add_to_cleanup=False)
+            for path, properties in sorted(match.updates().items()):
+                self.execute_cli_update_cmd(ms_node, path,
+                                            options_string(properties))
+            for path in match.to_remove:
+                self.execute_cli_remove_cmd(ms_node, path,
+                                            add_to_cleanup=False)
+        else:
+            self.remove_baseline_items(ms_node, fixtures, match,
+                                       timeout_mins)
+            self.apply_cs_and_apps_sg(ms_node, fixtures, rpm_src_dir)
+        self._run_baseline_plan(ms_node, timeout_mins, add_to_cleanup)
+        self.record_baseline(ms_node, fixtures)
+        return match
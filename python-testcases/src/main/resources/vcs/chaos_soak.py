@@ -0,0 +1,343 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Chaos soak: the fault and repair helpers of the test sets run
+            on a seeded random schedule for hours, with the recovery time,
+            success rate and had resource use of every step written to a
+            time series, stopping at the first VCS invariant violation
+
+Usage:
+    python chaos_soak.py SERIES.jsonl [--window FRACTION]
+"""
+import json
+import optparse
+import random
+import sys
+import time
+from cluster_common import (ENGINE_LOG, VCS_BIN, parse_all_group_states,
+                            percentile)
+from polling import wait_for
+
+# One command per node: resident KB and CPU seconds of had, engine log size
+SAMPLE_CMD = ('/bin/ps -C had -o rss=,times= | /usr/bin/head -1; '
+              '/usr/bin/stat -c %s ' + ENGINE_LOG)
+# Fraction of the steps compared at the start and at the end of the soak
+DEGRADATION_WINDOW = 0.2
+
+# Soaks run by the running test run, in order
+SOAK_METRICS = []
+
+
+class SoakViolation(Exception):
+    """
+    A VCS invariant broken during the soak.
+    """
+    pass
+
+
+def online_counts(states):
+    """
+    Return the number of systems every group is online on.
+    """
+    return dict((group, len([value for value in systems.values()
+                             if value.strip('|') == 'ONLINE']))
+                for group, systems in states.items())
+
+
+def check_invariants(states, baseline):
+    """
+    Raise SoakViolation if a group is online on more systems than at the
+    start of the soak, e.g. a failover group online on two nodes, or if a
+    group disappeared.
+    """
+    counts = online_counts(states)
+    for group, expected in sorted(baseline.items()):
+        if group not in counts:
+            raise SoakViolation('Group {0} is missing'.format(group))
+        if counts[group] > expected:
+            raise SoakViolation('Group {0} is online on {1} systems: '
+                                '{2}'.format(group, counts[group],
+                                             states[group]))
+
+
+def parse_sample(lines):
+    """
+    Return [had resident KB, had CPU seconds, engine log bytes] of the
+    SAMPLE_CMD output, None for a value that could not be read.
+    """
+    values = ' '.join(lines).split()
+    sample = []
+    for num in range(3):
+        try:
+            sample.append(int(values[num]))
+        except (IndexError, ValueError):
+            sample.append(None)
+    return sample
+
+
+def _window_median(records, key):
+    """
+    Return the median of the values of key in the records, ignoring None.
+    """
+    values = [value for value in (key(record) for record in records)
+              if value is not None]
+    return percentile(values, 50)
+
+
+def _rate(first, last, field, node):
+    """
+    Return the growth per hour of a node sample field between two records.
+    """
+    try:
+        start = first['nodes'][node][field]
+        end = last['nodes'][node][field]
+    except (KeyError, IndexError):
+        return None
+    if start is None or end is None or last['t'] <= first['t']:
+        return None
+    return (end - start) * 3600.0 / (last['t'] - first['t'])
+
+
+def summarize_soak(records, window=DEGRADATION_WINDOW):
+    """
+    Return the summary of the time series: the success rate of every
+    action, the median recovery time at the start and at the end of the
+    soak, and the growth per hour of the had memory, had CPU time and
+    engine log of every node, overall and at the start and at the end.
+    """
+    steps = [record for record in records if 'action' in record]
+    summary = {'steps': len(steps), 'actions': {}, 'nodes': {},
+               'violation': None, 'hours': 0.0}
+    for record in records:
+        if record.get('violation'):
+            summary['violation'] = record['violation']
+    if not steps:
+        return summary
+    summary['hours'] = (steps[-1]['t'] - steps[0]['t']) / 3600.0
+    for step in steps:
+        action = summary['actions'].setdefault(step['action'],
+                                               {'runs': 0, 'ok': 0})
+        action['runs'] += 1
+        action['ok'] += 1 if step['ok'] else 0
+    for action in summary['actions'].values():
+        action['success_rate'] = float(action['ok']) / action['runs']
+    size = max(1, int(len(steps) * window))
+    head, tail = steps[:size], steps[-size:]
+    summary['recovery'] = {
+        'start': _window_median(head, lambda step: step['recovery']),
+        'end': _window_median(tail, lambda step: step['recovery'])}
+    for node in sorted(steps[0]['nodes']):
+        summary['nodes'][node] = dict(
+            (name, {'overall': _rate(steps[0], steps[-1], field, node),
+                    'start': _rate(head[0], head[-1], field, node),
+                    'end': _rate(tail[0], tail[-1], field, node)})
+            for field, name in ((0, 'had_rss_kb'), (1, 'had_cpu_s'),
+                                (2, 'engine_log_bytes')))
+    return summary
+
+
+def _value(value, fmt='{0:.1f}'):
+    """
+    Format a summary value, - when unknown.
+    """
+    return '-' if value is None else fmt.format(value)
+
+
+def format_summary(summary):
+    """
+    Return the lines of a readable soak summary.
+    """
+    lines = ['{0} steps in {1:.2f}h{2}'.format(
+        summary['steps'], summary['hours'],
+        ', stopped: {0}'.format(summary['violation'])
+        if summary['violation'] else '')]
+    for name, action in sorted(summary['actions'].items()):
+        lines.append('{0}: {1}/{2} succeeded ({3:.0%})'.format(
+            name, action['ok'], action['runs'], action['success_rate']))
+    if 'recovery' in summary:
+        lines.append('recovery median: {0}s at start, {1}s at end'.format(
+            _value(summary['recovery']['start']),
+            _value(summary['recovery']['end'])))
+    for node, fields in sorted(summary['nodes'].items()):
+        for name, rates in sorted(fields.items()):
+            lines.append('{0} {1} per hour: {2} overall, {3} at start, '
+                         '{4} at end'.format(node, name,
+                                             _value(rates['overall']),
+                                             _value(rates['start']),
+                                             _value(rates['end'])))
+    return lines
+
+
+def read_series(path):
+    """
+    Return the records of a time series file.
+    """
+    with open(path) as series:
+        return [json.loads(line) for line in series if line.strip()]
+
+
+class ChaosSoakMixin(object):
+    """
+    GenericTest mixin that runs fault and repair actions at random for a
+    duration. The actions are callables of the test set taking the random
+    generator, so they can pick their target, e.g. a wrapper around
+    kill_service_on_node, kill_ip_address_on_node, issue_grp_repair_cmds
+    or online_offlined_service_groups. An action failing an assertion
+    counts as an unsuccessful step and the soak goes on.
+    """
+
+    def read_all_group_states(self, node):
+        """
+        Return the parse_all_group_states dictionary read on the node, or
+        None if the read failed, e.g. while had restarts on the node.
+        """
+        stdout, stderr, ret_code = self.run_command(
+            node, '{0}hagrp -state'.format(VCS_BIN), su_root=True)
+        if ret_code != 0:
+            self.log('info', 'Group states not read on {0}: {1}'.format(
+                node, stderr))
+            return None
+        return parse_all_group_states(stdout)
+
+    def sample_had(self, node):
+        """
+        Return the parse_sample values of the node.
+        """
+        stdout, _, _ = self.run_command(node, SAMPLE_CMD, su_root=True)
+        return parse_sample(stdout)
+
+    def _wait_for_recovery(self, node, baseline, timeout, clock, sleep,
+                           failed_reads=None):
+        """
+        Wait until every group is online on as many systems as at the
+        start, checking the invariants at every poll. A failed read is
+        polled again and counted in the failed_reads list.
+        """
+
+        def recovered():
+            """
+            Return True once the online counts are back to the baseline.
+            """
+            states = self.read_all_group_states(node)
+            if states is None:
+                if failed_reads is not None:
+                    failed_reads.append(clock())
+                return False
+            check_invariants(states, baseline)
+            return online_counts(states) == baseline
+
+        return wait_for(recovered, timeout=timeout, first_interval=1,
+                        max_interval=10, description='soak recovery',
+                        clock=clock, sleep=sleep)
+
+    def run_soak(self, actions, node, nodes, duration, series_path,
+                 seed=None, pause=(5, 60), recovery_timeout=600,
+                 max_steps=None, clock=None, sleep=None):
+        """
+        Run randomly chosen actions until duration seconds have passed.
+
+        Args:
+            actions (dict): Action name to (weight, callable(rand)).
+            node (str): Filename of the node the group states are read on.
+            nodes (list): Filenames of the nodes had is sampled on.
+            duration (int): Seconds the soak runs for.
+            series_path (str): Local file the time series is written to,
+                one compact JSON record per line.
+            seed (int): Seed of the schedule, logged to replay a soak.
+            pause (tuple): Bounds of the random pause between steps.
+            recovery_timeout (int): Seconds a group may take to recover.
+            max_steps (int): Optional limit of the number of steps.
+
+        Returns:
+            dict. The summarize_soak summary, also kept in SOAK_METRICS.
+        """
+        clock = clock or time.time
+        sleep = sleep or time.sleep
+        seed = random.randint(0, 2 ** 31) if seed is None else seed
+        rand = random.Random(seed)
+        names = sorted(actions)
+        total = sum(actions[name][0] for name in names)
+        states = self.read_all_group_states(node)
+        self.assertTrue(states is not None, 'Group states not read on '
+                        '{0}'.format(node))
+        baseline = online_counts(states)
+        records = [{'t': clock(), 'seed': seed, 'baseline': baseline,
+                    'nodes': dict((host, self.sample_had(host))
+                                  for host in nodes)}]
+        self.log('info', 'Chaos soak with seed {0} for {1}s'.format(
+            seed, duration))
+        start = clock()
+        with open(series_path, 'w') as series:
+            series.write(json.dumps(records[0], separators=(',', ':')) +
+                         '\n')
+            while clock() - start < duration and \
+                    (max_steps is None or len(records) <= max_steps):
+                pick = rand.uniform(0, total)
+                for name in names:
+                    pick -= actions[name][0]
+                    if pick <= 0:
+                        break
+                step = {'t': clock(), 'action': name, 'ok': True,
+                        'recovery': None}
+                try:
+                    actions[name][1](rand)
+                except AssertionError as err:
+                    step['ok'] = False
+                    self.log('error', 'Soak action {0} failed: {1}'.format(
+                        name, err))
+                failed_reads = []
+                try:
+                    result = self._wait_for_recovery(
+                        node, baseline, recovery_timeout, clock, sleep,
+                        failed_reads)
+                    if result:
+                        step['recovery'] = clock() - step['t']
+                    else:
+                        step['violation'] = 'Groups did not recover in ' \
+                            '{0}s after {1}'.format(recovery_timeout, name)
+                except SoakViolation as err:
+                    step['violation'] = '{0} after {1}'.format(err, name)
+                if failed_reads:
+                    step['failed_reads'] = len(failed_reads)
+                step['nodes'] = dict((host, self.sample_had(host))
+                                     for host in nodes)
+                records.append(step)
+                series.write(json.dumps(step, separators=(',', ':')) +
+                             '\n')
+                series.flush()
+                if 'violation' in step:
+                    break
+                sleep(rand.uniform(*pause))
+        summary = summarize_soak(records)
+        SOAK_METRICS.append(summary)
+        for line in format_summary(summary):
+            self.log('error' if summary['violation'] else 'info', line)
+        return summary
+
+
+PARSER = optparse.OptionParser(usage='%prog [options] SERIES.jsonl')
+PARSER.add_option('--window', action='store', dest='window', type='float',
+                  default=DEGRADATION_WINDOW,
+                  help='fraction of the steps compared at start and end')
+
+
+def main(args=None):
+    """
+    Print the summary of a time series file.
+    """
+    opts, paths = PARSER.parse_args(args)
+    if len(paths) != 1:
+        PARSER.error('one time series file is needed')
+    summary = summarize_soak(read_series(paths[0]), opts.window)
+    print '\n'.join(format_summary(summary))
+    return 1 if summary['violation'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Helpers and constants shared by the measurement modules, so
+            that none of them imports another, or inherits its mixin, only
+            to reach a node read or a parser
+"""
+import os
+import re
+import time
+
+VCS_BIN = '/opt/VRTS/bin/'
+ENGINE_LOG = '/var/VRTSvcs/log/engine_A.log'
+CLOCK_CMD = '/bin/date +%s.%N'
+# Where rpm_generator.py writes the generated packages
+RPM_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                       'rpm-out', 'dist')
+
+_LOG_TIME_REGEX = re.compile(r'^(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}) ')
+
+
+def clock_offset(sent_at, remote_now, received_at):
+    """
+    Return the offset of a node clock from the local clock, read as
+    remote_now by a command sent at sent_at and answered at received_at,
+    and its uncertainty, half the round-trip.
+    """
+    return (remote_now - (sent_at + received_at) / 2.0,
+            (received_at - sent_at) / 2.0)
+
+
+def log_time(line):
+    """
+    Return the epoch time of an engine log line, None for a line without
+    a timestamp.
+    """
+    time_match = _LOG_TIME_REGEX.match(line)
+    if not time_match:
+        return None
+    return time.mktime(time.strptime(time_match.group(1),
+                                     '%Y/%m/%d %H:%M:%S'))
+
+
+def percentile(values, pct):
+    """
+    Return the nearest rank percentile of the values, or None if there
+    are none.
+    """
+    values = sorted(values)
+    if not values:
+        return None
+    rank = int(round(pct / 100.0 * (len(values) - 1)))
+    return values[rank]
+
+
+def parse_all_group_states(lines):
+    """
+    Return the State of every group per system from "hagrp -state".
+    """
+    states = {}
+    for line in lines:
+        fields = line.split()
+        if len(fields) == 4 and fields[1] == 'State':
+            states.setdefault(fields[0], {})[fields[2]] = fields[3]
+    return states
+
+
+class NodeReadMixin(object):
+    """
+    GenericTest mixin reading the clock and the engine log of the nodes.
+    """
+
+    def read_clock_offset(self, node):
+        """
+        Return the clock_offset of the node.
+        """
+        sent_at = time.time()
+        stdout, stderr, ret_code = self.run_command(node, CLOCK_CMD)
+        received_at = time.time()
+        self.assertEqual(0, ret_code, stderr)
+        return clock_offset(sent_at, float(stdout[0]), received_at)
+
+    def engine_log_size(self, node):
+        """
+        Return the size of the engine log of the node, where the log read
+        by read_engine_log starts.
+        """
+        stdout, stderr, ret_code = self.run_command(
+            node, '/usr/bin/stat -c %s {0}'.format(ENGINE_LOG), su_root=True)
+        self.assertEqual(0, ret_code, stderr)
+        return int(stdout[0])
+
+    def read_engine_log(self, node, offset=0):
+        """
+        Return the engine log lines of the node written after offset.
+        """
+        stdout, stderr, ret_code = self.run_command(
+            node, '/usr/bin/tail -c +{0} {1}'.format(offset + 1, ENGINE_LOG),
+            su_root=True)
+        self.assertEqual(0, ret_code, stderr)
+        return stdout
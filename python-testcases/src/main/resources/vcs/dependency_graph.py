@@ -0,0 +1,373 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Dependency graph of the vcs-clustered-services, built from the
+            model once, giving the online layers, the critical path and
+            the check of the observed online order
+
+Usage:
+    python dependency_graph.py [--services N] [--degree D] [--seed S]
+"""
+import optparse
+import random
+import re
+import sys
+import time
+from cluster_common import VCS_BIN, NodeReadMixin, log_time
+from model_snapshot import ModelSnapshot, get_vcs_model_info
+
+# Properties of a vcs-clustered-service listing the services it waits for
+DEPENDENCY_PROPS = ('dependency_list', 'initial_online_dependency_list')
+HAGRP_DEP_CMD = VCS_BIN + 'hagrp -dep'
+
+_GROUP_ONLINE_REGEX = re.compile(r'Group (\S+) is online on system (\S+)')
+_RESOURCE_ONLINE_REGEX = re.compile(r'Initiating Online of Resource \S+ '
+                                    r'\(.*Group: ([^)\s]+)\)')
+
+# Online order checks made by the running test run, in order
+ONLINE_ORDER_METRICS = []
+
+
+class DependencyGraph(object):
+    """
+    Directed acyclic graph of clustered services, with an edge from every
+    parent to the children it waits for. Children come online first.
+    """
+
+    def __init__(self, dependencies=None):
+        self.children = {}
+        self.parents = {}
+        for parent, children in sorted((dependencies or {}).items()):
+            self.add(parent, children)
+
+    @classmethod
+    def from_model_info(cls, service_groups, props=DEPENDENCY_PROPS):
+        """
+        Return the graph of the get_vcs_model_info service groups, with the
+        dependencies of the given properties. Services are named by item
+        id, as in the dependency lists.
+        """
+        graph = cls()
+        for service_group in service_groups:
+            service = service_group['vcs-clustered-service']
+            children = []
+            for prop in props:
+                children.extend(service.get(prop, '').split(','))
+            graph.add(service['url'].split('/')[-1], children)
+        return graph
+
+    def add(self, name, children=()):
+        """
+        Add the service and the children it waits for. Empty names, as
+        given by an empty dependency list, are ignored.
+        """
+        self.children.setdefault(name, set())
+        self.parents.setdefault(name, set())
+        for child in children:
+            child = child.strip()
+            if not child:
+                continue
+            self.children.setdefault(child, set())
+            self.parents.setdefault(child, set()).add(name)
+            self.children[name].add(child)
+
+    @property
+    def nodes(self):
+        """
+        Return the names of the services, sorted.
+        """
+        return sorted(self.children)
+
+    def edges(self):
+        """
+        Return the (parent, child) pairs of the graph, sorted.
+        """
+        return sorted((parent, child)
+                      for parent, children in self.children.items()
+                      for child in children)
+
+    def renamed(self, name):
+        """
+        Return a copy of the graph with every service renamed by the
+        function name, e.g. to its VCS group name.
+        """
+        return DependencyGraph(dict(
+            (name(parent), [name(child) for child in children])
+            for parent, children in self.children.items()))
+
+    def subgraph(self, names):
+        """
+        Return the graph of the given services and the dependencies
+        between them.
+        """
+        names = set(names)
+        return DependencyGraph(dict(
+            (parent, [child for child in children if child in names])
+            for parent, children in self.children.items()
+            if parent in names))
+
+    def find_cycle(self):
+        """
+        Return a list of services forming a dependency cycle, the first
+        one repeated at the end, or None when the graph is acyclic.
+        """
+        state = {}
+        for root in self.nodes:
+            if root in state:
+                continue
+            path = [root]
+            stack = [iter(sorted(self.children[root]))]
+            state[root] = 'visiting'
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    state[path.pop()] = 'done'
+                    stack.pop()
+                elif state.get(child) == 'visiting':
+                    return path[path.index(child):] + [child]
+                elif child not in state:
+                    state[child] = 'visiting'
+                    path.append(child)
+                    stack.append(iter(sorted(self.children[child])))
+        return None
+
+    def layers(self):
+        """
+        Return the services in online layers: the first layer waits for
+        nothing and every later one only for the layers before it.
+        Raises ValueError if the dependencies form a cycle.
+        """
+        waiting = dict((name, len(children))
+                       for name, children in self.children.items())
+        layer = sorted(name for name, count in waiting.items() if not count)
+        layers = []
+        while layer:
+            layers.append(layer)
+            ready = []
+            for child in layer:
+                for parent in self.parents[child]:
+                    waiting[parent] -= 1
+                    if not waiting[parent]:
+                        ready.append(parent)
+            layer = sorted(ready)
+        if sum(len(names) for names in layers) != len(waiting):
+            raise ValueError('Circular dependencies: {0}'.format(
+                ' -> '.join(self.find_cycle())))
+        return layers
+
+    def critical_path(self, durations=None, default=1):
+        """
+        Return the expected minimum time to bring every service online and
+        the chain of services, first online first, that sets it. Services
+        take their durations, or default when not given, and every
+        service waits for all its children.
+        """
+        durations = durations or {}
+        finish = {}
+        previous = {}
+        for layer in self.layers():
+            for name in layer:
+                start = 0
+                if self.children[name]:
+                    previous[name] = max(sorted(self.children[name]),
+                                         key=lambda item: finish[item])
+                    start = finish[previous[name]]
+                finish[name] = start + durations.get(name, default)
+        if not finish:
+            return 0, []
+        name = max(sorted(finish), key=lambda item: finish[item])
+        total = finish[name]
+        path = [name]
+        while path[-1] in previous:
+            path.append(previous[path[-1]])
+        return total, path[::-1]
+
+    def check_online_order(self, online_at):
+        """
+        Return the (parent, child, parent_at, child_at) of every dependency
+        broken by the online times of the services: a parent online before
+        its child, or online while its child never was. Parents missing
+        from online_at are not checked.
+        """
+        violations = []
+        for parent, parent_at in sorted(online_at.items()):
+            for child in sorted(self.children.get(parent, ())):
+                child_at = online_at.get(child)
+                if child_at is None or parent_at < child_at:
+                    violations.append((parent, child, parent_at, child_at))
+        return violations
+
+
+def parse_hagrp_dep(lines):
+    """
+    Return the relationship of every (parent, child) pair of the "hagrp
+    -dep" output, e.g. "online global soft".
+    """
+    dependencies = {}
+    for line in lines:
+        fields = line.split()
+        if len(fields) >= 3 and not fields[0].startswith('#'):
+            dependencies[(fields[0], fields[1])] = ' '.join(fields[2:])
+    return dependencies
+
+
+def parse_group_online(lines):
+    """
+    Return the (initiated_at, online_at) of every group of the engine log
+    that came online: when the online of its first resource was initiated,
+    None if not logged, and when the group first came online on any
+    system.
+    """
+    initiated = {}
+    online = {}
+    for line in lines:
+        seen_at = log_time(line)
+        if seen_at is None:
+            continue
+        match = _GROUP_ONLINE_REGEX.search(line)
+        if match:
+            online.setdefault(match.group(1), seen_at)
+            continue
+        match = _RESOURCE_ONLINE_REGEX.search(line)
+        if match and match.group(1) not in online:
+            initiated.setdefault(match.group(1), seen_at)
+    return dict((group, (initiated.get(group), online_at))
+                for group, online_at in online.items())
+
+
+def generate_graph(services, degree=2, seed=None):
+    """
+    Return a random graph of the given number of services in which every
+    service waits for up to degree services created before it.
+    """
+    rand = random.Random(seed)
+    dependencies = {}
+    for number in range(services):
+        dependencies['CS{0}'.format(number)] = [
+            'CS{0}'.format(rand.randrange(number))
+            for _ in range(min(degree, number))]
+    return DependencyGraph(dependencies)
+
+
+class DependencyGraphMixin(NodeReadMixin):
+    """
+    GenericTest mixin that checks the VCS group dependencies and the
+    online order of the groups against the dependency graph of the model.
+    """
+
+    def build_dependency_graph(self, ms_node, cluster_url,
+                               props=DEPENDENCY_PROPS):
+        """
+        Return the dependency graph of the clustered services of the
+        cluster, read with one recursive show.
+        """
+        snapshot = ModelSnapshot.from_test(self, ms_node, cluster_url)
+        graph = DependencyGraph.from_model_info(
+            get_vcs_model_info(snapshot, [cluster_url], item_types=()),
+            props)
+        self.log('info', 'Dependency layers: {0}'.format(graph.layers()))
+        return graph
+
+    def assert_vcs_dependencies(self, node, graph):
+        """
+        Assert that every dependency of the graph, named by VCS group, is
+        configured in VCS, read with one "hagrp -dep" for all groups.
+
+        Returns:
+            dict. The relationship of every VCS dependency.
+        """
+        stdout, stderr, ret_code = self.run_command(node, HAGRP_DEP_CMD,
+                                                    su_root=True)
+        self.assertEqual(0, ret_code, stderr)
+        self.assertEqual([], stderr)
+        dependencies = parse_hagrp_dep(stdout)
+        self.assertEqual([], [edge for edge in graph.edges()
+                              if edge not in dependencies],
+                         'Dependencies missing from VCS')
+        return dependencies
+
+    def verify_online_order(self, node, graph, offset=0, durations=None):
+        """
+        Assert that the groups of the graph, named by VCS group, came
+        online after their children, going by the engine log of the node
+        written after offset, e.g. the engine_log_size before a plan. The
+        expected minimum time is the critical path of the groups that came
+        online, each taking its duration, by default the time from the
+        online of its first resource to the group online in the log.
+
+        Returns:
+            dict. The online time of every group of the graph, the
+            expected minimum and the observed time to bring them online
+            and the violations, also kept in ONLINE_ORDER_METRICS.
+        """
+        times = dict((group, seen) for group, seen in parse_group_online(
+            self.read_engine_log(node, offset)).items()
+            if group in graph.children)
+        online_at = dict((group, seen[1]) for group, seen in times.items())
+        if durations is None:
+            durations = dict((group, seen[1] - seen[0])
+                             for group, seen in times.items()
+                             if seen[0] is not None)
+        expected, path = graph.subgraph(times).critical_path(durations,
+                                                             default=0)
+        starts = [seen[0] if seen[0] is not None else seen[1]
+                  for seen in times.values()]
+        result = {'online_at': online_at, 'expected': expected,
+                  'critical_path': path,
+                  'observed': max(online_at.values()) - min(starts)
+                  if times else None,
+                  'violations': graph.check_online_order(online_at)}
+        ONLINE_ORDER_METRICS.append(result)
+        self.log('info', 'Online order: {0} groups online in {1}s, '
+                 'critical path {2} expected {3}s'.format(
+                     len(online_at), result['observed'], ' -> '.join(path),
+                     expected))
+        self.assertEqual([], result['violations'],
+                         'Groups online before their children')
+        return result
+
+
+PARSER = optparse.OptionParser(usage='%prog [options]')
+PARSER.add_option('--services', action='store', dest='services', type='int',
+                  default=10000, help='services of the generated graph')
+PARSER.add_option('--degree', action='store', dest='degree', type='int',
+                  default=3, help='dependencies of every service')
+PARSER.add_option('--seed', action='store', dest='seed', type='int',
+                  default=1, help='seed of the generated graph')
+
+
+def main(args=None):
+    """
+    Time the graph operations on a generated graph.
+    """
+    opts, _ = PARSER.parse_args(args)
+    started = time.time()
+    graph = generate_graph(opts.services, opts.degree, opts.seed)
+    timings = [('build', time.time() - started)]
+    started = time.time()
+    layers = graph.layers()
+    timings.append(('layers', time.time() - started))
+    started = time.time()
+    expected, path = graph.critical_path()
+    timings.append(('critical path', time.time() - started))
+    online_at = dict((name, number) for number, names in enumerate(layers)
+                     for name in names)
+    started = time.time()
+    violations = graph.check_online_order(online_at)
+    timings.append(('check', time.time() - started))
+    print '{0} services, {1} dependencies, {2} layers, critical path of ' \
+        '{3} services ({4})'.format(len(graph.children), len(graph.edges()),
+                                    len(layers), len(path), expected)
+    for name, seconds in timings:
+        print '{0:<14} {1:>9.1f} ms'.format(name, seconds * 1000)
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
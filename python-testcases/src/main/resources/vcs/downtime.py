@@ -0,0 +1,393 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Downtime analysis of availability probe streams, such as HTTP
+            hits, ping replies and service status checks, with the outage
+            windows lined up against the phases and tasks of a plan
+"""
+import re
+import time
+from cluster_common import NodeReadMixin
+from polling import wait_for
+
+# Timestamp of a SimpleHTTPServer log line: [19/Oct/2026 10:11:12]
+_HTTP_TIME_REGEX = re.compile(r'\[(\d+/\w+/\d+ \d+:\d+:\d+)\]')
+# "ping -D -O" lines: [1760000000.123] 64 bytes from ... or no answer yet
+_PING_REGEX = re.compile(r'^\[(\d+\.?\d*)\] (.*)$')
+DONE_STATES = ('Success', 'Failed', 'Stopped')
+STATUS_PROBE_PATH = '/tmp/vcs_downtime_probe_{0}.log'
+# One "EPOCH RC" line per run of the status command, for parse_status_log
+STATUS_PROBE_CMD = ("nohup /bin/sh -c 'while :; do {{ {command}; }} "
+                    "> /dev/null 2>&1; rc=$?; echo $(/bin/date +%s.%N) $rc; "
+                    "/bin/sleep {interval}; done' > {path} 2>&1 < /dev/null "
+                    "& echo $! > {path}.pid")
+STATUS_COLLECT_CMD = ('/bin/kill $(/bin/cat {path}.pid); /bin/cat {path}; '
+                      '/bin/rm -f {path} {path}.pid')
+
+
+def parse_http_log(lines, offset=0.0):
+    """
+    Return the hit times of every client of a SimpleHTTPServer log, as
+    written by simple_http_server.sh, the client being the first field.
+    offset is the clock offset of the logging host, taken off every time.
+    """
+    hits = {}
+    for line in lines:
+        match = _HTTP_TIME_REGEX.search(line)
+        if not match or not line.split():
+            continue
+        seen_at = time.mktime(time.strptime(match.group(1),
+                                            '%d/%b/%Y %H:%M:%S'))
+        hits.setdefault(line.split()[0], []).append(seen_at - offset)
+    return hits
+
+
+def parse_ping_log(lines, offset=0.0):
+    """
+    Return the (time, ok) samples of "ping -D -O" output: replies are up
+    and "no answer yet" lines are down.
+    """
+    samples = []
+    for line in lines:
+        match = _PING_REGEX.match(line.strip())
+        if match:
+            samples.append((float(match.group(1)) - offset,
+                            'bytes from' in match.group(2)))
+    return samples
+
+
+def parse_status_log(lines, offset=0.0):
+    """
+    Return the (time, ok) samples of a status probe loop printing
+    "EPOCH RC" lines, e.g. of the status command of a mock LSB service.
+    """
+    samples = []
+    for line in lines:
+        fields = line.split()
+        try:
+            samples.append((float(fields[0]) - offset, int(fields[1]) == 0))
+        except (IndexError, ValueError):
+            continue
+    return samples
+
+
+def plan_states(parsed_plan):
+    """
+    Return the (phase, index, description, state) of every task of a plan
+    parsed by CLIUtils.parse_plan_output, in plan order.
+    """
+    return [(phase, index, parsed_plan[phase][index]['DESC'][-1],
+             parsed_plan[phase][index]['STATUS'])
+            for phase in sorted(parsed_plan)
+            for index in sorted(parsed_plan[phase])]
+
+
+class PlanTimeline(object):
+    """
+    When the tasks of a plan started and ended, from show_plan states
+    observed over time. Times are accurate to the observation interval.
+    """
+
+    def __init__(self):
+        # (phase, index) to [started_at, ended_at, state, description]
+        self.tasks = {}
+        self._last_at = None
+
+    def observe(self, seen_at, plan_states):
+        """
+        Record the plan_states of a show_plan run at seen_at. A task seen
+        done without being seen running started after the previous
+        observation.
+        """
+        for phase, index, description, state in plan_states:
+            task = self.tasks.setdefault((phase, index),
+                                         [None, None, state, description])
+            task[2] = state
+            if state == 'Running' and task[0] is None:
+                task[0] = seen_at
+            if state in DONE_STATES and task[1] is None:
+                if task[0] is None:
+                    task[0] = self._last_at or seen_at
+                task[1] = seen_at
+        self._last_at = seen_at
+
+    @property
+    def done(self):
+        """
+        True once no task is initial or running.
+        """
+        return bool(self.tasks) and all(
+            task[2] not in ('Initial', 'Running')
+            for task in self.tasks.values())
+
+    def phases(self):
+        """
+        Return the (start, end) of every phase that started.
+        """
+        bounds = {}
+        for (phase, _), (started_at, ended_at, _, _) in self.tasks.items():
+            if started_at is None:
+                continue
+            start, end = bounds.get(phase, (started_at, ended_at))
+            bounds[phase] = (min(start, started_at),
+                             None if None in (end, ended_at)
+                             else max(end, ended_at))
+        return bounds
+
+    def overlapping(self, start, end):
+        """
+        Return the (phase, description) of the tasks running at any time
+        between start and end, in plan order.
+        """
+        return [(key[0], task[3]) for key, task in sorted(self.tasks.items())
+                if task[0] is not None and task[0] <= end and
+                (task[1] is None or task[1] >= start)]
+
+
+class Outage(object):
+    """
+    A window without successful probes of a service on a node, or of a
+    service on any node when node is None.
+    """
+
+    def __init__(self, service, node, start, end):
+        self.service = service
+        self.node = node
+        self.start = start
+        self.end = end
+        self.tasks = []
+
+    @property
+    def duration(self):
+        """
+        Seconds between the last good probe before and the first after.
+        """
+        return self.end - self.start
+
+    def __repr__(self):
+        return 'Outage({0}@{1}, {2:.1f}s)'.format(
+            self.service, self.node, self.duration)
+
+
+def gaps(times, start=None, end=None):
+    """
+    Return the (from, to) intervals between consecutive good probe
+    times, including from start to the first and from the last to end.
+    """
+    times = sorted(times)
+    if start is not None:
+        times = [start] + [seen_at for seen_at in times if seen_at > start]
+    if end is not None:
+        times = [seen_at for seen_at in times if seen_at < end] + [end]
+    return list(zip(times, times[1:]))
+
+
+class DowntimeReport(object):
+    """
+    Outages of availability probe streams. Every stream holds the times of
+    the good probes of a service on a node; failed probes only end the
+    streams. A gap longer than the probe interval plus its tolerance is an
+    outage. A service is up while any of its nodes answers, so a failover
+    is only a service outage when no node answered.
+
+    Args:
+        interval (float): Seconds between two probes.
+        tolerance (float): Seconds a probe may be late before it counts as
+            missing.
+        start, end (float): Window analysed, by default from the first to
+            the last probe of all streams.
+        timeline (PlanTimeline): Plan the outages are lined up against.
+    """
+
+    def __init__(self, interval=1.0, tolerance=1.0, start=None, end=None,
+                 timeline=None):
+        self.interval = interval
+        self.tolerance = tolerance
+        self.start = start
+        self.end = end
+        self.timeline = timeline
+        # (service, node) to the good probe times
+        self.streams = {}
+
+    def add(self, service, node, samples):
+        """
+        Add (time, ok) samples, or good probe times, of a service on a node.
+        """
+        stream = self.streams.setdefault((service, node), [])
+        for sample in samples:
+            if isinstance(sample, tuple):
+                if sample[1]:
+                    stream.append(sample[0])
+            else:
+                stream.append(sample)
+
+    def within(self, start, end):
+        """
+        Return a report of the same streams limited to start and end.
+        """
+        report = DowntimeReport(self.interval, self.tolerance, start, end,
+                                self.timeline)
+        report.streams = self.streams
+        return report
+
+    def _window(self):
+        """
+        Return the analysed window.
+        """
+        times = [seen_at for stream in self.streams.values()
+                 for seen_at in stream]
+        return (self.start if self.start is not None else min(times or [0]),
+                self.end if self.end is not None else max(times or [0]))
+
+    def _times(self, service=None, node=None):
+        """
+        Return the good probe times of the matching streams.
+        """
+        return [seen_at for (stream_service, stream_node), stream
+                in self.streams.items()
+                if service in (None, stream_service) and
+                node in (None, stream_node) for seen_at in stream]
+
+    def outages(self, service=None, node=None):
+        """
+        Return the outages of the service on the node. Without a node the
+        service is down only when no node answered; without a service
+        every service is analysed on its own.
+        """
+        services = sorted(set(key[0] for key in self.streams)) \
+            if service is None else [service]
+        start, end = self._window()
+        found = []
+        for name in services:
+            for gap_start, gap_end in gaps(self._times(name, node), start,
+                                           end):
+                if gap_end - gap_start > self.interval + self.tolerance:
+                    outage = Outage(name, node, gap_start, gap_end)
+                    if self.timeline is not None:
+                        outage.tasks = self.timeline.overlapping(gap_start,
+                                                                 gap_end)
+                    found.append(outage)
+        return found
+
+    def total_downtime(self, service=None, node=None):
+        """
+        Return the seconds of all the outages.
+        """
+        return sum(outage.duration for outage in
+                   self.outages(service, node))
+
+    def max_gap(self, service=None, node=None):
+        """
+        Return the longest interval without a good probe, outage or not,
+        of the service on the node, or of every service on its own.
+        """
+        services = sorted(set(key[0] for key in self.streams)) \
+            if service is None else [service]
+        start, end = self._window()
+        return max([gap_end - gap_start for name in services
+                    for gap_start, gap_end in gaps(
+                        self._times(name, node), start, end)] or [0.0])
+
+    def lines(self):
+        """
+        Return a readable report of the outages per service and per node.
+        """
+        lines = []
+        keys = sorted(set((service, None) for service, _ in self.streams))
+        keys.extend(sorted(self.streams))
+        for service, node in keys:
+            outages = self.outages(service, node)
+            lines.append('{0} on {1}: {2} outages, {3:.1f}s down, max gap '
+                         '{4:.1f}s'.format(service, node or 'any node',
+                                           len(outages),
+                                           self.total_downtime(service,
+                                                               node),
+                                           self.max_gap(service, node)))
+            for outage in outages:
+                lines.append('    {0:.1f}s from {1} during {2}'.format(
+                    outage.duration, time.strftime(
+                        '%H:%M:%S', time.localtime(outage.start)),
+                    '; '.join('phase {0}: {1}'.format(*task)
+                              for task in outage.tasks) or 'no task'))
+        return lines
+
+
+class DowntimeMixin(NodeReadMixin):
+    """
+    GenericTest mixin that records the plan timeline of a disruptive plan
+    and asserts on the downtime seen by the availability probes.
+    """
+
+    def start_status_probes(self, nodes, service, command, interval=1):
+        """
+        Start running the status command of the service on every node
+        every interval seconds, in the background, until collected. The
+        command must not hold single quotes.
+
+        Returns:
+            dict. The clock offset of every node.
+        """
+        offsets = {}
+        path = STATUS_PROBE_PATH.format(service)
+        for node in nodes:
+            offsets[node] = self.read_clock_offset(node)[0]
+            _, stderr, ret_code = self.run_command(
+                node, STATUS_PROBE_CMD.format(command=command,
+                                              interval=interval, path=path),
+                su_root=True)
+            self.assertEqual(0, ret_code, stderr)
+        return offsets
+
+    def collect_status_probes(self, offsets, service, report):
+        """
+        Stop the status probes of the service and add their samples to
+        the DowntimeReport.
+        """
+        path = STATUS_PROBE_PATH.format(service)
+        for node, offset in sorted(offsets.items()):
+            stdout, _, _ = self.run_command(
+                node, STATUS_COLLECT_CMD.format(path=path), su_root=True)
+            report.add(service, node, parse_status_log(stdout, offset))
+
+    def record_plan_timeline(self, ms_node, timeout=3600, interval=5,
+                             timeline=None):
+        """
+        Poll show_plan on the MS until the plan is done and return the
+        PlanTimeline of its tasks, while the probes run on the nodes.
+        """
+        timeline = timeline or PlanTimeline()
+
+        def plan_done():
+            """
+            Observe the plan once and return True when it is done.
+            """
+            plan_stdout, _, _ = self.execute_cli_showplan_cmd(ms_node)
+            timeline.observe(time.time(), plan_states(
+                self.cli.parse_plan_output(plan_stdout)))
+            return timeline.done
+
+        self.assertTrue(wait_for(plan_done, timeout=timeout,
+                                 first_interval=interval,
+                                 max_interval=interval, backoff=1,
+                                 description='plan timeline'),
+                        'Plan did not finish in {0}s'.format(timeout))
+        return timeline
+
+    def assert_max_gap(self, report, limit, service=None, node=None):
+        """
+        Assert that the service, on the node or on any node, was never
+        without a good probe for limit seconds or more.
+        """
+        for line in report.lines():
+            self.log('info', line)
+        self.assertTrue(report.max_gap(service, node) < limit,
+                        'Max gap of {0} on {1} is {2:.1f}s, not under '
+                        '{3}s'.format(service or 'every service',
+                                      node or 'any node',
+                                      report.max_gap(service, node), limit))
@@ -0,0 +1,296 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Local sqlite store of the durations and outcomes of every test
+            run, read from the nose xunit reports, used to order tests
+            longest first or fail fast and to find duration regressions
+
+Usage:
+    python duration_history.py [--db FILE] [--order FILE] [--fail-fast]
+        [--regressions] [--export FILE] [REPORT.xml ...]
+"""
+import hashlib
+import json
+import optparse
+import os
+import sqlite3
+import sys
+import time
+from xml.etree import ElementTree
+from cluster_common import percentile
+
+DEFAULT_DB = os.path.expanduser('~/.vcs_testware_history.sqlite')
+
+PASSED = 'passed'
+FAILED = 'failed'
+ERROR = 'error'
+SKIPPED = 'skipped'
+
+# Failure rate from which a test is run first in fail fast order
+FLAKY_RATE = 0.1
+# Last duration over the median of the earlier runs flagged as regressed
+REGRESSION_FACTOR = 1.5
+# Earlier runs needed before a regression is flagged
+MIN_HISTORY = 3
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    digest TEXT NOT NULL UNIQUE,
+    ingested REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test_id TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_test_id ON results (test_id);
+'''
+
+
+def report_test_id(testcase):
+    """
+    Return the file:test id used in ordered_tcs.txt of a testcase element
+    whose classname is module.Class.
+    """
+    module = testcase.get('classname', '').split('.')[0]
+    return '{0}.py:{1}'.format(module, testcase.get('name'))
+
+
+def read_report(path):
+    """
+    Return the (test id, seconds, outcome) of every testcase of a nose
+    xunit or surefire report.
+    """
+    results = []
+    for testcase in ElementTree.parse(path).getroot().iter('testcase'):
+        outcome = PASSED
+        for child, child_outcome in (('skipped', SKIPPED),
+                                     ('error', ERROR),
+                                     ('failure', FAILED)):
+            if testcase.find(child) is not None:
+                outcome = child_outcome
+        results.append((report_test_id(testcase),
+                        float(testcase.get('time') or 0), outcome))
+    return results
+
+
+class RunHistory(object):
+    """
+    The durations and outcomes of one test over the ingested runs, oldest
+    first. Skipped runs are not kept.
+    """
+
+    def __init__(self, test_id, runs=()):
+        self.test_id = test_id
+        self.runs = list(runs)
+
+    @property
+    def durations(self):
+        """
+        Durations in seconds of every run.
+        """
+        return [seconds for seconds, _ in self.runs]
+
+    @property
+    def failed_durations(self):
+        """
+        Durations in seconds of the runs that failed or errored.
+        """
+        return [seconds for seconds, outcome in self.runs
+                if outcome != PASSED]
+
+    @property
+    def failure_rate(self):
+        """
+        Share of the runs that failed or errored.
+        """
+        if not self.runs:
+            return 0.0
+        return len(self.failed_durations) / float(len(self.runs))
+
+    def median(self):
+        """
+        Median duration, or None without runs.
+        """
+        return percentile(self.durations, 50)
+
+    def regression(self, factor=REGRESSION_FACTOR, min_history=MIN_HISTORY):
+        """
+        Return the ratio of the last duration to the median of the earlier
+        ones if it is above factor, else None.
+        """
+        earlier = self.durations[:-1]
+        if len(earlier) < min_history:
+            return None
+        median = percentile(earlier, 50)
+        if not median:
+            return None
+        ratio = self.durations[-1] / median
+        return ratio if ratio > factor else None
+
+
+class DurationHistory(object):
+    """
+    The sqlite store of test runs.
+    """
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        """
+        Close the database.
+        """
+        self.conn.close()
+
+    def ingest(self, report_path):
+        """
+        Store the results of a report. A report already ingested, with the
+        same content, is skipped.
+
+        Returns:
+            int. Number of results stored.
+        """
+        with open(report_path, 'rb') as report:
+            digest = hashlib.sha1(report.read()).hexdigest()
+        if self.conn.execute('SELECT 1 FROM runs WHERE digest = ?',
+                             (digest,)).fetchone():
+            return 0
+        results = read_report(report_path)
+        with self.conn:
+            run_id = self.conn.execute(
+                'INSERT INTO runs (source, digest, ingested) '
+                'VALUES (?, ?, ?)',
+                (os.path.abspath(report_path), digest, time.time())
+            ).lastrowid
+            self.conn.executemany(
+                'INSERT INTO results (run_id, test_id, seconds, outcome) '
+                'VALUES (?, ?, ?, ?)',
+                [(run_id,) + result for result in results])
+        return len(results)
+
+    def histories(self, test_ids=None):
+        """
+        Return the RunHistory of every test with results, by test id.
+        """
+        histories = {}
+        rows = self.conn.execute(
+            'SELECT test_id, seconds, outcome FROM results '
+            'WHERE outcome != ? ORDER BY run_id', (SKIPPED,))
+        for test_id, seconds, outcome in rows:
+            if test_ids is None or test_id in test_ids:
+                histories.setdefault(
+                    test_id, RunHistory(test_id)).runs.append(
+                        (seconds, outcome))
+        return histories
+
+    def median_durations(self):
+        """
+        Return the median duration of every test by test id, in the format
+        of the scheduling.py --durations file.
+        """
+        return dict((test_id, history.median())
+                    for test_id, history in self.histories().items())
+
+    def longest_first(self, test_ids):
+        """
+        Return the test ids ordered by median duration, longest first.
+        Tests without history go first, as their duration is unknown.
+        """
+        histories = self.histories(set(test_ids))
+        return sorted(test_ids, key=lambda test_id: -(
+            histories[test_id].median() if test_id in histories
+            else float('inf')))
+
+    def fail_fast(self, test_ids, flaky_rate=FLAKY_RATE):
+        """
+        Return the test ids with the tests failing at least flaky_rate of
+        their runs first, those that fail quickest and most often leading,
+        followed by the others longest first.
+        """
+        histories = self.histories(set(test_ids))
+        flaky = [test_id for test_id in test_ids if test_id in histories and
+                 histories[test_id].failed_durations and
+                 histories[test_id].failure_rate >= flaky_rate]
+        flaky.sort(key=lambda test_id: (
+            percentile(histories[test_id].failed_durations, 50) /
+            histories[test_id].failure_rate))
+        return flaky + self.longest_first(
+            [test_id for test_id in test_ids if test_id not in flaky])
+
+    def regressions(self, factor=REGRESSION_FACTOR, min_history=MIN_HISTORY):
+        """
+        Return (test id, ratio) of every test whose last duration regressed
+        beyond factor, worst first.
+        """
+        found = []
+        for test_id, history in self.histories().items():
+            ratio = history.regression(factor, min_history)
+            if ratio is not None:
+                found.append((test_id, ratio))
+        return sorted(found, key=lambda item: -item[1])
+
+
+PARSER = optparse.OptionParser(usage='%prog [options] [REPORT.xml ...]')
+PARSER.add_option('--db', action='store', dest='db', type='str',
+                  default=DEFAULT_DB, help='sqlite history file')
+PARSER.add_option('--order', action='store', dest='order', type='str',
+                  help='print the file:test ids of the file longest first')
+PARSER.add_option('--fail-fast', action='store_true', dest='fail_fast',
+                  default=False, help='with --order, run flaky tests first')
+PARSER.add_option('--regressions', action='store_true', dest='regressions',
+                  default=False, help='print the tests whose last duration '
+                  'regressed, and fail if there are any')
+PARSER.add_option('--factor', action='store', dest='factor', type='float',
+                  default=REGRESSION_FACTOR, help='regression threshold as '
+                  'a ratio to the median duration')
+PARSER.add_option('--export', action='store', dest='export', type='str',
+                  help='write the median durations as JSON for '
+                  'scheduling.py --durations')
+
+
+def main(args=None):
+    """
+    Ingest the given reports, then answer the queries of the options.
+    """
+    opts, reports = PARSER.parse_args(args)
+    history = DurationHistory(opts.db)
+    status = 0
+    try:
+        for report in reports:
+            print 'Ingested {0} results from {1}'.format(
+                history.ingest(report), report)
+        if opts.order:
+            with open(opts.order) as ordered:
+                test_ids = [line.split('#')[0].strip() for line in ordered
+                            if line.split('#')[0].strip()]
+            order = history.fail_fast if opts.fail_fast else \
+                history.longest_first
+            print '\n'.join(order(test_ids))
+        if opts.regressions:
+            for test_id, ratio in history.regressions(opts.factor):
+                status = 1
+                print 'REGRESSED: {0} took {1:.1f}x its median'.format(
+                    test_id, ratio)
+        if opts.export:
+            with open(opts.export, 'w') as export:
+                json.dump(history.median_durations(), export, indent=2,
+                          sort_keys=True)
+    finally:
+        history.close()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Cluster expansion pipeline: expansion scripts, network hosts
+            loaded in one batch and per node setup of the new nodes, with
+            an expanded model detected from one model read
+"""
+import time
+from collections import OrderedDict
+from model_xml import ModelBatchMixin, ModelXmlBuilder
+from node_index import NodeIndexMixin
+
+FOUR_NODE_SCRIPTS = ('expand_cloud_c1_mn2.sh', 'expand_cloud_c1_mn3.sh',
+                     'expand_cloud_c1_mn4.sh')
+FOUR_NODE_CLUSTER_FILE = '192.168.0.42_4node.sh'
+FOUR_NODE_IDS = ('n1', 'n2', 'n3', 'n4')
+FOUR_NODE_NEW_NODES = ('node2', 'node3', 'node4')
+# vcs-network-host items of the expanded cluster by item id
+FOUR_NODE_NETWORK_HOSTS = OrderedDict([
+    ('nh21', {'ip': '10.10.14.4', 'network_name': 'dhcp_network'}),
+    ('nh22', {'ip': '192.168.0.4', 'network_name': 'mgmt'}),
+])
+
+# Stage timings of every expansion, keyed by test id
+EXPANSION_METRICS = {}
+
+
+class ExpansionMixin(NodeIndexMixin, ModelBatchMixin):
+    """
+    Mixin for GenericTest subclasses that expands the vcs-cluster of the
+    test set. It must come before GenericTest in the list of base classes.
+    """
+
+    def is_model_expanded(self, node_ids=FOUR_NODE_IDS, cluster_url=None):
+        """
+        Return True if the cluster has exactly the given nodes, read with
+        one recursive show of the cluster nodes.
+        """
+        return set(self.node_index(cluster_url).values('node_id')) == \
+            set(node_ids)
+
+    def expand_cluster(self, ms_node, network_hosts=('nh21',),
+                       scripts=FOUR_NODE_SCRIPTS,
+                       cluster_filename=FOUR_NODE_CLUSTER_FILE,
+                       plan_timeout_mins=None, new_nodes=None,
+                       add_to_cleanup=False):
+        """
+        Expand the cluster of the test set. Only the network hosts are
+        batched. The per node steps stay serial: every expansion script
+        adds one node to the model left by the previous one, and the new
+        nodes are prepared one at a time by prepare_new_nodes, as the
+        connections of GenericTest are not thread safe.
+
+        Args:
+            ms_node (str): Filename of the MS.
+            network_hosts (tuple): Ids of the FOUR_NODE_NETWORK_HOSTS to
+                create, loaded into the model together.
+            scripts (tuple): Expansion scripts, run in order.
+            cluster_filename (str): Cluster file of the scripts.
+            plan_timeout_mins (int): Run the plan and wait for it when set.
+            new_nodes (list): Filenames of the new nodes to prepare with
+                prepare_new_nodes once the plan has run.
+            add_to_cleanup (bool): Remove the network hosts in cleanup.
+        """
+        timings = OrderedDict()
+        start = time.time()
+        for script in scripts:
+            self.execute_expand_script(ms_node, script,
+                                       cluster_filename=cluster_filename)
+        timings['scripts'] = time.time() - start
+
+        start = time.time()
+        builder = ModelXmlBuilder()
+        for host_id in network_hosts:
+            builder.create(
+                '{0}/network_hosts/{1}'.format(self.vcs_cluster_url,
+                                               host_id),
+                'vcs-network-host',
+                'ip={ip} network_name={network_name}'.format(
+                    **FOUR_NODE_NETWORK_HOSTS[host_id]))
+        self.load_model_xml(ms_node, builder, add_to_cleanup,
+                            parent_types={self.vcs_cluster_url:
+                                          'vcs-cluster'})
+        timings['network_hosts'] = time.time() - start
+
+        if plan_timeout_mins:
+            from test_constants import PLAN_COMPLETE
+            start = time.time()
+            self.run_and_check_plan(ms_node, PLAN_COMPLETE,
+                                    plan_timeout_mins)
+            timings['plan'] = time.time() - start
+
+        if new_nodes:
+            start = time.time()
+            self.prepare_new_nodes(ms_node, new_nodes)
+            timings['new_nodes'] = time.time() - start
+
+        EXPANSION_METRICS[self.id()] = timings
+        self.log('info', 'Cluster expansion: {0}'.format(', '.join(
+            '{0} {1:.1f}s'.format(stage, secs)
+            for stage, secs in timings.items())))
+
+    def prepare_new_nodes(self, ms_node, nodes):
+        """
+        Set the passwords of the new nodes and check they are reachable,
+        one node at a time. The steps are not run concurrently as the
+        connections of GenericTest are not thread safe: threads sharing
+        them would interleave the commands of different nodes.
+        """
+        for node in nodes:
+            self._prepare_new_node(ms_node, node)
+
+    def _prepare_new_node(self, ms_node, node):
+        """
+        Set the passwords of one new node and check it answers with its
+        hostname.
+        """
+        self.assertTrue(self.set_pws_new_node(ms_node, node),
+                        "Failed to set password on {0}".format(node))
+        stdout, _, _ = self.run_command(node, 'hostname')
+        self.assertEqual([node], stdout[:1])
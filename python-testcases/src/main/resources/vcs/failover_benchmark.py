@@ -0,0 +1,408 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Failover latency benchmark: repeated fault injection with the
+            fault detection, offline and online times of every run and
+            their percentiles per scenario and ha-service-config setting
+
+Usage:
+    python failover_benchmark.py [--runs N] [--scenario NAME ...]
+        [--setting STATUS_INTERVAL:FAULT_ON_MONITOR_TIMEOUTS ...]
+        [--seed N] [--json FILE] [RESULTS.json ...]
+"""
+import json
+import optparse
+import random
+import sys
+import time
+from cluster_common import VCS_BIN, parse_all_group_states, percentile
+from vcs_simulator import SimulatedCluster, build_cluster
+
+APP_KILL = 'app_kill'
+IP_CLEAR = 'ip_clear'
+NODE_POWEROFF = 'node_poweroff'
+SCENARIOS = (APP_KILL, IP_CLEAR, NODE_POWEROFF)
+METRICS = ('detection', 'offline', 'online')
+PERCENTILES = (50, 95, 99)
+# (status_interval, fault_on_monitor_timeouts) of the LITP ha-service-config
+DEFAULT_SETTING = (10, 4)
+# Seconds between two reads of the group state, the resolution of a run
+POLL_INTERVAL = 1
+# LLT peerinact: seconds before a silent node is declared dead
+PEER_INACTIVE = 16
+# Seconds of the transitions of the simulated groups
+SIMULATED_LATENCIES = {'online': 5.0, 'offline': 3.0}
+# Results file written by the lab benchmarks, read back by main
+RESULTS_FILE = 'failover_benchmark.json'
+
+# Failover runs measured by the running test run, in order
+FAILOVER_METRICS = []
+
+
+class FailoverRun(object):
+    """
+    Timings of a single fault injection, in seconds since the epoch.
+    """
+
+    def __init__(self, scenario, setting, fault_at, detected_at=None,
+                 offline_at=None, online_at=None):
+        self.scenario = scenario
+        self.setting = tuple(setting)
+        self.fault_at = fault_at
+        self.detected_at = detected_at
+        self.offline_at = offline_at
+        self.online_at = online_at
+
+    @property
+    def failed_over(self):
+        """
+        True if the group was seen online on the standby system.
+        """
+        return self.online_at is not None
+
+    def seconds(self, metric):
+        """
+        Return the seconds from the fault to the detection, offline or
+        online time, or None if it was not seen.
+        """
+        seen_at = getattr(self, {'detection': 'detected_at'}.get(
+            metric, metric + '_at'))
+        return None if seen_at is None else seen_at - self.fault_at
+
+    def to_dict(self):
+        """
+        Return the run as a JSON document.
+        """
+        return {'scenario': self.scenario,
+                'status_interval': self.setting[0],
+                'fault_on_monitor_timeouts': self.setting[1],
+                'fault_at': self.fault_at, 'detected_at': self.detected_at,
+                'offline_at': self.offline_at, 'online_at': self.online_at}
+
+    @classmethod
+    def from_dict(cls, doc):
+        """
+        Return the run of a to_dict document.
+        """
+        return cls(doc['scenario'], (doc['status_interval'],
+                                     doc['fault_on_monitor_timeouts']),
+                   doc['fault_at'], doc['detected_at'], doc['offline_at'],
+                   doc['online_at'])
+
+    def summary(self):
+        """
+        Return a one line description of the run for the test log.
+        """
+        return 'Failover {0} {1}: {2}'.format(
+            self.scenario, self.setting, ', '.join(
+                '{0} {1}'.format(metric, 'not seen' if self.seconds(
+                    metric) is None else '{0:.1f}s'.format(
+                        self.seconds(metric)))
+                for metric in METRICS))
+
+
+def parse_group_states(lines):
+    """
+    Return the State of a group per system from "hagrp -state GROUP".
+    """
+    states = {}
+    for systems in parse_all_group_states(lines).values():
+        states.update(systems)
+    return states
+
+
+def observe_failover(read_states, faulted, standby, run, timeout=600,
+                     interval=POLL_INTERVAL, clock=None, sleep=None):
+    """
+    Poll the group states after the fault of the run, recording when VCS
+    detected the fault, seen as the group faulted or no longer online on
+    the faulted system, when the group was offline there and when it was
+    online on the standby system. The state of a system missing from a
+    read, e.g. when the read failed, is unknown: nothing is recorded from
+    it and polling goes on.
+
+    Args:
+        read_states (callable): Returns the parse_group_states dictionary
+            of the group.
+        faulted (str): System the fault was injected on.
+        standby (str): System the group must fail over to.
+        run (FailoverRun): Run updated with the times seen.
+        timeout (int): Seconds after the fault to stop waiting.
+        interval (float): Seconds between two reads.
+
+    Returns:
+        FailoverRun. The run, with online_at None on timeout.
+    """
+    clock = clock or time.time
+    sleep = sleep or time.sleep
+    deadline = run.fault_at + timeout
+    while True:
+        now = clock()
+        states = read_states()
+        faulted_state = states[faulted].strip('|').split('|') \
+            if faulted in states else []
+        online = states.get(standby, '').strip('|').split('|') == ['ONLINE']
+        offline = faulted_state[:1] == ['OFFLINE']
+        if run.detected_at is None and ('FAULTED' in faulted_state or
+                                        offline or online):
+            run.detected_at = now
+        if run.offline_at is None and offline:
+            run.offline_at = now
+        if online:
+            run.online_at = now
+            return run
+        if now >= deadline:
+            return run
+        sleep(interval)
+
+
+def summarize(runs):
+    """
+    Return the p50, p95 and p99 of the detection, offline and online
+    seconds of the runs per scenario and setting, with the run counts.
+    Runs that did not fail over count as failed and are left out of the
+    percentiles.
+    """
+    groups = {}
+    for run in runs:
+        groups.setdefault((run.scenario, run.setting), []).append(run)
+    summary = []
+    for scenario, setting in sorted(groups, key=lambda key: (
+            SCENARIOS.index(key[0]) if key[0] in SCENARIOS else
+            len(SCENARIOS), key)):
+        group = groups[(scenario, setting)]
+        row = {'scenario': scenario, 'status_interval': setting[0],
+               'fault_on_monitor_timeouts': setting[1], 'runs': len(group),
+               'failed': len([run for run in group
+                              if not run.failed_over])}
+        for metric in METRICS:
+            values = [run.seconds(metric) for run in group
+                      if run.failed_over and
+                      run.seconds(metric) is not None]
+            row[metric] = dict(('p{0}'.format(pct), percentile(values, pct))
+                               for pct in PERCENTILES)
+        summary.append(row)
+    return summary
+
+
+def write_results(runs, path):
+    """
+    Write the runs and their summary to the JSON results file read by
+    main.
+    """
+    with open(path, 'w') as out:
+        json.dump({'runs': [run.to_dict() for run in runs],
+                   'summary': summarize(runs)}, out, indent=2,
+                  sort_keys=True)
+
+
+def format_table(summary):
+    """
+    Return the lines of a table of the summarize output.
+    """
+    columns = ['{0} p{1}'.format(metric, pct) for metric in METRICS
+               for pct in PERCENTILES]
+    lines = ['{0:<14} {1:>8} {2:>5} {3:>5} {4:>6} '.format(
+        'scenario', 'interval', 'fomt', 'runs', 'failed') +
+        ' '.join('{0:>12}'.format(column) for column in columns)]
+    for row in summary:
+        values = [row[metric]['p{0}'.format(pct)] for metric in METRICS
+                  for pct in PERCENTILES]
+        lines.append('{0:<14} {1:>8} {2:>5} {3:>5} {4:>6} '.format(
+            row['scenario'], row['status_interval'],
+            row['fault_on_monitor_timeouts'], row['runs'], row['failed']) +
+            ' '.join('{0:>12}'.format('-' if value is None else
+                                      '{0:.1f}'.format(value))
+                     for value in values))
+    return lines
+
+
+def detection_latency(scenario, setting, rand):
+    """
+    Return the seconds VCS takes to react to the fault in the simulation:
+    a killed process or a cleared IP is found by the next monitor of the
+    resource, within status_interval; a powered off node is declared dead
+    after the LLT peer inactivity timeout. fault_on_monitor_timeouts only
+    applies to monitors that time out, which none of the scenarios cause.
+    """
+    if scenario == NODE_POWEROFF:
+        return PEER_INACTIVE + rand()
+    return rand() * setting[0]
+
+
+def _simulated_run(scenario, setting, latencies, rand, interval):
+    """
+    Inject one fault into a simulated two system cluster and observe it
+    on a virtual clock.
+    """
+    clock = [0.0]
+    state = build_cluster(1, latencies=latencies)
+    detect = detection_latency(scenario, setting, rand)
+    group_name = sorted(state['groups'])[0]
+    group = state['groups'][group_name]
+    faulted, standby = group['systems'][:2]
+    # A simulated crash is the node being declared dead, at once
+    powered_off = [scenario == NODE_POWEROFF]
+    if powered_off[0]:
+        state['latencies']['fault'] = 0
+    else:
+        state['latencies']['fault'] = detect
+        SimulatedCluster(state, now=clock[0]).fault(group['resources'][0],
+                                                    faulted)
+
+    def read_states():
+        """
+        Return the group states at the virtual time.
+        """
+        if powered_off[0] and clock[0] >= detect:
+            SimulatedCluster(state, now=detect).crash(faulted)
+            powered_off[0] = False
+        return parse_group_states(SimulatedCluster(
+            state, now=clock[0]).hagrp(['-state', group_name]))
+
+    def advance(seconds):
+        """
+        Move the virtual time on.
+        """
+        clock[0] += seconds
+
+    return observe_failover(read_states, faulted, standby,
+                            FailoverRun(scenario, setting, clock[0]),
+                            interval=interval, clock=lambda: clock[0],
+                            sleep=advance)
+
+
+def simulate(scenarios=SCENARIOS, settings=(DEFAULT_SETTING,), runs=10,
+             latencies=None, seed=None, interval=POLL_INTERVAL):
+    """
+    Return the FailoverRuns of runs fault injections per scenario and
+    setting against the VCS simulator, on a virtual clock.
+    """
+    rand = random.Random(seed).random
+    latencies = dict(SIMULATED_LATENCIES, **(latencies or {}))
+    return [_simulated_run(scenario, tuple(setting), latencies, rand,
+                           interval)
+            for scenario in scenarios for setting in settings
+            for _ in range(runs)]
+
+
+class FailoverBenchmarkMixin(object):
+    """
+    Mixin for GenericTest subclasses that measures how long failovers take.
+    The group state is read with run_command, so the benchmark runs against
+    a lab cluster, or against the simulator through LocalTransportMixin.
+    """
+
+    def read_group_states(self, node, group_name):
+        """
+        Return the parse_group_states dictionary of the group read on the
+        node, empty if the node does not answer.
+        """
+        stdout, _, ret_code = self.run_command(
+            node, '{0}hagrp -state {1}'.format(VCS_BIN, group_name),
+            su_root=True)
+        return parse_group_states(stdout) if ret_code == 0 else {}
+
+    def benchmark_failover(self, scenario, node, group_name, faulted,
+                           standby, inject, recover, runs=10,
+                           setting=DEFAULT_SETTING, timeout=600,
+                           interval=POLL_INTERVAL):
+        """
+        Inject a fault runs times and measure every failover.
+
+        Args:
+            scenario (str): One of SCENARIOS, used in the report.
+            node (str): Filename of the node the group state is read on,
+                one that stays up during the fault.
+            group_name (str): VCS name of the failover group.
+            faulted (str): Hostname of the system the fault is injected on.
+            standby (str): Hostname of the system the group fails over to.
+            inject (callable): Injects the fault, e.g. a call of
+                kill_service_on_node, kill_ip_address_on_node or
+                poweroff_peer_node.
+            recover (callable): Brings the group back online on the
+                faulted system, ready for the next run.
+            setting (tuple): status_interval and fault_on_monitor_timeouts
+                of the group, used in the report.
+
+        Returns:
+            list. The FailoverRuns, also kept in FAILOVER_METRICS.
+        """
+        results = []
+        for _ in range(runs):
+            run = FailoverRun(scenario, setting, time.time())
+            inject()
+            observe_failover(
+                lambda: self.read_group_states(node, group_name), faulted,
+                standby, run, timeout, interval)
+            FAILOVER_METRICS.append(run)
+            results.append(run)
+            self.log('info' if run.failed_over else 'error', run.summary())
+            recover()
+        return results
+
+    def write_failover_results(self, path=RESULTS_FILE):
+        """
+        Log the summary of the FAILOVER_METRICS of the test run and write
+        them to the results file, for "python failover_benchmark.py
+        RESULTS.json".
+        """
+        for line in format_table(summarize(FAILOVER_METRICS)):
+            self.log('info', line)
+        write_results(FAILOVER_METRICS, path)
+        self.log('info', 'Failover runs written to {0}'.format(path))
+
+
+PARSER = optparse.OptionParser(
+    usage='%prog [options] [RESULTS.json ...]')
+PARSER.add_option('--runs', action='store', dest='runs', type='int',
+                  default=10, help='simulated runs per scenario and setting')
+PARSER.add_option('--scenario', action='append', dest='scenarios',
+                  choices=SCENARIOS, help='scenario to simulate, by '
+                  'default all of {0}'.format(', '.join(SCENARIOS)))
+PARSER.add_option('--setting', action='append', dest='settings',
+                  help='STATUS_INTERVAL:FAULT_ON_MONITOR_TIMEOUTS, by '
+                  'default {0}:{1}'.format(*DEFAULT_SETTING))
+PARSER.add_option('--seed', action='store', dest='seed', type='int',
+                  help='seed of the simulated detection times')
+PARSER.add_option('--json', action='store', dest='json', type='str',
+                  help='write the runs and the summary to this file')
+
+
+def main(args=None):
+    """
+    Summarize the runs of the given results files, written by --json or
+    from FAILOVER_METRICS in the lab, or simulate runs when none is given.
+    """
+    opts, paths = PARSER.parse_args(args)
+    if paths:
+        runs = []
+        for path in paths:
+            with open(path) as results:
+                runs.extend(FailoverRun.from_dict(doc)
+                            for doc in json.load(results)['runs'])
+    else:
+        try:
+            settings = [tuple(int(value) for value in setting.split(':'))
+                        for setting in opts.settings or []]
+        except ValueError:
+            PARSER.error('--setting is STATUS_INTERVAL:'
+                         'FAULT_ON_MONITOR_TIMEOUTS')
+        runs = simulate(opts.scenarios or SCENARIOS,
+                        settings or [DEFAULT_SETTING], opts.runs,
+                        seed=opts.seed)
+    summary = summarize(runs)
+    print '\n'.join(format_table(summary))
+    if opts.json:
+        write_results(runs, opts.json)
+    return 1 if any(row['failed'] for row in summary) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Fault injection on several nodes at once: the fault commands
+            are staged on every node by fault_injection_agent.py and fired
+            together at a shared deadline, or on a staggered schedule, and
+            the skew between the injections is reported
+"""
+import base64
+import json
+import os
+import time
+from cluster_common import NodeReadMixin
+from polling import wait_for
+
+AGENT_LOCAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'fault_injection_agent.py')
+AGENT_REMOTE_DIR = '/tmp'
+AGENT_REMOTE_PATH = AGENT_REMOTE_DIR + '/fault_injection_agent.py'
+RESULT_PATH = '/tmp/vcs_fault_injection_{0}.json'
+# Seconds between the arming of the last node and the deadline
+ARM_MARGIN = 2.0
+
+# Injections made by the running test run, in order
+INJECTION_METRICS = []
+
+# Nodes the agent was copied to during this session
+_AGENT_NODES = set()
+
+
+class Fault(object):
+    """
+    A command that injects a fault on a node, fired delay seconds after
+    the deadline of the injection.
+    """
+
+    def __init__(self, node, cmd, name=None, delay=0.0):
+        self.node = node
+        self.cmd = cmd
+        self.name = name
+        self.delay = delay
+
+    def __repr__(self):
+        return 'Fault({0} on {1} +{2}s)'.format(self.name, self.node,
+                                                self.delay)
+
+
+def simultaneous(faults):
+    """
+    Schedule every fault at the deadline.
+    """
+    for fault in faults:
+        fault.delay = 0.0
+    return faults
+
+
+def staggered(faults, step):
+    """
+    Schedule the faults step seconds apart, in the given order.
+    """
+    for num, fault in enumerate(faults):
+        fault.delay = num * step
+    return faults
+
+
+class InjectionReport(object):
+    """
+    When the faults of one injection fired, in seconds since the epoch of
+    the local clock.
+    """
+
+    def __init__(self, deadline, faults, offsets):
+        self.deadline = deadline
+        self.faults = faults
+        # Node to (clock offset, uncertainty)
+        self.offsets = offsets
+        self.fired_at = {}
+        self.results = {}
+        self.late_nodes = []
+
+    def add_result(self, node, doc):
+        """
+        Add the result document the agent of the node wrote.
+        """
+        offset = self.offsets[node][0]
+        if doc['armed_at'] - offset > self.deadline:
+            self.late_nodes.append(node)
+        for name, result in doc['results'].items():
+            self.fired_at[name] = result['fired_at'] - offset
+            self.results[name] = result
+
+    def error(self, fault):
+        """
+        Return how many seconds after its scheduled time the fault fired,
+        or None if it did not.
+        """
+        if fault.name not in self.fired_at:
+            return None
+        return self.fired_at[fault.name] - self.deadline - fault.delay
+
+    @property
+    def errors(self):
+        """
+        The errors of the faults that fired.
+        """
+        return [self.error(fault) for fault in self.faults
+                if fault.name in self.fired_at]
+
+    @property
+    def skew(self):
+        """
+        Spread in seconds of the errors: zero when the faults fired
+        exactly on schedule relative to each other.
+        """
+        errors = self.errors
+        return max(errors) - min(errors) if errors else None
+
+    @property
+    def clock_uncertainty(self):
+        """
+        Largest uncertainty of the node clock offsets, which bounds the
+        accuracy of the skew across nodes.
+        """
+        return max(uncertainty for _, uncertainty in self.offsets.values())
+
+    @property
+    def failed(self):
+        """
+        The faults that did not fire or whose command failed.
+        """
+        return [fault for fault in self.faults
+                if self.results.get(fault.name, {}).get('rc') != 0]
+
+    def summary(self):
+        """
+        Return a one line description of the injection for the test log.
+        """
+        if not self.fired_at:
+            return 'Fault injection: no fault fired'
+        return ('Fault injection: {0} faults on {1} nodes, skew {2:.3f}s '
+                '(+/-{3:.3f}s), latest {4:.3f}s after schedule, {5} '
+                'failed{6}'.format(
+                    len(self.faults), len(self.offsets), self.skew,
+                    self.clock_uncertainty, max(self.errors),
+                    len(self.failed), ', armed late on {0}'.format(
+                        ', '.join(self.late_nodes))
+                    if self.late_nodes else ''))
+
+
+class FaultInjectionMixin(NodeReadMixin):
+    """
+    GenericTest mixin that fires fault commands on several nodes together.
+    The commands are staged on every node before a shared deadline, so
+    SSH latency does not spread faults meant to coincide.
+    """
+
+    def install_fault_agent(self, node, force=False):
+        """
+        Copy the agent to the node unless it was copied already.
+        """
+        if force or node not in _AGENT_NODES:
+            self.assertTrue(self.copy_file_to(node, AGENT_LOCAL_PATH,
+                                              AGENT_REMOTE_DIR,
+                                              root_copy=True,
+                                              add_to_cleanup=False))
+            _AGENT_NODES.add(node)
+
+    def _read_injection_result(self, node, path):
+        """
+        Return the result document of the agent once it is written.
+        """
+        stdout, _, ret_code = self.run_command(
+            node, '/bin/cat {0} && /bin/rm -f {0}'.format(path),
+            su_root=True)
+        return json.loads('\n'.join(stdout)) if ret_code == 0 else None
+
+    def inject_faults(self, faults, margin=ARM_MARGIN, timeout=300):
+        """
+        Fire the faults at a shared deadline, each delay seconds after it.
+
+        The clock offset of every node is read and the agent staged on it.
+        The deadline is then set margin seconds plus a round-trip per node
+        and two more ahead, the agents are armed with it and the results
+        are collected once the last fault is due. The nodes are handled one
+        at a time, as the connections of GenericTest are not thread safe;
+        only the firing at the deadline is simultaneous.
+
+        Args:
+            faults (list): Fault objects, scheduled with simultaneous or
+                staggered.
+            margin (float): Seconds left between arming and the deadline.
+            timeout (int): Seconds to wait for the results after the last
+                fault is due.
+
+        Returns:
+            InjectionReport. Also kept in INJECTION_METRICS.
+        """
+        for num, fault in enumerate(faults):
+            fault.name = fault.name or 'f{0}'.format(num)
+        nodes = []
+        for fault in faults:
+            if fault.node not in nodes:
+                nodes.append(fault.node)
+
+        offsets = {}
+        for node in nodes:
+            self.install_fault_agent(node)
+            offsets[node] = self.read_clock_offset(node)
+        round_trip = 2 * max(uncertainty for _, uncertainty
+                             in offsets.values())
+        deadline = time.time() + margin + (len(nodes) + 2) * round_trip
+        report = InjectionReport(deadline, faults, offsets)
+        result_path = RESULT_PATH.format(int(deadline * 1000))
+
+        def arm(node):
+            """
+            Start the agent of the node in the background.
+            """
+            payload = base64.b64encode(json.dumps({
+                'deadline': deadline + offsets[node][0],
+                'faults': [{'id': fault.name, 'cmd': fault.cmd,
+                            'delay': fault.delay}
+                           for fault in faults if fault.node == node]}))
+            _, stderr, ret_code = self.run_command(
+                node, 'nohup /usr/bin/python {0} {1} {2} > /dev/null 2>&1 '
+                '&'.format(AGENT_REMOTE_PATH, result_path, payload),
+                su_root=True)
+            self.assertEqual(0, ret_code, 'Arming faults on {0} failed: '
+                             '{1}'.format(node, stderr))
+
+        for node in nodes:
+            arm(node)
+        due = deadline + max(fault.delay for fault in faults)
+        time.sleep(max(0, due - time.time()))
+
+        def collect(node):
+            """
+            Wait for the result document of the node.
+            """
+            return wait_for(
+                lambda: self._read_injection_result(node, result_path),
+                timeout=timeout, first_interval=0.2, max_interval=2,
+                retry_on=(ValueError,), log=self.log,
+                description='fault injection results of {0}'.format(node))
+
+        for node in nodes:
+            result = collect(node)
+            self.assertTrue(result, 'No fault injection results from '
+                            '{0}'.format(node))
+            report.add_result(node, result.value)
+        INJECTION_METRICS.append(report)
+        self.log('info', report.summary())
+        return report
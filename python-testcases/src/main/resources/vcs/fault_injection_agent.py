@@ -0,0 +1,83 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Agent copied to the nodes that fires staged fault commands at a
+            deadline of the node clock and writes when each one fired
+
+Input:  the result file path and base64 JSON as arguments
+        {"deadline": 1760000000.5,
+         "faults": [{"id": "f1", "cmd": "service x stop", "delay": 0.0}]}
+Output: the result file, written once every command has returned
+        {"armed_at": 1759999998.1, "results": {"f1": {"fired_at": ...,
+         "rc": 0, "stderr": [...], "duration": 0.02}}}
+Every command runs in its own thread, fired at deadline + delay.
+"""
+import base64
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+# Seconds before the fire time at which sleeping turns into spinning
+SPIN = 0.05
+
+
+def wait_until(fire_at):
+    """
+    Sleep until shortly before fire_at, then spin until it.
+    """
+    remaining = fire_at - time.time()
+    if remaining > SPIN:
+        time.sleep(remaining - SPIN)
+    while time.time() < fire_at:
+        pass
+
+
+def fire(fault, fire_at, results, lock):
+    """
+    Run the command of the fault at fire_at and store its result.
+    """
+    wait_until(fire_at)
+    fired_at = time.time()
+    proc = subprocess.Popen(fault['cmd'], shell=True, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, universal_newlines=True)
+    _, stderr = proc.communicate()
+    with lock:
+        results[fault['id']] = {'fired_at': fired_at, 'rc': proc.returncode,
+                                'stderr': stderr.splitlines(),
+                                'duration': time.time() - fired_at}
+
+
+def main():
+    """
+    Arm the faults of the request, fire them and write the result file.
+    """
+    result_path = sys.argv[1]
+    request = json.loads(base64.b64decode(sys.argv[2]))
+    armed_at = time.time()
+    results = {}
+    lock = threading.Lock()
+    threads = [threading.Thread(target=fire, args=(
+        fault, request['deadline'] + fault.get('delay', 0), results, lock))
+               for fault in request['faults']]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    partial = result_path + '.part'
+    with open(partial, 'w') as out:
+        json.dump({'armed_at': armed_at, 'results': results}, out)
+    os.rename(partial, result_path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
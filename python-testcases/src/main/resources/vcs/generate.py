@@ -13,6 +13,7 @@ program(s) have been supplied.
             Agile: LITPCDS-10172
 """
 import codecs
+import copy
 import json
 import jsonschema
 import sys
@@ -122,6 +123,29 @@ TRIGGER_PROPS = {
     'trigger_type': lambda x: None
 }
 
+# Default values LITP applies to the properties the fixtures leave unset
+LITP_DEFAULT_VALUES = {
+    'vcs-clustered-service': {
+        'offline_timeout': '300',
+        'online_timeout': '300',
+    },
+    'service': {
+        'cleanup_command': '/bin/true',
+    },
+    'ha-service-config': {
+        'clean_timeout': '60',
+        'fault_on_monitor_timeouts': '4',
+        'tolerance_limit': '0',
+    },
+    'vip': {
+        'ipaddress': '172.17.100.83',
+        'network_name': 'traffic1',
+    },
+    'vcs_trigger': {
+        'trigger_type': 'nofailover'
+    }
+}
+
 
 def _extract_invalid_options(input_value):
     """
@@ -338,27 +362,7 @@ def generate_json(story, vcs_length=0, app_length=0, hsc_length=0,
             'vip_length': vip_length,
             'trigger_length': vcs_trigger
         },
-        'litp_default_values': {
-            'vcs-clustered-service': {
-                'offline_timeout': '300',
-                'online_timeout': '300',
-            },
-            'service': {
-                'cleanup_command': '/bin/true',
-            },
-            'ha-service-config': {
-                'clean_timeout': '60',
-                'fault_on_monitor_timeouts': '4',
-                'tolerance_limit': '0',
-            },
-            'vip': {
-                'ipaddress': '172.17.100.83',
-                'network_name': 'traffic1',
-            },
-            'vcs_trigger': {
-                'trigger_type': 'nofailover'
-            }
-        },
+        'litp_default_values': copy.deepcopy(LITP_DEFAULT_VALUES),
     }
     props = (
         ('vcs-clustered-service', vcs_length, vcs_options),
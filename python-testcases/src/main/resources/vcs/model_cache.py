@@ -0,0 +1,190 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Per test cache for read only LITP model queries with
+            write-through invalidation
+"""
+import copy
+
+# Hit ratios of finished tests, keyed by test id
+CACHE_STATS = {}
+
+
+class ModelQueryCache(object):
+    """
+    Store the results of read only model queries keyed by the query name
+    and its arguments.
+    """
+
+    def __init__(self):
+        self._results = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(query, args, kwargs):
+        """
+        Return a hashable key for the query and its arguments.
+        """
+        return (query, tuple(args), tuple(sorted(kwargs.items())))
+
+    def get(self, query, args, kwargs, fetch):
+        """
+        Return the cached result of the query or call fetch and cache what
+        it returns. A copy is returned so callers can mutate the result.
+        """
+        key = self.make_key(query, args, kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable arguments are never cached
+            self.misses += 1
+            return fetch()
+        if key in self._results:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._results[key] = fetch()
+        return copy.deepcopy(self._results[key])
+
+    def invalidate(self):
+        """
+        Drop every cached result.
+        """
+        if self._results:
+            self.invalidations += 1
+        self._results = {}
+
+    def hit_ratio(self):
+        """
+        Return the ratio of queries answered from the cache.
+        """
+        total = self.hits + self.misses
+        return float(self.hits) / total if total else 0.0
+
+    def stats(self):
+        """
+        Return the counters of the cache as a dictionary.
+        """
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'hit_ratio': self.hit_ratio()}
+
+
+def _cached_query(query):
+    """
+    Return a method that answers the query from the test model cache.
+    """
+    def method(self, *args, **kwargs):
+        parent = getattr(super(CachedModelMixin, self), query)
+        cache = getattr(self, 'model_cache', None)
+        if cache is None:
+            return parent(*args, **kwargs)
+        return cache.get(query, args, kwargs,
+                         lambda: parent(*args, **kwargs))
+    method.__name__ = query
+    method.__doc__ = 'Cached {0}, see GenericTest.{0}'.format(query)
+    return method
+
+
+def _model_write(write):
+    """
+    Return a method that drops the model cache once the write is done.
+    """
+    def method(self, *args, **kwargs):
+        try:
+            return getattr(super(CachedModelMixin, self), write)(
+                *args, **kwargs)
+        finally:
+            self.invalidate_model_cache()
+    method.__name__ = write
+    method.__doc__ = 'Invalidates the model cache, see GenericTest.{0}'.\
+        format(write)
+    return method
+
+
+def is_model_write_cmd(cmd):
+    """
+    Return True if the command is a litp command other than a show, which
+    can change the model.
+    """
+    words = cmd.split()
+    return len(words) > 1 and words[0] == 'litp' and \
+        not words[1].startswith('show') and words[1] != 'version'
+
+
+class CachedModelMixin(object):
+    """
+    Mixin for GenericTest subclasses that answers find, get_props_from_url
+    and execute_show_data_cmd from a cache that lives for a single test.
+    It must come before GenericTest in the list of base classes.
+    litp commands other than show sent through run_command drop the cache
+    too. Model writes made any other way, e.g. by a script run on the MS,
+    are not seen by the cache, call invalidate_model_cache after them.
+    """
+
+    def setUp(self):
+        """
+        Create an empty model cache before every test.
+        """
+        self.model_cache = ModelQueryCache()
+        super(CachedModelMixin, self).setUp()
+
+    def tearDown(self):
+        """
+        Record and log the hit ratio of the model cache.
+        """
+        stats = self.model_cache.stats()
+        CACHE_STATS[self.id()] = stats
+        self.log('info', 'Model query cache: {0} hits, {1} misses, '
+                 '{2} invalidations, hit ratio {3:.2f}'.format(
+                     stats['hits'], stats['misses'],
+                     stats['invalidations'], stats['hit_ratio']))
+        self.model_cache.invalidate()
+        super(CachedModelMixin, self).tearDown()
+
+    def run_command(self, node, cmd, *args, **kwargs):
+        """
+        Run the command and drop the model cache if it is a litp command
+        that can change the model.
+        """
+        try:
+            return super(CachedModelMixin, self).run_command(
+                node, cmd, *args, **kwargs)
+        finally:
+            if is_model_write_cmd(cmd):
+                self.invalidate_model_cache()
+
+    def invalidate_model_cache(self):
+        """
+        Drop every cached model query of the running test.
+        """
+        cache = getattr(self, 'model_cache', None)
+        if cache is not None:
+            cache.invalidate()
+
+    find = _cached_query('find')
+    get_props_from_url = _cached_query('get_props_from_url')
+    execute_show_data_cmd = _cached_query('execute_show_data_cmd')
+
+    execute_cli_create_cmd = _model_write('execute_cli_create_cmd')
+    execute_cli_update_cmd = _model_write('execute_cli_update_cmd')
+    execute_cli_remove_cmd = _model_write('execute_cli_remove_cmd')
+    execute_cli_inherit_cmd = _model_write('execute_cli_inherit_cmd')
+    execute_cli_load_cmd = _model_write('execute_cli_load_cmd')
+    execute_cli_runplan_cmd = _model_write('execute_cli_runplan_cmd')
+    run_and_check_plan = _model_write('run_and_check_plan')
+    execute_cli_restoremodel_cmd = _model_write(
+        'execute_cli_restoremodel_cmd')
+    execute_cli_prepare_restore_cmd = _model_write(
+        'execute_cli_prepare_restore_cmd')
+    wait_for_plan_state = _model_write('wait_for_plan_state')
+    execute_expand_script = _model_write('execute_expand_script')
@@ -0,0 +1,204 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   In memory snapshot of a LITP model subtree read with a single
+            recursive show, answering find and property queries locally
+"""
+import re
+from collections import defaultdict
+
+SHOW_RECURSIVE_CMD = 'litp show -p {0} -r'
+
+REFERENCE_PREFIX = 'reference-to-'
+
+INHERIT_SYMBOL = ' [*]'
+
+# Item types gathered per vcs-clustered-service by get_vcs_model_info
+VCS_MODEL_INFO_TYPES = ('ha-service-config', 'vip', 'package', 'file-system',
+                        'service', 'lsb-runtime', 'vcs-trigger')
+
+_KEY_VALUE_REGEX = re.compile(r'^(\s*)([\w\- ]+):\s?(.*)$')
+
+
+class ModelItem(object):
+    """
+    A single item of the LITP model as printed by litp show.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.item_id = path.split('/')[-1]
+        self.item_type = None
+        self.state = None
+        self.inherited_from = None
+        self.properties = {}
+        self.children = []
+
+    @property
+    def parent_path(self):
+        """
+        Return the path of the parent item.
+        """
+        return self.path.rsplit('/', 1)[0] or '/'
+
+    def is_type(self, item_type, include_refs=False):
+        """
+        Return True if the item is of the given type, or inherits from an
+        item of the given type when include_refs is set.
+        """
+        if self.item_type == item_type:
+            return True
+        return include_refs and \
+            self.item_type == REFERENCE_PREFIX + item_type
+
+    def __repr__(self):
+        return 'ModelItem({0}, {1})'.format(self.path, self.item_type)
+
+
+class ModelSnapshot(object):
+    """
+    A LITP model subtree indexed by path and by item type.
+    """
+
+    def __init__(self, items):
+        self.by_path = {}
+        self.by_type = defaultdict(list)
+        self._order = []
+        for item in items:
+            self.add_item(item)
+
+    def add_item(self, item):
+        """
+        Add the item to the path and type indexes and link it to its parent.
+        """
+        self.by_path[item.path] = item
+        self._order.append(item.path)
+        if item.item_type:
+            self.by_type[item.item_type].append(item.path)
+        parent = self.by_path.get(item.parent_path)
+        if parent is not None and item.path not in parent.children:
+            parent.children.append(item.path)
+
+    @classmethod
+    def from_show_output(cls, lines):
+        """
+        Build the snapshot from the output lines of litp show -r.
+        """
+        items = []
+        item = None
+        section = None
+        for line in lines:
+            if not line.strip():
+                continue
+            if line.startswith('/'):
+                item = ModelItem(line.strip())
+                items.append(item)
+                section = None
+                continue
+            match = _KEY_VALUE_REGEX.match(line)
+            if item is None or match is None:
+                continue
+            indent, key, value = match.groups()
+            key = key.strip()
+            if len(indent) <= 4:
+                section = None
+                if key == 'type':
+                    item.item_type = value.strip()
+                elif key == 'state':
+                    item.state = value.strip()
+                elif key == 'inherited from':
+                    item.inherited_from = value.strip()
+                elif key in ('properties', 'children'):
+                    section = key
+            elif section == 'properties':
+                item.properties[key] = value.strip()
+        return cls(items)
+
+    @classmethod
+    def from_test(cls, test, node, path='/deployments'):
+        """
+        Read the model subtree under path with one recursive show run
+        through the given GenericTest instance.
+        """
+        stdout, stderr, rc = test.run_command(
+            node, SHOW_RECURSIVE_CMD.format(path))
+        test.assertEqual(0, rc)
+        test.assertEqual([], stderr)
+        return cls.from_show_output(stdout)
+
+    def __contains__(self, path):
+        return path in self.by_path
+
+    def find(self, path, item_type, include_refs=False):
+        """
+        Return the paths of the items of item_type at or below path in the
+        order they were printed by litp show, with the items inheriting
+        from one when include_refs is set, as GenericTest.find does with
+        find_refs.
+        """
+        prefix = path.rstrip('/') + '/'
+        types = [item_type]
+        if include_refs:
+            types.append(REFERENCE_PREFIX + item_type)
+        found = set()
+        for itype in types:
+            found.update(url for url in self.by_type.get(itype, [])
+                         if url == path or url.startswith(prefix))
+        return [url for url in self._order if url in found]
+
+    def props(self, path, filter_prop=None, keep_inherit_symbol=False):
+        """
+        Return the properties of the item at path, or the value of the
+        single property filter_prop. The inherited value marker is removed
+        unless keep_inherit_symbol is set.
+        """
+        item = self.by_path.get(path)
+        if item is None:
+            return None
+        properties = dict(item.properties)
+        if not keep_inherit_symbol:
+            for key, value in properties.items():
+                if value.endswith(INHERIT_SYMBOL):
+                    properties[key] = value[:-len(INHERIT_SYMBOL)]
+        if filter_prop is not None:
+            return properties.get(filter_prop)
+        return properties
+
+    def children(self, path):
+        """
+        Return the paths of the direct children of the item at path.
+        """
+        item = self.by_path.get(path)
+        return list(item.children) if item else []
+
+
+def get_vcs_model_info(snapshot, cluster_urls,
+                       item_types=VCS_MODEL_INFO_TYPES):
+    """
+    Return the same list of service group dictionaries that the
+    get_vcs_model_info test helpers build with one find and one
+    get_props_from_url per item, using the snapshot instead. Like those
+    finds, inherited reference-to items are not returned.
+    """
+    service_groups = []
+    for cluster_url in cluster_urls:
+        for serv in snapshot.find(cluster_url, 'vcs-clustered-service'):
+            # vm services are tested in testset_vcs_vm.py
+            if snapshot.find(serv, 'vm-service'):
+                continue
+            prop_dict = {'url': serv}
+            prop_dict.update(snapshot.props(serv))
+            service_group = {'vcs-clustered-service': prop_dict}
+            for itype in item_types:
+                for url in snapshot.find(serv, itype):
+                    prop_dict = {'url': url}
+                    prop_dict.update(snapshot.props(url))
+                    service_group.setdefault(itype, []).append(prop_dict)
+            service_groups.append(service_group)
+    return service_groups
@@ -0,0 +1,505 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   In-process stand-in of the LITP model service, loaded from LITP
+            XML, that answers the GenericTest model queries and writes
+            with injected latency and counts every call
+"""
+import os
+import re
+import time
+from collections import Counter
+from xml.etree import ElementTree
+from model_snapshot import (INHERIT_SYMBOL, REFERENCE_PREFIX, ModelItem,
+                            ModelSnapshot)
+from model_xml import parse_options
+
+LOCAL_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Seconds of every call as seen by a test running against an MS: the SSH
+# round-trip plus the litp command
+REALISTIC_LATENCIES = {'find': 0.5, 'show': 0.3, 'create': 0.4,
+                       'update': 0.4, 'remove': 0.4, 'inherit': 0.4,
+                       'load': 1.5}
+
+# Fixture documents loaded by build_deployment, by the path they are
+# loaded under. {cluster} is the url of the vcs-cluster.
+DEPLOYMENT_XML = (('/software', 'software_items.xml'),
+                  ('/software', 'software_services.xml'),
+                  ('{cluster}', 'service_groups.xml'))
+
+# Item types extended by other types: a find of the base type returns the
+# items of the extending types too, as the model service does
+EXTENDED_TYPES = {'cluster': ('vcs-cluster',),
+                  'clustered-service': ('vcs-clustered-service',),
+                  'network-interface': ('eth', 'bond', 'bridge', 'vlan')}
+
+APPLIED = 'Applied'
+INITIAL = 'Initial'
+UPDATED = 'Updated'
+FOR_REMOVAL = 'ForRemoval'
+
+_SHOW_REGEX = re.compile(r'^litp show -p (\S+)( -r)?$')
+
+
+class ModelError(Exception):
+    """
+    A model request the LITP model service would reject.
+    """
+    pass
+
+
+def _local_name(tag):
+    """
+    Return the tag without its namespace.
+    """
+    return tag.split('}')[-1]
+
+
+class ModelStandIn(ModelSnapshot):
+    """
+    A writable ModelSnapshot. Every request counts in calls and costs its
+    latency, slept unless sleep is False, and added to simulated_seconds.
+    """
+
+    def __init__(self, items=(), latencies=None, sleep=True):
+        super(ModelStandIn, self).__init__(items)
+        self.latencies = dict(latencies or {})
+        self.sleep = sleep
+        self.calls = Counter()
+        self.simulated_seconds = 0.0
+
+    def _call(self, operation):
+        """
+        Count the request and spend its latency.
+        """
+        self.calls[operation] += 1
+        delay = self.latencies.get(operation, 0)
+        self.simulated_seconds += delay
+        if delay and self.sleep:
+            time.sleep(delay)
+
+    def _item(self, path):
+        """
+        Return the item at path or fail like litp for a missing one.
+        """
+        item = self.by_path.get(path)
+        if item is None:
+            raise ModelError('InvalidLocationError Not found {0}'.format(
+                path))
+        return item
+
+    def _add(self, path, item_type, properties, state=INITIAL,
+             inherited_from=None):
+        """
+        Add an item below an existing parent.
+        """
+        if path in self.by_path:
+            raise ModelError('ItemExistsError Item {0} already '
+                             'exists'.format(path))
+        parent_path = path.rsplit('/', 1)[0]
+        if parent_path and parent_path not in self.by_path:
+            raise ModelError('InvalidLocationError Not found {0}'.format(
+                parent_path))
+        item = ModelItem(path)
+        item.item_type = item_type
+        item.state = state
+        item.inherited_from = inherited_from
+        item.properties = dict(properties)
+        self.add_item(item)
+        return item
+
+    def _delete(self, path):
+        """
+        Drop the item at path and every item below it.
+        """
+        doomed = set(url for url in self._order
+                     if url == path or url.startswith(path + '/'))
+        for url in doomed:
+            item = self.by_path.pop(url)
+            if item.item_type:
+                self.by_type[item.item_type].remove(url)
+        self._order = [url for url in self._order if url not in doomed]
+        parent = self.by_path.get(path.rsplit('/', 1)[0])
+        if parent is not None:
+            parent.children.remove(path)
+
+    @staticmethod
+    def _touch(item):
+        """
+        Mark an applied item as updated.
+        """
+        if item.state == APPLIED:
+            item.state = UPDATED
+
+    def _set_properties(self, item, properties):
+        """
+        Set local values of properties, overriding inherited ones.
+        """
+        if properties:
+            item.properties.update(properties)
+            self._touch(item)
+
+    def _inherit_tree(self, path, source_path, properties=None):
+        """
+        Add a reference to the source item, and to every item below it,
+        with the source properties marked as inherited.
+        """
+        source = self._item(source_path)
+        source_type = source.item_type or ''
+        if source_type.startswith(REFERENCE_PREFIX):
+            source_type = source_type[len(REFERENCE_PREFIX):]
+        inherited = dict(
+            (key, value if value.endswith(INHERIT_SYMBOL)
+             else value + INHERIT_SYMBOL)
+            for key, value in source.properties.items())
+        inherited.update(properties or {})
+        self._add(path, REFERENCE_PREFIX + source_type, inherited,
+                  inherited_from=source_path)
+        for child in list(source.children):
+            self._inherit_tree(path + child[len(source_path):], child)
+
+    def find_paths(self, path, item_type, rtn_type_children=True,
+                   find_refs=False):
+        """
+        Return the items of item_type, or of a type extending it, at or
+        below path, with the items inheriting from one when find_refs is
+        set. Without
+        rtn_type_children the collections holding them are returned.
+        """
+        self._call('find')
+        found = set()
+        for itype in (item_type,) + EXTENDED_TYPES.get(item_type, ()):
+            found.update(self.find(path, itype, include_refs=find_refs))
+        found = [url for url in self._order if url in found]
+        if rtn_type_children:
+            return found
+        parents = []
+        for url in found:
+            parent_path = url.rsplit('/', 1)[0]
+            if parent_path not in parents:
+                parents.append(parent_path)
+        return parents
+
+    def show(self, path, prop=None):
+        """
+        Return the properties of the item, or the value of prop, as litp
+        show prints them, with the inherited value marker.
+        """
+        self._call('show')
+        self._item(path)
+        return self.props(path, prop, keep_inherit_symbol=True)
+
+    def show_lines(self, path, recursive=True):
+        """
+        Return the output lines of litp show -p path [-r].
+        """
+        self._call('show')
+        self._item(path)
+        lines = []
+        for url in self._order:
+            if url != path and not (recursive and
+                                    url.startswith(path.rstrip('/') + '/')):
+                continue
+            item = self.by_path[url]
+            lines.append(url)
+            if item.inherited_from:
+                lines.append('    inherited from: {0}'.format(
+                    item.inherited_from))
+            lines.extend(['    type: {0}'.format(item.item_type),
+                          '    state: {0}'.format(item.state)])
+            if item.properties:
+                lines.append('    properties:')
+                lines.extend('        {0}: {1}'.format(key, value)
+                             for key, value in sorted(
+                                 item.properties.items()))
+        return lines
+
+    def create(self, path, item_type, options=''):
+        """
+        litp create -p path -t item_type -o options.
+        """
+        self._call('create')
+        self._add(path, item_type, parse_options(options))
+
+    def update(self, path, options, action_del=False):
+        """
+        litp update -p path -o options, or -d options when action_del is
+        set. Deleting an inherited property restores the inherited value.
+        """
+        self._call('update')
+        item = self._item(path)
+        if not action_del:
+            self._set_properties(item, parse_options(options))
+            return
+        source = self.by_path.get(item.inherited_from)
+        for key in re.split(r'[\s,]+', options.strip()):
+            if source is not None and key in source.properties:
+                value = source.properties[key]
+                item.properties[key] = value if \
+                    value.endswith(INHERIT_SYMBOL) else \
+                    value + INHERIT_SYMBOL
+            else:
+                item.properties.pop(key, None)
+        self._touch(item)
+
+    def remove(self, path):
+        """
+        litp remove -p path: items never applied are dropped, the others
+        are marked ForRemoval until the next plan.
+        """
+        self._call('remove')
+        item = self._item(path)
+        if item.state == INITIAL:
+            self._delete(path)
+            return
+        for url in [path] + self.find(path, None):
+            self.by_path[url].state = FOR_REMOVAL
+
+    def inherit(self, path, source_path, options=''):
+        """
+        litp inherit -p path -s source_path -o options.
+        """
+        self._call('inherit')
+        self._inherit_tree(path, source_path, parse_options(options))
+
+    def load(self, parent_path, xml, merge=True):
+        """
+        litp load -p parent_path of an XML document, given as text or a
+        file path, with --merge when merge is set.
+        """
+        self._call('load')
+        if not xml.lstrip().startswith('<'):
+            with open(xml) as xml_file:
+                xml = xml_file.read()
+        self._load_element(parent_path.rstrip('/'),
+                           ElementTree.fromstring(xml), merge)
+
+    def _load_element(self, parent_path, element, merge):
+        """
+        Create, or merge into, the item of the element and its children.
+        """
+        tag = _local_name(element.tag)
+        path = '{0}/{1}'.format(parent_path, element.get('id'))
+        properties = dict((child.tag, (child.text or '').strip())
+                          for child in element
+                          if not child.tag.startswith('{'))
+        if path in self.by_path:
+            if not merge:
+                raise ModelError('ItemExistsError Item {0} already '
+                                 'exists'.format(path))
+            self._set_properties(self.by_path[path], properties)
+        elif tag.endswith('-inherit'):
+            self._inherit_tree(path, element.get('source_path'), properties)
+        else:
+            self._add(path, tag, properties)
+        for child in element:
+            if child.tag.startswith('{'):
+                self._load_element(path, child, merge)
+
+    def apply_plan(self):
+        """
+        Apply the model as a successful plan would.
+        """
+        for url in list(self._order):
+            item = self.by_path.get(url)
+            if item is None:
+                continue
+            if item.state == FOR_REMOVAL:
+                self._delete(url)
+            else:
+                item.state = APPLIED
+
+    def find(self, path, item_type, include_refs=False):
+        """
+        ModelSnapshot.find, returning every item below path when
+        item_type is None.
+        """
+        if item_type is not None:
+            return super(ModelStandIn, self).find(path, item_type,
+                                                  include_refs)
+        prefix = path.rstrip('/') + '/'
+        return [url for url in self._order if url.startswith(prefix)]
+
+
+def build_deployment(nodes=2, cluster_id='c1', xml_files=DEPLOYMENT_XML,
+                     latencies=None, sleep=True):
+    """
+    Return a ModelStandIn of a deployment with one vcs-cluster of the
+    given number of nodes, every node with a mgmt interface, and the
+    xml_files fixtures loaded and applied.
+    """
+    model = ModelStandIn(latencies=latencies, sleep=sleep)
+    cluster = '/deployments/d1/clusters/{0}'.format(cluster_id)
+    base = [('/deployments', 'deployments-collection', {}),
+            ('/deployments/d1', 'deployment', {}),
+            ('/deployments/d1/clusters', 'deployment-clusters-collection',
+             {}),
+            (cluster, 'vcs-cluster', {'cluster_type': 'sfha',
+                                      'cluster_id': '4768',
+                                      'low_prio_net': 'mgmt',
+                                      'llt_nets': 'hb1,hb2'}),
+            (cluster + '/nodes', 'cluster-nodes-collection', {}),
+            (cluster + '/services', 'cluster-services-collection', {}),
+            (cluster + '/network_hosts',
+             'vcs-cluster-network_hosts-collection', {}),
+            ('/software', 'software', {}),
+            ('/software/items', 'software-items-collection', {}),
+            ('/software/services', 'software-services-collection', {})]
+    for num in range(1, nodes + 1):
+        node = '{0}/nodes/n{1}'.format(cluster, num)
+        base.extend([
+            (node, 'node', {'hostname': 'node{0}'.format(num),
+                            'node_id': str(num)}),
+            (node + '/network_interfaces',
+             'node-network_interfaces-collection', {}),
+            (node + '/network_interfaces/if0', 'eth',
+             {'device_name': 'eth0', 'network_name': 'mgmt',
+              'ipaddress': '192.168.0.{0}'.format(num + 1)})])
+    for path, item_type, properties in base:
+        model._add(path, item_type, properties, state=APPLIED)
+    for parent_path, xml_file in xml_files:
+        model._load_element(parent_path.format(cluster=cluster).rstrip('/'),
+                            ElementTree.parse(os.path.join(
+                                LOCAL_DIR, xml_file)).getroot(), True)
+    model.apply_plan()
+    return model
+
+
+class ModelStandInMixin(object):
+    """
+    Mixin that answers the GenericTest model queries and writes from the
+    ModelStandIn in litp_model instead of an MS, so that model helpers
+    run in unit tests. It goes after the mixins that wrap those methods,
+    such as CachedModelMixin and ModelBatchMixin, and before the class
+    providing the assertions. The node arguments are ignored.
+    """
+    litp_model = None
+
+    def _model_request(self, request, expect_positive, *args):
+        """
+        Run a model write and check it succeeds only if expected to.
+        """
+        try:
+            request(*args)
+        except ModelError as err:
+            self.assertFalse(expect_positive, str(err))
+            return [], [str(err)], 1
+        self.assertTrue(expect_positive, '{0} {1} did not fail'.format(
+            request.__name__, args[0]))
+        return [], [], 0
+
+    def find(self, node, path, resource, rtn_type_children=True,
+             assert_not_empty=True, find_refs=False):
+        """
+        Stand-in for GenericTest.find.
+        """
+        found = self.litp_model.find_paths(path, resource,
+                                           rtn_type_children, find_refs)
+        if assert_not_empty:
+            self.assertNotEqual([], found)
+        return found
+
+    def find_children_of_collect(self, node, path, resource):
+        """
+        Stand-in for GenericTest.find_children_of_collect.
+        """
+        return self.litp_model.find_paths(path, resource, find_refs=True)
+
+    def get_props_from_url(self, node, url, filter_prop=None):
+        """
+        Stand-in for GenericTest.get_props_from_url.
+        """
+        return self.litp_model.show(url, filter_prop)
+
+    def execute_show_data_cmd(self, node, url, prop):
+        """
+        Stand-in for GenericTest.execute_show_data_cmd.
+        """
+        return self.litp_model.show(url, prop)
+
+    def execute_cli_create_cmd(self, node, url, class_type, props='',
+                               expect_positive=True, add_to_cleanup=True):
+        """
+        Stand-in for GenericTest.execute_cli_create_cmd.
+        """
+        return self._model_request(self.litp_model.create, expect_positive,
+                                   url, class_type, props)
+
+    def execute_cli_update_cmd(self, node, url, props, action_del=False,
+                               expect_positive=True):
+        """
+        Stand-in for GenericTest.execute_cli_update_cmd.
+        """
+        return self._model_request(self.litp_model.update, expect_positive,
+                                   url, props, action_del)
+
+    def execute_cli_remove_cmd(self, node, url, expect_positive=True,
+                               add_to_cleanup=True):
+        """
+        Stand-in for GenericTest.execute_cli_remove_cmd.
+        """
+        return self._model_request(self.litp_model.remove, expect_positive,
+                                   url)
+
+    def execute_cli_inherit_cmd(self, node, url, source_url, props='',
+                                expect_positive=True, add_to_cleanup=True):
+        """
+        Stand-in for GenericTest.execute_cli_inherit_cmd.
+        """
+        return self._model_request(self.litp_model.inherit, expect_positive,
+                                   url, source_url, props)
+
+    def get_filelist_dict(self, local_path, remote_dir):
+        """
+        Stand-in for GenericTest.get_filelist_dict.
+        """
+        return {'local_path': local_path, 'remote_path': remote_dir}
+
+    def copy_filelist_to(self, node, filelist, add_to_cleanup=True,
+                         root_copy=False):
+        """
+        Keep the content of the files as copied to the MS, for
+        execute_cli_load_cmd.
+        """
+        copied = self.__dict__.setdefault('_standin_files', {})
+        for entry in filelist:
+            remote_path = os.path.join(entry['remote_path'],
+                                       os.path.basename(entry['local_path']))
+            with open(entry['local_path']) as local_file:
+                copied[remote_path] = local_file.read()
+        return True
+
+    def execute_cli_load_cmd(self, node, url, filepath, args='',
+                             expect_positive=True, add_to_cleanup=False):
+        """
+        Stand-in for GenericTest.execute_cli_load_cmd of a file copied
+        with copy_filelist_to.
+        """
+        xml = self.__dict__.get('_standin_files', {}).get(filepath)
+        self.assertNotEqual(None, xml, '{0} was not copied'.format(filepath))
+        return self._model_request(self.litp_model.load, expect_positive,
+                                   url, xml, '--merge' in args)
+
+    def run_command(self, node, cmd, su_root=False, default_asserts=False,
+                    **kwargs):
+        """
+        Answer litp show commands from the stand-in, such as the one of
+        ModelSnapshot.from_test, and pass other commands on.
+        """
+        match = _SHOW_REGEX.match(cmd.strip())
+        if match is None:
+            return super(ModelStandInMixin, self).run_command(
+                node, cmd, su_root=su_root, default_asserts=default_asserts,
+                **kwargs)
+        try:
+            return self.litp_model.show_lines(match.group(1),
+                                              bool(match.group(2))), [], 0
+        except ModelError as err:
+            return [], [str(err)], 1
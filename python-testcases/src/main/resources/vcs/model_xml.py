@@ -0,0 +1,399 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Builder of LITP XML documents from create and inherit commands,
+            so that a batch of items is loaded with one litp load --merge
+"""
+import os
+import shlex
+import shutil
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from xml.etree import ElementTree
+
+LITP_NS = 'http://www.ericsson.com/litp'
+XSI_NS = 'http://www.w3.org/2001/XMLSchema-instance'
+SCHEMA_LOCATION = LITP_NS + ' litp-xml-schema/litp.xsd'
+
+ElementTree.register_namespace('litp', LITP_NS)
+ElementTree.register_namespace('xsi', XSI_NS)
+
+# Directory on the MS the documents are copied to before they are loaded
+XML_REMOTE_DIR = '/home/litp-admin/'
+
+# Collection elements that are not named <item type>-<collection>-collection
+COLLECTION_TAGS = {
+    ('software', 'items'): 'software-items-collection',
+    ('software', 'services'): 'software-services-collection',
+    ('cluster', 'services'): 'cluster-services-collection',
+    ('vcs-clustered-service', 'applications'):
+        'clustered-service-applications-collection',
+    ('vcs-clustered-service', 'ha_configs'):
+        'clustered-service-ha_configs-collection',
+    ('vcs-clustered-service', 'runtimes'):
+        'clustered-service-runtimes-collection',
+    ('lsb-runtime', 'packages'): 'runtime-entity-packages-collection',
+}
+
+# Properties and collections of the base item types. LITP writes them
+# before the ones added by the extending type, as in service_groups.xml.
+BASE_TYPE_ELEMENTS = {
+    'vcs-clustered-service': ('active', 'dependency_list', 'name',
+                              'node_list', 'standby', 'applications',
+                              'ha_configs', 'runtimes'),
+    'lsb-runtime': ('cleanup_command', 'start_command', 'stop_command',
+                    'user', 'packages'),
+    'ha-service-config': ('status_interval', 'status_timeout'),
+}
+
+# Item type of an inherit source, by the collection holding the source
+SOURCE_TYPES = {'items': 'package', 'packages': 'package',
+                'services': 'service'}
+
+
+def parse_options(options):
+    """
+    Return the properties of a CLI options string such as
+    name="CS1" active=1 as an ordered dictionary.
+    """
+    if isinstance(options, dict):
+        return OrderedDict(sorted(options.items()))
+    properties = OrderedDict()
+    for pair in shlex.split(options or ''):
+        key, _, value = pair.partition('=')
+        properties[key] = value
+    return properties
+
+
+class _Item(object):
+    """
+    An item created or inherited in the batch.
+    """
+
+    def __init__(self, path, item_type, properties=None, source_path=None):
+        self.path = path
+        self.item_type = item_type
+        self.properties = properties or OrderedDict()
+        self.source_path = source_path
+        self.collections = OrderedDict()
+
+    @property
+    def item_id(self):
+        """ The last element of the path """
+        return self.path.rsplit('/', 1)[-1]
+
+    @property
+    def collection_path(self):
+        """ The path of the collection that holds the item """
+        return self.path.rsplit('/', 1)[0]
+
+
+class ModelXmlBuilder(object):
+    """
+    Collect create and inherit commands and turn them into LITP XML
+    documents in the schema of service_groups.xml, one document for every
+    collection the new items are created in.
+    """
+
+    def __init__(self):
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def create(self, path, item_type, options=''):
+        """
+        Add the equivalent of litp create -p path -t item_type -o options.
+        """
+        self._add(_Item(path, item_type, parse_options(options)))
+
+    def inherit(self, path, source_path, options=''):
+        """
+        Add the equivalent of litp inherit -p path -s source_path.
+        """
+        source = self._items.get(source_path)
+        if source is not None:
+            item_type = source.item_type
+        else:
+            item_type = SOURCE_TYPES.get(source_path.split('/')[-2])
+        if item_type is None:
+            raise ValueError('Unknown item type of inherit source '
+                             '{0}'.format(source_path))
+        self._add(_Item(path, item_type, parse_options(options),
+                        source_path))
+
+    def _add(self, item):
+        """
+        Add the item and link it to the collection of its parent item.
+        """
+        if item.path in self._items:
+            raise ValueError('Item {0} is already in the batch'.format(
+                item.path))
+        self._items[item.path] = item
+        parent_path, collection = item.collection_path.rsplit('/', 1)
+        parent = self._items.get(parent_path)
+        if parent is not None:
+            parent.collections.setdefault(collection, []).append(item.path)
+
+    def add_cli_data(self, cli_data, cs_options, app_class='lsb-runtime',
+                     with_ips=True):
+        """
+        Add the items of one clustered service as returned by
+        VCSUtils.generate_cli_commands, in the order the test sets used to
+        create them one by one.
+        """
+        self.create(cli_data['cs']['url'], cli_data['cs']['class_type'],
+                    cs_options)
+        self.create(cli_data['apps']['url'], cli_data['apps']['class_type'],
+                    cli_data['apps']['options'])
+        if with_ips:
+            for ip_data in cli_data['ips']:
+                self.create(ip_data['url'], ip_data['class_type'],
+                            ip_data['options'])
+        for pkg_data in cli_data['pkgs']:
+            self.create(pkg_data['url'], pkg_data['class_type'],
+                        pkg_data['options'])
+        if cli_data['ha_service_config']:
+            self.create(cli_data['ha_service_config']['url'],
+                        cli_data['ha_service_config']['class_type'],
+                        cli_data['ha_service_config']['options'])
+        for pkg_link_data in cli_data['pkg_links']:
+            self.inherit(pkg_link_data['child_url'],
+                         pkg_link_data['parent_url'])
+        if app_class in ('service', 'vm-service'):
+            self.inherit(cli_data['apps']['app_url_in_cluster'],
+                         cli_data['apps']['url'])
+
+    def documents(self, parent_types=None):
+        """
+        Return a list of (load path, XML text) tuples, one for every
+        collection holding items of the batch whose parent item is not in
+        the batch. parent_types gives the item type of those parents
+        where it cannot be told from the path.
+        """
+        parent_types = parent_types or {}
+        roots = OrderedDict()
+        for item in self._items.values():
+            parent_path, collection = item.collection_path.rsplit('/', 1)
+            if parent_path not in self._items:
+                roots.setdefault((parent_path, collection), []).append(item)
+        documents = []
+        for (parent_path, collection), items in self._load_order(roots):
+            parent_type = parent_types.get(parent_path) or \
+                _parent_type(parent_path)
+            root = ElementTree.Element(
+                _tag(_collection_tag(parent_type, collection)),
+                {'id': collection,
+                 '{%s}schemaLocation' % XSI_NS: SCHEMA_LOCATION})
+            for item in items:
+                root.append(self._element(item))
+            documents.append((parent_path or '/', "<?xml version='1.0' "
+                              "encoding='utf-8'?>\n" +
+                              ElementTree.tostring(root)))
+        return documents
+
+    def _load_order(self, roots):
+        """
+        Return the root collections ordered so that the sources of the
+        inherited items are loaded before the items that inherit them.
+        """
+        pending = roots.items()
+        ordered = []
+        while pending:
+            for num, (key, items) in enumerate(pending):
+                prefixes = ['/'.join(other) + '/' for other, _ in pending
+                            if other != key]
+                sources = [source for item in items
+                           for source in self._sources(item)]
+                if not any(source.startswith(prefix) for source in sources
+                           for prefix in prefixes):
+                    break
+            else:
+                num = 0
+            ordered.append(pending.pop(num))
+        return ordered
+
+    def _sources(self, item):
+        """
+        Return the inherit sources of the item and the items below it.
+        """
+        sources = [item.source_path] if item.source_path else []
+        for paths in item.collections.values():
+            for path in paths:
+                sources.extend(self._sources(self._items[path]))
+        return sources
+
+    def _element(self, item):
+        """
+        Return the XML element of the item and the items below it.
+        """
+        attrib = {'id': item.item_id}
+        if item.source_path:
+            attrib['source_path'] = item.source_path
+            tag = item.item_type + '-inherit'
+        else:
+            tag = item.item_type
+        element = ElementTree.Element(_tag(tag), attrib)
+        collections = self._collections(item)
+        for name in _element_order(item.item_type, item.properties,
+                                   collections):
+            if name in item.properties:
+                prop = ElementTree.SubElement(element, name)
+                prop.text = item.properties[name]
+            else:
+                element.append(collections[name])
+        return element
+
+    def _collections(self, item):
+        """
+        Return the collection elements of the item by collection name.
+        Inherited items mirror the collections of a source in the batch.
+        """
+        collections = OrderedDict()
+        source = self._items.get(item.source_path)
+        if source is not None:
+            for name, paths in source.collections.items():
+                element = ElementTree.Element(
+                    _tag(_collection_tag(source.item_type, name) +
+                         '-inherit'),
+                    {'id': name,
+                     'source_path': '{0}/{1}'.format(source.path, name)})
+                for path in paths:
+                    child = self._items[path]
+                    ElementTree.SubElement(
+                        element, _tag(child.item_type + '-inherit'),
+                        {'id': child.item_id, 'source_path': path})
+                collections[name] = element
+        for name, paths in item.collections.items():
+            element = collections.get(name)
+            if element is None:
+                element = ElementTree.Element(
+                    _tag(_collection_tag(item.item_type, name)),
+                    {'id': name})
+                collections[name] = element
+            for path in paths:
+                element.append(self._element(self._items[path]))
+        return collections
+
+
+def _tag(name):
+    """
+    Return the name qualified with the LITP namespace.
+    """
+    return '{%s}%s' % (LITP_NS, name)
+
+
+def _collection_tag(parent_type, collection):
+    """
+    Return the element name of the collection of an item type.
+    """
+    return COLLECTION_TAGS.get((parent_type, collection),
+                               '{0}-{1}-collection'.format(parent_type,
+                                                           collection))
+
+
+def _parent_type(parent_path):
+    """
+    Return the item type of a parent that is already in the model.
+    """
+    if parent_path == '/software':
+        return 'software'
+    if parent_path.rsplit('/', 2)[-2:-1] == ['clusters']:
+        return 'cluster'
+    raise ValueError('Unknown item type of {0}'.format(parent_path))
+
+
+def _element_order(item_type, properties, collections):
+    """
+    Return the property and collection names of an item in the order
+    LITP writes them: the properties and then the collections of the base
+    type, followed by the properties and then the collections of the type.
+    """
+    base = BASE_TYPE_ELEMENTS.get(item_type, ())
+    order = []
+    for in_base in (True, False):
+        order.extend(sorted(name for name in properties
+                            if (name in base) == in_base))
+        order.extend(sorted(name for name in collections
+                            if (name in base) == in_base))
+    return order
+
+
+class ModelBatchMixin(object):
+    """
+    Mixin for GenericTest subclasses that loads items created through
+    ModelXmlBuilder with one litp load --merge per collection, instead of
+    one litp create or inherit per item.
+    """
+
+    def setUp(self):
+        """
+        Start every test without an open batch.
+        """
+        self._model_batch = None
+        super(ModelBatchMixin, self).setUp()
+
+    @contextmanager
+    def model_batch(self, ms_node, add_to_cleanup=False):
+        """
+        Collect the items created with create_cs_from_cli_data in the
+        with block and load them when the block ends.
+        """
+        self._model_batch = ModelXmlBuilder()
+        try:
+            yield self._model_batch
+            builder = self._model_batch
+        finally:
+            self._model_batch = None
+        self.load_model_xml(ms_node, builder, add_to_cleanup)
+
+    def create_cs_from_cli_data(self, ms_node, cli_data, cs_options,
+                                app_class='lsb-runtime', with_ips=True,
+                                add_to_cleanup=False):
+        """
+        Create the items of VCSUtils.generate_cli_commands output. Inside
+        model_batch they are loaded with the batch, otherwise at once.
+        """
+        if self._model_batch is not None:
+            self._model_batch.add_cli_data(cli_data, cs_options, app_class,
+                                           with_ips)
+            return
+        builder = ModelXmlBuilder()
+        builder.add_cli_data(cli_data, cs_options, app_class, with_ips)
+        self.load_model_xml(ms_node, builder, add_to_cleanup)
+
+    def load_model_xml(self, ms_node, builder, add_to_cleanup=False,
+                       parent_types=None):
+        """
+        Copy the documents of the builder to the MS and merge each of them
+        into the model. parent_types is passed to builder.documents.
+        """
+        documents = builder.documents(parent_types)
+        if not documents:
+            return
+        local_dir = tempfile.mkdtemp()
+        try:
+            filelist = []
+            for num, (_, xml) in enumerate(documents):
+                local_path = os.path.join(
+                    local_dir, 'model_batch_{0}.xml'.format(num))
+                with open(local_path, 'w') as xml_file:
+                    xml_file.write(xml)
+                filelist.append(self.get_filelist_dict(local_path,
+                                                       XML_REMOTE_DIR))
+            self.copy_filelist_to(ms_node, filelist, add_to_cleanup=False)
+        finally:
+            shutil.rmtree(local_dir)
+        kwargs = {'add_to_cleanup': True} if add_to_cleanup else {}
+        for num, (load_path, _) in enumerate(documents):
+            self.execute_cli_load_cmd(
+                ms_node, load_path,
+                '{0}model_batch_{1}.xml'.format(XML_REMOTE_DIR, num),
+                '--merge', **kwargs)
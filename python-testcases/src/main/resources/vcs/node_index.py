@@ -0,0 +1,210 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Bidirectional index of node identities (hostname, filename,
+            model URL and item id) built from a single model read
+"""
+from model_snapshot import ModelSnapshot
+
+IDENTITIES = ('hostname', 'filename', 'url', 'node_id')
+
+
+class NodeIndex(object):
+    """
+    Map any identity of a node to all the others.
+    Every record is a dictionary with the hostname, filename, url and
+    node_id keys. The filename is None for nodes that are not in the
+    connection data of the test framework.
+    """
+
+    def __init__(self, records):
+        self.records = list(records)
+        self._by_identity = dict((key, {}) for key in IDENTITIES)
+        for record in self.records:
+            for key in IDENTITIES:
+                if record.get(key) is not None:
+                    self._by_identity[key][record[key]] = record
+
+    @classmethod
+    def from_snapshot(cls, snapshot, cluster_url, host_to_file):
+        """
+        Build the index from the nodes of the cluster in the snapshot.
+        host_to_file maps the node hostnames to the framework filenames.
+        """
+        records = []
+        for url in snapshot.find(cluster_url, 'node'):
+            hostname = snapshot.props(url, 'hostname')
+            records.append({'hostname': hostname,
+                            'filename': host_to_file.get(hostname),
+                            'url': url,
+                            'node_id': url.split('/')[-1]})
+        return cls(records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, identity):
+        return self.lookup(identity) is not None
+
+    def lookup(self, identity, kind=None):
+        """
+        Return the record of the node known by identity. The identity is
+        matched against the hostnames, filenames, URLs and ids in that
+        order unless kind names a single one of them.
+        """
+        kinds = (kind,) if kind else IDENTITIES
+        for key in kinds:
+            record = self._by_identity[key].get(identity)
+            if record is not None:
+                return record
+        return None
+
+    def _convert(self, identity, target):
+        """
+        Return the target identity of the node known by identity.
+        """
+        record = self.lookup(identity)
+        if record is None:
+            raise KeyError('Unknown node identity: {0}'.format(identity))
+        return record[target]
+
+    def hostname(self, identity):
+        """
+        Return the hostname of the node.
+        """
+        return self._convert(identity, 'hostname')
+
+    def filename(self, identity):
+        """
+        Return the connection filename of the node.
+        """
+        return self._convert(identity, 'filename')
+
+    def url(self, identity):
+        """
+        Return the model URL of the node.
+        """
+        return self._convert(identity, 'url')
+
+    def node_id(self, identity):
+        """
+        Return the model item id of the node, e.g. n1.
+        """
+        return self._convert(identity, 'node_id')
+
+    def mapping(self, source, target):
+        """
+        Return a dictionary mapping one identity of every node to another.
+        """
+        return dict((record[source], record[target])
+                    for record in self.records)
+
+    def host_to_file(self):
+        """
+        Return a dictionary mapping the node hostnames to their filenames.
+        """
+        return self.mapping('hostname', 'filename')
+
+    def file_to_host(self):
+        """
+        Return a dictionary mapping the node filenames to their hostnames.
+        """
+        return self.mapping('filename', 'hostname')
+
+    def values(self, target):
+        """
+        Return the given identity of every node in model order.
+        """
+        return [record[target] for record in self.records]
+
+
+def _topology_write(write):
+    """
+    Return a method that drops the node indexes when the write changes the
+    nodes of a cluster.
+    """
+    def method(self, *args, **kwargs):
+        try:
+            return getattr(super(NodeIndexMixin, self), write)(
+                *args, **kwargs)
+        finally:
+            urls = [arg for arg in args if isinstance(arg, basestring)]
+            if any('/nodes' in url for url in urls):
+                self.invalidate_node_index()
+    method.__name__ = write
+    method.__doc__ = 'Drops the node indexes after node writes, see ' \
+        'GenericTest.{0}'.format(write)
+    return method
+
+
+def _topology_change(change):
+    """
+    Return a method that always drops the node indexes.
+    """
+    def method(self, *args, **kwargs):
+        try:
+            return getattr(super(NodeIndexMixin, self), change)(
+                *args, **kwargs)
+        finally:
+            self.invalidate_node_index()
+    method.__name__ = change
+    method.__doc__ = 'Drops the node indexes, see GenericTest.{0}'.format(
+        change)
+    return method
+
+
+class NodeIndexMixin(object):
+    """
+    Mixin for GenericTest subclasses that keeps one NodeIndex per cluster.
+    The index is built from one recursive show of the cluster nodes and is
+    rebuilt after the cluster is expanded or contracted.
+    It must come before GenericTest in the list of base classes.
+    """
+
+    def setUp(self):
+        """
+        Start every test without node indexes.
+        """
+        self._node_indexes = {}
+        super(NodeIndexMixin, self).setUp()
+
+    def invalidate_node_index(self):
+        """
+        Drop the node indexes so that they are rebuilt on next use.
+        """
+        self._node_indexes = {}
+
+    def node_index(self, cluster_url=None, ms_node=None):
+        """
+        Return the NodeIndex of the cluster, by default the vcs-cluster
+        of the test set.
+        """
+        cluster_url = cluster_url or self.vcs_cluster_url
+        index = self._node_indexes.get(cluster_url)
+        if index is None:
+            ms_node = ms_node or self.get_management_node_filename()
+            snapshot = ModelSnapshot.from_test(self, ms_node,
+                                               cluster_url + '/nodes')
+            host_to_file = dict(
+                (self.get_node_att(filename, 'hostname'), filename)
+                for filename in self.get_managed_node_filenames())
+            index = NodeIndex.from_snapshot(snapshot, cluster_url,
+                                            host_to_file)
+            self._node_indexes[cluster_url] = index
+        return index
+
+    execute_cli_create_cmd = _topology_write('execute_cli_create_cmd')
+    execute_cli_update_cmd = _topology_write('execute_cli_update_cmd')
+    execute_cli_remove_cmd = _topology_write('execute_cli_remove_cmd')
+    execute_cli_load_cmd = _topology_write('execute_cli_load_cmd')
+    run_and_check_plan = _topology_change('run_and_check_plan')
+    wait_for_plan_state = _topology_change('wait_for_plan_state')
+    execute_cli_restoremodel_cmd = _topology_change(
+        'execute_cli_restoremodel_cmd')
+    execute_expand_script = _topology_change('execute_expand_script')
@@ -0,0 +1,395 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   NumThreads sweep of the VCS Application agent: the bulk online,
+            bulk offline and monitor cycle times of a number of generated
+            applications per NumThreads value, and the NumThreads
+            recommended per application count
+
+Usage:
+    python numthreads_benchmark.py [--apps N,N,...] [--threads FIRST:LAST]
+        [--template NAME] [--monitor-latency S] [--runs N] [--seed N]
+        [--json FILE] [RESULTS.json ...]
+"""
+import heapq
+import json
+import optparse
+import random
+import sys
+import time
+from cluster_common import RPM_DIR, VCS_BIN, percentile
+from polling import wait_for
+
+APP_COUNTS = (10, 50, 100, 200)
+THREAD_RANGE = (1, 30)
+# NumThreads of the Application agent when app_agent_num_threads is unset
+DEFAULT_NUM_THREADS = 10
+# MonitorInterval of the Application type: a monitor cycle must fit in it
+MONITOR_INTERVAL = 60
+# Bulk times within this fraction of the best of the sweep are good enough
+TOLERANCE = 0.1
+PHASES = ('online', 'offline', 'monitor')
+# Seconds of the start and stop entry points of the rpm_generator templates,
+# each confirmed by a monitor. The mock LSB scripts are Python scripts that
+# return at once, except the stop of test-lsb-off-del- that sleeps 300s.
+LATENCY_TEMPLATES = {
+    'test-lsb-': {'online': 0.2, 'offline': 0.2},
+    'test-lsb-off-del-': {'online': 0.2, 'offline': 300.2},
+}
+DEFAULT_TEMPLATE = 'test-lsb-'
+# Seconds of the status entry point, the monitor latency
+MONITOR_LATENCY = 0.2
+# Entry point times vary by this fraction either way
+JITTER = 0.25
+NUM_THREADS_CMD = VCS_BIN + 'hatype -display Application -attribute NumThreads'
+
+# Sweep rows measured by the running test run, in order
+NUMTHREADS_METRICS = []
+
+
+def makespan(durations, threads):
+    """
+    Return the seconds an agent with threads threads takes to run entry
+    points of the durations, queued together and each run by the first
+    free thread in queue order.
+    """
+    free_at = [0.0] * max(1, min(threads, len(durations)))
+    for duration in durations:
+        heapq.heappush(free_at, heapq.heappop(free_at) + duration)
+    return max(free_at) if durations else 0.0
+
+
+def draw_durations(apps, template=DEFAULT_TEMPLATE,
+                   monitor_latency=MONITOR_LATENCY, rand=None):
+    """
+    Return the online, offline and monitor entry point seconds of apps
+    applications of the latency template. An online or offline lasts its
+    template latency plus a monitor.
+    """
+    rand = rand or random.Random()
+    latencies = LATENCY_TEMPLATES[template]
+
+    def jitter(seconds):
+        """
+        Return the seconds varied by JITTER.
+        """
+        return seconds * rand.uniform(1 - JITTER, 1 + JITTER)
+
+    durations = dict((phase, [jitter(latencies[phase]) +
+                              jitter(monitor_latency) for _ in range(apps)])
+                     for phase in ('online', 'offline'))
+    durations['monitor'] = [jitter(monitor_latency) for _ in range(apps)]
+    return durations
+
+
+def simulate(app_counts=APP_COUNTS, thread_values=None,
+             template=DEFAULT_TEMPLATE, monitor_latency=MONITOR_LATENCY,
+             runs=5, seed=None):
+    """
+    Return the simulated sweep rows: the bulk online, bulk offline and
+    monitor cycle seconds, runs per application count and NumThreads
+    value. Every run draws its durations once and replays them at every
+    NumThreads value, so the values are compared on the same workload.
+    """
+    rand = random.Random(seed)
+    thread_values = thread_values or range(THREAD_RANGE[0],
+                                           THREAD_RANGE[1] + 1)
+    rows = []
+    for apps in app_counts:
+        for _ in range(runs):
+            durations = draw_durations(apps, template, monitor_latency, rand)
+            for threads in thread_values:
+                row = {'apps': apps, 'threads': threads}
+                for phase in PHASES:
+                    row[phase] = makespan(durations[phase], threads)
+                rows.append(row)
+    return rows
+
+
+def summarize(rows):
+    """
+    Return the median online, offline and monitor seconds of the rows per
+    application count and NumThreads value, in that order. Phases that were
+    not measured are None.
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['apps'], row['threads']), []).append(row)
+    summary = []
+    for apps, threads in sorted(groups):
+        group = groups[(apps, threads)]
+        entry = {'apps': apps, 'threads': threads, 'runs': len(group)}
+        for phase in PHASES:
+            entry[phase] = percentile([row[phase] for row in group
+                                       if row.get(phase) is not None], 50)
+        summary.append(entry)
+    return summary
+
+
+def recommend(summary, monitor_interval=MONITOR_INTERVAL,
+              tolerance=TOLERANCE):
+    """
+    Return the recommended NumThreads per application count: the smallest
+    value whose bulk online and offline are within tolerance of the best
+    of the sweep and whose monitor cycle fits in the monitor interval.
+    Fewer threads mean less agent memory and less load on the node, so
+    extra threads that do not shorten the bulk times are not worth it.
+    None when no value of the sweep qualifies.
+    """
+    recommended = {}
+    for apps in sorted(set(entry['apps'] for entry in summary)):
+        entries = [entry for entry in summary if entry['apps'] == apps]
+        best = dict((phase, min([entry[phase] for entry in entries
+                                 if entry[phase] is not None] or [None]))
+                    for phase in ('online', 'offline'))
+        recommended[apps] = None
+        for entry in sorted(entries, key=lambda item: item['threads']):
+            if all(best[phase] is None or
+                   entry[phase] <= best[phase] * (1 + tolerance)
+                   for phase in ('online', 'offline')) and \
+                    (entry['monitor'] is None or
+                     entry['monitor'] <= monitor_interval):
+                recommended[apps] = entry['threads']
+                break
+    return recommended
+
+
+def format_table(summary, recommended):
+    """
+    Return the lines of a table of the summarize output, with the
+    recommended NumThreads marked.
+    """
+    lines = ['{0:>6} {1:>8} {2:>5} {3:>9} {4:>9} {5:>9}'.format(
+        'apps', 'threads', 'runs', 'online', 'offline', 'monitor')]
+    for entry in summary:
+        lines.append('{0:>6} {1:>8} {2:>5} {3} {4}'.format(
+            entry['apps'], entry['threads'], entry['runs'],
+            ' '.join('{0:>9}'.format('-' if entry[phase] is None else
+                                     '{0:.1f}'.format(entry[phase]))
+                     for phase in PHASES),
+            '<- recommended' if recommended.get(entry['apps']) ==
+            entry['threads'] else '').rstrip())
+    return lines
+
+
+def parse_num_threads(lines):
+    """
+    Return the NumThreads of the NUM_THREADS_CMD output, or None.
+    """
+    for line in lines:
+        fields = line.split()
+        if fields[:2] == ['Application', 'NumThreads'] and len(fields) == 3:
+            return int(fields[2])
+    return None
+
+
+class NumThreadsBenchmarkMixin(object):
+    """
+    GenericTest mixin that sweeps the app_agent_num_threads of the cluster
+    and measures the bulk online and offline of a group of generated
+    applications at every value.
+    """
+
+    def read_num_threads(self, node):
+        """
+        Return the NumThreads of the Application agent on the node.
+        """
+        stdout, stderr, ret_code = self.run_command(node, NUM_THREADS_CMD,
+                                                    su_root=True)
+        self.assertEqual(0, ret_code, stderr)
+        return parse_num_threads(stdout)
+
+    def set_num_threads(self, ms_node, node, threads, plan_timeout_mins=20):
+        """
+        Set app_agent_num_threads of the cluster and check the agent of
+        the node uses it.
+        """
+        from test_constants import PLAN_COMPLETE
+        self.execute_cli_update_cmd(
+            ms_node, self.vcs_cluster_url,
+            'app_agent_num_threads={0}'.format(threads))
+        self.run_and_check_plan(ms_node, PLAN_COMPLETE, plan_timeout_mins)
+        self.assertEqual(threads, self.read_num_threads(node))
+
+    def deploy_benchmark_apps(self, ms_node, story, apps, valid_rpm=1,
+                              plan_timeout_mins=60):
+        """
+        Deploy the one node parallel clustered service CS_<story>_1 with
+        apps generated applications, e.g. valid_rpm 5 for applications
+        that take 300 seconds to stop.
+        """
+        from generate import generate_json, load_fixtures
+        from test_constants import PLAN_COMPLETE
+        nodes_urls = self.find(ms_node, self.vcs_cluster_url, 'node')
+        fixtures = load_fixtures(story, self.vcs_cluster_url, nodes_urls,
+                                 input_data=generate_json(
+                                     to_file=False, story=story,
+                                     vcs_length=1, app_length=apps,
+                                     hsc_length=apps, valid_rpm=valid_rpm,
+                                     add_to_cleanup=True))
+        self.apply_cs_and_apps_sg(ms_node, fixtures, RPM_DIR + '/')
+        self.run_and_check_plan(ms_node, PLAN_COMPLETE, plan_timeout_mins)
+        return fixtures
+
+    def remove_benchmark_apps(self, ms_node, fixtures_list,
+                              plan_timeout_mins=60):
+        """
+        Remove the clustered services deployed by deploy_benchmark_apps,
+        with their software services and packages, and delete the
+        app_agent_num_threads of the cluster when set, in one plan.
+        """
+        from test_constants import PLAN_COMPLETE
+        paths = []
+        for fixtures in fixtures_list:
+            paths.extend(service['vpath'] for service
+                         in fixtures['vcs-clustered-service'])
+            for service in fixtures['service']:
+                paths.extend([service['vpath'], service['package_vpath']])
+        for path in paths:
+            self.execute_cli_remove_cmd(ms_node, path, add_to_cleanup=False)
+        threads_set = self.get_props_from_url(
+            ms_node, self.vcs_cluster_url,
+            filter_prop='app_agent_num_threads') is not None
+        if threads_set:
+            self.execute_cli_update_cmd(ms_node, self.vcs_cluster_url,
+                                        'app_agent_num_threads',
+                                        action_del=True)
+        if paths or threads_set:
+            self.run_and_check_plan(ms_node, PLAN_COMPLETE, plan_timeout_mins,
+                                    add_to_cleanup=False)
+
+    def _switch_group(self, node, group_name, system, action, state,
+                      timeout):
+        """
+        Run hagrp -online or -offline and return the seconds until the
+        group shows the state on the system.
+        """
+        start = time.time()
+        _, stderr, ret_code = self.run_command(
+            node, '{0}hagrp -{1} {2} -sys {3}'.format(VCS_BIN, action,
+                                                      group_name, system),
+            su_root=True)
+        self.assertEqual(0, ret_code, stderr)
+
+        def reached():
+            """
+            Return True once the group shows the state.
+            """
+            stdout, _, _ = self.run_command(
+                node, '{0}hagrp -state {1} -sys {2}'.format(
+                    VCS_BIN, group_name, system), su_root=True)
+            return stdout[-1:] == ['|{0}|'.format(state)] or \
+                stdout[-1:] == [state]
+
+        self.assertTrue(wait_for(reached, timeout=timeout,
+                                 first_interval=0.5, max_interval=2,
+                                 description='{0} {1}'.format(group_name,
+                                                              action)))
+        return time.time() - start
+
+    def benchmark_num_threads(self, ms_node, node, apps, group_name, system,
+                              thread_values, runs=1, timeout=1800):
+        """
+        Measure the bulk offline and online of the group of apps
+        applications at every NumThreads value.
+
+        Args:
+            ms_node (str): Filename of the MS.
+            node (str): Filename of the node the VCS commands run on.
+            apps (int): Number of applications of the group.
+            group_name (str): VCS name of the group deployed by
+                deploy_benchmark_apps.
+            system (str): Hostname of the system the group is online on.
+            thread_values (list): NumThreads values to sweep.
+            runs (int): Offline and online cycles per value.
+            timeout (int): Seconds a bulk transition may take.
+
+        Returns:
+            list. The sweep rows, also kept in NUMTHREADS_METRICS. The
+            monitor cycle is not observable on a cluster and is None.
+        """
+        rows = []
+        for threads in thread_values:
+            self.set_num_threads(ms_node, node, threads)
+            for _ in range(runs):
+                row = {'apps': apps, 'threads': threads, 'monitor': None}
+                row['offline'] = self._switch_group(
+                    node, group_name, system, 'offline', 'OFFLINE', timeout)
+                row['online'] = self._switch_group(
+                    node, group_name, system, 'online', 'ONLINE', timeout)
+                NUMTHREADS_METRICS.append(row)
+                rows.append(row)
+                self.log('info', 'NumThreads {0} with {1} apps: online '
+                         '{2:.1f}s, offline {3:.1f}s'.format(
+                             threads, apps, row['online'], row['offline']))
+        return rows
+
+
+PARSER = optparse.OptionParser(
+    usage='%prog [options] [RESULTS.json ...]')
+PARSER.add_option('--apps', action='store', dest='apps', type='str',
+                  default=','.join(str(apps) for apps in APP_COUNTS),
+                  help='comma separated application counts')
+PARSER.add_option('--threads', action='store', dest='threads', type='str',
+                  default='{0}:{1}'.format(*THREAD_RANGE),
+                  help='FIRST:LAST NumThreads values to sweep')
+PARSER.add_option('--template', action='store', dest='template',
+                  choices=sorted(LATENCY_TEMPLATES),
+                  default=DEFAULT_TEMPLATE,
+                  help='latency template of the applications')
+PARSER.add_option('--monitor-latency', action='store',
+                  dest='monitor_latency', type='float',
+                  default=MONITOR_LATENCY,
+                  help='seconds of a monitor of an application')
+PARSER.add_option('--runs', action='store', dest='runs', type='int',
+                  default=5, help='simulated runs per setting')
+PARSER.add_option('--seed', action='store', dest='seed', type='int',
+                  help='seed of the simulated latencies')
+PARSER.add_option('--json', action='store', dest='json', type='str',
+                  help='write the rows, summary and recommendation here')
+
+
+def main(args=None):
+    """
+    Summarize the rows of the given results files, written by --json or
+    from NUMTHREADS_METRICS in the lab, or simulate a sweep when none is
+    given, and print the recommended NumThreads per application count.
+    """
+    opts, paths = PARSER.parse_args(args)
+    if paths:
+        rows = []
+        for path in paths:
+            with open(path) as results:
+                rows.extend(json.load(results)['rows'])
+    else:
+        try:
+            app_counts = [int(apps) for apps in opts.apps.split(',')]
+            first, last = [int(value) for value in opts.threads.split(':')]
+        except ValueError:
+            PARSER.error('--apps is N,N,... and --threads is FIRST:LAST')
+        rows = simulate(app_counts, range(first, last + 1), opts.template,
+                        opts.monitor_latency, opts.runs, opts.seed)
+    summary = summarize(rows)
+    recommended = recommend(summary)
+    print '\n'.join(format_table(summary, recommended))
+    top = max(entry['threads'] for entry in summary) if summary else None
+    for apps, threads in sorted(recommended.items()):
+        print 'Recommended NumThreads for {0} apps: {1}{2}'.format(
+            apps, 'none of the sweep' if threads is None else threads,
+            ', the top of the sweep' if threads == top else '')
+    if opts.json:
+        with open(opts.json, 'w') as out:
+            json.dump({'rows': rows, 'summary': summary,
+                       'recommended': recommended}, out, indent=2,
+                      sort_keys=True)
+    return 0 if None not in recommended.values() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Plan indexed by task description, node and phase, built from a
+            single show_plan output, with task ordering helpers
+"""
+import re
+
+LOCK_TASK = 'Lock VCS on node "{0}"'
+UNLOCK_TASK = 'Unlock VCS on node "{0}"'
+
+_NODE_REGEX = re.compile(r'on node "([^"]+)"', re.IGNORECASE)
+
+
+class PlanTask(object):
+    """
+    A single task of the plan. The order is the position of the task in
+    the whole plan, counted over all phases.
+    """
+
+    def __init__(self, phase, index, order, path, description):
+        self.phase = phase
+        self.index = index
+        self.order = order
+        self.path = path
+        self.description = description
+        match = _NODE_REGEX.search(description)
+        self.node = match.group(1) if match else None
+
+    def is_lock(self, node=None):
+        """
+        Return True if the task locks VCS on the node, or on any node.
+        """
+        return self.description.lower() == \
+            LOCK_TASK.format(node or self.node).lower()
+
+    def is_unlock(self, node=None):
+        """
+        Return True if the task unlocks VCS on the node, or on any node.
+        """
+        return self.description.lower() == \
+            UNLOCK_TASK.format(node or self.node).lower()
+
+    def __repr__(self):
+        return 'PlanTask({0}, {1}, {2})'.format(self.phase, self.index,
+                                                self.description)
+
+
+class PlanIndex(object):
+    """
+    The tasks of a plan as parsed by CLIUtils.parse_plan_output, indexed
+    by description, node and phase. Descriptions and node names are
+    matched case insensitively.
+    """
+
+    def __init__(self, parsed_plan):
+        self.tasks = []
+        self.by_description = {}
+        self.by_node = {}
+        self.by_phase = {}
+        for phase in sorted(parsed_plan):
+            for index in sorted(parsed_plan[phase]):
+                path, description = parsed_plan[phase][index]['DESC'][:2]
+                task = PlanTask(phase, index, len(self.tasks),
+                                path.strip(), description.strip())
+                self.tasks.append(task)
+                self.by_description.setdefault(
+                    task.description.lower(), []).append(task)
+                self.by_phase.setdefault(phase, []).append(task)
+                if task.node is not None:
+                    self.by_node.setdefault(task.node.lower(), []).append(
+                        task)
+
+    @classmethod
+    def from_test(cls, test, ms_node):
+        """
+        Build the index from one show_plan run through the given
+        GenericTest instance.
+        """
+        plan_stdout, _, _ = test.execute_cli_showplan_cmd(ms_node)
+        return cls(test.cli.parse_plan_output(plan_stdout))
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def task(self, description):
+        """
+        Return the first task with the description, or None.
+        """
+        tasks = self.by_description.get(description.lower())
+        return tasks[0] if tasks else None
+
+    def position(self, description):
+        """
+        Return the (phase, index) of the first task with the description.
+        """
+        task = self.task(description)
+        return (task.phase, task.index) if task else None
+
+    def task_at(self, phase, index):
+        """
+        Return the task at the phase and index.
+        """
+        for task in self.by_phase.get(phase, []):
+            if task.index == index:
+                return task
+        return None
+
+    def find(self, task_regex):
+        """
+        Return the first task whose description matches the regex.
+        """
+        for task in self.tasks:
+            if re.match(task_regex, task.description):
+                return task
+        return None
+
+    def tasks_on(self, node):
+        """
+        Return the tasks that name the node, in plan order.
+        """
+        return self.by_node.get(node.lower(), [])
+
+    def locked_before(self, task, node):
+        """
+        Return True if the last VCS lock or unlock of the node that comes
+        before the task is a lock.
+        """
+        for other in reversed(self.tasks_on(node)):
+            if other.order >= task.order:
+                continue
+            if other.is_lock(node):
+                return True
+            if other.is_unlock(node):
+                return False
+        return False
+
+    def unlocked_after(self, task, node):
+        """
+        Return True if the first VCS lock or unlock of the node that comes
+        after the task is an unlock.
+        """
+        for other in self.tasks_on(node):
+            if other.order <= task.order:
+                continue
+            if other.is_unlock(node):
+                return True
+            if other.is_lock(node):
+                return False
+        return False
+
+    def in_order(self, *descriptions):
+        """
+        Return True if tasks with the descriptions exist and come in the
+        given order, e.g. lock(n) < update(pkg, n) < unlock(n).
+        """
+        tasks = [self.task(description) for description in descriptions]
+        if None in tasks:
+            return False
+        orders = [task.order for task in tasks]
+        return orders == sorted(orders) and len(set(orders)) == len(orders)
@@ -0,0 +1,222 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Predicate based wait engine with exponential backoff, jitter,
+            a total deadline and per test wait metrics
+"""
+import random
+import threading
+import time
+from collections import defaultdict
+
+# Seconds spent waiting per test, keyed by test id
+WAIT_METRICS = defaultdict(list)
+
+# Succeeds when chronyd or ntpd report the clock as synchronised
+NTP_SYNC_CMD = ('/usr/bin/chronyc tracking 2>/dev/null | '
+                '/bin/grep -q "^Leap status *: Normal" || /usr/bin/ntpstat')
+
+
+class AttemptTimeout(Exception):
+    """
+    Raised when a single poll does not return within its time limit.
+    """
+    pass
+
+
+class WaitResult(object):
+    """
+    The outcome of a wait. It is truthy when the predicate was satisfied.
+    Every attempt is recorded as a tuple of the attempt number, the offset
+    from the start of the wait, the latency of the poll and its outcome.
+    """
+
+    def __init__(self, description):
+        self.description = description
+        self.success = False
+        self.value = None
+        self.elapsed = 0.0
+        self.attempts = []
+
+    def __nonzero__(self):
+        return self.success
+
+    __bool__ = __nonzero__
+
+    def summary(self):
+        """
+        Return a one line description of the wait.
+        """
+        return '{0}: {1} after {2} attempt(s) in {3:.1f}s'.format(
+            self.description or 'wait',
+            'satisfied' if self.success else 'timed out',
+            len(self.attempts), self.elapsed)
+
+
+def backoff_intervals(first_interval, max_interval, backoff, jitter,
+                      rand=random.random):
+    """
+    Yield the sleeps between polls. They start at first_interval and grow
+    by the backoff factor up to max_interval, each one randomised by
+    +/- jitter (a fraction of the interval).
+    """
+    interval = float(first_interval)
+    while True:
+        spread = interval * jitter * (2 * rand() - 1)
+        yield max(0.0, interval + spread)
+        interval = min(float(max_interval), interval * backoff)
+
+
+def _call_with_timeout(predicate, timeout):
+    """
+    Call the predicate in a helper thread and raise AttemptTimeout if it
+    does not return in time. The thread is left to finish on its own.
+    """
+    outcome = {}
+
+    def target():
+        """
+        Run the predicate and keep its result or exception.
+        """
+        try:
+            outcome['value'] = predicate()
+        except Exception as err:  # pylint: disable=broad-except
+            outcome['error'] = err
+
+    worker = threading.Thread(target=target)
+    worker.daemon = True
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise AttemptTimeout('Poll did not return in {0}s'.format(timeout))
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['value']
+
+
+def wait_for(predicate, timeout=300, first_interval=1, max_interval=30,
+             backoff=2.0, jitter=0.1, attempt_timeout=None, retry_on=(),
+             description='', log=None, metrics_key=None,
+             clock=None, sleep=None, rand=None):
+    """
+    Poll the predicate until it returns a truthy value or the deadline of
+    timeout seconds passes.
+
+    Args:
+        predicate (callable): Called without arguments, a truthy return
+            value ends the wait and is kept in WaitResult.value.
+        timeout (int): Total deadline of the wait in seconds.
+        first_interval (float): Sleep after the first unsuccessful poll.
+        max_interval (float): Upper limit of the sleep between polls.
+        backoff (float): Factor the sleep grows by after every poll.
+        jitter (float): Random fraction added to or taken from each sleep.
+        attempt_timeout (float): Optional limit of a single poll.
+        retry_on (tuple): Exceptions that count as "not ready yet". Any
+            other exception ends the wait and is raised.
+        description (str): Name of the wait used in the logs.
+        log (callable): Called as log(level, message), e.g. GenericTest.log.
+        metrics_key (str): Key under which the wait time is recorded in
+            WAIT_METRICS, e.g. the test id.
+
+    Returns:
+        WaitResult. Truthy if the predicate was satisfied.
+    """
+    clock = clock or time.time
+    sleep = sleep or time.sleep
+    rand = rand or random.random
+    result = WaitResult(description)
+    retry_on = tuple(retry_on) + (AttemptTimeout,)
+    start = clock()
+    deadline = start + timeout
+    intervals = backoff_intervals(first_interval, max_interval, backoff,
+                                  jitter, rand)
+    attempt = 0
+    while True:
+        attempt += 1
+        poll_start = clock()
+        try:
+            if attempt_timeout:
+                value = _call_with_timeout(predicate, attempt_timeout)
+            else:
+                value = predicate()
+            outcome = 'ready' if value else 'not ready'
+        except retry_on as err:
+            value = None
+            outcome = '{0}: {1}'.format(type(err).__name__, err)
+        now = clock()
+        result.attempts.append((attempt, poll_start - start,
+                                now - poll_start, outcome))
+        if log:
+            log('info', '{0} attempt {1}: {2} ({3:.1f}s)'.format(
+                description or 'wait', attempt, outcome, now - poll_start))
+        if value:
+            result.success = True
+            result.value = value
+            break
+        if now >= deadline:
+            break
+        sleep(min(next(intervals), deadline - now))
+    result.elapsed = clock() - start
+    if log:
+        log('info' if result.success else 'error', result.summary())
+    if metrics_key is not None:
+        WAIT_METRICS[metrics_key].append((description, result.elapsed,
+                                          result.success))
+    return result
+
+
+def total_wait_time(metrics_key):
+    """
+    Return the seconds spent waiting under the metrics key.
+    """
+    return sum(elapsed for _, elapsed, _ in WAIT_METRICS.get(metrics_key, []))
+
+
+class PollingMixin(object):
+    """
+    Mixin for GenericTest subclasses that provides wait_until and
+    readiness predicates, and logs the time every test spent waiting.
+    It must come before GenericTest in the list of base classes.
+    """
+
+    def tearDown(self):
+        """
+        Log the time the test spent in wait_until.
+        """
+        waits = WAIT_METRICS.get(self.id(), [])
+        self.log('info', 'Time spent waiting: {0:.1f}s in {1} wait(s)'.format(
+            total_wait_time(self.id()), len(waits)))
+        super(PollingMixin, self).tearDown()
+
+    def wait_until(self, predicate, **kwargs):
+        """
+        Run wait_for with the test logger and per test metrics.
+        """
+        kwargs.setdefault('log', self.log)
+        kwargs.setdefault('metrics_key', self.id())
+        return wait_for(predicate, **kwargs)
+
+    def command_succeeds(self, node, cmd, su_root=False):
+        """
+        Return a predicate that is True when cmd returns 0 on the node.
+        """
+        def predicate():
+            """
+            Run the command and check its return code.
+            """
+            _, _, ret_code = self.run_command(node, cmd, su_root=su_root)
+            return ret_code == 0
+        return predicate
+
+    def ntp_synchronised(self, node):
+        """
+        Return a predicate that is True once the clock of the node is
+        synchronised by chronyd or ntpd.
+        """
+        return self.command_succeeds(node, NTP_SYNC_CMD, su_root=True)
@@ -0,0 +1,183 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Reboot detection based on the kernel boot id with SSH port
+            readiness probing of the rebooted node only
+"""
+import socket
+import time
+from polling import wait_for
+
+BOOT_ID_PATH = '/proc/sys/kernel/random/boot_id'
+
+# Reboots measured by the running test run, in order
+REBOOT_METRICS = []
+
+
+def ssh_port_open(host, port=22, timeout=2):
+    """
+    Return True if a TCP connection to the port of the host is accepted
+    within timeout seconds.
+    """
+    try:
+        sock = socket.create_connection((host, port), timeout)
+    except (socket.error, socket.timeout):
+        return False
+    sock.close()
+    return True
+
+
+class RebootRecord(object):
+    """
+    Timings of a single reboot, in seconds since the epoch.
+    """
+
+    def __init__(self, node, boot_id_before, issued_at):
+        self.node = node
+        self.boot_id_before = boot_id_before
+        self.boot_id_after = None
+        self.issued_at = issued_at
+        self.down_at = None
+        self.ssh_ready_at = None
+        self.confirmed_at = None
+
+    @property
+    def rebooted(self):
+        """
+        True once a new boot id was read from the node.
+        """
+        return self.boot_id_after is not None and \
+            self.boot_id_after != self.boot_id_before
+
+    @property
+    def down_time(self):
+        """
+        Seconds between the SSH port closing and opening again.
+        """
+        if self.down_at is None or self.ssh_ready_at is None:
+            return None
+        return self.ssh_ready_at - self.down_at
+
+    @property
+    def time_to_ssh_ready(self):
+        """
+        Seconds between the reboot command and the SSH port opening again.
+        """
+        if self.ssh_ready_at is None:
+            return None
+        return self.ssh_ready_at - self.issued_at
+
+    def summary(self):
+        """
+        Return a one line description of the reboot.
+        """
+        def fmt(value):
+            """ Format an optional duration """
+            return 'n/a' if value is None else '{0:.1f}s'.format(value)
+        return '{0} {1}: down time {2}, SSH ready after {3}'.format(
+            self.node, 'rebooted' if self.rebooted else 'NOT rebooted',
+            fmt(self.down_time), fmt(self.time_to_ssh_ready))
+
+
+class RebootMixin(object):
+    """
+    Mixin for GenericTest subclasses that detects reboots by comparing the
+    kernel boot id before and after, probing only the SSH port of the
+    rebooted node while it is down. The pooled sessions of the rebooted
+    node are dropped once the SSH port is open again.
+    """
+
+    def read_boot_id(self, node):
+        """
+        Return the boot id of the running kernel of the node.
+        """
+        out, err, ret_code = self.run_command(
+            node, '/bin/cat {0}'.format(BOOT_ID_PATH))
+        self.assertEqual(0, ret_code)
+        self.assertEqual([], err)
+        self.assertNotEqual([], out)
+        return out[0].strip()
+
+    def wait_for_node_reboot(self, node, boot_id, issued_at=None,
+                             timeout=1800, port=22, probe_timeout=2):
+        """
+        Wait for the node to go down, for its SSH port to accept connections
+        again and for a boot id different from boot_id.
+
+        Args:
+            node (str): Filename of the rebooted node.
+            boot_id (str): Boot id read before the reboot was issued.
+            issued_at (float): Time the reboot was issued, defaults to now.
+            timeout (int): Deadline of the whole reboot in seconds.
+            port (int): Port that is probed, 22 by default.
+            probe_timeout (float): TCP connect timeout of a single probe.
+
+        Returns:
+            RebootRecord. The measured timings of the reboot.
+        """
+        issued_at = issued_at or time.time()
+        deadline = issued_at + timeout
+        host = self.get_node_att(node, 'ipv4')
+        record = RebootRecord(node, boot_id, issued_at)
+        common = {'log': self.log, 'metrics_key': self.id()}
+
+        went_down = wait_for(
+            lambda: not ssh_port_open(host, port, probe_timeout),
+            timeout=min(300, deadline - time.time()), first_interval=0.5,
+            max_interval=2, description='{0} going down'.format(node),
+            **common)
+        if went_down:
+            record.down_at = time.time()
+
+        if wait_for(lambda: ssh_port_open(host, port, probe_timeout),
+                    timeout=max(0, deadline - time.time()), first_interval=1,
+                    max_interval=10,
+                    description='{0} SSH ready'.format(node), **common):
+            record.ssh_ready_at = time.time()
+            self.reset_node_connection(node)
+
+            new_boot_id = wait_for(
+                lambda: self._new_boot_id(node, boot_id),
+                timeout=max(0, deadline - time.time()), first_interval=1,
+                max_interval=10, retry_on=(Exception,),
+                description='{0} new boot id'.format(node), **common)
+            if new_boot_id:
+                record.boot_id_after = new_boot_id.value
+                record.confirmed_at = time.time()
+
+        REBOOT_METRICS.append(record)
+        self.log('info' if record.rebooted else 'error', record.summary())
+        return record
+
+    def reset_node_connection(self, node):
+        """
+        Drop the pooled sessions to the node when the test set pools them,
+        so that the next command opens a new one. The connections to the
+        other nodes are left alone.
+        """
+        reset_node_session = getattr(self, 'reset_node_session', None)
+        if reset_node_session is not None:
+            reset_node_session(node)
+
+    def _new_boot_id(self, node, boot_id):
+        """
+        Return the boot id of the node if it differs from boot_id. A failed
+        read drops the pooled sessions of the node before it is retried,
+        so a stale session is not reused until the deadline. GenericTest
+        can only disconnect all nodes, so its connections are dropped only
+        when the read failed on a socket error.
+        """
+        try:
+            current = self.read_boot_id(node)
+        except Exception as err:
+            self.reset_node_connection(node)
+            if isinstance(err, socket.error):
+                self.disconnect_all_nodes()
+            raise
+        return current if current != boot_id else None
@@ -0,0 +1,166 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Runs a batch of commands on a node in one SSH round-trip through
+            the remote_batch_agent.py script and returns their results
+"""
+import base64
+import json
+import os
+
+AGENT_LOCAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'remote_batch_agent.py')
+AGENT_REMOTE_DIR = '/tmp'
+AGENT_REMOTE_PATH = AGENT_REMOTE_DIR + '/remote_batch_agent.py'
+# Return code of the batch command when the agent is not on the node
+AGENT_MISSING_RC = 97
+
+# Read only queries, safe to run concurrently on the node
+NAMED_QUERIES = {
+    'hares_display': '/opt/VRTS/bin/hares -display {0}',
+    'hares_value': '/opt/VRTS/bin/hares -value {0} {1}',
+    'hagrp_value': '/opt/VRTS/bin/hagrp -value {0} {1}',
+    'hagrp_state': '/opt/VRTS/bin/hagrp -state {0}',
+    'rpm_query': '/bin/rpm -q {0}',
+    'cat': '/bin/cat {0}',
+    'ifconfig': '/sbin/ifconfig {0}',
+}
+
+# Nodes the agent was copied to during this session
+_AGENT_NODES = set()
+
+
+class CommandResult(object):
+    """
+    The outcome of one command of a batch.
+    """
+
+    def __init__(self, stdout, stderr, rc, duration):
+        self.stdout = stdout
+        self.stderr = stderr
+        self.rc = rc
+        self.duration = duration
+
+    def __iter__(self):
+        """
+        Unpack as the (stdout, stderr, rc) tuple of run_command.
+        """
+        return iter((self.stdout, self.stderr, self.rc))
+
+    def __repr__(self):
+        return 'CommandResult(rc={0}, {1:.2f}s)'.format(self.rc,
+                                                        self.duration)
+
+
+def query(name, *args):
+    """
+    Return a batch command entry for the named read only query.
+    """
+    return {'cmd': NAMED_QUERIES[name].format(*args), 'parallel': True}
+
+
+def build_request(commands, parallel=False, workers=8):
+    """
+    Return the JSON request read by the agent. The commands are a dict of
+    command id to either a shell command or an entry made by query().
+    """
+    entries = []
+    for cmd_id in sorted(commands):
+        command = commands[cmd_id]
+        if isinstance(command, basestring):
+            command = {'cmd': command, 'parallel': parallel}
+        entry = dict(command, id=cmd_id)
+        entries.append(entry)
+    return json.dumps({'commands': entries, 'workers': workers})
+
+
+def parse_response(stdout):
+    """
+    Return the CommandResult of each command id from the agent output.
+    """
+    response = json.loads('\n'.join(stdout))
+    return dict((cmd_id, CommandResult(result['stdout'], result['stderr'],
+                                       result['rc'], result['duration']))
+                for cmd_id, result in response['results'].items())
+
+
+def parse_hares_display(lines):
+    """
+    Parse hares -display output into the format returned by
+    GenericTest.run_vcs_hares_display_command, a dict of attribute to a
+    list of {'RESOURCE', 'SYSTEM', 'VALUE'} dicts.
+    """
+    display = {}
+    for line in lines:
+        if not line.strip() or line.startswith('#'):
+            continue
+        fields = line.split(None, 3)
+        if len(fields) < 3:
+            continue
+        display.setdefault(fields[1], []).append(
+            {'RESOURCE': fields[0], 'SYSTEM': fields[2],
+             'VALUE': fields[3].strip() if len(fields) > 3 else ''})
+    return display
+
+
+class BatchAgentMixin(object):
+    """
+    GenericTest mixin that runs batches of commands on a node with one
+    run_command call. The agent is copied to each node once per session.
+    """
+
+    def install_batch_agent(self, node, force=False):
+        """
+        Copy the agent to the node unless it was copied already.
+        """
+        if force or node not in _AGENT_NODES:
+            self.assertTrue(self.copy_file_to(node, AGENT_LOCAL_PATH,
+                                              AGENT_REMOTE_DIR,
+                                              root_copy=True,
+                                              add_to_cleanup=False))
+            _AGENT_NODES.add(node)
+
+    def batch_run(self, node, commands, su_root=True, parallel=False,
+                  workers=8):
+        """
+        Run the commands, a dict of command id to command, on the node and
+        return a dict of command id to CommandResult. Plain commands run
+        one at a time unless parallel is set, queries always run
+        concurrently.
+        """
+        if not commands:
+            return {}
+        self.install_batch_agent(node)
+        payload = base64.b64encode(build_request(commands, parallel,
+                                                 workers))
+        cmd = ('[ -f {0} ] || exit {1}; echo {2} | /usr/bin/base64 -d | '
+               '/usr/bin/python {0}'.format(AGENT_REMOTE_PATH,
+                                            AGENT_MISSING_RC, payload))
+        stdout, stderr, rc = self.run_command(node, cmd, su_root=su_root)
+        if rc == AGENT_MISSING_RC:
+            # /tmp was cleaned, e.g. after a reboot of the node
+            self.install_batch_agent(node, force=True)
+            stdout, stderr, rc = self.run_command(node, cmd, su_root=su_root)
+        self.assertEqual(0, rc, 'Batch agent failed on {0}: {1}'.format(
+            node, stderr))
+        return parse_response(stdout)
+
+    def hares_display_batch(self, node, resources):
+        """
+        Return the parsed hares -display output of each resource, fetched
+        from the node in one batch.
+        """
+        results = self.batch_run(node, dict(
+            (res, query('hares_display', res)) for res in resources))
+        displays = {}
+        for res, result in results.items():
+            self.assertEqual(0, result.rc, 'hares -display {0} failed: '
+                             '{1}'.format(res, result.stderr))
+            displays[res] = parse_hares_display(result.stdout)
+        return displays
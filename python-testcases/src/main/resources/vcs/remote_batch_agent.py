@@ -0,0 +1,83 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Agent copied to the nodes that runs a batch of commands read as
+            JSON from stdin and prints their results as one JSON document
+
+Input:  {"commands": [{"id": "q1", "cmd": "rpm -q x", "parallel": true}],
+         "workers": 8}
+Output: {"results": {"q1": {"stdout": [...], "stderr": [...], "rc": 0,
+                           "duration": 0.01}}}
+The commands marked parallel run concurrently, the others then run one at
+a time in the given order.
+"""
+import json
+import subprocess
+import sys
+import threading
+import time
+
+
+def run(cmd):
+    """
+    Run the shell command and return its result dictionary.
+    """
+    start = time.time()
+    proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, universal_newlines=True)
+    stdout, stderr = proc.communicate()
+    return {'stdout': stdout.splitlines(), 'stderr': stderr.splitlines(),
+            'rc': proc.returncode, 'duration': time.time() - start}
+
+
+def run_batch(commands, workers=8):
+    """
+    Run the commands and return their results by command id.
+    """
+    results = {}
+    pending = [command for command in commands if command.get('parallel')]
+    lock = threading.Lock()
+
+    def worker():
+        """
+        Run parallel commands until there are none left.
+        """
+        while True:
+            with lock:
+                if not pending:
+                    return
+                command = pending.pop(0)
+            result = run(command['cmd'])
+            with lock:
+                results[command['id']] = result
+
+    threads = [threading.Thread(target=worker)
+               for _ in range(min(workers, len(pending)))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for command in commands:
+        if not command.get('parallel'):
+            results[command['id']] = run(command['cmd'])
+    return results
+
+
+def main():
+    """
+    Read the batch from stdin and print the results to stdout.
+    """
+    request = json.loads(sys.stdin.read())
+    results = run_batch(request['commands'], request.get('workers', 8))
+    sys.stdout.write(json.dumps({'results': results}) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
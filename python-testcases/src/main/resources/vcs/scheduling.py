@@ -0,0 +1,446 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Orders the tests of ordered_tcs.txt so that tests sharing a
+            topology and a baseline run together, from the requirements
+            read offline from the test set sources
+
+Usage:
+    python scheduling.py [--durations FILE] [--write] [--validate]
+"""
+import ast
+import json
+import optparse
+import os
+import sys
+
+LOCAL_DIR = os.path.dirname(os.path.abspath(__file__))
+ORDERED_TCS = os.path.join(LOCAL_DIR, 'ordered_tcs.txt')
+
+BASE = 'base'
+FOUR_NODE = 'four-node'
+CLOUD = 'cloud'
+PHYSICAL = 'physical'
+
+PHYSICAL_TAGS = ('physical', 'kgb-physical')
+EXPANSION_TAGS = ('expansion',)
+FENCING_TAGS = ('fencing',)
+# Methods whose use means the test needs the expanded cluster
+EXPANSION_CALLS = ('_is_model_expanded', '_four_node_expansion',
+                   'is_model_expanded', 'expand_cluster')
+# Methods whose use means the test leaves the cluster contracted again
+CONTRACTION_CALLS = ('_perform_cleanup', 'restore_snapshot',
+                     'restore_snapshot_and_recreate',
+                     'execute_and_wait_restore_snapshot')
+
+# Estimated seconds of every change of precondition between two tests
+TRANSITION_COSTS = {'platform': 36000, 'expansion': 3600,
+                    'contraction': 1800, 'fencing': 1800, 'redeploy': 600}
+# Estimated seconds of a test without a recorded duration
+DEFAULT_DURATION = 600
+
+
+def requires(**requirements):
+    """
+    Declare the preconditions of a test, or of every test of a test set
+    when applied to the class. The scheduler reads them from the source.
+
+    Args:
+        topology (str): BASE or FOUR_NODE.
+        platform (str): CLOUD or PHYSICAL.
+        fencing (bool): True if the test needs fencing configured.
+        baseline (str): Name of the fixture baseline the test needs
+            deployed. Tests sharing a baseline are run together.
+        after (str): Comma separated test set files, or file:test entries,
+            that must run before the test.
+    """
+    def decorate(obj):
+        """
+        Attach the requirements to the test or test set.
+        """
+        obj.requirements = dict(getattr(obj, 'requirements', {}),
+                                **requirements)
+        return obj
+    return decorate
+
+
+class TestEntry(object):
+    """
+    A test with the preconditions it needs and the topology it leaves.
+    """
+
+    def __init__(self, testset, name, tags=(), requirements=None,
+                 calls=(), class_name=None):
+        self.testset = testset
+        self.name = name
+        self.class_name = class_name
+        self.tags = tuple(tags)
+        requirements = requirements or {}
+        calls = set(calls)
+        self.platform = requirements.get('platform') or (
+            PHYSICAL if set(self.tags) & set(PHYSICAL_TAGS) else CLOUD)
+        self.topology = requirements.get('topology') or (
+            FOUR_NODE if set(self.tags) & set(EXPANSION_TAGS) or
+            calls & set(EXPANSION_CALLS) else BASE)
+        self.fencing = bool(requirements.get(
+            'fencing', set(self.tags) & set(FENCING_TAGS)))
+        self.baseline = requirements.get('baseline')
+        self.after = [item.strip() for item in
+                      requirements.get('after', '').split(',')
+                      if item.strip()]
+        self.leaves_topology = BASE if calls & set(CONTRACTION_CALLS) \
+            else self.topology
+
+    @property
+    def test_id(self):
+        """
+        The file:test name used in ordered_tcs.txt.
+        """
+        return '{0}:{1}'.format(self.testset, self.name)
+
+    @property
+    def nose_name(self):
+        """
+        The file:Class.test name that selects the test in nosetests.
+        """
+        return '{0}:{1}.{2}'.format(self.testset, self.class_name, self.name)
+
+    @property
+    def key(self):
+        """
+        The preconditions shared by tests that can run back to back.
+        """
+        return (self.platform, self.fencing, self.topology, self.baseline)
+
+    def __repr__(self):
+        return 'TestEntry({0})'.format(self.test_id)
+
+
+def _decorator_call(decorator, name):
+    """
+    Return the call node of the decorator if it is a call of name.
+    """
+    if isinstance(decorator, ast.Call) and \
+            getattr(decorator.func, 'id', None) == name:
+        return decorator
+    return None
+
+
+def _requirements(node):
+    """
+    Return the requirements declared with @requires on the node.
+    """
+    requirements = {}
+    for decorator in node.decorator_list:
+        call = _decorator_call(decorator, 'requires')
+        if call is not None:
+            for keyword in call.keywords:
+                requirements[keyword.arg] = ast.literal_eval(keyword.value)
+    return requirements
+
+
+def _self_calls(node):
+    """
+    Return the names of the self methods called in the function.
+    """
+    return set(call.func.attr for call in ast.walk(node)
+               if isinstance(call, ast.Call) and
+               isinstance(call.func, ast.Attribute) and
+               getattr(call.func.value, 'id', None) == 'self')
+
+
+def read_testset(path):
+    """
+    Return the TestEntry of every test of the test set file, in source
+    order. The calls of a test include the methods of its class it calls
+    through other methods, and those of the tearDown run after it.
+    """
+    with open(path) as source:
+        tree = ast.parse(source.read(), path)
+    testset = os.path.basename(path)
+    entries = []
+    for cls in tree.body:
+        if not isinstance(cls, ast.ClassDef):
+            continue
+        class_requirements = _requirements(cls)
+        methods = dict((node.name, node) for node in cls.body
+                       if isinstance(node, ast.FunctionDef))
+        direct_calls = dict((name, _self_calls(node))
+                            for name, node in methods.items())
+        for node in cls.body:
+            if not isinstance(node, ast.FunctionDef) or \
+                    not node.name.startswith('test'):
+                continue
+            calls = set()
+            pending = [name for name in (node.name, 'tearDown')
+                       if name in methods]
+            while pending:
+                for called in direct_calls.get(pending.pop(), ()):
+                    if called not in calls:
+                        calls.add(called)
+                        pending.append(called)
+            tags = []
+            for decorator in node.decorator_list:
+                call = _decorator_call(decorator, 'attr')
+                if call is not None:
+                    tags.extend(arg.s for arg in call.args
+                                if isinstance(arg, ast.Str))
+            requirements = dict(class_requirements, **_requirements(node))
+            entries.append(TestEntry(testset, node.name, tags, requirements,
+                                     calls, cls.name))
+    return entries
+
+
+def read_ordered_tcs(path=ORDERED_TCS):
+    """
+    Return the suites of the file as a list of (header, [test ids]).
+    """
+    suites = []
+    with open(path) as ordered:
+        for line in ordered:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('#'):
+                suites.append((line, []))
+            else:
+                if not suites:
+                    suites.append(('', []))
+                suites[-1][1].append(line)
+    return suites
+
+
+def load_entries(test_ids, testset_dir=LOCAL_DIR):
+    """
+    Return the TestEntry of each test id, read from the test set sources.
+    """
+    by_id = {}
+    for testset in sorted(set(test_id.split(':')[0] for test_id in test_ids)):
+        for entry in read_testset(os.path.join(testset_dir, testset)):
+            by_id[entry.test_id] = entry
+    missing = [test_id for test_id in test_ids if test_id not in by_id]
+    if missing:
+        raise ValueError('Tests not found: {0}'.format(', '.join(missing)))
+    return [by_id[test_id] for test_id in test_ids]
+
+
+def transitions(state, entry):
+    """
+    Return the names of the precondition changes needed to run the entry
+    from the state, a (platform, fencing, topology, baseline) tuple.
+    """
+    platform, fencing, topology, baseline = state
+    changes = []
+    if entry.platform != platform:
+        changes.append('platform')
+    if entry.fencing != fencing:
+        changes.append('fencing')
+    if entry.topology != topology:
+        changes.append('expansion' if entry.topology == FOUR_NODE
+                       else 'contraction')
+    if entry.baseline is not None and entry.baseline != baseline:
+        changes.append('redeploy')
+    return changes
+
+
+def next_state(state, entry):
+    """
+    Return the state after the entry has run.
+    """
+    baseline = entry.baseline or state[3]
+    if entry.leaves_topology != entry.topology:
+        baseline = None
+    return (entry.platform, entry.fencing, entry.leaves_topology, baseline)
+
+
+def predecessors(entries):
+    """
+    Return, by test id, the ids of the tests that must run first: the
+    earlier tests of the same test set, the earlier tests with the same
+    preconditions and the tests named in after.
+    """
+    preds = {}
+    for num, entry in enumerate(entries):
+        earlier = entries[:num]
+        preds[entry.test_id] = set(
+            other.test_id for other in earlier
+            if other.testset == entry.testset or other.key == entry.key)
+        for after in entry.after:
+            preds[entry.test_id].update(
+                other.test_id for other in entries if other is not entry and
+                after in (other.testset, other.test_id))
+    return preds
+
+
+class Plan(object):
+    """
+    An order of tests with the precondition changes between them and the
+    estimated duration.
+    """
+
+    def __init__(self, entries, durations=None, costs=None,
+                 initial_state=(CLOUD, False, BASE, None)):
+        self.entries = list(entries)
+        self.durations = durations or {}
+        self.costs = costs or TRANSITION_COSTS
+        self.steps = []
+        state = initial_state
+        for entry in self.entries:
+            changes = transitions(state, entry)
+            self.steps.append((entry, changes))
+            state = next_state(state, entry)
+
+    def duration(self, entry):
+        """
+        Return the recorded or default duration of the entry in seconds.
+        """
+        return self.durations.get(entry.test_id, DEFAULT_DURATION)
+
+    def counts(self):
+        """
+        Return the number of each precondition change in the plan.
+        """
+        counts = dict((change, 0) for change in self.costs)
+        for _, changes in self.steps:
+            for change in changes:
+                counts[change] += 1
+        return counts
+
+    @property
+    def estimated_seconds(self):
+        """
+        Test durations plus the cost of the precondition changes.
+        """
+        return sum(self.duration(entry) + sum(self.costs[change]
+                                              for change in changes)
+                   for entry, changes in self.steps)
+
+    def lines(self):
+        """
+        Return the plan as ordered_tcs.txt lines, with the precondition
+        changes and the estimated start of every test as comments.
+        """
+        lines = []
+        elapsed = 0
+        for entry, changes in self.steps:
+            if changes:
+                lines.append('# {0}'.format(', '.join(changes)))
+                elapsed += sum(self.costs[change] for change in changes)
+            lines.append('{0}  # +{1}m'.format(entry.test_id,
+                                               int(elapsed // 60)))
+            elapsed += self.duration(entry)
+        return lines
+
+
+def schedule(entries, durations=None, costs=None):
+    """
+    Return the Plan that runs the entries in the order of fewest
+    precondition changes. At every step the ready test with the cheapest
+    changes is run, the earliest given one on a tie.
+    """
+    costs = costs or TRANSITION_COSTS
+    preds = predecessors(entries)
+    remaining = list(entries)
+    done = set()
+    order = []
+    state = (CLOUD, False, BASE, None)
+    while remaining:
+        ready = [entry for entry in remaining
+                 if preds[entry.test_id] <= done]
+        if not ready:
+            raise ValueError('Circular test requirements: {0}'.format(
+                remaining))
+        entry = min(ready, key=lambda item: sum(
+            costs[change] for change in transitions(state, item)))
+        remaining.remove(entry)
+        done.add(entry.test_id)
+        order.append(entry)
+        state = next_state(state, entry)
+    return Plan(order, durations, costs)
+
+
+def validate(original, plan):
+    """
+    Check the plan against the original order and return a list of
+    problems: tests added or lost, requirements not met, or a longer
+    estimated duration.
+    """
+    problems = []
+    original_ids = [entry.test_id for entry in original]
+    planned_ids = [entry.test_id for entry in plan.entries]
+    if sorted(original_ids) != sorted(planned_ids):
+        problems.append('Planned tests differ from the original tests')
+    position = dict((test_id, num) for num, test_id in enumerate(planned_ids))
+    for test_id, preds in predecessors(original).items():
+        for pred in preds:
+            if position.get(pred, -1) > position.get(test_id, -1):
+                problems.append('{0} runs before {1}'.format(test_id, pred))
+    before = Plan(original, plan.durations, plan.costs)
+    if plan.estimated_seconds > before.estimated_seconds:
+        problems.append('Plan takes longer than the original order: '
+                        '{0}s > {1}s'.format(plan.estimated_seconds,
+                                             before.estimated_seconds))
+    return problems
+
+
+def load_durations(path):
+    """
+    Return the recorded test durations in seconds by file:test id from a
+    JSON file.
+    """
+    with open(path) as durations:
+        return json.load(durations)
+
+
+PARSER = optparse.OptionParser()
+PARSER.add_option('--durations', action='store', dest='durations',
+                  type='str', help='JSON file of recorded durations in '
+                  'seconds by file:test')
+PARSER.add_option('--write', action='store_true', dest='write',
+                  default=False, help='rewrite ordered_tcs.txt in the '
+                  'scheduled order')
+PARSER.add_option('--validate', action='store_true', dest='validate',
+                  default=False, help='fail if the schedule is not valid '
+                  'or not shorter than the current order')
+
+
+def main(args=None):
+    """
+    Print the scheduled plan of every suite of ordered_tcs.txt.
+    """
+    opts = PARSER.parse_args(args)[0]
+    durations = load_durations(opts.durations) if opts.durations else {}
+    output, failed = [], False
+    for header, test_ids in read_ordered_tcs():
+        original = load_entries(test_ids)
+        plan = schedule(original, durations)
+        before = Plan(original, durations)
+        output.append(header)
+        output.extend(line.split('  #')[0] if opts.write else line
+                      for line in plan.lines())
+        print '{0}\n  {1} tests, estimated {2:.1f}h (was {3:.1f}h), ' \
+            'changes {4} (were {5})'.format(
+                header, len(plan.entries), plan.estimated_seconds / 3600.0,
+                before.estimated_seconds / 3600.0, plan.counts(),
+                before.counts())
+        if opts.validate:
+            for problem in validate(original, plan):
+                failed = True
+                print '  INVALID: {0}'.format(problem)
+    if opts.write:
+        with open(ORDERED_TCS, 'w') as ordered:
+            ordered.write('\n'.join(line for line in output
+                                    if not line.startswith('# ')) + '\n')
+    else:
+        print '\n'.join(output)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,368 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Process level pool of authenticated SSH sessions keyed by host
+            and user, with keepalives and a persistent root shell per
+            session so su_root commands skip the su handshake
+"""
+import os
+import re
+import time
+import uuid
+
+# Seconds between SSH keepalives, and idle time after which a session is
+# probed before it is reused
+KEEPALIVE_INTERVAL = 30
+CONNECT_TIMEOUT = 20
+COMMAND_TIMEOUT = 600
+SU_PROMPT = 'assword:'
+# End of the root prompt printed once su has started the root shell, and
+# the messages su prints instead when it fails
+ROOT_PROMPT = '# '
+SU_FAILURES = ('Authentication failure', 'incorrect password', 'Sorry')
+# Executables whose commands are left to GenericTest.run_command: litp
+# commands keep their cleanup and commands that end the session are not
+# framed in the shell
+UNPOOLED_COMMANDS = ('litp', 'reboot', 'shutdown', 'halt', 'poweroff')
+# run_command keyword arguments the pool handles, calls with any other go
+# to GenericTest.run_command
+POOLED_KWARGS = ('logging',)
+# Set once in the root shell so commands on the PTY never wait in a pager
+SHELL_SETUP = ("unset HISTFILE; export PS1='' PS2='' PAGER=cat "
+               "SYSTEMD_PAGER=; stty -echo")
+
+
+_COMMAND_SEPARATOR_REGEX = re.compile(r'[;&|()]')
+
+
+class SessionError(Exception):
+    """
+    Raised when a pooled session fails. The session is dropped from the
+    pool and reconnected on next use.
+    """
+    pass
+
+
+def command_names(cmd):
+    """
+    Return the executable names of a command line: the first token of
+    every command separated by ;, &, | or a subshell, without its path.
+    """
+    names = []
+    for command in _COMMAND_SEPARATOR_REGEX.split(cmd):
+        tokens = command.split()
+        if tokens:
+            names.append(os.path.basename(tokens[0]))
+    return names
+
+
+def paramiko_connect(host, user, password, port=22,
+                     timeout=CONNECT_TIMEOUT):
+    """
+    Open an authenticated paramiko SSHClient to the host.
+    """
+    import paramiko
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client.connect(host, port=port, username=user, password=password,
+                   timeout=timeout, allow_agent=False, look_for_keys=False)
+    client.get_transport().set_keepalive(KEEPALIVE_INTERVAL)
+    return client
+
+
+class RootShell(object):
+    """
+    An interactive shell on a session escalated once with su. Commands are
+    framed by unique markers so their stdout, stderr and return code can be
+    told apart on the single channel. Every command runs in a subshell
+    started from the root home directory, so an exit, cd or export in one
+    command does not leak into the next.
+    """
+
+    def __init__(self, channel, root_password, timeout=COMMAND_TIMEOUT):
+        self.channel = channel
+        self.timeout = timeout
+        self._buffer = ''
+        channel.settimeout(timeout)
+        channel.send('su -\n')
+        self._read_until(SU_PROMPT)
+        channel.send(root_password + '\n')
+        # su may flush what is typed before the root shell starts, so the
+        # setup is only sent once the root prompt is printed
+        output = self._read_until(ROOT_PROMPT, *SU_FAILURES)
+        if not output.endswith(ROOT_PROMPT):
+            raise SessionError('su failed: {0}'.format(output.strip()))
+        channel.send(SHELL_SETUP + '\n')
+        self._sync()
+        stdout, _, _ = self.run('id -u')
+        if stdout != ['0']:
+            raise SessionError('su did not give a root shell, uid {0}'.format(
+                ' '.join(stdout)))
+
+    @property
+    def closed(self):
+        """
+        True if the channel of the shell can no longer be used.
+        """
+        return self.channel.closed or self.channel.exit_status_ready()
+
+    def _read_until(self, *markers):
+        """
+        Return the output received up to and including the first of the
+        markers.
+        """
+        deadline = time.time() + self.timeout
+        while not any(marker in self._buffer for marker in markers):
+            if self.channel.closed or time.time() > deadline:
+                raise SessionError('Root shell closed before "{0}"'.format(
+                    '" or "'.join(markers)))
+            data = self.channel.recv(65536)
+            if not data:
+                raise SessionError('Root shell closed')
+            self._buffer += data.replace('\r', '')
+        end = min(self._buffer.index(marker) + len(marker)
+                  for marker in markers if marker in self._buffer)
+        output, self._buffer = self._buffer[:end], self._buffer[end:]
+        return output
+
+    def _sync(self):
+        """
+        Drop everything printed before the shell became ready.
+        """
+        token = uuid.uuid4().hex
+        self.channel.send('echo __READY_{0}__\n'.format(token))
+        self._read_until('__READY_{0}__\n'.format(token))
+
+    def run(self, cmd):
+        """
+        Run the command as root and return (stdout, stderr, rc) in the
+        format of GenericTest.run_command.
+        """
+        token = uuid.uuid4().hex
+        err_file = '/tmp/.session_pool_{0}'.format(token)
+        self.channel.send(
+            'cd; ( {cmd}\n) 2>{err} </dev/null; echo __RC_{tok}__$?; '
+            'cat {err}; rm -f {err}; echo __END_{tok}__\n'.format(
+                cmd=cmd, err=err_file, tok=token))
+        output = self._read_until('__END_{0}__\n'.format(token))
+        stdout, rest = output.split('__RC_{0}__'.format(token), 1)
+        rc, stderr = rest.split('\n', 1)
+        stderr = stderr[:-len('__END_{0}__\n'.format(token))]
+        return stdout.splitlines(), stderr.splitlines(), int(rc)
+
+
+class PooledSession(object):
+    """
+    An authenticated SSH session to a host as a user.
+    """
+
+    def __init__(self, client, setup_time):
+        self.client = client
+        self.setup_time = setup_time
+        self.last_used = time.time()
+        self.root_shell = None
+
+    def is_alive(self):
+        """
+        Return True if the transport is up. A session idle for longer than
+        the keepalive interval is probed with an ignore message first.
+        """
+        transport = self.client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        if time.time() - self.last_used > KEEPALIVE_INTERVAL:
+            try:
+                transport.send_ignore()
+            except Exception:  # pylint: disable=broad-except
+                return False
+        return True
+
+    def run(self, cmd, timeout=COMMAND_TIMEOUT):
+        """
+        Run the command on a new channel of the session and return
+        (stdout, stderr, rc).
+        """
+        self.last_used = time.time()
+        _, stdout, stderr = self.client.exec_command(cmd, timeout=timeout)
+        rc = stdout.channel.recv_exit_status()
+        return (stdout.read().splitlines(), stderr.read().splitlines(), rc)
+
+    def close(self):
+        """
+        Close the session and its root shell.
+        """
+        try:
+            self.client.close()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+
+class SessionPool(object):
+    """
+    Authenticated sessions keyed by (host, user), shared by every test of
+    the process. A failed session is reconnected on its own, the other
+    sessions are left alone.
+    """
+
+    def __init__(self, connect=paramiko_connect):
+        self.connect = connect
+        self.sessions = {}
+        self.counters = {'connections': 0, 'reconnections': 0, 'reuses': 0,
+                         'root_shells': 0, 'su_skipped': 0}
+        self.setup_times = []
+        self.su_times = []
+
+    def session(self, host, user, password):
+        """
+        Return a live session to the host as the user, connecting only if
+        there is none or the pooled one has failed.
+        """
+        key = (host, user)
+        session = self.sessions.get(key)
+        if session is not None and session.is_alive():
+            self.counters['reuses'] += 1
+            return session
+        if session is not None:
+            self.counters['reconnections'] += 1
+            session.close()
+        start = time.time()
+        client = self.connect(host, user, password)
+        session = PooledSession(client, time.time() - start)
+        self.setup_times.append(session.setup_time)
+        self.counters['connections'] += 1
+        self.sessions[key] = session
+        return session
+
+    def run(self, host, user, password, cmd, root_password=None):
+        """
+        Run the command on the host and return (stdout, stderr, rc). With
+        a root password the command runs in the persistent root shell of
+        the session.
+        """
+        session = self.session(host, user, password)
+        try:
+            if root_password is None:
+                return session.run(cmd)
+            if session.root_shell is None or session.root_shell.closed:
+                start = time.time()
+                session.root_shell = RootShell(
+                    session.client.invoke_shell(width=1000), root_password)
+                self.su_times.append(time.time() - start)
+                self.counters['root_shells'] += 1
+            else:
+                self.counters['su_skipped'] += 1
+            session.last_used = time.time()
+            return session.root_shell.run(cmd)
+        except Exception as error:
+            self.drop(host)
+            raise SessionError('{0}@{1}: {2}'.format(user, host, error))
+
+    def drop(self, host):
+        """
+        Close and forget every session to the host.
+        """
+        for key in [key for key in self.sessions if key[0] == host]:
+            self.sessions.pop(key).close()
+
+    def close_all(self):
+        """
+        Close every session of the pool.
+        """
+        for host in set(key[0] for key in self.sessions):
+            self.drop(host)
+
+    def stats(self):
+        """
+        Return the pool counters with the total setup time spent and an
+        estimate of the setup time saved by reusing sessions and root
+        shells.
+        """
+        def mean(times):
+            """ Mean of the times, 0 if there are none """
+            return sum(times) / len(times) if times else 0.0
+        stats = dict(self.counters)
+        stats['setup_seconds'] = sum(self.setup_times) + sum(self.su_times)
+        stats['saved_seconds'] = (
+            stats['reuses'] * mean(self.setup_times) +
+            stats['su_skipped'] * mean(self.su_times))
+        return stats
+
+
+# The pool shared by every test set of the process
+SESSION_POOL = SessionPool()
+
+
+class SessionPoolMixin(object):
+    """
+    Mixin for GenericTest subclasses that sends run_command through the
+    process level SESSION_POOL. It must come before GenericTest in the list
+    of base classes. The UNPOOLED_COMMANDS, calls with keyword arguments
+    other than POOLED_KWARGS, and commands to nodes whose credentials are
+    not known, go through GenericTest.run_command as before.
+    """
+
+    session_pool = SESSION_POOL
+
+    def _pool_credentials(self, node):
+        """
+        Return (host, user, password, root password) of the node, or None
+        if they are not all known.
+        """
+        try:
+            creds = tuple(self.get_node_att(node, att) for att in
+                          ('ipv4', 'username', 'password', 'rootpw'))
+        except Exception:  # pylint: disable=broad-except
+            return None
+        return creds if None not in creds else None
+
+    def run_command(self, node, cmd, su_root=False, default_asserts=False,
+                    **kwargs):
+        """
+        Pooled run_command, see GenericTest.run_command.
+        """
+        creds = self._pool_credentials(node)
+        if creds is None or set(command_names(cmd)) & \
+                set(UNPOOLED_COMMANDS) or \
+                set(kwargs) - set(POOLED_KWARGS):
+            return super(SessionPoolMixin, self).run_command(
+                node, cmd, su_root=su_root, default_asserts=default_asserts,
+                **kwargs)
+        host, user, password, root_password = creds
+        stdout, stderr, rc = self.session_pool.run(
+            host, user, password, cmd,
+            root_password=root_password if su_root else None)
+        if kwargs.get('logging', True):
+            self.log('info', '[{0}] {1}{2} -> rc {3}'.format(
+                node, '(root) ' if su_root else '', cmd, rc))
+        if default_asserts:
+            self.assertEqual(0, rc)
+            self.assertEqual([], stderr)
+        return stdout, stderr, rc
+
+    def reset_node_session(self, node):
+        """
+        Drop the pooled sessions to the node only, e.g. after it rebooted.
+        """
+        creds = self._pool_credentials(node)
+        if creds is not None:
+            self.session_pool.drop(creds[0])
+
+    def tearDown(self):
+        """
+        Log the pool connection counts and the setup time saved so far.
+        """
+        stats = self.session_pool.stats()
+        self.log('info', 'SSH session pool: {0} connections, {1} '
+                 'reconnections, {2} reuses, {3} root shells, {4} su '
+                 'skipped, {5:.1f}s setup, {6:.1f}s saved'.format(
+                     stats['connections'], stats['reconnections'],
+                     stats['reuses'], stats['root_shells'],
+                     stats['su_skipped'], stats['setup_seconds'],
+                     stats['saved_seconds']))
+        super(SessionPoolMixin, self).tearDown()
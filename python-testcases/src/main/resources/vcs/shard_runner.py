@@ -0,0 +1,361 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Runs a suite of ordered_tcs.txt on several independent
+            deployments at once, one nosetests process per deployment,
+            and merges the xunit reports into one
+
+Usage:
+    python shard_runner.py --shard NAME=DIR[:CAPABILITY,...] ...
+        --command COMMAND [--suite NAME] [--history FILE] [--output FILE]
+        [--dry-run]
+"""
+import optparse
+import os
+import shlex
+import subprocess
+import sys
+import time
+from xml.etree import ElementTree
+from duration_history import DurationHistory
+from scheduling import (CLOUD, FOUR_NODE, LOCAL_DIR, Plan, load_entries,
+                        read_ordered_tcs, schedule)
+
+FENCING = 'fencing'
+DEFAULT_CAPABILITIES = (CLOUD, FOUR_NODE, FENCING)
+DEFAULT_SUITE = 'ERIClitpvcs'
+DEFAULT_OUTPUT = 'nosetests.xml'
+# Test sets that prepare a deployment for the test sets run after them.
+# They are run on every shard that needs them instead of keeping all
+# their dependants on one shard.
+SHARED_TESTSETS = ('testset_vcs_setup.py',)
+# Placeholders of the command run per shard. The command must use
+# {connection_dir} to point the test framework at the deployment of the
+# shard, or every shard would run against the same deployment.
+COMMAND_PLACEHOLDERS = ('{shard}', '{connection_dir}', '{report}',
+                        '{tests}')
+
+
+class Shard(object):
+    """
+    An independent deployment the tests can run on, with the tests
+    assigned to it.
+    """
+
+    def __init__(self, name, connection_dir,
+                 capabilities=DEFAULT_CAPABILITIES):
+        self.name = name
+        self.connection_dir = connection_dir
+        self.capabilities = set(capabilities)
+        self.entries = []
+        self.load = 0
+
+    @classmethod
+    def parse(cls, spec):
+        """
+        Return the Shard of a NAME=DIR[:CAPABILITY,...] option value.
+        """
+        name, _, rest = spec.partition('=')
+        connection_dir, _, capabilities = rest.partition(':')
+        if not name or not connection_dir:
+            raise ValueError('Shard is not NAME=DIR[:CAPABILITY,...]: '
+                             '{0}'.format(spec))
+        if capabilities:
+            return cls(name, connection_dir, capabilities.split(','))
+        return cls(name, connection_dir)
+
+    def can_run(self, needs):
+        """
+        Return True if the deployment provides every need.
+        """
+        return needs <= self.capabilities
+
+    def __repr__(self):
+        return 'Shard({0})'.format(self.name)
+
+
+def needs_of(entries):
+    """
+    Return the capabilities a deployment needs to run the entries.
+    """
+    needs = set()
+    for entry in entries:
+        needs.add(entry.platform)
+        if entry.topology == FOUR_NODE:
+            needs.add(FOUR_NODE)
+        if entry.fencing:
+            needs.add(FENCING)
+    return needs
+
+
+def testset_groups(entries, shared=SHARED_TESTSETS):
+    """
+    Return the entries split into groups that must run on the same
+    deployment: a test set with the test sets it must run after or before,
+    other than the shared test sets, which are left out of the groups.
+    Groups are in the order of their first entry.
+    """
+    entries = [entry for entry in entries if entry.testset not in shared]
+    group_of = dict((entry.testset, entry.testset) for entry in entries)
+
+    def root(testset):
+        """
+        Return the group the test set is in.
+        """
+        while group_of[testset] != testset:
+            testset = group_of[testset]
+        return testset
+
+    for entry in entries:
+        for after in entry.after:
+            testset = after.split(':')[0]
+            if testset in group_of:
+                group_of[root(testset)] = root(entry.testset)
+    groups = {}
+    order = []
+    for entry in entries:
+        group = root(entry.testset)
+        if group not in groups:
+            groups[group] = []
+            order.append(group)
+        groups[group].append(entry)
+    return [groups[name] for name in order]
+
+
+def shared_needed(group, shared=SHARED_TESTSETS):
+    """
+    Return the shared test sets the entries of the group run after.
+    """
+    return set(after.split(':')[0] for entry in group
+               for after in entry.after) & set(shared)
+
+
+def assign(entries, shards, durations=None, shared=SHARED_TESTSETS):
+    """
+    Assign the groups of entries to the shards, longest group first to the
+    capable shard with the least work, and schedule the tests of every
+    shard. The shared test sets a group needs are added to its shard.
+    Entries keep their relative order within a shard.
+    """
+    durations = durations or {}
+    groups = testset_groups(entries, shared)
+    costs = [schedule(group, durations).estimated_seconds
+             for group in groups]
+    assigned = dict((shard.name, []) for shard in shards)
+    for num in sorted(range(len(groups)), key=lambda n: -costs[n]):
+        needs = needs_of(groups[num])
+        capable = [shard for shard in shards if shard.can_run(needs)]
+        if not capable:
+            raise ValueError('No shard provides {0} for {1}'.format(
+                ', '.join(sorted(needs)),
+                ', '.join(sorted(set(e.testset for e in groups[num])))))
+        shard = min(capable, key=lambda item: item.load)
+        assigned[shard.name].append(num)
+        shard.load += costs[num]
+    for shard in shards:
+        nums = assigned[shard.name]
+        needed = set().union(*[shared_needed(groups[num], shared)
+                               for num in nums])
+        shard_entries = [entry for entry in entries
+                         if entry.testset in needed or any(
+                             entry in groups[num] for num in nums)]
+        plan = schedule(shard_entries, durations)
+        shard.entries = plan.entries
+        shard.load = plan.estimated_seconds
+    return shards
+
+
+def check_command(command):
+    """
+    Raise ValueError unless the command runs the tests against the
+    connection directory of the shard.
+    """
+    if not command or '{connection_dir}' not in command:
+        raise ValueError('The command run per shard must use '
+                         '{{connection_dir}}: {0}'.format(command))
+
+
+def start_shard(shard, report, command, cwd=LOCAL_DIR):
+    """
+    Start the nosetests process of the shard and return the Popen object.
+    The output of the process goes to the report path with a .log suffix.
+    """
+    check_command(command)
+    args = [arg.format(shard=shard.name,
+                       connection_dir=shard.connection_dir,
+                       report=report, tests='{tests}')
+            for arg in shlex.split(command)]
+    if '{tests}' in args:
+        position = args.index('{tests}')
+        args[position:position + 1] = [entry.nose_name
+                                       for entry in shard.entries]
+    env = dict(os.environ, VCS_SHARD=shard.name,
+               VCS_SHARD_CONNECTION_DIR=shard.connection_dir)
+    log = open(report + '.log', 'w')
+    try:
+        return subprocess.Popen(args, cwd=cwd, env=env, stdout=log,
+                                stderr=subprocess.STDOUT)
+    finally:
+        log.close()
+
+
+def _outcome_rank(testcase):
+    """
+    Return how bad the outcome of the testcase element is.
+    """
+    for rank, child in ((3, 'error'), (2, 'failure'), (1, 'skipped')):
+        if testcase.find(child) is not None:
+            return rank
+    return 0
+
+
+def merge_reports(reports, output):
+    """
+    Merge the xunit reports of the shards into one testsuite document in
+    the nose format read by parseNosetestsReports.
+
+    Args:
+        reports (list): (shard name, report path, process return code).
+        output (str): Path of the merged report.
+
+    A shard without a report is added as an errored testcase so that its
+    failure shows in the results. A shared test run on several shards is
+    reported once, failed if it failed on any of them.
+    """
+    merged = ElementTree.Element('testsuite', name='nosetests')
+    totals = dict((key, 0) for key in ('tests', 'errors', 'failures',
+                                       'skip'))
+    seen = {}
+    for name, path, returncode in reports:
+        if os.path.exists(path):
+            for testcase in ElementTree.parse(path).getroot().iter(
+                    'testcase'):
+                key = (testcase.get('classname'), testcase.get('name'))
+                if key not in seen:
+                    seen[key] = testcase
+                    merged.append(testcase)
+                elif _outcome_rank(testcase) > _outcome_rank(seen[key]):
+                    merged.remove(seen[key])
+                    seen[key] = testcase
+                    merged.append(testcase)
+            continue
+        testcase = ElementTree.SubElement(
+            merged, 'testcase', classname='shard_runner',
+            name='shard_{0}'.format(name), time='0')
+        ElementTree.SubElement(
+            testcase, 'error', type='ShardError',
+            message='Shard {0} exited with {1} and no report'.format(
+                name, returncode))
+    for testcase in merged:
+        totals['tests'] += 1
+        for child, key in (('error', 'errors'), ('failure', 'failures'),
+                           ('skipped', 'skip')):
+            if testcase.find(child) is not None:
+                totals[key] += 1
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    ElementTree.ElementTree(merged).write(output, encoding='UTF-8')
+    return totals
+
+
+def run_shards(shards, output=DEFAULT_OUTPUT, command=None):
+    """
+    Run every shard with tests in its own process, wait for all of them and
+    merge their reports into output. The command is checked with
+    check_command before any shard is started.
+
+    Returns:
+        dict. Totals of the merged report.
+    """
+    check_command(command)
+    output_dir = os.path.dirname(os.path.abspath(output))
+    running = []
+    for shard in shards:
+        if shard.entries:
+            report = os.path.join(output_dir,
+                                  'nosetests_{0}.xml'.format(shard.name))
+            if os.path.exists(report):
+                os.remove(report)
+            running.append((shard, report,
+                            start_shard(shard, report, command)))
+    reports = []
+    for shard, report, process in running:
+        reports.append((shard.name, report, process.wait()))
+    return merge_reports(reports, output)
+
+
+PARSER = optparse.OptionParser()
+PARSER.add_option('--shard', action='append', dest='shards', default=[],
+                  help='deployment as NAME=CONNECTION_DIR[:CAPABILITY,...],'
+                  ' capabilities among cloud, physical, four-node, fencing')
+PARSER.add_option('--suite', action='store', dest='suite', type='str',
+                  default=DEFAULT_SUITE, help='suite of ordered_tcs.txt')
+PARSER.add_option('--history', action='store', dest='history', type='str',
+                  help='duration_history.py database of durations')
+PARSER.add_option('--shared', action='append', dest='shared',
+                  help='test set run on every shard that needs it, by '
+                  'default {0}'.format(', '.join(SHARED_TESTSETS)))
+PARSER.add_option('--command', action='store', dest='command', type='str',
+                  help='command run per shard, with the placeholders {0}. '
+                  'It must point the test framework at {{connection_dir}}, '
+                  'e.g. "nosetests -v --with-xunit --xunit-file={{report}} '
+                  '{{tests}}" run with the connection data of '
+                  '{{connection_dir}}'.format(', '.join(
+                      COMMAND_PLACEHOLDERS)))
+PARSER.add_option('--output', action='store', dest='output', type='str',
+                  default=DEFAULT_OUTPUT, help='merged xunit report')
+PARSER.add_option('--dry-run', action='store_true', dest='dry_run',
+                  default=False, help='print the assignment only')
+
+
+def main(args=None):
+    """
+    Assign the tests of the suite to the shards and run them.
+    """
+    opts = PARSER.parse_args(args)[0]
+    if not opts.shards:
+        PARSER.error('at least one --shard is needed')
+    if not opts.dry_run:
+        try:
+            check_command(opts.command)
+        except ValueError as error:
+            PARSER.error(str(error))
+    shards = [Shard.parse(spec) for spec in opts.shards]
+    suites = dict((header.strip('# '), test_ids)
+                  for header, test_ids in read_ordered_tcs())
+    if opts.suite not in suites:
+        PARSER.error('no suite {0} in ordered_tcs.txt'.format(opts.suite))
+    entries = load_entries(suites[opts.suite])
+    durations = {}
+    if opts.history:
+        history = DurationHistory(opts.history)
+        durations = history.median_durations()
+        history.close()
+    assign(entries, shards, durations, opts.shared or SHARED_TESTSETS)
+    serial = Plan(entries, durations).estimated_seconds
+    for shard in shards:
+        print '{0}: {1} tests, estimated {2:.1f}h'.format(
+            shard.name, len(shard.entries), shard.load / 3600.0)
+    print 'Estimated wall time {0:.1f}h, serial {1:.1f}h'.format(
+        max(shard.load for shard in shards) / 3600.0, serial / 3600.0)
+    if opts.dry_run:
+        for shard in shards:
+            print '\n'.join('{0} {1}'.format(shard.name, entry.test_id)
+                            for entry in shard.entries)
+        return 0
+    start = time.time()
+    totals = run_shards(shards, opts.output, opts.command)
+    print 'Ran {0} tests in {1:.1f}h: {2} errors, {3} failures'.format(
+        totals['tests'], (time.time() - start) / 3600.0, totals['errors'],
+        totals['failures'])
+    return 1 if totals['errors'] or totals['failures'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Model fingerprints of LITP snapshots, used to skip recreating a
+            snapshot of an unchanged model, with timed snapshot phases
+"""
+import hashlib
+import time
+from baseline_fingerprint import read_ms_records, write_ms_records
+from model_snapshot import ModelSnapshot
+
+# Model fingerprint and timestamp of every snapshot, keyed by snapshot path
+SNAPSHOT_FILE = '/var/tmp/vcs_testware_snapshots.json'
+DEFAULT_SNAPSHOT = '/snapshots/snapshot'
+
+# Model subtrees that change without changing the deployment
+VOLATILE_PATHS = ('/snapshots', '/plans', '/litp')
+# Installed LITP packages, whose upgrades do not show in the model
+LITP_PACKAGES_CMD = "/bin/rpm -qa 'ERIClitp*'"
+
+# Timings of every snapshot phase as (test id, phase, seconds)
+SNAPSHOT_METRICS = []
+
+
+def model_fingerprint(snapshot, packages=()):
+    """
+    Return the sha1 of the type, state and properties of every item of
+    the model, leaving out the VOLATILE_PATHS, and of the installed LITP
+    packages.
+    """
+    digest = hashlib.sha1()
+    for package in sorted(packages):
+        digest.update('rpm|{0}\n'.format(package))
+    for path in sorted(snapshot.by_path):
+        if any(path == volatile or path.startswith(volatile + '/')
+               for volatile in VOLATILE_PATHS):
+            continue
+        item = snapshot.by_path[path]
+        digest.update('{0}|{1}|{2}|{3}\n'.format(
+            path, item.item_type, item.state,
+            sorted(item.properties.items())))
+    return digest.hexdigest()
+
+
+def snapshot_timestamp(snapshot, path=DEFAULT_SNAPSHOT):
+    """
+    Return the timestamp of the snapshot item, or None if there is no
+    such snapshot.
+    """
+    if path not in snapshot:
+        return None
+    return snapshot.props(path, 'timestamp') or ''
+
+
+def snapshot_is_current(snapshot, records, path=DEFAULT_SNAPSHOT,
+                        packages=()):
+    """
+    Return True if the snapshot exists, is the one that was recorded and
+    was taken of a model and LITP packages with the fingerprint of the
+    model in snapshot and the packages.
+    """
+    record = records.get(path)
+    timestamp = snapshot_timestamp(snapshot, path)
+    return record is not None and timestamp is not None and \
+        record.get('timestamp') == timestamp and \
+        record.get('fingerprint') == model_fingerprint(snapshot, packages)
+
+
+class SnapshotMixin(object):
+    """
+    Mixin for GenericTest subclasses that creates the deployment snapshot
+    only when the model or the LITP packages have changed since it was
+    taken, and logs how long every snapshot phase takes.
+    """
+
+    def _snapshot_phase(self, phase, start):
+        """
+        Record and log the time spent in the phase since start.
+        """
+        secs = time.time() - start
+        SNAPSHOT_METRICS.append((self.id(), phase, secs))
+        self.log('info', 'Snapshot {0} took {1:.1f}s'.format(phase, secs))
+
+    def read_model(self, ms_node):
+        """
+        Return the whole model read with one recursive show.
+        """
+        start = time.time()
+        snapshot = ModelSnapshot.from_test(self, ms_node, '/')
+        self._snapshot_phase('model read', start)
+        return snapshot
+
+    def read_litp_packages(self, ms_node):
+        """
+        Return the installed LITP packages of the MS with their versions.
+        """
+        stdout, stderr, ret_code = self.run_command(ms_node,
+                                                    LITP_PACKAGES_CMD)
+        self.assertEqual(0, ret_code, stderr)
+        return sorted(stdout)
+
+    def create_snapshot_if_changed(self, ms_node, model=None):
+        """
+        Create the deployment snapshot unless the existing one was taken of
+        the current model and LITP packages, e.g. after a plugin upgrade. A
+        stale snapshot is removed first.
+
+        Returns:
+            bool. True if a snapshot was created.
+        """
+        model = model or self.read_model(ms_node)
+        packages = self.read_litp_packages(ms_node)
+        records = read_ms_records(self, ms_node, SNAPSHOT_FILE)
+        if snapshot_is_current(model, records, packages=packages):
+            self.log('info', 'Snapshot {0} matches the model, not '
+                     'recreated'.format(DEFAULT_SNAPSHOT))
+            return False
+        self._record_new_snapshot(ms_node, model, packages, records,
+                                  snapshot_timestamp(model) is not None)
+        return True
+
+    def _record_new_snapshot(self, ms_node, model, packages, records,
+                             remove_snapshot):
+        """
+        Create the deployment snapshot, removing the existing one first if
+        remove_snapshot is set, and record its timestamp with the
+        fingerprint of the model and packages it was taken of.
+        """
+        start = time.time()
+        self.execute_and_wait_createsnapshot(ms_node, add_to_cleanup=False,
+                                             remove_snapshot=remove_snapshot)
+        self._snapshot_phase('remove and create' if remove_snapshot
+                             else 'create', start)
+        created = ModelSnapshot.from_test(self, ms_node, '/snapshots')
+        records[DEFAULT_SNAPSHOT] = {
+            'fingerprint': model_fingerprint(model, packages),
+            'timestamp': snapshot_timestamp(created)}
+        write_ms_records(self, ms_node, SNAPSHOT_FILE, records)
+
+    def restore_snapshot_and_recreate(self, ms_node, poweroff_nodes=None):
+        """
+        Restore the deployment snapshot, then always remove it and create
+        a new one of the restored model for the next test. The restored
+        snapshot matches the model, but is not reused, as a snapshot that
+        has been restored may not restore again.
+        """
+        start = time.time()
+        self.execute_and_wait_restore_snapshot(ms_node,
+                                               poweroff_nodes=poweroff_nodes)
+        self._snapshot_phase('restore', start)
+        self._record_new_snapshot(ms_node, self.read_model(ms_node),
+                                  self.read_litp_packages(ms_node),
+                                  read_ms_records(self, ms_node,
+                                                  SNAPSHOT_FILE), True)
@@ -0,0 +1,297 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import copy
+import unittest
+import mock
+from baseline_fingerprint import (REUSE, PATCH, REDEPLOY,
+                                  BaselineMixin,
+                                  fingerprint,
+                                  match_baseline,
+                                  packages_fingerprint,
+                                  parse_group_states)
+from generate import apply_options_changes
+from model_snapshot import ModelSnapshot
+
+CLUSTER = '/deployments/d1/clusters/c1'
+CS_URL = CLUSTER + '/services/CS_1'
+
+FIXTURES = {
+    'vcs-clustered-service': [{
+        'vpath': CS_URL,
+        'options': {'active': '1', 'standby': '1', 'name': 'CS_1',
+                    'node_list': 'n1,n2'},
+        'options_string': 'active="1" standby="1" name="CS_1" '
+                          'node_list="n1,n2"'}],
+    'service': [{
+        'destination': CS_URL + '/applications/APP_1',
+        'options': {'service_name': 'test-lsb-1'},
+        'options_string': 'service_name="test-lsb-1"'}],
+    'ha-service-config': [{
+        'vpath': CS_URL + '/ha_configs/HSC_1',
+        'options': {'restart_limit': '2'},
+        'options_string': 'restart_limit="2"'}],
+    'packages': ['EXTR-lsbwrapper-1-1.0-1.noarch.rpm'],
+    'litp_default_values': {},
+}
+
+HAGRP_STATE = ['#Group         Attribute             System     Value',
+               'Grp_CS_c1_CS_1 State                 node1      |ONLINE|',
+               'Grp_CS_c1_CS_1 State                 node2      |OFFLINE|']
+
+
+def _show_services(restart_limit='2', node_list='n1,n2', state='Applied',
+                   extra=()):
+    """
+    Return a recursive show output of the clustered service of FIXTURES,
+    followed by the extra lines.
+    """
+    return [CS_URL,
+            '    type: vcs-clustered-service',
+            '    state: Applied',
+            '    properties:',
+            '        active: 1',
+            '        standby: 1',
+            '        name: CS_1',
+            '        node_list: {0}'.format(node_list),
+            CS_URL + '/applications/APP_1',
+            '    inherited from: /software/services/APP_1',
+            '    type: reference-to-service',
+            '    state: Applied',
+            '    properties:',
+            '        service_name: test-lsb-1 [*]',
+            CS_URL + '/ha_configs/HSC_1',
+            '    type: ha-service-config',
+            '    state: {0}'.format(state),
+            '    properties:',
+            '        restart_limit: {0}'.format(restart_limit)] + list(extra)
+
+
+def _group_name(name):
+    """
+    Return the VCS group name of a clustered service of cluster c1.
+    """
+    return 'Grp_CS_c1_' + name
+
+
+class Dummy(BaselineMixin):
+    """
+    Test class answering the model commands of a deployment.
+    """
+
+    vcs_cluster_url = CLUSTER
+
+    def __init__(self, case, services, software):
+        self.case = case
+        self.services = services
+        self.software = software
+        self.log = mock.Mock()
+        self.vcs = mock.Mock()
+        self.vcs.generate_clustered_service_name.side_effect = \
+            lambda name, _: _group_name(name)
+        self.vcs.get_hagrp_cmd.return_value = '/opt/VRTS/bin/hagrp -state'
+        self.get_managed_node_filenames = mock.Mock(return_value=['node1'])
+        self.execute_cli_create_cmd = mock.Mock()
+        self.execute_cli_update_cmd = mock.Mock()
+        self.execute_cli_remove_cmd = mock.Mock()
+        self.execute_cli_createplan_cmd = mock.Mock()
+        self.apply_cs_and_apps_sg = mock.Mock()
+        self._run_baseline_plan = mock.Mock(
+            side_effect=lambda *args: self.commands.append('plan'))
+        self.execute_cli_remove_cmd.side_effect = \
+            lambda node, url, **kwargs: self.commands.append('remove ' + url)
+        self.records = None
+        self.commands = []
+
+    def run_command(self, node, cmd, su_root=False):
+        """ Answers the show, state and record commands """
+        self.commands.append(cmd)
+        if cmd.startswith('litp show') and '/software' in cmd:
+            return self.software, [], 0
+        if cmd.startswith('litp show'):
+            return self.services, [], 0
+        if cmd.endswith('hagrp -state'):
+            return HAGRP_STATE, [], 0
+        if cmd.startswith('/bin/cat'):
+            return [], [], 1
+        self.records = cmd
+        return [], [], 0
+
+    def assertTrue(self, expr, msg=None):
+        """ Base assertTrue """
+        self.case.assertTrue(expr, msg)
+
+    def assertEqual(self, first, second, msg=None):
+        """ Base assertEqual """
+        self.case.assertEqual(first, second, msg)
+
+
+class TestBaselineFingerprint(unittest.TestCase):
+    """
+    Test suite for the deployed baseline matcher.
+    """
+
+    def _match(self, lines, states=HAGRP_STATE, records=None):
+        """
+        Match FIXTURES against the show output and group states.
+        """
+        return match_baseline(FIXTURES, ModelSnapshot.from_show_output(lines),
+                              parse_group_states(states), records or {},
+                              _group_name)
+
+    def test_fingerprint(self):
+        """ Procedure:
+            1. Fingerprint a copy of the fixtures and a changed copy.
+            ---------
+            Verification:
+            2. Verify equal fixtures have the same fingerprint.
+            3. Verify a changed option changes the fingerprint.
+        """
+        same = copy.deepcopy(FIXTURES)
+        self.assertEqual(fingerprint(FIXTURES), fingerprint(same))
+        apply_options_changes(same, 'ha-service-config', 0,
+                              {'restart_limit': '3'})
+        self.assertNotEqual(fingerprint(FIXTURES), fingerprint(same))
+
+    def test_reuse(self):
+        """ Procedure:
+            1. Match fixtures that are deployed and online.
+            ---------
+            Verification:
+            2. Verify the baseline is reused.
+            3. Verify the group states are read without their | markers.
+        """
+        self.assertEqual({'Grp_CS_c1_CS_1': {'node1': 'ONLINE',
+                                             'node2': 'OFFLINE'}},
+                         parse_group_states(HAGRP_STATE[:2] + [
+                             'Grp_CS_c1_CS_1 State node2 |OFFLINE|FAULTED|']))
+        match = self._match(_show_services(), records={
+            CS_URL: packages_fingerprint(FIXTURES)})
+        self.assertEqual(REUSE, match.decision)
+        self.assertEqual({}, match.updates())
+        self.assertEqual([CS_URL], match.deployed)
+
+    def test_patch(self):
+        """ Procedure:
+            1. Match fixtures against a model with a different non
+               structural property and an item that is not applied.
+            ---------
+            Verification:
+            2. Verify the baseline is patched with the expected update.
+        """
+        match = self._match(_show_services(restart_limit='5'))
+        self.assertEqual(PATCH, match.decision)
+        self.assertEqual({CS_URL + '/ha_configs/HSC_1':
+                          {'restart_limit': '2'}}, match.updates())
+        self.assertEqual(PATCH, self._match(
+            _show_services(state='Updated')).decision)
+
+    def test_patch_items(self):
+        """ Procedure:
+            1. Match fixtures against a model without their ha-service-config
+               and with a trigger the fixtures do not have.
+            ---------
+            Verification:
+            2. Verify the ha-service-config is created and the trigger
+               removed with a patch.
+        """
+        match = self._match(_show_services()[:-5] + [
+            CS_URL + '/triggers/trig1',
+            '    type: vcs-trigger',
+            '    state: Applied',
+            '    properties:',
+            '        trigger_type: nofailover'])
+        self.assertEqual(PATCH, match.decision)
+        self.assertEqual([(CS_URL + '/ha_configs/HSC_1', 'ha-service-config',
+                           {'restart_limit': '2'})], match.to_create)
+        self.assertEqual([CS_URL + '/triggers/trig1'], match.to_remove)
+
+    def test_redeploy(self):
+        """ Procedure:
+            1. Match fixtures against a missing, a structurally different,
+               an offline and a differently recorded deployment.
+            ---------
+            Verification:
+            2. Verify every one of them is redeployed.
+        """
+        self.assertEqual(REDEPLOY, self._match([]).decision)
+        self.assertEqual(REDEPLOY, self._match(
+            _show_services(node_list='n2,n1')).decision)
+        self.assertEqual(REDEPLOY, self._match(
+            _show_services(), states=HAGRP_STATE[:1]).decision)
+        match = self._match(_show_services(), records={CS_URL: 'other'})
+        self.assertEqual(REDEPLOY, match.decision)
+        self.assertEqual([CS_URL], match.foreign)
+        match = self._match(_show_services(extra=[
+            CS_URL + '/applications/APP_2',
+            '    inherited from: /software/services/APP_2',
+            '    type: reference-to-service',
+            '    state: Applied']))
+        self.assertEqual(REDEPLOY, match.decision)
+        self.assertEqual([CS_URL + '/applications/APP_2'], match.extra)
+
+    def test_deploy_baseline(self):
+        """ Procedure:
+            1. Deploy fixtures whose clustered service is deployed with a
+               different node_list and whose service is in the model.
+            2. Deploy fixtures that are not deployed at all.
+            3. Deploy fixtures that differ in a non structural property.
+            ---------
+            Verification:
+            4. Verify the deployed items are removed with a plan before
+               the software items they reference are removed, and before
+               the fixtures are applied again.
+            5. Verify nothing is removed and a single plan is run when
+               nothing is deployed.
+            6. Verify a patch is applied with a single plan, created only
+               by _run_baseline_plan.
+            7. Verify the packages fingerprint is recorded.
+        """
+        fixtures = copy.deepcopy(FIXTURES)
+        fixtures['service'][0].update({
+            'vpath': '/software/services/APP_1',
+            'package_vpath': '/software/items/EXTR-lsbwrapper-1'})
+        test = Dummy(self, _show_services(node_list='n2,n1'), [
+            '/software/services/APP_1',
+            '    type: service',
+            '    state: Applied'])
+        match = test.deploy_baseline('ms1', fixtures, '/tmp')
+        self.assertEqual(REDEPLOY, match.decision)
+        self.assertEqual([mock.call('ms1', CS_URL, add_to_cleanup=False),
+                          mock.call('ms1', '/software/services/APP_1',
+                                    add_to_cleanup=False)],
+                         test.execute_cli_remove_cmd.call_args_list)
+        self.assertEqual(2, test._run_baseline_plan.call_count)
+        commands = [cmd for cmd in test.commands
+                    if cmd.split()[0] in ('remove', 'plan')]
+        self.assertEqual(['remove ' + CS_URL, 'plan',
+                          'remove /software/services/APP_1', 'plan'],
+                         commands)
+        self.assertTrue(test.commands.index('plan') < [
+            i for i, cmd in enumerate(test.commands)
+            if cmd.startswith('litp show -p /software')][0])
+        test.apply_cs_and_apps_sg.assert_called_once_with('ms1', fixtures,
+                                                          '/tmp')
+        self.assertTrue(packages_fingerprint(fixtures) in test.records)
+        test = Dummy(self, [], [])
+        test.deploy_baseline('ms1', fixtures, '/tmp')
+        self.assertEqual(0, test.execute_cli_remove_cmd.call_count)
+        self.assertEqual(1, test._run_baseline_plan.call_count)
+        test = Dummy(self, _show_services(restart_limit='5'), [])
+        self.assertEqual(PATCH, test.deploy_baseline('ms1', FIXTURES,
+                                                     '/tmp').decision)
+        self.assertEqual(1, test.execute_cli_update_cmd.call_count)
+        self.assertEqual(0, test.execute_cli_createplan_cmd.call_count)
+        self.assertEqual(1, test._run_baseline_plan.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
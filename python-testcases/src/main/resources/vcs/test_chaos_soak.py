@@ -0,0 +1,214 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import mock
+from chaos_soak import (SOAK_METRICS, ChaosSoakMixin, format_summary, main,
+                        parse_sample, read_series, summarize_soak)
+from vcs_simulator import (LocalTransportMixin, build_cluster, locked_state,
+                           run_simulated, save_state)
+
+
+class Dummy(ChaosSoakMixin, LocalTransportMixin):
+    """
+    Test class soaking a simulated cluster.
+    """
+
+    def __init__(self, case):
+        self.case = case
+        self.log = mock.Mock()
+        self.failing_reads = 0
+
+    def run_command(self, node, cmd, su_root=False, **kwargs):
+        """ Fails the next failing_reads reads of the group states """
+        if cmd.endswith('hagrp -state') and self.failing_reads:
+            self.failing_reads -= 1
+            return [], ['VCS ERROR V-16-1-10600 Cannot connect to VCS '
+                        'engine'], 1
+        return super(Dummy, self).run_command(node, cmd, su_root, **kwargs)
+
+    def assertTrue(self, expr, msg=None):
+        """ Base assertTrue """
+        self.case.assertTrue(expr, msg)
+
+    def assertEqual(self, first, second, msg=None):
+        """ Base assertEqual """
+        self.case.assertEqual(first, second, msg)
+
+
+def _step(seconds, action, ok, recovery, rss, log_size):
+    """
+    Return a time series step with one node sample.
+    """
+    return {'t': seconds, 'action': action, 'ok': ok, 'recovery': recovery,
+            'nodes': {'n1': [rss, seconds / 10, log_size]}}
+
+
+class TestChaosSoak(unittest.TestCase):
+    """
+    Test suite for the chaos soak runner.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.state_path = os.path.join(self.tmp_dir, 'state.json')
+        self.series_path = os.path.join(self.tmp_dir, 'series.jsonl')
+        with open(self.state_path, 'w') as state_file:
+            json.dump(build_cluster(3, latencies={'online': 0.05,
+                                                  'offline': 0.02,
+                                                  'fault': 0.02}),
+                      state_file)
+        self.test = Dummy(self)
+        self.test.vcs_sim_state = self.state_path
+        del SOAK_METRICS[:]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _kill(self, rand):
+        """ Faults the resource of a random group where it is online,
+            once the earlier faults of the group are cleared """
+        with locked_state(self.state_path) as state:
+            group = rand.choice(sorted(state['groups']))
+        run_simulated(self.state_path, 'hagrp', ['-clear', group])
+        with locked_state(self.state_path) as state:
+            systems = [system for system, record in
+                       state['groups'][group]['on'].items()
+                       if record['state'] == 'ONLINE']
+            resource = state['groups'][group]['resources'][0]
+        self.assertNotEqual([], systems, 'No system to fault')
+        self.assertEqual(0, run_simulated(self.state_path, 'fault',
+                                          [resource, systems[0]])[2])
+
+    def _repair(self, _):
+        """ Clears the faults of every group """
+        for num in (1, 2, 3):
+            run_simulated(self.state_path, 'hagrp',
+                          ['-clear', 'Grp_CS_c1_CS{0}'.format(num)])
+
+    def _soak(self, actions, max_steps):
+        """ Runs a short soak of the simulated cluster """
+        return self.test.run_soak(
+            actions, 'node1', ['node1'], 60, self.series_path, seed=7,
+            pause=(0, 0), recovery_timeout=2, max_steps=max_steps,
+            sleep=lambda _: time.sleep(0.01))
+
+    def test_soak(self):
+        """ Procedure:
+            1. Soak the simulated cluster with kills and repairs.
+            ---------
+            Verification:
+            2. Verify every step recovered, with the action counts.
+            3. Verify the time series holds the seed and every step.
+            4. Verify the same seed gives the same schedule.
+        """
+        actions = {'kill': (2, self._kill), 'repair': (1, self._repair)}
+        summary = self._soak(actions, 8)
+        self.assertEqual(None, summary['violation'])
+        self.assertEqual(8, summary['steps'])
+        self.assertEqual(8, sum(action['runs'] for action in
+                                summary['actions'].values()))
+        records = read_series(self.series_path)
+        self.assertEqual(7, records[0]['seed'])
+        self.assertEqual({'Grp_CS_c1_CS1': 1, 'Grp_CS_c1_CS2': 1,
+                          'Grp_CS_c1_CS3': 1}, records[0]['baseline'])
+        self.assertTrue(all(record['recovery'] >= 0
+                            for record in records[1:] if record['ok']))
+        self.assertEqual([summary], SOAK_METRICS)
+        schedule = [record['action'] for record in records[1:]]
+        self.tearDown()
+        self.setUp()
+        self._soak(actions, 8)
+        self.assertEqual(schedule, [record['action'] for record in
+                                    read_series(self.series_path)[1:]])
+
+    def test_violation(self):
+        """ Procedure:
+            1. Soak with an action that brings a failover group online on
+               both systems.
+            ---------
+            Verification:
+            2. Verify the soak stops at the first step with the violation.
+        """
+
+        def double_online(_):
+            """ Corrupts the state of the first group """
+            with locked_state(self.state_path) as state:
+                for record in state['groups']['Grp_CS_c1_CS1']['on'] \
+                        .values():
+                    record['state'] = 'ONLINE'
+                save_state(self.state_path, state)
+
+        summary = self._soak({'corrupt': (1, double_online)}, 5)
+        self.assertEqual(1, summary['steps'])
+        self.assertTrue('Grp_CS_c1_CS1 is online on 2 systems' in
+                        summary['violation'])
+        self.assertEqual(2, len(read_series(self.series_path)))
+
+    def test_failed_read(self):
+        """ Procedure:
+            1. Soak with an action after which two reads of the group
+               states fail.
+            ---------
+            Verification:
+            2. Verify the reads are polled again and counted, and the step
+               recovers without a violation.
+        """
+
+        def fail_reads(_):
+            """ Makes the next two reads fail """
+            self.test.failing_reads = 2
+
+        summary = self._soak({'fail': (1, fail_reads)}, 1)
+        self.assertEqual(None, summary['violation'])
+        step = read_series(self.series_path)[1]
+        self.assertEqual((2, True), (step['failed_reads'],
+                                     step['recovery'] >= 0))
+
+    def test_summary(self):
+        """ Procedure:
+            1. Summarize a series whose recovery, memory and log growth
+               get worse.
+            2. Summarize it through the command line.
+            ---------
+            Verification:
+            3. Verify the success rates and the start and end figures.
+        """
+        records = [{'t': 0, 'seed': 1, 'nodes': {'n1': [1000, 0, 0]}}]
+        records.extend(_step(3600 * num, 'kill', True, 10 + num * 2,
+                             1000 + num * num * 100, num * 1000)
+                       for num in range(1, 11))
+        records.append(_step(39600, 'repair', False, None, 20000, 12000))
+        summary = summarize_soak(records, window=0.2)
+        self.assertEqual({'runs': 1, 'ok': 0, 'success_rate': 0.0},
+                         summary['actions']['repair'])
+        self.assertEqual(10, summary['hours'])
+        self.assertEqual({'start': 14, 'end': 30}, summary['recovery'])
+        rss = summary['nodes']['n1']['had_rss_kb']
+        self.assertEqual((300.0, 1890.0), (rss['start'], rss['overall']))
+        self.assertTrue(rss['end'] > rss['start'])
+        self.assertEqual([None] * 3, parse_sample([]))
+        self.assertEqual([512, 7, 4096], parse_sample(['  512 7', '4096']))
+        self.assertTrue(format_summary(summary)[1].startswith(
+            'kill: 10/10 succeeded'))
+        path = os.path.join(self.tmp_dir, 'series.jsonl')
+        with open(path, 'w') as series:
+            series.write('\n'.join(json.dumps(record) for record in records))
+        self.assertEqual(0, main([path]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import time
+import unittest
+import mock
+from cluster_common import (CLOCK_CMD, ENGINE_LOG, NodeReadMixin,
+                            clock_offset, log_time, parse_all_group_states,
+                            percentile)
+
+
+class Dummy(NodeReadMixin):
+    """
+    Test class answering the node commands with canned output.
+    """
+
+    def __init__(self, case):
+        self.case = case
+        self.commands = []
+
+    def run_command(self, node, cmd, su_root=False):
+        """ Answers the clock and engine log commands """
+        self.commands.append((node, cmd))
+        if cmd.startswith('/usr/bin/stat'):
+            return ['2048'], [], 0
+        if cmd.startswith('/usr/bin/tail'):
+            return ['2026/10/19 10:00:00 VCS NOTICE V-16-1-10447'], [], 0
+        return ['1000.5'], [], 0
+
+    def assertEqual(self, first, second, msg=None):
+        """ Base assertEqual """
+        self.case.assertEqual(first, second, msg)
+
+
+class TestClusterCommon(unittest.TestCase):
+    """
+    Test suite for the shared helpers.
+    """
+
+    def test_parsers(self):
+        """ Procedure:
+            1. Take percentiles of a list of values.
+            2. Parse engine log times and "hagrp -state" output.
+            ---------
+            Verification:
+            3. Verify the nearest rank values are returned.
+            4. Verify lines without a timestamp have no time.
+            5. Verify the state of every group per system.
+        """
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(3, percentile(values, 50))
+        self.assertEqual(5, percentile(values, 100))
+        self.assertEqual(None, percentile([], 50))
+        self.assertEqual(time.mktime((2026, 10, 19, 10, 0, 5, 0, 0, -1)),
+                         log_time('2026/10/19 10:00:05 VCS INFO message'))
+        self.assertEqual(None, log_time('a continuation line'))
+        self.assertEqual({'Grp_CS1': {'node1': '|ONLINE|',
+                                      'node2': '|OFFLINE|'}},
+                         parse_all_group_states([
+                             '#Group   Attribute   System   Value',
+                             'Grp_CS1  State       node1    |ONLINE|',
+                             'Grp_CS1  State       node2    |OFFLINE|']))
+
+    def test_engine_log(self):
+        """ Procedure:
+            1. Read the engine log size and the lines written after it
+               through the mixin.
+            ---------
+            Verification:
+            2. Verify the log is read from the byte after the size.
+        """
+        test = Dummy(self)
+        offset = test.engine_log_size('node1')
+        self.assertEqual(2048, offset)
+        self.assertEqual(1, len(test.read_engine_log('node1', offset)))
+        self.assertEqual('/usr/bin/tail -c +2049 {0}'.format(ENGINE_LOG),
+                         test.commands[-1][1])
+
+    def test_clock_offset(self):
+        """ Procedure:
+            1. Compute a clock offset.
+            2. Read the clock offset of a node through the mixin.
+            ---------
+            Verification:
+            3. Verify the offset and its uncertainty.
+            4. Verify the node clock is read once.
+        """
+        self.assertEqual((7.5, 0.5), clock_offset(100.0, 108.0, 101.0))
+        test = Dummy(self)
+        with mock.patch('time.time', side_effect=[999.0, 1001.0]):
+            self.assertEqual((0.5, 1.0), test.read_clock_offset('node1'))
+        self.assertEqual([('node1', CLOCK_CMD)], test.commands)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import time
+import unittest
+import mock
+from dependency_graph import (ONLINE_ORDER_METRICS, DependencyGraph,
+                              DependencyGraphMixin, generate_graph, main,
+                              parse_group_online, parse_hagrp_dep)
+
+CLUSTER = '/deployments/d1/clusters/c1'
+
+SHOW_OUTPUT = """/deployments/d1/clusters/c1
+    type: vcs-cluster
+    state: Applied
+/deployments/d1/clusters/c1/services/CS1
+    type: vcs-clustered-service
+    state: Applied
+    properties:
+        name: CS1
+        dependency_list: CS3
+        initial_online_dependency_list: CS2
+/deployments/d1/clusters/c1/services/CS2
+    type: vcs-clustered-service
+    state: Applied
+    properties:
+        name: CS2
+        initial_online_dependency_list: CS3
+/deployments/d1/clusters/c1/services/CS3
+    type: vcs-clustered-service
+    state: Applied
+    properties:
+        name: CS3
+        dependency_list:
+""".splitlines()
+
+
+def _engine_line(clock, message):
+    """
+    Return an engine log line logged clock seconds after 10:00.
+    """
+    return '2026/10/19 10:{0:02d}:{1:02d} VCS NOTICE {2}'.format(
+        clock // 60, clock % 60, message)
+
+
+def _online_lines(group, initiated, online):
+    """
+    Return the engine log lines of the group coming online.
+    """
+    return [_engine_line(initiated, 'V-16-1-10301 Initiating Online of '
+                         'Resource Res_App_{0} (Owner: Unspecified, Group: '
+                         '{0}) on System node1'.format(group)),
+            _engine_line(online, 'V-16-1-10447 Group {0} is online on '
+                         'system node1'.format(group))]
+
+
+class Dummy(DependencyGraphMixin):
+    """
+    Test class answering the model, hagrp and engine log commands.
+    """
+
+    def __init__(self, case, engine_lines):
+        self.case = case
+        self.log = mock.Mock()
+        self.engine_lines = engine_lines
+        self.dep_stderr = []
+        self.commands = []
+
+    def run_command(self, node, cmd, su_root=False):
+        """ Answers the show, dependency and log commands """
+        self.commands.append(cmd)
+        if cmd.startswith('litp show'):
+            return SHOW_OUTPUT, [], 0
+        if cmd.endswith('hagrp -dep'):
+            return ['#Parent   Child   Relationship',
+                    'Grp_CS1   Grp_CS2 online global soft',
+                    'Grp_CS1   Grp_CS3 online global soft'], \
+                self.dep_stderr, 0
+        if cmd.startswith('/usr/bin/tail'):
+            return self.engine_lines, [], 0
+        return [], [], 0
+
+    def assertTrue(self, expr, msg=None):
+        """ Base assertTrue """
+        self.case.assertTrue(expr, msg)
+
+    def assertEqual(self, first, second, msg=None):
+        """ Base assertEqual """
+        self.case.assertEqual(first, second, msg)
+
+
+class TestDependencyGraph(unittest.TestCase):
+    """
+    Test suite for the dependency graph.
+    """
+
+    def setUp(self):
+        del ONLINE_ORDER_METRICS[:]
+
+    def test_graph(self):
+        """ Procedure:
+            1. Build a graph of services with a diamond of dependencies.
+            ---------
+            Verification:
+            2. Verify the layers, the critical path and its duration.
+            3. Verify broken online orders are reported.
+            4. Verify a cycle is found and fails the layers.
+        """
+        graph = DependencyGraph({'A': ['B', 'C'], 'B': ['D'], 'C': ['D', ''],
+                                 'E': []})
+        self.assertEqual(['A', 'B', 'C', 'D', 'E'], graph.nodes)
+        self.assertEqual([['D', 'E'], ['B', 'C'], ['A']], graph.layers())
+        self.assertEqual((3, ['D', 'B', 'A']), graph.critical_path())
+        self.assertEqual((12, ['D', 'C', 'A']), graph.critical_path(
+            {'D': 5, 'C': 4, 'B': 1}, default=3))
+        self.assertEqual([], graph.check_online_order(
+            {'D': 1, 'B': 2, 'C': 2, 'A': 3}))
+        self.assertEqual([('A', 'B', 2, None), ('A', 'C', 2, 3)],
+                         graph.check_online_order({'D': 1, 'C': 3, 'A': 2}))
+        self.assertEqual([('Grp_B', 'Grp_D')], graph.subgraph(
+            ['B', 'D']).renamed(lambda name: 'Grp_' + name).edges())
+        self.assertEqual(None, graph.find_cycle())
+        graph.add('D', ['A'])
+        self.assertEqual(['A', 'B', 'D', 'A'], graph.find_cycle())
+        self.assertRaises(ValueError, graph.layers)
+
+    def test_large_graph(self):
+        """ Procedure:
+            1. Generate a graph of 10000 services.
+            2. Check online times one layer apart.
+            ---------
+            Verification:
+            3. Verify the check passes and takes well under a second.
+            4. Verify an early parent is reported.
+        """
+        graph = generate_graph(10000, degree=3, seed=1)
+        started = time.time()
+        online_at = dict((name, number)
+                         for number, names in enumerate(graph.layers())
+                         for name in names)
+        self.assertEqual([], graph.check_online_order(online_at))
+        self.assertTrue(time.time() - started < 1)
+        parent, children = next((name, children) for name, children
+                                in sorted(graph.children.items())
+                                if children)
+        online_at[parent] = -1
+        self.assertEqual(len(children), len(graph.check_online_order(
+            online_at)))
+        self.assertEqual(0, main(['--services', '100']))
+
+    def test_parsers(self):
+        """ Procedure:
+            1. Parse "hagrp -dep" output and engine log lines.
+            ---------
+            Verification:
+            2. Verify the relationships and the online times of the groups.
+        """
+        self.assertEqual({('G1', 'G2'): 'online local soft'}, parse_hagrp_dep(
+            ['#Parent Child Relationship', 'G1  G2  online local soft', '']))
+        times = parse_group_online(
+            _online_lines('G1', 5, 9) + _online_lines('G1', 20, 21) +
+            [_engine_line(0, 'V-16-1-10447 Group G2 is online on system '
+                          'node2'), 'not a log line'])
+        self.assertEqual(4, times['G1'][1] - times['G1'][0])
+        self.assertEqual(None, times['G2'][0])
+
+    def test_mixin(self):
+        """ Procedure:
+            1. Build the graph of a cluster through the mixin.
+            2. Check VCS and the engine log of a plan against it.
+            ---------
+            Verification:
+            3. Verify the model and VCS are read with one command each.
+            4. Verify the expected and observed online times are kept.
+            5. Verify a group online before its child fails the check.
+            6. Verify a warning of "hagrp -dep" fails the dependency check.
+        """
+        test = Dummy(self, _online_lines('Grp_CS3', 0, 10) +
+                     _online_lines('Grp_CS2', 11, 16) +
+                     _online_lines('Grp_CS1', 17, 20))
+        graph = test.build_dependency_graph('ms1', CLUSTER).renamed(
+            lambda name: 'Grp_' + name)
+        self.assertEqual([('Grp_CS1', 'Grp_CS2'), ('Grp_CS1', 'Grp_CS3'),
+                          ('Grp_CS2', 'Grp_CS3')], graph.edges())
+        self.assertRaises(AssertionError, test.assert_vcs_dependencies,
+                          'node1', graph)
+        self.assertEqual(2, len(test.assert_vcs_dependencies(
+            'node1', graph.subgraph(['Grp_CS1', 'Grp_CS2']))))
+        result = test.verify_online_order('node1', graph, offset=100)
+        self.assertEqual((18, 20, ['Grp_CS3', 'Grp_CS2', 'Grp_CS1']), (
+            result['expected'], result['observed'], result['critical_path']))
+        self.assertEqual([result], ONLINE_ORDER_METRICS)
+        self.assertTrue('/usr/bin/tail -c +101 ' in ' '.join(test.commands))
+        test.engine_lines = _online_lines('Grp_CS1', 0, 1) + \
+            _online_lines('Grp_CS2', 2, 3)
+        self.assertRaises(AssertionError, test.verify_online_order, 'node1',
+                          graph)
+        test.dep_stderr = ['VCS WARNING V-16-1-10554 No dependencies']
+        self.assertRaises(AssertionError, test.assert_vcs_dependencies,
+                          'node1', graph.subgraph(['Grp_CS1', 'Grp_CS2']))
+
+
+if __name__ == '__main__':
+    unittest.main()
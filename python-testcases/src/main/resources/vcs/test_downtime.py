@@ -0,0 +1,194 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import time
+import unittest
+import mock
+from downtime import (DowntimeMixin, DowntimeReport, PlanTimeline,
+                      parse_http_log, parse_ping_log, parse_status_log,
+                      plan_states)
+
+
+def _plan(*states):
+    """
+    Return a parse_plan_output result with one task per phase.
+    """
+    return dict((phase, {1: {'DESC': ['/deployments/d1/clusters/c1/nodes/'
+                                      'n{0}'.format(phase),
+                                      'Task {0}'.format(phase)],
+                             'STATUS': state}})
+                for phase, state in enumerate(states, 1))
+
+
+class Dummy(DowntimeMixin):
+    """
+    Test class reading a scripted sequence of plans.
+    """
+
+    def __init__(self, case, plans):
+        self.case = case
+        self.plans = list(plans)
+        self.log = mock.Mock()
+        self.cli = mock.Mock()
+        self.cli.parse_plan_output.side_effect = lambda stdout: stdout
+        self.commands = []
+
+    def execute_cli_showplan_cmd(self, _):
+        """ Returns the next plan """
+        return self.plans.pop(0) if len(self.plans) > 1 \
+            else self.plans[0], [], 0
+
+    def run_command(self, node, cmd, su_root=False):
+        """ Answers the clock, probe and collection commands """
+        self.commands.append((node, cmd))
+        if cmd.startswith('/bin/date'):
+            return ['1000.0'], [], 0
+        if cmd.startswith('/bin/kill'):
+            return ['{0} {1}'.format(seen_at, int(node == 'node1' and
+                                                  seen_at > 1005))
+                    for seen_at in range(1000, 1011)], [], 0
+        return [], [], 0
+
+    def assertTrue(self, expr, msg=None):
+        """ Base assertTrue """
+        self.case.assertTrue(expr, msg)
+
+    def assertEqual(self, first, second, msg=None):
+        """ Base assertEqual """
+        self.case.assertEqual(first, second, msg)
+
+
+class TestDowntime(unittest.TestCase):
+    """
+    Test suite for the downtime analyzer.
+    """
+
+    def test_outages(self):
+        """ Procedure:
+            1. Add the probes of a service failing over from node1 to
+               node2 with a 4 second gap, and node1 coming back later.
+            ---------
+            Verification:
+            2. Verify the service outage is the failover gap.
+            3. Verify the per node outages and the maximum gaps.
+        """
+        report = DowntimeReport(interval=1, tolerance=0.5, start=0, end=20)
+        report.add('httpd', 'node1', [(num, num < 5 or num > 15)
+                                      for num in range(21)])
+        report.add('httpd', 'node2', range(8, 21))
+        report.add('ping', 'node1', range(21))
+        outages = report.outages('httpd')
+        self.assertEqual([(4, 8)], [(outage.start, outage.end)
+                                    for outage in outages])
+        self.assertEqual(4, report.total_downtime('httpd'))
+        self.assertEqual(4, report.max_gap())
+        self.assertEqual(12, report.max_gap('httpd', 'node1'))
+        self.assertEqual([(0, 8)], [(outage.start, outage.end) for outage
+                                    in report.outages('httpd', 'node2')])
+        self.assertEqual([], report.outages('ping'))
+        self.assertEqual(1, report.max_gap('ping'))
+        self.assertTrue(report.lines()[0].startswith(
+            'httpd on any node: 1 outages, 4.0s down'))
+
+    def test_timeline(self):
+        """ Procedure:
+            1. Observe a plan of three phases over time.
+            2. Line an outage up against it.
+            ---------
+            Verification:
+            3. Verify the task and phase boundaries.
+            4. Verify the outage lists the tasks running during it.
+        """
+        timeline = PlanTimeline()
+        timeline.observe(0, plan_states(_plan('Initial', 'Initial',
+                                              'Initial')))
+        self.assertFalse(timeline.done)
+        timeline.observe(10, plan_states(_plan('Running', 'Initial',
+                                               'Initial')))
+        timeline.observe(20, plan_states(_plan('Success', 'Running',
+                                               'Initial')))
+        timeline.observe(30, plan_states(_plan('Success', 'Success',
+                                               'Success')))
+        self.assertTrue(timeline.done)
+        self.assertEqual({1: (10, 20), 2: (20, 30), 3: (20, 30)},
+                         timeline.phases())
+        report = DowntimeReport(start=0, end=40, timeline=timeline)
+        report.add('httpd', 'node1', [0, 1, 2, 22, 23, 24, 40])
+        outages = report.outages()
+        self.assertEqual([[(1, 'Task 1'), (2, 'Task 2'), (3, 'Task 3')],
+                          [(2, 'Task 2'), (3, 'Task 3')]],
+                         [outage.tasks for outage in outages])
+        self.assertTrue('phase 1: Task 1' in report.lines()[1])
+
+    def test_parsers(self):
+        """ Procedure:
+            1. Parse HTTP server, ping and status probe logs.
+            ---------
+            Verification:
+            2. Verify the good and failed samples, with the clock offset.
+        """
+        http_log = ['node1 - - [19/Oct/2026 10:11:12] "GET / HTTP/1.1" 200 -',
+                    'garbage',
+                    'node2 - - [19/Oct/2026 10:11:14] "GET / HTTP/1.1" 200 -']
+        hits = parse_http_log(http_log, offset=2)
+        start = time.mktime((2026, 10, 19, 10, 11, 12, 0, 0, -1))
+        self.assertEqual({'node1': [start - 2], 'node2': [start]}, hits)
+        ping_log = ['PING 10.10.10.1 56(84) bytes of data.',
+                    '[100.5] 64 bytes from 10.10.10.1: icmp_seq=1 ttl=64',
+                    '[101.5] no answer yet for icmp_seq=2']
+        self.assertEqual([(100.5, True), (101.5, False)],
+                         parse_ping_log(ping_log))
+        self.assertEqual([(9.0, True), (10.0, False)],
+                         parse_status_log(['10 0', '11 3', 'bad'], 1))
+
+    def test_mixin(self):
+        """ Procedure:
+            1. Record the timeline of a plan through the mixin.
+            2. Assert on the maximum gap.
+            ---------
+            Verification:
+            3. Verify the timeline is complete.
+            4. Verify the assertion fails only when the gap is too long.
+        """
+        test = Dummy(self, [_plan('Running'), _plan('Success')])
+        timeline = test.record_plan_timeline('ms1', timeout=5, interval=0.01)
+        self.assertTrue(timeline.done)
+        report = DowntimeReport(start=0, end=10)
+        report.add('httpd', 'node1', [0, 1, 5, 10])
+        test.assert_max_gap(report, 6)
+        self.assertRaises(AssertionError, test.assert_max_gap, report, 5)
+
+    def test_status_probes(self):
+        """ Procedure:
+            1. Start the status probes of a group on two nodes.
+            2. Collect them once the group went offline on node1.
+            ---------
+            Verification:
+            3. Verify the command runs in a background status loop.
+            4. Verify the group is up on any node but down on node1.
+        """
+        test = Dummy(self, [])
+        with mock.patch('time.time', return_value=1000.0):
+            offsets = test.start_status_probes(
+                ['node1', 'node2'], 'Grp_CS1', 'hagrp -state Grp_CS1')
+        self.assertEqual({'node1': 0.0, 'node2': 0.0}, offsets)
+        self.assertTrue(test.commands[1][1].startswith(
+            "nohup /bin/sh -c 'while :; do { hagrp -state Grp_CS1; }"))
+        self.assertTrue('/tmp/vcs_downtime_probe_Grp_CS1.log' in
+                        test.commands[1][1])
+        report = DowntimeReport(interval=1)
+        test.collect_status_probes(offsets, 'Grp_CS1', report)
+        self.assertEqual(1, report.max_gap('Grp_CS1'))
+        self.assertEqual(5, report.max_gap('Grp_CS1', 'node1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
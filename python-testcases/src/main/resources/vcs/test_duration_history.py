@@ -0,0 +1,141 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from duration_history import (ERROR, FAILED, PASSED, SKIPPED,
+                              DurationHistory, read_report)
+
+FAILURE = '<failure type="AssertionError" message="failed"/>'
+
+
+def _report(durations, failing=()):
+    """
+    Return a nose xunit report of testset_story1 tests with the given
+    durations, the failing ones with a failure.
+    """
+    cases = ''.join(
+        '<testcase classname="testset_story1.Story1" name="{0}" '
+        'time="{1}">{2}</testcase>'.format(
+            name, seconds, FAILURE if name in failing else '')
+        for name, seconds in sorted(durations.items()))
+    return '<testsuite name="nosetests" tests="{0}">{1}</testsuite>'.format(
+        len(durations), cases)
+
+
+class TestDurationHistory(unittest.TestCase):
+    """
+    Test suite for the test duration history store.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.history = DurationHistory(os.path.join(self.tmp_dir, 'h.db'))
+        self.reports = 0
+
+    def tearDown(self):
+        self.history.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def _ingest(self, durations, failing=()):
+        """ Writes and ingests a report """
+        self.reports += 1
+        path = os.path.join(self.tmp_dir, '{0}.xml'.format(self.reports))
+        with open(path, 'w') as report:
+            report.write(_report(durations, failing))
+        return self.history.ingest(path)
+
+    def test_read_report(self):
+        """ Procedure:
+            1. Read a report with every outcome.
+            ---------
+            Verification:
+            2. Verify the test ids, durations and outcomes.
+        """
+        path = os.path.join(self.tmp_dir, 'report.xml')
+        with open(path, 'w') as report:
+            report.write(
+                '<testsuite>'
+                '<testcase classname="testset_a.A" name="test_01" time="1.5"/>'
+                '<testcase classname="testset_a.A" name="test_02" time="2">'
+                '<failure/></testcase>'
+                '<testcase classname="testset_a.A" name="test_03" time="3">'
+                '<error/></testcase>'
+                '<testcase classname="testset_a.A" name="test_04" time="0">'
+                '<skipped/></testcase>'
+                '</testsuite>')
+        self.assertEqual([('testset_a.py:test_01', 1.5, PASSED),
+                          ('testset_a.py:test_02', 2.0, FAILED),
+                          ('testset_a.py:test_03', 3.0, ERROR),
+                          ('testset_a.py:test_04', 0.0, SKIPPED)],
+                         read_report(path))
+
+    def test_ingest(self):
+        """ Procedure:
+            1. Ingest the same report twice.
+            ---------
+            Verification:
+            2. Verify the second ingestion is skipped.
+        """
+        self.assertEqual(2, self._ingest({'test_01': 10, 'test_02': 20}))
+        self.reports = 0
+        self.assertEqual(0, self._ingest({'test_01': 10, 'test_02': 20}))
+        self.assertEqual([10.0], self.history.histories()[
+            'testset_story1.py:test_01'].durations)
+
+    def test_ordering(self):
+        """ Procedure:
+            1. Ingest runs where one quick test fails half of the time.
+            ---------
+            Verification:
+            2. Verify longest first order puts unknown tests first.
+            3. Verify fail fast order puts the flaky test first.
+        """
+        for num in range(4):
+            self._ingest({'test_01': 10 + num, 'test_02': 30, 'test_03': 5},
+                         failing=('test_03',) if num % 2 else ())
+        test_ids = ['testset_story1.py:test_0{0}'.format(num)
+                    for num in range(1, 5)]
+        self.assertEqual(['testset_story1.py:test_04',
+                          'testset_story1.py:test_02',
+                          'testset_story1.py:test_01',
+                          'testset_story1.py:test_03'],
+                         self.history.longest_first(test_ids))
+        self.assertEqual(['testset_story1.py:test_03',
+                          'testset_story1.py:test_04',
+                          'testset_story1.py:test_02',
+                          'testset_story1.py:test_01'],
+                         self.history.fail_fast(test_ids))
+        self.assertEqual(0.5, self.history.histories()[
+            'testset_story1.py:test_03'].failure_rate)
+
+    def test_regressions(self):
+        """ Procedure:
+            1. Ingest runs where one test doubles its duration.
+            ---------
+            Verification:
+            2. Verify only that test is flagged, after enough history.
+        """
+        for seconds in (100, 110, 90):
+            self._ingest({'test_01': seconds, 'test_02': 10})
+        self.assertEqual([], self.history.regressions())
+        self._ingest({'test_01': 200, 'test_02': 11})
+        self.assertEqual([('testset_story1.py:test_01', 2.0)],
+                         self.history.regressions())
+        self.assertEqual({'testset_story1.py:test_01': 110.0,
+                          'testset_story1.py:test_02': 10.0},
+                         self.history.median_durations())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import unittest
+import mock
+from xml.etree import ElementTree
+from expansion import ExpansionMixin
+from node_index import NodeIndex
+
+CLUSTER = '/deployments/d1/clusters/c1'
+
+
+class FakeGenericTest(object):
+    """
+    Stand-in for the GenericTest commands used by the expansion.
+    """
+
+    def __init__(self):
+        self.vcs_cluster_url = CLUSTER
+        self.execute_expand_script = mock.Mock()
+        self.execute_cli_load_cmd = mock.Mock()
+        self.copy_filelist_to = mock.Mock()
+        self.run_and_check_plan = mock.Mock()
+        self.documents = []
+        self.prepared = []
+
+    def setUp(self):
+        """ Base setUp """
+        pass
+
+    def id(self):
+        """ Base id """
+        return 'test_expansion'
+
+    def log(self, level, message):
+        """ Base log """
+        pass
+
+    def get_filelist_dict(self, local_path, remote_dir):
+        """ Keeps the document that is copied """
+        with open(local_path) as xml_file:
+            self.documents.append(xml_file.read())
+        return {'local_path': local_path, 'remote_path': remote_dir}
+
+    def set_pws_new_node(self, ms_node, node):
+        """ Records the nodes that are set up """
+        self.prepared.append(node)
+        return True
+
+    @staticmethod
+    def run_command(node, cmd):
+        """ Base run_command """
+        return [node], [], 0
+
+    def assertTrue(self, expr, msg=None):
+        """ Base assertTrue """
+        assert expr, msg
+
+    def assertEqual(self, first, second, msg=None):
+        """ Base assertEqual """
+        assert first == second, msg
+
+
+class Dummy(ExpansionMixin, FakeGenericTest):
+    """
+    Test class using the expansion mixin.
+    """
+    pass
+
+
+class TestExpansion(unittest.TestCase):
+    """
+    Test suite for the cluster expansion pipeline.
+    """
+
+    def test_is_model_expanded(self):
+        """ Procedure:
+            1. Check the expansion of a one and a four node cluster.
+            ---------
+            Verification:
+            2. Verify only the four node cluster is expanded.
+        """
+        test = Dummy()
+        for node_ids, expanded in ((['n1'], False),
+                                   (['n1', 'n2', 'n3', 'n4'], True)):
+            test.node_index = mock.Mock(return_value=NodeIndex(
+                {'node_id': node_id} for node_id in node_ids))
+            self.assertEqual(expanded, test.is_model_expanded())
+
+    def test_expand_cluster(self):
+        """ Procedure:
+            1. Expand the cluster with two network hosts.
+            ---------
+            Verification:
+            2. Verify the scripts run in order and no plan is run.
+            3. Verify both network hosts are loaded in one document.
+            4. Verify the new nodes are prepared in order.
+        """
+        test = Dummy()
+        test.setUp()
+        test.expand_cluster('ms1', network_hosts=('nh21', 'nh22'),
+                            new_nodes=['node2', 'node3', 'node4'])
+        self.assertEqual(
+            ['expand_cloud_c1_mn2.sh', 'expand_cloud_c1_mn3.sh',
+             'expand_cloud_c1_mn4.sh'],
+            [call[0][1] for call in
+             test.execute_expand_script.call_args_list])
+        self.assertEqual(0, test.run_and_check_plan.call_count)
+        self.assertEqual(1, test.execute_cli_load_cmd.call_count)
+        self.assertEqual(CLUSTER,
+                         test.execute_cli_load_cmd.call_args[0][1])
+        root = ElementTree.fromstring(test.documents[0])
+        self.assertTrue(root.tag.endswith(
+            'vcs-cluster-network_hosts-collection'))
+        self.assertEqual(['nh21', 'nh22'], [host.get('id') for host in root])
+        self.assertEqual(['node2', 'node3', 'node4'], test.prepared)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,201 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+from failover_benchmark import (APP_KILL, FAILOVER_METRICS, NODE_POWEROFF,
+                                PEER_INACTIVE, FailoverBenchmarkMixin,
+                                FailoverRun, format_table, main,
+                                observe_failover, parse_group_states,
+                                simulate, summarize)
+from vcs_simulator import LocalTransportMixin, build_cluster, run_simulated
+
+GROUP = 'Grp_CS_c1_CS1'
+RESOURCE = 'Res_App_c1_CS1_APP1'
+
+
+def _table(node1, node2):
+    """
+    Return "hagrp -state" output of the group.
+    """
+    return ['#Group         Attribute  System  Value',
+            '{0} State node1 {1}'.format(GROUP, node1),
+            '{0} State node2 {1}'.format(GROUP, node2)]
+
+
+class Dummy(FailoverBenchmarkMixin, LocalTransportMixin):
+    """
+    Test class measuring failovers of the simulated cluster.
+    """
+
+    def __init__(self):
+        self.log = mock.Mock()
+
+
+class TestFailoverBenchmark(unittest.TestCase):
+    """
+    Test suite for the failover latency benchmark.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        del FAILOVER_METRICS[:]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_observe_failover(self):
+        """ Procedure:
+            1. Observe a sequence of group states on a fake clock.
+            ---------
+            Verification:
+            2. Verify the detection, offline and online times.
+            3. Verify failed reads and a system missing from a read are
+               not taken for the group going offline.
+            4. Verify a failover that never completes times out.
+        """
+        outputs = [_table('|ONLINE|', '|OFFLINE|'), [],
+                   _table('|ONLINE|', '|OFFLINE|')[::2],
+                   _table('|OFFLINE|FAULTED|', '|OFFLINE|STARTING|'),
+                   _table('|OFFLINE|FAULTED|', '|OFFLINE|STARTING|'),
+                   _table('|OFFLINE|FAULTED|', '|ONLINE|')]
+        clock = [100.0]
+
+        def sleep(seconds):
+            """ Moves the fake clock on """
+            clock[0] += seconds
+
+        run = observe_failover(
+            lambda: parse_group_states(outputs.pop(0)), 'node1', 'node2',
+            FailoverRun(APP_KILL, (10, 4), 100.0), clock=lambda: clock[0],
+            sleep=sleep)
+        self.assertEqual([3, 3, 5], [run.seconds(metric) for metric in
+                                     ('detection', 'offline', 'online')])
+        run = observe_failover(
+            lambda: parse_group_states(_table('|ONLINE|', '|OFFLINE|')),
+            'node1', 'node2', FailoverRun(APP_KILL, (10, 4), clock[0]),
+            timeout=5, clock=lambda: clock[0], sleep=sleep)
+        self.assertFalse(run.failed_over)
+        self.assertEqual(None, run.seconds('detection'))
+
+    def test_simulate(self):
+        """ Procedure:
+            1. Simulate app kill and node power off runs at two status
+               intervals.
+            ---------
+            Verification:
+            2. Verify every run fails over.
+            3. Verify app kills are detected within the status interval
+               and power offs after the LLT peer inactivity timeout.
+            4. Verify the same seed gives the same runs.
+        """
+        runs = simulate((APP_KILL, NODE_POWEROFF), [(10, 4), (30, 4)],
+                        runs=20, seed=3)
+        self.assertEqual(80, len(runs))
+        self.assertTrue(all(run.failed_over for run in runs))
+        for run in runs:
+            if run.scenario == APP_KILL:
+                self.assertTrue(0 <= run.seconds('detection') <=
+                                run.setting[0])
+            else:
+                self.assertTrue(PEER_INACTIVE <= run.seconds('detection') <=
+                                PEER_INACTIVE + 1)
+            self.assertEqual(5, run.seconds('online') -
+                             run.seconds('detection'))
+        self.assertEqual([run.to_dict() for run in runs],
+                         [run.to_dict() for run in simulate(
+                             (APP_KILL, NODE_POWEROFF), [(10, 4), (30, 4)],
+                             runs=20, seed=3)])
+
+    def test_summarize(self):
+        """ Procedure:
+            1. Summarize runs of two settings, one run not failing over.
+            ---------
+            Verification:
+            2. Verify the percentiles and the failed count per setting.
+            3. Verify the table has a row per scenario and setting.
+        """
+        runs = [FailoverRun(APP_KILL, (10, 4), 0, num, num, num + 5)
+                for num in range(1, 11)]
+        runs.append(FailoverRun(APP_KILL, (10, 4), 0))
+        runs.append(FailoverRun(NODE_POWEROFF, (10, 4), 0, 17, 17, 22))
+        summary = summarize(runs)
+        self.assertEqual([(APP_KILL, 11, 1), (NODE_POWEROFF, 1, 0)],
+                         [(row['scenario'], row['runs'], row['failed'])
+                          for row in summary])
+        self.assertEqual({'p50': 6, 'p95': 10, 'p99': 10},
+                         summary[0]['detection'])
+        self.assertEqual(15, summary[0]['online']['p99'])
+        lines = format_table(summary)
+        self.assertEqual(3, len(lines))
+        self.assertTrue(lines[2].startswith(NODE_POWEROFF))
+
+    def test_mixin(self):
+        """ Procedure:
+            1. Benchmark a resource fault of a simulated cluster through
+               the local transport.
+            ---------
+            Verification:
+            2. Verify the failover is measured and recorded.
+            3. Verify the recovery is called after every run.
+            4. Verify the runs are written to a results file that main
+               summarizes.
+        """
+        state_path = os.path.join(self.tmp_dir, 'state.json')
+        with open(state_path, 'w') as state_file:
+            json.dump(build_cluster(1, latencies={'online': 0.2,
+                                                  'fault': 0.1}),
+                      state_file)
+        test = Dummy()
+        test.vcs_sim_state = state_path
+        recover = mock.Mock()
+        runs = test.benchmark_failover(
+            APP_KILL, 'node2', GROUP, 'node1', 'node2',
+            lambda: run_simulated(state_path, 'fault', [RESOURCE, 'node1']),
+            recover, runs=1, interval=0.02, timeout=10)
+        self.assertEqual(runs, FAILOVER_METRICS)
+        self.assertTrue(runs[0].failed_over)
+        self.assertTrue(0.1 <= runs[0].seconds('detection') <
+                        runs[0].seconds('online'))
+        self.assertEqual(1, recover.call_count)
+        test.log.assert_called_with('info', runs[0].summary())
+        output = os.path.join(self.tmp_dir, 'RESULTS.json')
+        test.write_failover_results(output)
+        with open(output) as results:
+            self.assertEqual([runs[0].to_dict()],
+                             json.load(results)['runs'])
+        self.assertEqual(0, main([output]))
+
+    def test_main(self):
+        """ Procedure:
+            1. Simulate runs into a JSON file and summarize the file.
+            ---------
+            Verification:
+            2. Verify the file holds the runs and the summary.
+            3. Verify summarizing the file succeeds.
+        """
+        output = os.path.join(self.tmp_dir, 'failover.json')
+        self.assertEqual(0, main(['--runs', '3', '--seed', '1', '--setting',
+                                  '30:2', '--json', output]))
+        with open(output) as results:
+            doc = json.load(results)
+        self.assertEqual(9, len(doc['runs']))
+        self.assertEqual([30] * 3, [row['status_interval']
+                                    for row in doc['summary']])
+        self.assertEqual(0, main([output]))
+
+
+if __name__ == '__main__':
+    unittest.main()
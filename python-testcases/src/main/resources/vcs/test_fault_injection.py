@@ -0,0 +1,168 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import mock
+import fault_injection
+from fault_injection import (INJECTION_METRICS, Fault, FaultInjectionMixin,
+                             InjectionReport, simultaneous, staggered)
+
+
+class FakeGenericTest(object):
+    """
+    Stand-in for GenericTest that runs the commands of every node in a
+    local shell, with /tmp replaced by a directory of the node.
+    """
+
+    def __init__(self, case, tmp_dir):
+        self.case = case
+        self.tmp_dir = tmp_dir
+        self.log = mock.Mock()
+
+    def assertEqual(self, first, second, msg=None):
+        """ Base assertEqual """
+        self.case.assertEqual(first, second, msg)
+
+    def assertTrue(self, expr, msg=None):
+        """ Base assertTrue """
+        self.case.assertTrue(expr, msg)
+
+    def _node_dir(self, node):
+        """ Returns the directory standing in for /tmp of the node """
+        path = os.path.join(self.tmp_dir, node)
+        if not os.path.isdir(path):
+            os.mkdir(path)
+        return path
+
+    def copy_file_to(self, node, local_path, remote_dir, root_copy,
+                     add_to_cleanup):
+        """ Base copy_file_to """
+        shutil.copy(local_path, self._node_dir(node))
+        return True
+
+    def run_command(self, node, cmd, su_root=False):
+        """ Base run_command """
+        cmd = cmd.replace('/tmp/', self._node_dir(node) + '/').replace(
+            '/usr/bin/python', sys.executable)
+        proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE)
+        stdout, stderr = proc.communicate()
+        return stdout.splitlines(), stderr.splitlines(), proc.returncode
+
+
+class Dummy(FaultInjectionMixin, FakeGenericTest):
+    """
+    Test class injecting faults on local stand-in nodes.
+    """
+    pass
+
+
+class TestFaultInjection(unittest.TestCase):
+    """
+    Test suite for the synchronized fault injection.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        fault_injection._AGENT_NODES.clear()
+        del INJECTION_METRICS[:]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_schedules(self):
+        """ Procedure:
+            1. Schedule faults simultaneously and staggered.
+            ---------
+            Verification:
+            2. Verify the delays of the faults.
+        """
+        faults = [Fault('n1', 'true'), Fault('n2', 'true'),
+                  Fault('n1', 'true')]
+        self.assertEqual([0, 0.5, 1.0], [fault.delay for fault in
+                                         staggered(faults, 0.5)])
+        self.assertEqual([0] * 3, [fault.delay for fault in
+                                   simultaneous(faults)])
+
+    def test_report(self):
+        """ Procedure:
+            1. Report the results of two nodes with different clocks.
+            ---------
+            Verification:
+            2. Verify the fire times are corrected by the clock offsets.
+            3. Verify the skew, the late node and the failed fault.
+        """
+        faults = staggered([Fault('n1', 'a', 'kill'), Fault('n2', 'b', 'ip'),
+                            Fault('n2', 'c', 'none')], 1.0)
+        report = InjectionReport(100.0, faults, {'n1': (10.0, 0.01),
+                                                 'n2': (-5.0, 0.02)})
+        report.add_result('n1', {'armed_at': 108.0, 'results': {
+            'kill': {'fired_at': 110.01, 'rc': 0}}})
+        report.add_result('n2', {'armed_at': 96.0, 'results': {
+            'ip': {'fired_at': 96.03, 'rc': 1}}})
+        self.assertAlmostEqual(100.01, report.fired_at['kill'])
+        self.assertAlmostEqual(0.03, report.error(faults[1]))
+        self.assertEqual(None, report.error(faults[2]))
+        self.assertAlmostEqual(0.02, report.skew)
+        self.assertEqual(0.02, report.clock_uncertainty)
+        self.assertEqual(['n2'], report.late_nodes)
+        self.assertEqual(['ip', 'none'], [fault.name for fault in
+                                          report.failed])
+        self.assertTrue('skew 0.020s' in report.summary())
+
+    def test_inject_simultaneous(self):
+        """ Procedure:
+            1. Inject three simultaneous faults on two nodes, one of them
+               failing.
+            ---------
+            Verification:
+            2. Verify every fault fired within a small skew.
+            3. Verify the failing fault is reported.
+            4. Verify the agent is copied once per node and its result
+               files are removed.
+        """
+        test = Dummy(self, self.tmp_dir)
+        faults = simultaneous([Fault('n1', 'true'), Fault('n2', 'true'),
+                               Fault('n2', 'false', 'broken')])
+        report = test.inject_faults(faults, margin=0.3)
+        self.assertEqual(3, len(report.fired_at))
+        self.assertTrue(report.skew < 0.2, report.summary())
+        self.assertEqual(['broken'], [fault.name for fault in
+                                      report.failed])
+        self.assertEqual([report], INJECTION_METRICS)
+        test.inject_faults(simultaneous([Fault('n1', 'true')]), margin=0.1)
+        self.assertEqual([['fault_injection_agent.py']] * 2,
+                         [os.listdir(os.path.join(self.tmp_dir, node))
+                          for node in ('n1', 'n2')])
+
+    def test_inject_staggered(self):
+        """ Procedure:
+            1. Inject two faults on two nodes 0.3 seconds apart.
+            ---------
+            Verification:
+            2. Verify the faults fired 0.3 seconds apart.
+        """
+        test = Dummy(self, self.tmp_dir)
+        faults = staggered([Fault('n1', 'true', 'first'),
+                            Fault('n2', 'true', 'second')], 0.3)
+        report = test.inject_faults(faults, margin=0.3)
+        self.assertAlmostEqual(0.3, report.fired_at['second'] -
+                               report.fired_at['first'], delta=0.1)
+        self.assertTrue(report.deadline <= report.fired_at['first'])
+
+
+if __name__ == '__main__':
+    unittest.main()
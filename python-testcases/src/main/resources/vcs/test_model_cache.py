@@ -0,0 +1,196 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import unittest
+import mock
+from model_cache import (ModelQueryCache,
+                         CachedModelMixin,
+                         CACHE_STATS)
+
+
+class FakeGenericTest(object):
+    """
+    Stand-in for the GenericTest model queries and writes.
+    """
+
+    def __init__(self):
+        self.find_mock = mock.Mock(side_effect=lambda *args: [
+            '/deployments/d1/clusters/c1/nodes/n1'])
+        self.props_mock = mock.Mock(return_value='node1')
+        self.create_mock = mock.Mock(return_value=([], [], 0))
+        self.run_mock = mock.Mock(return_value=([], [], 0))
+        self.log = mock.Mock()
+
+    def setUp(self):
+        """ Base setUp """
+        pass
+
+    def tearDown(self):
+        """ Base tearDown """
+        pass
+
+    @staticmethod
+    def id():
+        """ Base test id """
+        return 'testset_dummy.Dummy.test_01'
+
+    def find(self, *args, **kwargs):
+        """ Base find """
+        return self.find_mock(*args, **kwargs)
+
+    def get_props_from_url(self, *args, **kwargs):
+        """ Base get_props_from_url """
+        return self.props_mock(*args, **kwargs)
+
+    def execute_cli_create_cmd(self, *args, **kwargs):
+        """ Base execute_cli_create_cmd """
+        return self.create_mock(*args, **kwargs)
+
+    def run_command(self, *args, **kwargs):
+        """ Base run_command """
+        return self.run_mock(*args, **kwargs)
+
+
+class Dummy(CachedModelMixin, FakeGenericTest):
+    """
+    Test class using the cached model mixin.
+    """
+    pass
+
+
+class TestModelQueryCache(unittest.TestCase):
+    """
+    Test suite for the model query cache.
+    """
+
+    def setUp(self):
+        self.test = Dummy()
+        self.test.setUp()
+
+    def test_repeated_queries_hit(self):
+        """ Procedure:
+            1. Run the same find and get_props_from_url queries three times.
+            ---------
+            Verification:
+            2. Verify the base queries run only once.
+            3. Verify the hit ratio.
+        """
+        for _ in range(3):
+            self.test.find('ms1', '/deployments', 'node')
+            self.test.get_props_from_url('ms1', '/n1', filter_prop='hostname')
+        self.assertEqual(1, self.test.find_mock.call_count)
+        self.assertEqual(1, self.test.props_mock.call_count)
+        self.assertEqual(4, self.test.model_cache.hits)
+        self.assertEqual(2, self.test.model_cache.misses)
+
+    def test_different_filters_are_separate(self):
+        """ Procedure:
+            1. Query the same url with two different filters.
+            ---------
+            Verification:
+            2. Verify both queries reach the base class.
+        """
+        self.test.get_props_from_url('ms1', '/n1', filter_prop='hostname')
+        self.test.get_props_from_url('ms1', '/n1', filter_prop='node_id')
+        self.assertEqual(2, self.test.props_mock.call_count)
+
+    def test_write_invalidates(self):
+        """ Procedure:
+            1. Run a find, a create and the same find again.
+            ---------
+            Verification:
+            2. Verify the second find reaches the base class.
+        """
+        self.test.find('ms1', '/deployments', 'node')
+        self.test.execute_cli_create_cmd('ms1', '/x', 'vip')
+        self.test.find('ms1', '/deployments', 'node')
+        self.assertEqual(2, self.test.find_mock.call_count)
+        self.assertEqual(1, self.test.model_cache.invalidations)
+
+    def test_failed_write_invalidates(self):
+        """ Procedure:
+            1. Run a find and a create that raises.
+            ---------
+            Verification:
+            2. Verify the cache is dropped anyway.
+        """
+        self.test.find('ms1', '/deployments', 'node')
+        self.test.create_mock.side_effect = AssertionError
+        self.assertRaises(AssertionError, self.test.execute_cli_create_cmd,
+                          'ms1', '/x', 'vip')
+        self.test.find('ms1', '/deployments', 'node')
+        self.assertEqual(2, self.test.find_mock.call_count)
+
+    def test_raw_litp_write_invalidates(self):
+        """ Procedure:
+            1. Run a find, a raw litp update and the same find again.
+            2. Run a raw litp show and a node command between finds.
+            ---------
+            Verification:
+            3. Verify the update drops the cache.
+            4. Verify the show and the node command keep it.
+        """
+        self.test.find('ms1', '/deployments', 'node')
+        self.test.run_command('ms1', 'litp update -p /n1 -o hostname=n',
+                              su_root=False)
+        self.test.find('ms1', '/deployments', 'node')
+        self.assertEqual(2, self.test.find_mock.call_count)
+        self.test.run_command('ms1', 'litp show -p /n1')
+        self.test.run_command('node1', '/bin/hostname')
+        self.test.find('ms1', '/deployments', 'node')
+        self.assertEqual(2, self.test.find_mock.call_count)
+        self.assertEqual(1, self.test.model_cache.invalidations)
+        self.assertEqual(mock.call('ms1', 'litp update -p /n1 -o hostname=n',
+                                   su_root=False),
+                         self.test.run_mock.mock_calls[0])
+
+    def test_results_are_copies(self):
+        """ Procedure:
+            1. Mutate the list returned by a cached find.
+            ---------
+            Verification:
+            2. Verify the next find is not affected.
+        """
+        self.test.find('ms1', '/deployments', 'node').append('/extra')
+        self.assertEqual(['/deployments/d1/clusters/c1/nodes/n1'],
+                         self.test.find('ms1', '/deployments', 'node'))
+
+    def test_unhashable_arguments_bypass(self):
+        """ Procedure:
+            1. Query with a list argument twice.
+            ---------
+            Verification:
+            2. Verify both queries reach the base class.
+        """
+        cache = ModelQueryCache()
+        fetch = mock.Mock(return_value='x')
+        cache.get('find', (['a'],), {}, fetch)
+        cache.get('find', (['a'],), {}, fetch)
+        self.assertEqual(2, fetch.call_count)
+
+    def test_teardown_records_stats(self):
+        """ Procedure:
+            1. Run a repeated query and tear the test down.
+            ---------
+            Verification:
+            2. Verify the hit ratio is recorded and logged.
+        """
+        self.test.find('ms1', '/deployments', 'node')
+        self.test.find('ms1', '/deployments', 'node')
+        self.test.tearDown()
+        self.assertEqual(0.5,
+                         CACHE_STATS['testset_dummy.Dummy.test_01'][
+                             'hit_ratio'])
+        self.assertTrue(self.test.log.called)
+
+
+if __name__ == '__main__':
+    unittest.main()
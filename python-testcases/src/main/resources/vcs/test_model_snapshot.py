@@ -0,0 +1,220 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import unittest
+import mock
+from model_snapshot import (VCS_MODEL_INFO_TYPES, ModelSnapshot,
+                            get_vcs_model_info)
+from model_standin import ModelStandIn, ModelStandInMixin
+
+CLUSTER = '/deployments/d1/clusters/c1'
+CS = CLUSTER + '/services/CS1'
+
+SHOW_OUTPUT = """/deployments
+    type: collection-of-deployment
+    state: Applied
+    collection-of: deployment
+/deployments/d1
+    type: deployment
+    state: Applied
+/deployments/d1/clusters/c1
+    type: vcs-cluster
+    state: Applied
+    properties:
+        cluster_type: sfha
+        cluster_id: 4768
+/deployments/d1/clusters/c1/nodes/n1
+    type: node
+    state: Applied
+    properties:
+        hostname: node1
+/deployments/d1/clusters/c1/services/CS1
+    type: vcs-clustered-service
+    state: Applied
+    properties:
+        active: 1
+        standby: 1
+        name: CS1
+        node_list: n1,n2
+/deployments/d1/clusters/c1/services/CS1/applications
+    type: collection-of-service
+    state: Applied
+    collection-of: service
+/deployments/d1/clusters/c1/services/CS1/applications/APP1
+    inherited from: /software/services/APP1
+    type: reference-to-service
+    state: Applied
+    properties:
+        service_name: test-lsb-1 [*]
+        cleanup_command: /bin/true [*]
+/deployments/d1/clusters/c1/services/CS1/ipaddresses/ip1
+    type: vip
+    state: Applied
+    properties:
+        ipaddress: 2001:2100:ef::2/64
+        network_name: traffic1
+/deployments/d1/clusters/c1/services/CS2
+    type: vcs-clustered-service
+    state: Applied
+    properties:
+        name: CS2
+/deployments/d1/clusters/c1/services/CS2/applications/VM1
+    type: vm-service
+    state: Applied
+""".splitlines()
+
+
+class LegacyModelInfo(ModelStandInMixin):
+    """
+    The get_vcs_model_info test helper as it was before the snapshot,
+    with one GenericTest find and get_props_from_url per item.
+    """
+
+    def __init__(self, litp_model):
+        self.litp_model = litp_model
+
+    def get_vcs_model_info(self, cluster_urls, item_types):
+        """
+        Return the service group dictionaries read item by item.
+        """
+        service_groups = []
+        for cluster_url in cluster_urls:
+            for serv in self.find('ms1', cluster_url,
+                                  'vcs-clustered-service',
+                                  assert_not_empty=False):
+                if self.find('ms1', serv, 'vm-service',
+                             assert_not_empty=False):
+                    continue
+                prop_dict = {'url': serv}
+                prop_dict.update(self.get_props_from_url('ms1', serv))
+                service_group = {'vcs-clustered-service': prop_dict}
+                for itype in item_types:
+                    for url in self.find('ms1', serv, itype,
+                                         assert_not_empty=False):
+                        prop_dict = {'url': url}
+                        prop_dict.update(self.get_props_from_url('ms1', url))
+                        service_group.setdefault(itype, []).append(prop_dict)
+                service_groups.append(service_group)
+        return service_groups
+
+
+class TestModelSnapshot(unittest.TestCase):
+    """
+    Test suite for the model snapshot.
+    """
+
+    def setUp(self):
+        self.snapshot = ModelSnapshot.from_show_output(SHOW_OUTPUT)
+
+    def test_parse_items(self):
+        """ Procedure:
+            1. Parse a recursive show output.
+            ---------
+            Verification:
+            2. Verify types, states and inherited sources.
+        """
+        app = self.snapshot.by_path[CS + '/applications/APP1']
+        self.assertEqual('reference-to-service', app.item_type)
+        self.assertEqual('Applied', app.state)
+        self.assertEqual('/software/services/APP1', app.inherited_from)
+        self.assertEqual([CS + '/applications/APP1'],
+                         self.snapshot.children(CS + '/applications'))
+
+    def test_find_references(self):
+        """ Procedure:
+            1. Find service items below the cluster.
+            ---------
+            Verification:
+            2. Verify only exact types are returned by default.
+            3. Verify inherited references are returned with include_refs.
+        """
+        self.assertEqual([], self.snapshot.find(CLUSTER, 'service'))
+        self.assertFalse(self.snapshot.by_path[
+            CS + '/applications/APP1'].is_type('service'))
+        self.assertEqual([CS + '/applications/APP1'],
+                         self.snapshot.find(CLUSTER, 'service',
+                                            include_refs=True))
+        self.assertTrue(self.snapshot.by_path[
+            CS + '/applications/APP1'].is_type('service',
+                                               include_refs=True))
+        self.assertEqual([CS, CLUSTER + '/services/CS2'],
+                         self.snapshot.find('/deployments',
+                                            'vcs-clustered-service'))
+
+    def test_props(self):
+        """ Procedure:
+            1. Read properties of an inherited item.
+            ---------
+            Verification:
+            2. Verify the inherited marker is removed unless requested.
+            3. Verify values containing colons are kept.
+        """
+        url = CS + '/applications/APP1'
+        self.assertEqual('test-lsb-1',
+                         self.snapshot.props(url, 'service_name'))
+        self.assertEqual('test-lsb-1 [*]',
+                         self.snapshot.props(url, 'service_name',
+                                             keep_inherit_symbol=True))
+        self.assertEqual('2001:2100:ef::2/64',
+                         self.snapshot.props(CS + '/ipaddresses/ip1',
+                                             'ipaddress'))
+        self.assertEqual(None, self.snapshot.props('/missing'))
+
+    def test_get_vcs_model_info(self):
+        """ Procedure:
+            1. Build the service group list from the snapshot.
+            ---------
+            Verification:
+            2. Verify vm services are skipped.
+            3. Verify the item types found per service group, without the
+               inherited reference-to-service.
+        """
+        service_groups = get_vcs_model_info(self.snapshot, [CLUSTER])
+        self.assertEqual(1, len(service_groups))
+        group = service_groups[0]
+        self.assertEqual({'url': CS, 'active': '1', 'standby': '1',
+                          'name': 'CS1', 'node_list': 'n1,n2'},
+                         group['vcs-clustered-service'])
+        self.assertEqual(['vcs-clustered-service', 'vip'],
+                         sorted(group.keys()))
+
+    def test_get_vcs_model_info_matches_legacy(self):
+        """ Procedure:
+            1. Build the service group list from the snapshot and with the
+               per item finds of the legacy helper, on a model with a
+               reference-to-service item.
+            ---------
+            Verification:
+            2. Verify both lists are the same.
+        """
+        legacy = LegacyModelInfo(ModelStandIn.from_show_output(SHOW_OUTPUT))
+        for item_types in ((), VCS_MODEL_INFO_TYPES):
+            self.assertEqual(
+                legacy.get_vcs_model_info([CLUSTER], item_types),
+                get_vcs_model_info(self.snapshot, [CLUSTER], item_types))
+
+    def test_from_test(self):
+        """ Procedure:
+            1. Build the snapshot through a test instance.
+            ---------
+            Verification:
+            2. Verify a single recursive show is run.
+        """
+        test = mock.Mock(assertEqual=self.assertEqual)
+        test.run_command.return_value = (SHOW_OUTPUT, [], 0)
+        snapshot = ModelSnapshot.from_test(test, 'ms1')
+        test.run_command.assert_called_once_with(
+            'ms1', 'litp show -p /deployments -r')
+        self.assertTrue(CS in snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
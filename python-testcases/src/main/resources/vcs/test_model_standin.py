@@ -0,0 +1,240 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import unittest
+import mock
+from model_cache import CachedModelMixin
+from model_snapshot import ModelSnapshot, get_vcs_model_info
+from model_standin import (REALISTIC_LATENCIES, ModelError, ModelStandIn,
+                           ModelStandInMixin, build_deployment)
+from model_xml import ModelBatchMixin, ModelXmlBuilder
+
+CLUSTER = '/deployments/d1/clusters/c1'
+SERVICES = CLUSTER + '/services'
+
+
+class FakeGenericTest(object):
+    """
+    Stand-in for the GenericTest assertions and test hooks.
+    """
+
+    def __init__(self, case):
+        self.case = case
+        self.log = mock.Mock()
+
+    def __getattr__(self, name):
+        if name.startswith('assert'):
+            return getattr(self.case, name)
+        raise AttributeError(name)
+
+    def setUp(self):
+        """ Base setUp """
+        pass
+
+    def tearDown(self):
+        """ Base tearDown """
+        pass
+
+    @staticmethod
+    def id():
+        """ Base test id """
+        return 'testset_dummy.Dummy.test_01'
+
+
+class Dummy(CachedModelMixin, ModelBatchMixin, ModelStandInMixin,
+            FakeGenericTest):
+    """
+    Test class querying the model stand-in through the model mixins.
+    """
+
+    def get_networks(self, cluster_url):
+        """
+        Return the networks of the cluster, as
+        testset_vcs._get_list_of_networks_in_cluster.
+        """
+        return [self.get_props_from_url('ms1', url,
+                                        filter_prop='network_name')
+                for url in self.find_children_of_collect(
+                    'ms1', cluster_url, 'network-interface')]
+
+
+class TestModelStandIn(unittest.TestCase):
+    """
+    Test suite for the LITP model stand-in.
+    """
+
+    def setUp(self):
+        self.model = build_deployment(nodes=2)
+
+    def test_load_fixtures(self):
+        """ Procedure:
+            1. Build a deployment with the service group fixtures.
+            ---------
+            Verification:
+            2. Verify the clustered services and their properties.
+            3. Verify inherited packages are references with marked
+               inherited values.
+            4. Verify get_vcs_model_info reads the stand-in without the
+               inherited packages.
+        """
+        services = self.model.find_paths(SERVICES, 'vcs-clustered-service')
+        self.assertEqual(11, len(services))
+        self.assertEqual('CS1', self.model.show(SERVICES + '/CS1', 'name'))
+        package = SERVICES + '/CS1/runtimes/APP1/packages/EXTR-lsbwrapper1'
+        self.assertEqual('reference-to-package',
+                         self.model.by_path[package].item_type)
+        self.assertEqual('EXTR-lsbwrapper1 [*]',
+                         self.model.show(package, 'name'))
+        self.assertEqual('EXTR-lsbwrapper1', self.model.props(package,
+                                                              'name'))
+        self.assertEqual(['Applied'], list(set(
+            item.state for item in self.model.by_path.values())))
+        info = get_vcs_model_info(self.model, [CLUSTER])
+        self.assertEqual('CS1', info[0]['vcs-clustered-service']['name'])
+        self.assertFalse('package' in info[0])
+        self.assertEqual(1, self.model.calls['find'])
+
+    def test_writes(self):
+        """ Procedure:
+            1. Create, update, inherit and remove items and run a plan.
+            ---------
+            Verification:
+            2. Verify the item states follow the LITP life cycle.
+            3. Verify updating an inherited property overrides it and
+               deleting it restores the inherited value.
+            4. Verify invalid writes fail.
+        """
+        url = SERVICES + '/CS1/ipaddresses/ip9'
+        self.model.create(url, 'vip', 'ipaddress=10.0.0.9 '
+                          'network_name=traffic1')
+        self.assertEqual('Initial', self.model.by_path[url].state)
+        self.assertRaises(ModelError, self.model.create, url, 'vip')
+        self.assertRaises(ModelError, self.model.create,
+                          SERVICES + '/none/ip', 'vip')
+        self.model.remove(url)
+        self.assertFalse(url in self.model)
+        package = SERVICES + '/CS1/runtimes/APP1/packages/EXTR-lsbwrapper1'
+        self.model.update(package, 'version=2.0')
+        self.assertEqual(('Updated', '2.0'), (
+            self.model.by_path[package].state,
+            self.model.show(package, 'version')))
+        self.model.update(package, 'version', action_del=True)
+        self.assertTrue(self.model.show(package, 'version').endswith(' [*]'))
+        self.model.create(CLUSTER + '/nodes/n1/items', 'node-items-'
+                          'collection')
+        self.model.inherit(CLUSTER + '/nodes/n1/items/pkg',
+                           '/software/items/EXTR-lsbwrapper2', 'epoch=1')
+        self.assertEqual('1', self.model.show(CLUSTER + '/nodes/n1/items/'
+                                              'pkg', 'epoch'))
+        self.model.remove(SERVICES + '/CS1')
+        self.assertEqual('ForRemoval', self.model.by_path[package].state)
+        self.model.apply_plan()
+        self.assertEqual([], self.model.find(SERVICES + '/CS1', None))
+        self.assertFalse(SERVICES + '/CS1' in self.model.children(SERVICES))
+        self.assertRaises(ModelError, self.model.show, SERVICES + '/CS1')
+        self.assertEqual(
+            {'create': 4, 'update': 2, 'inherit': 1, 'remove': 2,
+             'show': 4},
+            dict((key, value) for key, value in self.model.calls.items()
+                 if key != 'find'))
+
+    def test_show_round_trip(self):
+        """ Procedure:
+            1. Read the deployment with a recursive show command.
+            ---------
+            Verification:
+            2. Verify the snapshot holds the same items and properties.
+        """
+        test = Dummy(self)
+        test.litp_model = self.model
+        snapshot = ModelSnapshot.from_test(test, 'ms1')
+        self.assertEqual(['/deployments'] +
+                         self.model.find('/deployments', None),
+                         [url for url in self.model._order
+                          if url in snapshot])
+        self.assertEqual(len(snapshot.by_path),
+                         1 + len(self.model.find('/deployments', None)))
+        package = SERVICES + '/CS1/runtimes/APP1/packages/EXTR-lsbwrapper1'
+        self.assertEqual(self.model.props(package), snapshot.props(package))
+        self.assertEqual('/software/items/EXTR-lsbwrapper1',
+                         snapshot.by_path[package].inherited_from)
+        self.assertEqual(([], ['InvalidLocationError Not found /none'], 1),
+                         test.run_command('ms1', 'litp show -p /none -r'))
+
+    def test_call_counts(self):
+        """ Procedure:
+            1. Run a model helper twice through the model cache.
+            ---------
+            Verification:
+            2. Verify the helper result.
+            3. Verify the properties are shown only the first time, while
+               find_children_of_collect, not cached, runs every time.
+        """
+        test = Dummy(self)
+        test.litp_model = self.model
+        test.setUp()
+        self.assertEqual(['mgmt', 'mgmt'], test.get_networks(CLUSTER))
+        self.assertEqual({'find': 1, 'show': 2}, dict(self.model.calls))
+        test.get_networks(CLUSTER)
+        self.assertEqual({'find': 2, 'show': 2}, dict(self.model.calls))
+        test.execute_cli_update_cmd('ms1', CLUSTER + '/nodes/n1/'
+                                    'network_interfaces/if0',
+                                    'network_name=data')
+        self.assertEqual(['data', 'mgmt'], test.get_networks(CLUSTER))
+        self.assertEqual({'find': 3, 'show': 4, 'update': 1},
+                         dict(self.model.calls))
+        _, stderr, rc = test.execute_cli_create_cmd(
+            'ms1', CLUSTER, 'vcs-cluster', expect_positive=False)
+        self.assertEqual(1, rc)
+        self.assertTrue('ItemExistsError' in stderr[0])
+
+    def test_model_batch_load(self):
+        """ Procedure:
+            1. Load a clustered service through a model batch.
+            ---------
+            Verification:
+            2. Verify the service is in the model as created items.
+            3. Verify one load request is made.
+        """
+        test = Dummy(self)
+        test.litp_model = self.model
+        test.setUp()
+        builder = ModelXmlBuilder()
+        builder.create(SERVICES + '/CS99', 'vcs-clustered-service',
+                       'name=CS99 active=1 standby=0 node_list=n1')
+        builder.create(SERVICES + '/CS99/ipaddresses/ip1', 'vip',
+                       'ipaddress=10.0.0.99 network_name=traffic1')
+        test.load_model_xml('ms1', builder)
+        self.assertEqual(1, self.model.calls['load'])
+        self.assertEqual('Initial', self.model.by_path[SERVICES +
+                                                       '/CS99'].state)
+        self.assertEqual('10.0.0.99', test.get_props_from_url(
+            'ms1', SERVICES + '/CS99/ipaddresses/ip1', 'ipaddress'))
+
+    def test_latency(self):
+        """ Procedure:
+            1. Run queries against a stand-in with realistic latencies
+               without sleeping.
+            ---------
+            Verification:
+            2. Verify the simulated time of the requests.
+        """
+        model = ModelStandIn(latencies=REALISTIC_LATENCIES, sleep=False)
+        model.create('/software', 'software')
+        model.find_paths('/', 'software')
+        model.show('/software')
+        self.assertAlmostEqual(
+            REALISTIC_LATENCIES['create'] + REALISTIC_LATENCIES['find'] +
+            REALISTIC_LATENCIES['show'], model.simulated_seconds)
+
+
+if __name__ == '__main__':
+    unittest.main()
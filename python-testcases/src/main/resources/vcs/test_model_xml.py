@@ -0,0 +1,176 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import unittest
+import mock
+from xml.etree import ElementTree
+from model_xml import (LITP_NS,
+                       ModelBatchMixin,
+                       ModelXmlBuilder,
+                       parse_options)
+
+SERVICES = '/deployments/d1/clusters/c1/services'
+
+
+def _cli_data(num):
+    """
+    Return generate_cli_commands output of a service based CS.
+    """
+    cs_url = '{0}/CS{1}'.format(SERVICES, num)
+    pkg = 'EXTR-lsbwrapper{0}'.format(num)
+    return {
+        'cs': {'url': cs_url, 'class_type': 'vcs-clustered-service',
+               'options': 'name="CS{0}" standby=1 active=1'.format(num)},
+        'apps': {'url': '/software/services/APP{0}'.format(num),
+                 'class_type': 'service',
+                 'options': 'service_name="test-lsb-{0}" '
+                            'cleanup_command="/bin/touch /tmp/x"'.format(num),
+                 'app_url_in_cluster': '{0}/applications/APP{1}'.format(
+                     cs_url, num)},
+        'ips': [{'url': cs_url + '/ipaddresses/ip1', 'class_type': 'vip',
+                 'options': 'network_name=traffic1 ipaddress=10.0.0.1'}],
+        'pkgs': [{'url': '/software/items/' + pkg, 'class_type': 'package',
+                  'options': 'name={0}'.format(pkg)}],
+        'ha_service_config': {'url': cs_url + '/ha_configs/HSC1',
+                              'class_type': 'ha-service-config',
+                              'options': 'tolerance_limit=0 '
+                                         'status_timeout=20'},
+        'pkg_links': [{'child_url': '/software/services/APP{0}/packages/'
+                                    '{1}'.format(num, pkg),
+                       'parent_url': '/software/items/' + pkg}],
+    }
+
+
+def _litp(tag):
+    """
+    Return the tag qualified with the LITP namespace.
+    """
+    return '{%s}%s' % (LITP_NS, tag)
+
+
+class FakeGenericTest(object):
+    """
+    Stand-in for the GenericTest file copy and load commands.
+    """
+
+    def __init__(self):
+        self.copy_filelist_to = mock.Mock()
+        self.execute_cli_load_cmd = mock.Mock()
+        self.execute_cli_create_cmd = mock.Mock()
+
+    def setUp(self):
+        """ Base setUp """
+        pass
+
+    @staticmethod
+    def get_filelist_dict(local_path, remote_dir):
+        """ Base get_filelist_dict """
+        return {'local_path': local_path, 'remote_path': remote_dir}
+
+
+class Dummy(ModelBatchMixin, FakeGenericTest):
+    """
+    Test class using the model batch mixin.
+    """
+    pass
+
+
+class TestModelXml(unittest.TestCase):
+    """
+    Test suite for the LITP XML batch builder.
+    """
+
+    def test_parse_options(self):
+        """ Procedure:
+            1. Parse a CLI options string with quoted values.
+            ---------
+            Verification:
+            2. Verify the properties keep their order and values.
+        """
+        self.assertEqual([('name', 'CS1'), ('node_list', 'n1,n2'),
+                          ('cmd', '/bin/touch /tmp/x')],
+                         parse_options('name="CS1" node_list=\'n1,n2\' '
+                                       'cmd="/bin/touch /tmp/x"').items())
+
+    def test_documents(self):
+        """ Procedure:
+            1. Add the CLI data of two clustered services.
+            ---------
+            Verification:
+            2. Verify one document per collection in load order.
+            3. Verify base type properties are written first.
+            4. Verify the inherited service mirrors its packages.
+        """
+        builder = ModelXmlBuilder()
+        for num in (1, 2):
+            builder.add_cli_data(_cli_data(num), _cli_data(num)['cs'][
+                'options'] + " node_list='n1,n2'", 'service')
+        documents = builder.documents()
+        self.assertEqual(['/software', '/software',
+                          '/deployments/d1/clusters/c1'],
+                         [path for path, _ in documents])
+        roots = [ElementTree.fromstring(xml) for _, xml in documents]
+        self.assertEqual([_litp('software-items-collection'),
+                          _litp('software-services-collection'),
+                          _litp('cluster-services-collection')],
+                         [root.tag for root in roots])
+        cs1 = roots[2][0]
+        self.assertEqual(
+            ['active', 'name', 'node_list', 'standby',
+             _litp('clustered-service-applications-collection'),
+             _litp('clustered-service-ha_configs-collection'),
+             _litp('vcs-clustered-service-ipaddresses-collection')],
+            [child.tag for child in cs1])
+        self.assertEqual(['status_timeout', 'tolerance_limit'],
+                         [child.tag for child in cs1[5][0]])
+        service = cs1[4][0]
+        self.assertEqual(_litp('service-inherit'), service.tag)
+        self.assertEqual('/software/services/APP1/packages/'
+                         'EXTR-lsbwrapper1', service[0][0].get('source_path'))
+
+    def test_duplicate_and_unknown_items(self):
+        """ Procedure:
+            1. Add an item twice and inherit from an unknown source.
+            ---------
+            Verification:
+            2. Verify both are refused.
+        """
+        builder = ModelXmlBuilder()
+        builder.create('/software/items/pkg', 'package', 'name=pkg')
+        self.assertRaises(ValueError, builder.create, '/software/items/pkg',
+                          'package')
+        self.assertRaises(ValueError, builder.inherit, SERVICES + '/CS1/x',
+                          '/ms/configs/fw')
+
+    def test_mixin_batches_loads(self):
+        """ Procedure:
+            1. Create three clustered services in a model batch.
+            ---------
+            Verification:
+            2. Verify one copy and three loads are issued, with no create.
+        """
+        test = Dummy()
+        test.setUp()
+        with test.model_batch('ms1'):
+            for num in (1, 2, 3):
+                test.create_cs_from_cli_data('ms1', _cli_data(num),
+                                             _cli_data(num)['cs']['options'],
+                                             'service')
+        self.assertEqual(1, test.copy_filelist_to.call_count)
+        self.assertEqual(3, test.execute_cli_load_cmd.call_count)
+        self.assertEqual(0, test.execute_cli_create_cmd.call_count)
+        test.execute_cli_load_cmd.assert_called_with(
+            'ms1', '/deployments/d1/clusters/c1',
+            '/home/litp-admin/model_batch_2.xml', '--merge')
+
+
+if __name__ == '__main__':
+    unittest.main()
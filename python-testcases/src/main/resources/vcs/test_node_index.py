@@ -0,0 +1,159 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import unittest
+import mock
+from model_snapshot import ModelSnapshot
+from node_index import (NodeIndex,
+                        NodeIndexMixin)
+
+CLUSTER = '/deployments/d1/clusters/c1'
+
+
+def _show_nodes(count):
+    """
+    Return a recursive show output of a cluster with count nodes.
+    """
+    lines = ['{0}/nodes'.format(CLUSTER),
+             '    type: collection-of-node']
+    for num in range(1, count + 1):
+        lines.extend(['{0}/nodes/n{1}'.format(CLUSTER, num),
+                      '    type: node',
+                      '    state: Applied',
+                      '    properties:',
+                      '        hostname: node{0}'.format(num)])
+    return lines
+
+
+class FakeGenericTest(object):
+    """
+    Stand-in for the GenericTest node queries.
+    """
+
+    def __init__(self):
+        self.vcs_cluster_url = CLUSTER
+        self.node_count = 2
+        self.run_command = mock.Mock(
+            side_effect=lambda *args: (_show_nodes(self.node_count), [], 0))
+
+    def setUp(self):
+        """ Base setUp """
+        pass
+
+    @staticmethod
+    def assertEqual(first, second):
+        """ Base assertEqual """
+        assert first == second
+
+    @staticmethod
+    def get_management_node_filename():
+        """ Base get_management_node_filename """
+        return 'ms1'
+
+    @staticmethod
+    def get_managed_node_filenames():
+        """ Base get_managed_node_filenames """
+        return ['mn1', 'mn2', 'mn3', 'mn4']
+
+    @staticmethod
+    def get_node_att(filename, att):
+        """ Base get_node_att """
+        return {'hostname': 'node' + filename[-1]}[att]
+
+    def execute_expand_script(self, *args, **kwargs):
+        """ Base execute_expand_script """
+        self.node_count = 4
+
+    def execute_cli_create_cmd(self, *args, **kwargs):
+        """ Base execute_cli_create_cmd """
+        pass
+
+
+class Dummy(NodeIndexMixin, FakeGenericTest):
+    """
+    Test class using the node index mixin.
+    """
+    pass
+
+
+class TestNodeIndex(unittest.TestCase):
+    """
+    Test suite for the node identity index.
+    """
+
+    def setUp(self):
+        snapshot = ModelSnapshot.from_show_output(_show_nodes(2))
+        self.index = NodeIndex.from_snapshot(
+            snapshot, CLUSTER, {'node1': 'mn1', 'node2': 'mn2'})
+
+    def test_convert_any_identity(self):
+        """ Procedure:
+            1. Convert between every pair of identities.
+            ---------
+            Verification:
+            2. Verify the conversions.
+        """
+        url = CLUSTER + '/nodes/n2'
+        self.assertEqual('mn2', self.index.filename('node2'))
+        self.assertEqual('node2', self.index.hostname('mn2'))
+        self.assertEqual(url, self.index.url('n2'))
+        self.assertEqual('n2', self.index.node_id(url))
+        self.assertRaises(KeyError, self.index.hostname, 'node9')
+        self.assertTrue('n1' in self.index)
+
+    def test_mappings(self):
+        """ Procedure:
+            1. Build the hostname and filename mappings.
+            ---------
+            Verification:
+            2. Verify both directions.
+        """
+        self.assertEqual({'node1': 'mn1', 'node2': 'mn2'},
+                         self.index.host_to_file())
+        self.assertEqual({'mn1': 'node1', 'mn2': 'node2'},
+                         self.index.file_to_host())
+        self.assertEqual(['node1', 'node2'], self.index.values('hostname'))
+
+    def test_mixin_builds_once(self):
+        """ Procedure:
+            1. Query the index of the test several times.
+            ---------
+            Verification:
+            2. Verify the model is read once.
+            3. Verify unrelated writes keep the index.
+        """
+        test = Dummy()
+        test.setUp()
+        test.node_index().hostname('mn1')
+        test.execute_cli_create_cmd('ms1', CLUSTER + '/services/CS1', 'x')
+        test.node_index().url('node2')
+        self.assertEqual(1, test.run_command.call_count)
+
+    def test_mixin_refreshes_after_expansion(self):
+        """ Procedure:
+            1. Query the index, expand the cluster and query it again.
+            ---------
+            Verification:
+            2. Verify the new nodes are in the index.
+            3. Verify a write under the nodes drops the index.
+        """
+        test = Dummy()
+        test.setUp()
+        self.assertEqual(2, len(test.node_index()))
+        test.execute_expand_script('ms1', 'expand_cloud_c1_mn2.sh')
+        self.assertEqual('mn4', test.node_index().filename('n4'))
+        test.execute_cli_create_cmd('ms1', CLUSTER + '/nodes/n5', 'node')
+        test.node_index()
+        self.assertEqual(3, test.run_command.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+from numthreads_benchmark import (NUMTHREADS_METRICS,
+                                  NumThreadsBenchmarkMixin, format_table,
+                                  main, makespan, parse_num_threads,
+                                  recommend, simulate, summarize)
+from vcs_simulator import LocalTransportMixin, build_cluster
+
+
+class Dummy(NumThreadsBenchmarkMixin, LocalTransportMixin):
+    """
+    Test class sweeping NumThreads of a simulated cluster.
+    """
+
+    def __init__(self, case):
+        self.case = case
+        self.log = mock.Mock()
+
+    def assertTrue(self, expr, msg=None):
+        """ Base assertTrue """
+        self.case.assertTrue(expr, msg)
+
+    def assertEqual(self, first, second, msg=None):
+        """ Base assertEqual """
+        self.case.assertEqual(first, second, msg)
+
+
+class TestNumThreadsBenchmark(unittest.TestCase):
+    """
+    Test suite for the NumThreads sweep.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        del NUMTHREADS_METRICS[:]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_makespan(self):
+        """ Procedure:
+            1. Schedule entry points on agents of several thread counts.
+            ---------
+            Verification:
+            2. Verify the completion times.
+        """
+        self.assertEqual(2, makespan([1, 1, 1, 1], 2))
+        self.assertEqual(3, makespan([3, 1, 1, 1], 2))
+        self.assertEqual(4, makespan([1, 1, 1, 1], 1))
+        self.assertEqual(1, makespan([1, 1], 10))
+        self.assertEqual(0, makespan([], 4))
+
+    def test_sweep(self):
+        """ Procedure:
+            1. Simulate a sweep of NumThreads for 10 and 100 apps.
+            2. Summarize it through the command line from a results file.
+            ---------
+            Verification:
+            3. Verify more threads never make the bulk times longer.
+            4. Verify the recommendations, at most one thread per app.
+            5. Verify a monitor cycle too long for the interval rules a
+               value out.
+        """
+        rows = simulate([10, 100], range(1, 21), runs=3, seed=3)
+        summary = summarize(rows)
+        online = [entry['online'] for entry in summary
+                  if entry['apps'] == 100]
+        self.assertEqual(sorted(online, reverse=True), online)
+        recommended = recommend(summary)
+        self.assertEqual(10, recommended[10])
+        self.assertTrue(15 <= recommended[100] <= 20, recommended)
+        self.assertEqual(None, recommend(summary, monitor_interval=0.1)[100])
+        lines = format_table(summary, recommended)
+        self.assertEqual(41, len(lines))
+        self.assertTrue(lines[10].endswith('<- recommended'))
+        path = os.path.join(self.tmp_dir, 'results.json')
+        with open(path, 'w') as results:
+            json.dump({'rows': [{'apps': 10, 'threads': threads,
+                                 'online': 10.0 / threads, 'offline': 5.0,
+                                 'monitor': None}
+                                for threads in (1, 5, 10)]}, results)
+        out_path = os.path.join(self.tmp_dir, 'out.json')
+        self.assertEqual(0, main([path, '--json', out_path]))
+        with open(out_path) as out:
+            self.assertEqual({'10': 10}, json.load(out)['recommended'])
+        self.assertEqual(1, main(['--apps', '10', '--threads', '1:2',
+                                  '--monitor-latency', '100', '--runs',
+                                  '1', '--seed', '1']))
+
+    def test_mixin(self):
+        """ Procedure:
+            1. Sweep two NumThreads values of a simulated group.
+            ---------
+            Verification:
+            2. Verify every value is set and the bulk times are recorded.
+            3. Verify the agent output is parsed.
+        """
+        state_path = os.path.join(self.tmp_dir, 'state.json')
+        with open(state_path, 'w') as state_file:
+            json.dump(build_cluster(1, latencies={'online': 0.2,
+                                                  'offline': 0.1}),
+                      state_file)
+        test = Dummy(self)
+        test.vcs_sim_state = state_path
+        with mock.patch.object(test, 'set_num_threads') as set_num_threads:
+            rows = test.benchmark_num_threads('ms1', 'node1', 3,
+                                              'Grp_CS_c1_CS1', 'node1',
+                                              [5, 10], timeout=10)
+        self.assertEqual([mock.call('ms1', 'node1', 5),
+                          mock.call('ms1', 'node1', 10)],
+                         set_num_threads.mock_calls)
+        self.assertEqual(rows, NUMTHREADS_METRICS)
+        self.assertEqual([5, 10], [row['threads'] for row in rows])
+        self.assertTrue(all(row['online'] >= 0.2 and row['offline'] >= 0.1
+                            for row in rows))
+        self.assertEqual(27, parse_num_threads(
+            ['#Type        Attribute    Value',
+             'Application  NumThreads   27']))
+        self.assertEqual(None, parse_num_threads([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import re
+import unittest
+import mock
+from plan_index import LOCK_TASK, UNLOCK_TASK, PlanIndex
+
+NODES = '/deployments/d1/clusters/c1/nodes'
+UPDATE_TASK = 'Update package "{0}" on node "{1}"'
+
+
+def _parsed_plan():
+    """
+    Return a parse_plan_output result that upgrades a package on two
+    nodes one after the other.
+    """
+    plan = {}
+    for num, node in ((1, 'node1'), (2, 'node2')):
+        url = '{0}/n{1}'.format(NODES, num)
+        first = num * 3 - 2
+        plan[first] = {1: {'DESC': [url, LOCK_TASK.format(node)]}}
+        plan[first + 1] = {
+            1: {'DESC': [url + '/items/pkg1', UPDATE_TASK.format('pkg1',
+                                                                 node)]},
+            2: {'DESC': [url + '/items/pkg2', UPDATE_TASK.format('pkg2',
+                                                                 node)]}}
+        plan[first + 2] = {1: {'DESC': [url, UNLOCK_TASK.format(node)]}}
+    return plan
+
+
+class TestPlanIndex(unittest.TestCase):
+    """
+    Test suite for the indexed plan.
+    """
+
+    def setUp(self):
+        self.plan = PlanIndex(_parsed_plan())
+
+    def test_indexes(self):
+        """ Procedure:
+            1. Index a plan of six phases.
+            ---------
+            Verification:
+            2. Verify the description, node and phase indexes.
+        """
+        self.assertEqual(8, len(self.plan))
+        self.assertEqual((4, 1), self.plan.position(LOCK_TASK.format(
+            'node2')))
+        self.assertEqual(None, self.plan.position('Unknown task'))
+        self.assertEqual(4, len(self.plan.tasks_on('NODE1')))
+        self.assertEqual(2, len(self.plan.by_phase[5]))
+        self.assertEqual(UPDATE_TASK.format('pkg2', 'node2'),
+                         self.plan.task_at(5, 2).description)
+
+    def test_lock_ordering(self):
+        """ Procedure:
+            1. Check the locks around the package updates.
+            ---------
+            Verification:
+            2. Verify every update happens while its node is locked.
+            3. Verify an update is not inside the lock of the other node.
+        """
+        for node in ('node1', 'node2'):
+            task = self.plan.find(re.escape(UPDATE_TASK.format('pkg2', node)))
+            self.assertTrue(self.plan.locked_before(task, node))
+            self.assertTrue(self.plan.unlocked_after(task, node))
+            self.assertTrue(self.plan.in_order(
+                LOCK_TASK.format(node), UPDATE_TASK.format('pkg1', node),
+                UNLOCK_TASK.format(node)))
+        task = self.plan.find(re.escape(UPDATE_TASK.format('pkg1', 'node2')))
+        self.assertFalse(self.plan.locked_before(task, 'node1'))
+        self.assertFalse(self.plan.in_order(UNLOCK_TASK.format('node1'),
+                                            LOCK_TASK.format('node1')))
+
+    def test_from_test(self):
+        """ Procedure:
+            1. Build the index through a test instance.
+            ---------
+            Verification:
+            2. Verify show_plan is run once.
+        """
+        test = mock.Mock()
+        test.execute_cli_showplan_cmd.return_value = (['plan'], [], 0)
+        test.cli.parse_plan_output.return_value = _parsed_plan()
+        plan = PlanIndex.from_test(test, 'ms1')
+        self.assertEqual(8, len(plan))
+        test.execute_cli_showplan_cmd.assert_called_once_with('ms1')
+        test.cli.parse_plan_output.assert_called_once_with(['plan'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import socket
+import time
+import unittest
+import mock
+from polling import (backoff_intervals,
+                     wait_for,
+                     total_wait_time,
+                     PollingMixin,
+                     WAIT_METRICS)
+
+
+class FakeClock(object):
+    """
+    A clock that only moves when the wait sleeps or a poll takes time.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        """ Current time """
+        return self.now
+
+    def sleep(self, seconds):
+        """ Advance the clock """
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestPolling(unittest.TestCase):
+    """
+    Test suite for the wait engine.
+    """
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.kwargs = {'clock': self.clock.time, 'sleep': self.clock.sleep,
+                       'rand': lambda: 0.5}
+
+    def test_backoff_intervals(self):
+        """ Procedure:
+            1. Generate intervals without and with jitter.
+            ---------
+            Verification:
+            2. Verify the growth is capped by max_interval.
+            3. Verify the jitter stays within its bounds.
+        """
+        intervals = backoff_intervals(1, 5, 2, 0, rand=lambda: 0.5)
+        self.assertEqual([1, 2, 4, 5, 5],
+                         [next(intervals) for _ in range(5)])
+        low = backoff_intervals(10, 10, 2, 0.2, rand=lambda: 0.0)
+        high = backoff_intervals(10, 10, 2, 0.2, rand=lambda: 1.0)
+        self.assertEqual(8, next(low))
+        self.assertEqual(12, next(high))
+
+    def test_wait_succeeds(self):
+        """ Procedure:
+            1. Wait for a predicate that is ready on the third poll.
+            ---------
+            Verification:
+            2. Verify the result, the value and the attempts.
+        """
+        polls = iter([False, None, 'done'])
+        result = wait_for(lambda: next(polls), first_interval=1,
+                          description='test', **self.kwargs)
+        self.assertTrue(result)
+        self.assertEqual('done', result.value)
+        self.assertEqual(3, len(result.attempts))
+        self.assertEqual([1.0, 2.0], self.clock.sleeps)
+        self.assertEqual(3.0, result.elapsed)
+
+    def test_wait_respects_deadline(self):
+        """ Procedure:
+            1. Wait for a predicate that is never ready.
+            ---------
+            Verification:
+            2. Verify the wait stops at the deadline.
+        """
+        result = wait_for(lambda: False, timeout=20, first_interval=4,
+                          max_interval=8, **self.kwargs)
+        self.assertFalse(result)
+        self.assertEqual(20.0, self.clock.now)
+        self.assertEqual([4.0, 8.0, 8.0], self.clock.sleeps)
+        self.assertTrue('timed out' in result.summary())
+
+    def test_retry_on_exceptions(self):
+        """ Procedure:
+            1. Wait for a predicate that raises socket errors and
+               then another exception.
+            ---------
+            Verification:
+            2. Verify listed exceptions are retried.
+            3. Verify other exceptions are raised.
+        """
+        errors = iter([socket.error('refused'), ValueError('boom')])
+
+        def predicate():
+            """ Raise the next error """
+            raise next(errors)
+        self.assertRaises(ValueError, wait_for, predicate,
+                          retry_on=(socket.error,), **self.kwargs)
+
+    def test_attempt_timeout(self):
+        """ Procedure:
+            1. Wait with a per attempt limit for a slow predicate.
+            ---------
+            Verification:
+            2. Verify the slow poll counts as a failed attempt.
+        """
+        polls = iter([0.5, 0])
+
+        def predicate():
+            """ Sleep for a while and return """
+            time.sleep(next(polls))
+            return True
+        result = wait_for(predicate, attempt_timeout=0.05, **self.kwargs)
+        self.assertTrue(result)
+        self.assertTrue(result.attempts[0][3].startswith('AttemptTimeout'))
+
+    def test_metrics(self):
+        """ Procedure:
+            1. Wait twice under the same metrics key.
+            ---------
+            Verification:
+            2. Verify the total wait time.
+        """
+        wait_for(lambda: False, timeout=5, metrics_key='t1', **self.kwargs)
+        wait_for(lambda: True, metrics_key='t1', **self.kwargs)
+        self.assertEqual(5.0, total_wait_time('t1'))
+        self.assertEqual(2, len(WAIT_METRICS['t1']))
+
+    def test_mixin_predicates(self):
+        """ Procedure:
+            1. Build the command and NTP predicates of the mixin.
+            ---------
+            Verification:
+            2. Verify the commands run and the return codes are checked.
+        """
+        test = PollingMixin()
+        test.run_command = mock.Mock(side_effect=[([], [], 1), ([], [], 0)])
+        predicate = test.ntp_synchronised('mn1')
+        self.assertFalse(predicate())
+        self.assertTrue(predicate())
+        self.assertTrue('chronyc' in test.run_command.call_args[0][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
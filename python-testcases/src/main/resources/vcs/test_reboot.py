@@ -0,0 +1,159 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import socket
+import unittest
+import mock
+from reboot import (ssh_port_open,
+                    RebootMixin,
+                    RebootRecord,
+                    REBOOT_METRICS)
+
+
+def _ticking_clock(start, step):
+    """
+    Return a clock that moves by step on every call.
+    """
+    now = [start - step]
+
+    def clock():
+        """ Advance and return the time """
+        now[0] += step
+        return now[0]
+    return clock
+
+
+class Dummy(RebootMixin):
+    """
+    Test class using the reboot mixin.
+    """
+
+    def __init__(self, boot_ids):
+        self.boot_ids = iter(boot_ids)
+        self.log = mock.Mock()
+        self.disconnect_all_nodes = mock.Mock()
+
+    def run_command(self, node, cmd):
+        """ Return the next boot id or fail like a dead connection """
+        boot_id = next(self.boot_ids)
+        if boot_id is None:
+            raise socket.error('Connection reset')
+        return [boot_id], [], 0
+
+    @staticmethod
+    def assertEqual(first, second):
+        """ Base assertEqual """
+        assert first == second
+
+    @staticmethod
+    def assertNotEqual(first, second):
+        """ Base assertNotEqual """
+        assert first != second
+
+    @staticmethod
+    def get_node_att(node, att):
+        """ Base get_node_att """
+        return {'ipv4': '192.168.0.42'}[att]
+
+    @staticmethod
+    def id():
+        """ Base test id """
+        return 'testset_dummy.Dummy.test_01'
+
+
+class TestReboot(unittest.TestCase):
+    """
+    Test suite for boot id based reboot detection.
+    """
+
+    @mock.patch('socket.create_connection')
+    def test_ssh_port_open(self, _connect):
+        """ Procedure:
+            1. Probe an open and a closed port.
+            ---------
+            Verification:
+            2. Verify the probe result and the connect timeout.
+        """
+        self.assertTrue(ssh_port_open('10.0.0.1', timeout=1))
+        _connect.assert_called_once_with(('10.0.0.1', 22), 1)
+        _connect.side_effect = socket.timeout
+        self.assertFalse(ssh_port_open('10.0.0.1'))
+
+    def test_record_timings(self):
+        """ Procedure:
+            1. Fill in the timings of a reboot.
+            ---------
+            Verification:
+            2. Verify the down time and time to SSH ready.
+        """
+        record = RebootRecord('mn1', 'a', 100.0)
+        self.assertEqual(None, record.down_time)
+        record.down_at, record.ssh_ready_at = 105.0, 160.0
+        record.boot_id_after = 'b'
+        self.assertTrue(record.rebooted)
+        self.assertEqual(55.0, record.down_time)
+        self.assertEqual(60.0, record.time_to_ssh_ready)
+        self.assertTrue('down time 55.0s' in record.summary())
+
+    @mock.patch('time.time')
+    @mock.patch('time.sleep')
+    @mock.patch('reboot.ssh_port_open')
+    def test_wait_for_node_reboot(self, _port_open, _sleep, _time):
+        """ Procedure:
+            1. Simulate a node whose port closes, opens again and which
+               reports the old boot id, a connection error and a new one.
+            ---------
+            Verification:
+            2. Verify the reboot is confirmed with the new boot id.
+            3. Verify the record is kept in the metrics.
+            4. Verify the framework connections are only dropped after
+               the connection error.
+            5. Verify the pooled sessions of the node are dropped once the
+               port is open, without dropping the framework connections.
+        """
+        _time.side_effect = _ticking_clock(100.0, 1.0)
+        _port_open.side_effect = [True, False, False, True]
+        test = Dummy(['old', None, 'new'])
+        record = test.wait_for_node_reboot('mn1', 'old', timeout=1800)
+        self.assertTrue(record.rebooted)
+        self.assertEqual('new', record.boot_id_after)
+        self.assertTrue(record.down_time > 0)
+        _port_open.assert_called_with('192.168.0.42', 22, 2)
+        self.assertTrue(record in REBOOT_METRICS)
+        self.assertEqual(1, test.disconnect_all_nodes.call_count)
+        test = Dummy(['new'])
+        test.reset_node_session = mock.Mock()
+        _port_open.side_effect = [False, True]
+        self.assertTrue(test.wait_for_node_reboot('mn1', 'old').rebooted)
+        test.reset_node_session.assert_called_once_with('mn1')
+        self.assertEqual(0, test.disconnect_all_nodes.call_count)
+
+    @mock.patch('time.time')
+    @mock.patch('time.sleep')
+    @mock.patch('reboot.ssh_port_open')
+    def test_wait_for_node_reboot_times_out(self, _port_open, _sleep, _time):
+        """ Procedure:
+            1. Simulate a node whose port never opens again.
+            ---------
+            Verification:
+            2. Verify the reboot is not confirmed.
+        """
+        _time.side_effect = _ticking_clock(0.0, 50.0)
+        _port_open.return_value = False
+        test = Dummy([])
+        record = test.wait_for_node_reboot('mn1', 'old', issued_at=0.0,
+                                           timeout=600)
+        self.assertFalse(record.rebooted)
+        self.assertEqual(None, record.ssh_ready_at)
+
+
+if __name__ == '__main__':
+    unittest.main()
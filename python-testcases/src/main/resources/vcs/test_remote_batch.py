@@ -0,0 +1,169 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import base64
+import json
+import subprocess
+import sys
+import unittest
+import remote_batch
+from remote_batch import (AGENT_LOCAL_PATH,
+                          AGENT_MISSING_RC,
+                          BatchAgentMixin,
+                          build_request,
+                          parse_hares_display,
+                          parse_response,
+                          query)
+
+HARES_DISPLAY = [
+    '#Resource    Attribute             System     Value',
+    'Res_App_c1_CS1_APP1 MonitorTimeout  global     60',
+    'Res_App_c1_CS1_APP1 StartProgram    global     /bin/systemctl start x',
+    'Res_App_c1_CS1_APP1 State           node1      ONLINE',
+    'Res_App_c1_CS1_APP1 State           node2      OFFLINE',
+    'Res_App_c1_CS1_APP1 User            global',
+]
+
+
+def _run_agent(request):
+    """
+    Run the agent locally and return its output lines.
+    """
+    proc = subprocess.Popen([sys.executable, AGENT_LOCAL_PATH],
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    stdout, _ = proc.communicate(request)
+    return stdout.splitlines()
+
+
+class FakeGenericTest(object):
+    """
+    Stand-in for GenericTest that runs the batch command locally.
+    """
+
+    def __init__(self):
+        self.copies = []
+        self.commands = []
+        self.missing = False
+
+    def copy_file_to(self, node, local_path, remote_dir, root_copy,
+                     add_to_cleanup):
+        """ Base copy_file_to """
+        self.copies.append((node, local_path, remote_dir))
+        return True
+
+    def run_command(self, node, cmd, su_root):
+        """ Decodes the payload of the batch command and runs the agent """
+        self.commands.append((node, cmd))
+        if self.missing:
+            self.missing = False
+            return [], [], AGENT_MISSING_RC
+        payload = cmd.split('echo ')[1].split(' |')[0]
+        return _run_agent(base64.b64decode(payload)), [], 0
+
+    def assertTrue(self, expr):
+        """ Base assertTrue """
+        assert expr
+
+    def assertEqual(self, first, second, msg=None):
+        """ Base assertEqual """
+        assert first == second, msg
+
+
+class Dummy(BatchAgentMixin, FakeGenericTest):
+    """
+    Test class using the batch agent mixin.
+    """
+    pass
+
+
+class TestRemoteBatch(unittest.TestCase):
+    """
+    Test suite for the remote batch agent.
+    """
+
+    def setUp(self):
+        remote_batch._AGENT_NODES.clear()
+
+    def test_parse_hares_display(self):
+        """ Procedure:
+            1. Parse hares -display output.
+            ---------
+            Verification:
+            2. Verify values with spaces, per system rows and empty values.
+        """
+        display = parse_hares_display(HARES_DISPLAY)
+        self.assertEqual('60', display['MonitorTimeout'][0]['VALUE'])
+        self.assertEqual('/bin/systemctl start x',
+                         display['StartProgram'][0]['VALUE'])
+        self.assertEqual(['node1', 'node2'],
+                         [row['SYSTEM'] for row in display['State']])
+        self.assertEqual('', display['User'][0]['VALUE'])
+        self.assertFalse('Attribute' in display)
+
+    def test_agent(self):
+        """ Procedure:
+            1. Run a batch of parallel and serial commands with the agent.
+            ---------
+            Verification:
+            2. Verify stdout, stderr, rc and duration of every command.
+            3. Verify serial commands run in the given order.
+        """
+        out = '/tmp/test_remote_batch_{0}'.format(id(self))
+        request = build_request({
+            'a': {'cmd': 'echo one; echo two', 'parallel': True},
+            'b': {'cmd': 'echo err >&2; exit 3', 'parallel': True},
+            'c': 'echo c > {0}'.format(out),
+            'd': 'cat {0}; rm -f {0}'.format(out)}, workers=2)
+        results = parse_response(_run_agent(request))
+        self.assertEqual(['one', 'two'], results['a'].stdout)
+        self.assertEqual((['err'], 3), (results['b'].stderr, results['b'].rc))
+        self.assertEqual(['c'], results['d'].stdout)
+        self.assertTrue(results['a'].duration >= 0)
+        stdout, stderr, rc = results['a']
+        self.assertEqual(([], 0), (stderr, rc))
+
+    def test_build_request(self):
+        """ Procedure:
+            1. Build a request with a named query and a plain command.
+            ---------
+            Verification:
+            2. Verify only the query is marked as parallel.
+        """
+        request = json.loads(build_request({
+            'res': query('hares_display', 'Res_App_1'), 'cmd': 'reboot'}))
+        self.assertEqual(
+            [{'id': 'cmd', 'cmd': 'reboot', 'parallel': False},
+             {'id': 'res', 'cmd': '/opt/VRTS/bin/hares -display Res_App_1',
+              'parallel': True}], request['commands'])
+
+    def test_mixin_installs_agent_once(self):
+        """ Procedure:
+            1. Run two batches on a node, the agent missing for the second.
+            ---------
+            Verification:
+            2. Verify each batch uses one round-trip plus one retry when
+               the agent is missing.
+            3. Verify the agent is copied again only when missing.
+        """
+        test = Dummy()
+        results = test.batch_run('node1', {'a': 'echo a', 'b': 'echo b'})
+        self.assertEqual(['b'], results['b'].stdout)
+        self.assertEqual(1, len(test.commands))
+        test.missing = True
+        test.batch_run('node1', {'a': 'echo a'})
+        test.batch_run('node2', {})
+        self.assertEqual(3, len(test.commands))
+        self.assertEqual([('node1', AGENT_LOCAL_PATH, '/tmp')] * 2,
+                         test.copies)
+
+
+if __name__ == '__main__':
+    unittest.main()
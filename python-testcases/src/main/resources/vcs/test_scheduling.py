@@ -0,0 +1,177 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+from scheduling import (BASE, FOUR_NODE, PHYSICAL, Plan, load_entries,
+                        read_testset, requires, schedule, validate)
+
+TESTSETS = {
+    'testset_a.py': '''
+        from scheduling import requires
+
+        class StoryA(GenericTest):
+
+            def tearDown(self):
+                self.restore_snapshot()
+
+            @attr('all', 'expansion')
+            def test_01_expanded(self):
+                pass
+
+            @attr('all', 'revert')
+            def test_02_base(self):
+                self._helper()
+
+            def _helper(self):
+                self.expand_cluster('ms1')
+        ''',
+    'testset_b.py': '''
+        from scheduling import requires
+
+        @requires(baseline='cdb')
+        class StoryB(GenericTest):
+
+            @attr('all', 'kgb-physical')
+            def test_01_physical(self):
+                pass
+
+            @attr('all', 'revert')
+            @requires(topology='base', after='testset_a.py:test_02_base')
+            def test_02_after(self):
+                pass
+        ''',
+    'testset_c.py': '''
+        class StoryC(GenericTest):
+
+            @attr('all', 'revert')
+            def test_01_base(self):
+                pass
+
+            @attr('all', 'expansion')
+            def test_02_expanded(self):
+                pass
+        ''',
+    'testset_d.py': '''
+        class StoryD(GenericTest):
+
+            @attr('all', 'revert')
+            def test_01_base(self):
+                pass
+
+            @attr('all', 'revert')
+            def test_02_expanded(self):
+                self.assertTrue(self.is_model_expanded())
+        ''',
+}
+
+
+class TestScheduling(unittest.TestCase):
+    """
+    Test suite for the topology aware test scheduler.
+    """
+
+    def setUp(self):
+        self.testset_dir = tempfile.mkdtemp()
+        for name, source in TESTSETS.items():
+            with open(os.path.join(self.testset_dir, name), 'w') as testset:
+                testset.write(textwrap.dedent(source))
+
+    def tearDown(self):
+        shutil.rmtree(self.testset_dir)
+
+    def _entries(self, test_ids):
+        """ Loads the entries of the fake test sets """
+        return load_entries(test_ids, self.testset_dir)
+
+    def test_requires(self):
+        """ Procedure:
+            1. Decorate a function twice with requires.
+            ---------
+            Verification:
+            2. Verify both requirements are attached.
+        """
+        @requires(topology=FOUR_NODE)
+        @requires(fencing=True)
+        def test_func():
+            """ Test function """
+            pass
+        self.assertEqual({'topology': FOUR_NODE, 'fencing': True},
+                         test_func.requirements)
+
+    def test_read_testset(self):
+        """ Procedure:
+            1. Read the tests of the fake test sets.
+            ---------
+            Verification:
+            2. Verify tags and calls through helpers give the topology.
+            3. Verify a snapshot restore in tearDown contracts the cluster.
+            4. Verify class and test requirements are merged.
+        """
+        first, second = read_testset(os.path.join(self.testset_dir,
+                                                  'testset_a.py'))
+        self.assertEqual('testset_a.py:test_01_expanded', first.test_id)
+        self.assertEqual(FOUR_NODE, first.topology)
+        self.assertEqual(FOUR_NODE, second.topology)
+        self.assertEqual(BASE, second.leaves_topology)
+        physical, after = read_testset(os.path.join(self.testset_dir,
+                                                    'testset_b.py'))
+        self.assertEqual(PHYSICAL, physical.platform)
+        self.assertEqual('cdb', physical.baseline)
+        self.assertEqual(BASE, after.topology)
+        self.assertEqual('cdb', after.baseline)
+        self.assertEqual(['testset_a.py:test_02_base'], after.after)
+
+    def test_schedule(self):
+        """ Procedure:
+            1. Schedule tests alternating between topologies.
+            ---------
+            Verification:
+            2. Verify tests of a topology are grouped and fewer expansions
+               are needed.
+            3. Verify the schedule is valid.
+        """
+        original = self._entries(['testset_c.py:test_01_base',
+                                  'testset_c.py:test_02_expanded',
+                                  'testset_d.py:test_01_base',
+                                  'testset_d.py:test_02_expanded'])
+        plan = schedule(original)
+        self.assertEqual(['testset_c.py:test_01_base',
+                          'testset_d.py:test_01_base',
+                          'testset_c.py:test_02_expanded',
+                          'testset_d.py:test_02_expanded'],
+                         [entry.test_id for entry in plan.entries])
+        self.assertEqual(1, plan.counts()['expansion'])
+        self.assertEqual(2, Plan(original).counts()['expansion'])
+        self.assertEqual([], validate(original, plan))
+
+    def test_validate(self):
+        """ Procedure:
+            1. Validate a plan that runs a test before one it must follow.
+            ---------
+            Verification:
+            2. Verify the violation is reported.
+        """
+        original = self._entries(['testset_a.py:test_01_expanded',
+                                  'testset_a.py:test_02_base',
+                                  'testset_b.py:test_01_physical',
+                                  'testset_b.py:test_02_after'])
+        plan = Plan([original[0], original[2], original[3], original[1]])
+        self.assertIn('testset_b.py:test_02_after runs before '
+                      'testset_a.py:test_02_base', validate(original, plan))
+        self.assertEqual([], validate(original, schedule(original)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,315 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import os
+import subprocess
+import unittest
+from session_pool import (RootShell,
+                          SessionError,
+                          SessionPool,
+                          SessionPoolMixin,
+                          command_names)
+
+
+class FakeChannel(object):
+    """
+    Interactive channel backed by a local bash process. The su command
+    prompts for a password and swallows the next line. Like su, it then
+    drops what is sent before its root prompt is read, or prints the
+    failure message when su_fails is set. After su, id reports the given
+    uid.
+    """
+
+    def __init__(self, uid=0, su_fails=False):
+        self.uid = uid
+        self.su_fails = su_fails
+        self.su_starting = False
+        self.proc = subprocess.Popen(['/bin/bash'], stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.STDOUT)
+        self.closed = False
+        self.pending = ''
+        self.password = None
+        self.expect_password = False
+
+    def settimeout(self, timeout):
+        """ Base settimeout """
+        pass
+
+    def send(self, data):
+        """ Write to bash, handling the su password prompt """
+        if data == 'su -\n':
+            self.expect_password = True
+            self.pending = 'Password: '
+            return
+        if self.su_starting:
+            return
+        if self.expect_password:
+            self.expect_password = False
+            self.password = data.strip()
+            if self.su_fails:
+                self.pending = 'su: Authentication failure\n'
+                return
+            self.su_starting = True
+            self.pending = '[root@node1 ~]# '
+            data = 'id() {{ echo {0}; }}\n'.format(self.uid)
+        self.proc.stdin.write(data)
+        self.proc.stdin.flush()
+
+    def recv(self, size):
+        """ Read the prompt, or the output of bash """
+        if self.pending:
+            data, self.pending = self.pending, ''
+            self.su_starting = False
+            return data
+        return os.read(self.proc.stdout.fileno(), size)
+
+    def exit_status_ready(self):
+        """ Base exit_status_ready """
+        return self.proc.poll() is not None
+
+    def close(self):
+        """ Stop bash """
+        self.closed = True
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+class FakeTransport(object):
+    """
+    Transport that can be marked as failed.
+    """
+
+    def __init__(self):
+        self.active = True
+
+    def is_active(self):
+        """ Base is_active """
+        return self.active
+
+    def send_ignore(self):
+        """ Base send_ignore """
+        if not self.active:
+            raise EOFError()
+
+
+class FakeClient(object):
+    """
+    SSHClient whose interactive shells are local bash processes.
+    """
+
+    def __init__(self):
+        self.transport = FakeTransport()
+        self.channels = []
+
+    def get_transport(self):
+        """ Base get_transport """
+        return self.transport
+
+    def invoke_shell(self, width):
+        """ Base invoke_shell """
+        self.channels.append(FakeChannel())
+        return self.channels[-1]
+
+    def close(self):
+        """ Close the shells """
+        self.transport.active = False
+        for channel in self.channels:
+            channel.close()
+
+
+class FakeGenericTest(object):
+    """
+    Stand-in for GenericTest node attributes and run_command.
+    """
+
+    def __init__(self):
+        self.framework_commands = []
+        self.logs = []
+
+    def get_node_att(self, node, att):
+        """ Base get_node_att """
+        if node == 'unknown':
+            raise KeyError(node)
+        return {'ipv4': '10.0.0.1', 'username': 'litp-admin',
+                'password': 'pw', 'rootpw': 'rootpw'}[att]
+
+    def run_command(self, node, cmd, su_root=False, default_asserts=False,
+                    **kwargs):
+        """ Base run_command """
+        self.framework_commands.append((node, cmd))
+        return [], [], 0
+
+    def log(self, level, message):
+        """ Base log """
+        self.logs.append(message)
+
+    def tearDown(self):
+        """ Base tearDown """
+        pass
+
+
+class Dummy(SessionPoolMixin, FakeGenericTest):
+    """
+    Test class using the session pool mixin.
+    """
+    pass
+
+
+class TestSessionPool(unittest.TestCase):
+    """
+    Test suite for the SSH session pool.
+    """
+
+    def setUp(self):
+        self.clients = []
+        self.pool = SessionPool(connect=self._connect)
+
+    def tearDown(self):
+        self.pool.close_all()
+
+    def _connect(self, host, user, password):
+        """ Record a new connection """
+        self.clients.append(FakeClient())
+        return self.clients[-1]
+
+    def test_root_shell(self):
+        """ Procedure:
+            1. Run commands in a root shell.
+            ---------
+            Verification:
+            2. Verify stdout, stderr and return code are separated.
+            3. Verify su is only run once and gets the root password.
+            4. Verify the shell setup is sent after the root prompt, as
+               su drops what is sent before it.
+        """
+        channel = FakeChannel()
+        try:
+            shell = RootShell(channel, 'secret', timeout=10)
+            self.assertEqual('secret', channel.password)
+            self.assertEqual((['a', 'b'], ['err'], 3),
+                             shell.run('echo a; echo b; echo err >&2; '
+                                       '(exit 3)'))
+            self.assertEqual((['x y'], [], 0), shell.run("echo 'x y'"))
+            self.assertEqual(['cat'], shell.run('echo $PAGER')[0])
+        finally:
+            channel.close()
+
+    def test_root_shell_isolation(self):
+        """ Procedure:
+            1. Run a command that exits the shell, as the batch agent
+               command does when the agent file is missing.
+            2. Run commands that change directory and environment.
+            3. Start a root shell whose su does not give root, and one
+               whose su fails.
+            ---------
+            Verification:
+            4. Verify the exit code is returned and the shell still runs
+               the next command.
+            5. Verify the directory and environment are reset, and pagers
+               are disabled.
+            6. Verify the shell that is not root, and the failed su, are
+               refused.
+        """
+        channel = FakeChannel()
+        try:
+            shell = RootShell(channel, 'secret', timeout=10)
+            self.assertEqual(97, shell.run(
+                '[ -f /tmp/.missing_batch_agent ] || exit 97; echo found')[2])
+            home = shell.run('pwd')[0]
+            shell.run('cd /tmp; export SESSION_POOL_TEST=1')
+            self.assertEqual((home, ['']), (shell.run('pwd')[0], shell.run(
+                'echo "$SESSION_POOL_TEST"')[0]))
+            self.assertEqual(['cat'], shell.run('echo $PAGER')[0])
+        finally:
+            channel.close()
+        for channel in (FakeChannel(uid=1000), FakeChannel(su_fails=True)):
+            try:
+                self.assertRaises(SessionError, RootShell, channel, 'secret',
+                                  timeout=10)
+            finally:
+                channel.close()
+
+    def test_reuse_and_reconnect(self):
+        """ Procedure:
+            1. Run root commands on two hosts, then fail one host.
+            ---------
+            Verification:
+            2. Verify sessions and root shells are reused.
+            3. Verify only the failed host is reconnected.
+        """
+        for _ in range(3):
+            for host in ('ms', 'n1'):
+                self.assertEqual(0, self.pool.run(
+                    host, 'litp-admin', 'pw', 'true', 'root')[2])
+        self.assertEqual(2, len(self.clients))
+        self.clients[1].transport.active = False
+        self.pool.run('n1', 'litp-admin', 'pw', 'true', 'root')
+        self.pool.run('ms', 'litp-admin', 'pw', 'true', 'root')
+        stats = self.pool.stats()
+        self.assertEqual((3, 1, 5, 3, 5), (
+            stats['connections'], stats['reconnections'], stats['reuses'],
+            stats['root_shells'], stats['su_skipped']))
+        self.assertFalse(self.clients[0].channels[0].closed)
+        self.assertTrue(self.clients[1].channels[0].closed)
+
+    def test_failed_command_drops_session(self):
+        """ Procedure:
+            1. Run a command on a session whose shell cannot start.
+            ---------
+            Verification:
+            2. Verify a SessionError is raised and the session is dropped.
+        """
+        def broken_shell(width):
+            """ Shell that closes at once """
+            channel = FakeChannel()
+            channel.close()
+            return channel
+        self.pool.session('n1', 'u', 'pw').client.invoke_shell = broken_shell
+        self.assertRaises(SessionError, self.pool.run, 'n1', 'u', 'pw',
+                          'true', 'root')
+        self.assertEqual({}, self.pool.sessions)
+
+    def test_mixin(self):
+        """ Procedure:
+            1. Run commands through the mixin.
+            ---------
+            Verification:
+            2. Verify litp and reboot commands, and unknown nodes, use
+               GenericTest.
+            3. Verify other commands use the pool, also when their
+               arguments contain litp or reboot.
+        """
+        self.assertEqual(['sleep', 'shutdown', 'grep'], command_names(
+            'sleep 1; /sbin/shutdown -r now && grep reboot /tmp/x'))
+        test = Dummy()
+        test.session_pool = self.pool
+        self.assertEqual((['1'], [], 0),
+                         test.run_command('n1', 'echo 1', su_root=True))
+        test.run_command('ms1', '/usr/bin/litp show -p /')
+        test.run_command('unknown', 'hostname')
+        test.run_command('n1', 'hostname', su_timeout_secs=30)
+        self.assertEqual([('ms1', '/usr/bin/litp show -p /'),
+                          ('unknown', 'hostname'), ('n1', 'hostname')],
+                         test.framework_commands)
+        test.run_command('n1', 'hostname', su_root=True, logging=False)
+        self.assertEqual(3, len(test.framework_commands))
+        self.assertEqual((['litp-admin reboot'], [], 0), test.run_command(
+            'n1', 'echo litp-admin reboot', su_root=True))
+        test.run_command('n1', '(sleep 1; /sbin/reboot) &', su_root=True)
+        self.assertEqual(('n1', '(sleep 1; /sbin/reboot) &'),
+                         test.framework_commands[-1])
+        test.tearDown()
+        self.assertTrue('1 connections' in test.logs[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
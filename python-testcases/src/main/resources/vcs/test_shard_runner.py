@@ -0,0 +1,182 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+from xml.etree import ElementTree
+import scheduling
+from scheduling import CLOUD, PHYSICAL, requires
+from shard_runner import (Shard, assign, merge_reports, run_shards,
+                          testset_groups)
+
+# Writes a passing nose report of the file:Class.test arguments given after
+# the report and connection directory, and prints the directory it got
+FAKE_NOSE = '''
+    import os
+    import sys
+    print sys.argv[2], os.environ['VCS_SHARD_CONNECTION_DIR']
+    cases = ''.join('<testcase classname="{0}.{1}" name="{2}" time="1"/>'
+                    .format(test.split('.py:')[0],
+                            *test.split(':')[1].split('.'))
+                    for test in sys.argv[3:])
+    with open(sys.argv[1], 'w') as report:
+        report.write('<testsuite name="nosetests">' + cases + '</testsuite>')
+    '''
+
+
+def _entry(testset, name, tags=('all',), **requirements):
+    """
+    Return the entry of a test of class Story in the test set.
+    """
+    return scheduling.TestEntry(testset, name, tags, requires(**requirements)(
+        lambda: None).requirements, class_name='Story')
+
+
+class TestShardRunner(unittest.TestCase):
+    """
+    Test suite for the sharded test runner.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _write(self, name, content):
+        """ Writes a file in the temporary directory """
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'w') as out:
+            out.write(content)
+        return path
+
+    def test_parse(self):
+        """ Procedure:
+            1. Parse shard options with and without capabilities.
+            ---------
+            Verification:
+            2. Verify the name, directory and capabilities.
+            3. Verify a shard without a directory is rejected.
+        """
+        shard = Shard.parse('hw1=/conn/hw1:physical')
+        self.assertEqual(('hw1', '/conn/hw1'), (shard.name,
+                                                shard.connection_dir))
+        self.assertEqual(set([PHYSICAL]), shard.capabilities)
+        self.assertTrue(CLOUD in Shard.parse('c1=/conn/c1').capabilities)
+        self.assertRaises(ValueError, Shard.parse, 'c1')
+
+    def test_testset_groups(self):
+        """ Procedure:
+            1. Group test sets where one runs after another and two run
+               after a shared test set.
+            ---------
+            Verification:
+            2. Verify the dependent test sets are grouped.
+            3. Verify the shared test set is left out of the groups.
+        """
+        entries = [_entry('setup.py', 'test_01'),
+                   _entry('a.py', 'test_01', after='setup.py'),
+                   _entry('b.py', 'test_01', after='setup.py'),
+                   _entry('c.py', 'test_01', after='a.py:test_01')]
+        self.assertEqual([[entries[1], entries[3]], [entries[2]]],
+                         testset_groups(entries, shared=('setup.py',)))
+
+    def test_assign(self):
+        """ Procedure:
+            1. Assign cloud and physical test sets to a cloud and a
+               physical shard.
+            ---------
+            Verification:
+            2. Verify test sets go to the shards providing their needs.
+            3. Verify the shared test set runs first on both shards.
+            4. Verify test sets no shard can run are rejected.
+        """
+        entries = [_entry('setup.py', 'test_01'),
+                   _entry('a.py', 'test_01', after='setup.py'),
+                   _entry('b.py', 'test_01', ('all', 'kgb-physical'),
+                          after='setup.py'),
+                   _entry('c.py', 'test_01')]
+        cloud = Shard('cloud', '/c')
+        physical = Shard('hw', '/h', [PHYSICAL])
+        assign(entries, [cloud, physical], shared=('setup.py',))
+        self.assertEqual(['setup.py:test_01', 'a.py:test_01',
+                          'c.py:test_01'],
+                         [entry.test_id for entry in cloud.entries])
+        self.assertEqual(['setup.py:test_01', 'b.py:test_01'],
+                         [entry.test_id for entry in physical.entries])
+        self.assertRaises(ValueError, assign, entries, [Shard('c', '/c')])
+
+    def test_merge_reports(self):
+        """ Procedure:
+            1. Merge two reports sharing a test and a missing report.
+            ---------
+            Verification:
+            2. Verify the shared test is reported once, as failed.
+            3. Verify the missing report is reported as an error.
+        """
+        first = self._write('1.xml', '<testsuite>'
+                            '<testcase classname="s.S" name="test_01"/>'
+                            '<testcase classname="a.A" name="test_01"/>'
+                            '</testsuite>')
+        second = self._write('2.xml', '<testsuite>'
+                             '<testcase classname="s.S" name="test_01">'
+                             '<failure/></testcase></testsuite>')
+        output = os.path.join(self.tmp_dir, 'merged.xml')
+        totals = merge_reports([('one', first, 0), ('two', second, 1),
+                                ('three', '/missing.xml', 2)], output)
+        self.assertEqual({'tests': 3, 'errors': 1, 'failures': 1,
+                          'skip': 0}, totals)
+        root = ElementTree.parse(output).getroot()
+        self.assertEqual('3', root.get('tests'))
+        self.assertEqual(['a.A', 's.S', 'shard_runner'],
+                         sorted(case.get('classname') for case in root))
+
+    def test_run_shards(self):
+        """ Procedure:
+            1. Run two shards with a command that reports its tests.
+            ---------
+            Verification:
+            2. Verify the tests of both shards are in the merged report.
+            3. Verify every shard ran against its own connection directory.
+            4. Verify a command without the connection directory is
+               refused.
+        """
+        script = self._write('fake_nose.py', textwrap.dedent(FAKE_NOSE))
+        first, second = Shard('one', '/c1'), Shard('two', '/c2')
+        first.entries = [_entry('testset_a.py', 'test_01')]
+        second.entries = [_entry('testset_b.py', 'test_01'),
+                          _entry('testset_b.py', 'test_02')]
+        output = os.path.join(self.tmp_dir, 'nosetests.xml')
+        command = '{0} {1} {{report}} {{tests}}'.format(
+            sys.executable, script)
+        self.assertRaises(ValueError, run_shards, [first, second], output,
+                          command)
+        totals = run_shards([first, second], output, command.replace(
+            '{report}', '{report} {connection_dir}'))
+        self.assertEqual(3, totals['tests'])
+        self.assertEqual(0, totals['failures'] + totals['errors'])
+        self.assertEqual(
+            ['testset_a.Story', 'testset_b.Story', 'testset_b.Story'],
+            [case.get('classname') for case in
+             ElementTree.parse(output).getroot()])
+        for name, connection_dir in (('one', '/c1'), ('two', '/c2')):
+            with open(os.path.join(self.tmp_dir, 'nosetests_{0}.xml'
+                                   '.log'.format(name))) as log:
+                self.assertEqual('{0} {0}'.format(connection_dir),
+                                 log.read().strip())
+
+
+if __name__ == '__main__':
+    unittest.main()
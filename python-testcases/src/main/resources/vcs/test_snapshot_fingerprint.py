@@ -0,0 +1,192 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import json
+import unittest
+import mock
+from model_snapshot import ModelSnapshot
+from snapshot_fingerprint import (DEFAULT_SNAPSHOT,
+                                  SnapshotMixin,
+                                  model_fingerprint,
+                                  snapshot_is_current)
+
+
+def _show_model(standby='1', timestamp='1700000000.0'):
+    """
+    Return a recursive show output of / with a snapshot when a timestamp
+    is given.
+    """
+    lines = ['/deployments/d1/clusters/c1/services/CS1',
+             '    type: vcs-clustered-service',
+             '    state: Applied',
+             '    properties:',
+             '        name: CS1',
+             '        standby: {0}'.format(standby),
+             '/plans/plan',
+             '    type: plan',
+             '    state: successful',
+             '/snapshots',
+             '    type: collection-of-snapshot-base',
+             '    state: Applied']
+    if timestamp:
+        lines.extend([DEFAULT_SNAPSHOT,
+                      '    type: snapshot-base',
+                      '    state: Applied',
+                      '    properties:',
+                      '        timestamp: {0}'.format(timestamp)])
+    return lines
+
+
+class FakeGenericTest(object):
+    """
+    Stand-in for GenericTest with the model and the records file of an MS.
+    """
+
+    def __init__(self, model, records):
+        self.model = model
+        self.records = records
+        self.packages = ['ERIClitpcore_CXP9030418-2.1.0.noarch']
+        self.execute_and_wait_createsnapshot = mock.Mock(
+            side_effect=self._create)
+        self.execute_and_wait_restore_snapshot = mock.Mock()
+
+    def _create(self, ms_node, add_to_cleanup, remove_snapshot):
+        """ Takes a new snapshot """
+        self.model = self.model[:9] + _show_model(timestamp='1800000000.0')[9:]
+
+    def run_command(self, node, cmd, su_root=False):
+        """ Answers show, cat and echo on the MS """
+        if cmd.startswith('/bin/cat'):
+            return [json.dumps(self.records)], [], 0
+        if cmd.startswith('/bin/echo'):
+            self.records = json.loads(cmd.split("'")[1])
+            return [], [], 0
+        if cmd.startswith('/bin/rpm'):
+            return self.packages, [], 0
+        return self.model, [], 0
+
+    def id(self):
+        """ Base id """
+        return 'test_snapshot'
+
+    def log(self, level, message):
+        """ Base log """
+        pass
+
+    @staticmethod
+    def assertEqual(first, second, msg=None):
+        """ Base assertEqual """
+        assert first == second, msg
+
+
+class Dummy(SnapshotMixin, FakeGenericTest):
+    """
+    Test class using the snapshot mixin.
+    """
+    pass
+
+
+class TestSnapshotFingerprint(unittest.TestCase):
+    """
+    Test suite for the snapshot fingerprints.
+    """
+
+    def test_model_fingerprint(self):
+        """ Procedure:
+            1. Fingerprint models that differ in snapshots, plans and in a
+               property.
+            ---------
+            Verification:
+            2. Verify only the property change changes the fingerprint.
+            3. Verify a package upgrade changes the fingerprint.
+        """
+        base = model_fingerprint(ModelSnapshot.from_show_output(
+            _show_model()))
+        self.assertNotEqual(base, model_fingerprint(
+            ModelSnapshot.from_show_output(_show_model()),
+            ['ERIClitpvcs_CXP9030870-2.0.1.noarch']))
+        self.assertEqual(base, model_fingerprint(
+            ModelSnapshot.from_show_output(_show_model(timestamp=None))))
+        self.assertNotEqual(base, model_fingerprint(
+            ModelSnapshot.from_show_output(_show_model(standby='0'))))
+
+    def test_snapshot_is_current(self):
+        """ Procedure:
+            1. Match snapshots against recorded fingerprints.
+            ---------
+            Verification:
+            2. Verify a missing, replaced or unrecorded snapshot, or a
+               changed model, is not current.
+        """
+        model = ModelSnapshot.from_show_output(_show_model())
+        record = {'fingerprint': model_fingerprint(model),
+                  'timestamp': '1700000000.0'}
+        self.assertTrue(snapshot_is_current(model,
+                                            {DEFAULT_SNAPSHOT: record}))
+        self.assertFalse(snapshot_is_current(model, {}))
+        for show in (_show_model(timestamp=None),
+                     _show_model(timestamp='1'), _show_model(standby='0')):
+            self.assertFalse(snapshot_is_current(
+                ModelSnapshot.from_show_output(show),
+                {DEFAULT_SNAPSHOT: record}))
+
+    def test_create_snapshot_if_changed(self):
+        """ Procedure:
+            1. Create the snapshot twice and then after a model change.
+            ---------
+            Verification:
+            2. Verify the first call replaces the unrecorded snapshot.
+            3. Verify the second call skips the unchanged model.
+            4. Verify the changed model is snapshot again.
+            5. Verify an upgraded LITP package is snapshot again.
+        """
+        test = Dummy(_show_model(), {})
+        self.assertTrue(test.create_snapshot_if_changed('ms1'))
+        test.execute_and_wait_createsnapshot.assert_called_once_with(
+            'ms1', add_to_cleanup=False, remove_snapshot=True)
+        self.assertEqual('1800000000.0',
+                         test.records[DEFAULT_SNAPSHOT]['timestamp'])
+        self.assertFalse(test.create_snapshot_if_changed('ms1'))
+        test.model = test.model[:5] + ['        standby: 0'] + test.model[6:]
+        self.assertTrue(test.create_snapshot_if_changed('ms1'))
+        self.assertEqual(2, test.execute_and_wait_createsnapshot.call_count)
+        self.assertFalse(test.create_snapshot_if_changed('ms1'))
+        test.packages = ['ERIClitpcore_CXP9030418-2.2.0.noarch']
+        self.assertTrue(test.create_snapshot_if_changed('ms1'))
+
+    def test_restore_snapshot_and_recreate(self):
+        """ Procedure:
+            1. Restore a recorded snapshot of the current model.
+            ---------
+            Verification:
+            2. Verify the snapshot is restored with the nodes to power off.
+            3. Verify the restored snapshot is removed and created again
+               although it matches the model.
+            4. Verify the new snapshot is recorded.
+        """
+        test = Dummy(_show_model(), {})
+        test.create_snapshot_if_changed('ms1')
+        self.assertTrue(snapshot_is_current(
+            ModelSnapshot.from_show_output(test.model), test.records,
+            packages=test.packages))
+        test.execute_and_wait_createsnapshot.reset_mock()
+        test.restore_snapshot_and_recreate('ms1', poweroff_nodes=['node2'])
+        test.execute_and_wait_restore_snapshot.assert_called_once_with(
+            'ms1', poweroff_nodes=['node2'])
+        test.execute_and_wait_createsnapshot.assert_called_once_with(
+            'ms1', add_to_cleanup=False, remove_snapshot=True)
+        self.assertTrue(snapshot_is_current(
+            ModelSnapshot.from_show_output(test.model), test.records,
+            packages=test.packages))
+
+
+if __name__ == '__main__':
+    unittest.main()
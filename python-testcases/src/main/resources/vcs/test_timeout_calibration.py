@@ -0,0 +1,183 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+from timeout_calibration import (TIMEOUT_CALIBRATION, TimeoutCalibrationMixin,
+                                 calibrate, default_timeouts, format_report,
+                                 main, parse_engine_log, parse_timeouts)
+
+RES = 'Res_App_c1_CS1_APP1'
+OWNER = '(Owner: Unspecified, Group: Grp_CS_c1_CS1)'
+ENGINE_LINES = [
+    '2026/10/19 10:00:00 VCS NOTICE V-16-1-10301 Initiating Offline of '
+    'Resource {0} {1} on System node1'.format(RES, OWNER),
+    '2026/10/19 10:00:04 VCS INFO V-16-1-10305 Resource {0} {1} is offline '
+    'on node1 (VCS initiated)'.format(RES, OWNER),
+    '2026/10/19 10:00:05 VCS NOTICE V-16-1-10447 Group Grp_CS_c1_CS1 is '
+    'offline on system node1',
+    '2026/10/19 10:00:06 VCS NOTICE V-16-1-10301 Initiating Online of '
+    'Resource {0} {1} on System node1'.format(RES, OWNER),
+    'a continuation line without a timestamp',
+    '2026/10/19 10:00:16 VCS INFO V-16-1-10298 Resource {0} {1} is online '
+    'on node1 (VCS initiated)'.format(RES, OWNER),
+    '2026/10/19 10:00:20 VCS NOTICE V-16-1-10301 Initiating Online of '
+    'Resource Res_App_c1_CS2_APP1 (Owner: Unspecified, Group: '
+    'Grp_CS_c1_CS2) on System node2']
+DISPLAY_LINES = [
+    '#Resource            Attribute        System     Value',
+    '{0}  OnlineTimeout    global     25'.format(RES),
+    '{0}  OfflineTimeout   global     300'.format(RES),
+    'Res_App_c1_CS2_APP1  OnlineTimeout    global     unknown']
+
+
+class Dummy(TimeoutCalibrationMixin):
+    """
+    Test class answering the cluster commands with canned output.
+    """
+
+    def __init__(self, case):
+        self.case = case
+        self.log = mock.Mock()
+        self.commands = []
+
+    def run_command(self, node, cmd, su_root=False):
+        """ Answers the state, log and timeout commands """
+        self.commands.append(cmd)
+        if cmd.endswith('hagrp -state'):
+            return ['#Group         Attribute   System   Value',
+                    'Grp_CS_c1_CS1  State       node1    |ONLINE|',
+                    'Grp_CS_c1_CS1  State       node2    |OFFLINE|',
+                    'Grp_CS_c1_CS2  State       node1    |OFFLINE|'], [], 0
+        if cmd.startswith('/usr/bin/stat'):
+            return ['2048'], [], 0
+        if cmd.startswith('/usr/bin/tail'):
+            return ENGINE_LINES, [], 0
+        if 'hares -display' in cmd:
+            return DISPLAY_LINES, [], 0
+        return [], [], 0
+
+    def assertTrue(self, expr, msg=None):
+        """ Base assertTrue """
+        self.case.assertTrue(expr, msg)
+
+    def assertEqual(self, first, second, msg=None):
+        """ Base assertEqual """
+        self.case.assertEqual(first, second, msg)
+
+
+class TestTimeoutCalibration(unittest.TestCase):
+    """
+    Test suite for the timeout calibration.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        del TIMEOUT_CALIBRATION[:]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_calibrate(self):
+        """ Procedure:
+            1. Parse an engine log and the timeouts of its resources.
+            2. Calibrate the timeouts.
+            ---------
+            Verification:
+            3. Verify the transitions, an unfinished one included.
+            4. Verify a timeout under twice the longest duration is tight,
+               one far over it is oversized and the LITP default is used
+               when the timeout is unknown.
+        """
+        transitions = parse_engine_log(ENGINE_LINES)
+        self.assertEqual([(RES, 'node1', 'offline', 4.0),
+                          (RES, 'node1', 'online', 10.0)],
+                         [(res, system, kind, ended_at - started_at)
+                          for res, system, kind, started_at, ended_at
+                          in transitions[:2]])
+        self.assertEqual(('Res_App_c1_CS2_APP1', 'node2', 'online', None),
+                         transitions[2][:3] + transitions[2][4:])
+        timeouts = parse_timeouts(DISPLAY_LINES)
+        self.assertEqual({RES: {'online': 25, 'offline': 300}}, timeouts)
+        self.assertEqual({'online': 300, 'offline': 300}, default_timeouts())
+        rows = calibrate(transitions, timeouts)
+        verdicts = dict(((row['resource'], row['kind']), row)
+                        for row in rows)
+        self.assertEqual(('oversized', 20, 75.0), (
+            verdicts[(RES, 'offline')]['verdict'],
+            verdicts[(RES, 'offline')]['suggested'],
+            verdicts[(RES, 'offline')]['headroom']))
+        self.assertEqual(('ok', 30), (verdicts[(RES, 'online')]['verdict'],
+                                      verdicts[(RES, 'online')]['suggested']))
+        self.assertEqual('tight', calibrate(transitions, {RES: {
+            'online': 15, 'offline': 8}})[1]['verdict'])
+        unfinished = verdicts[('Res_App_c1_CS2_APP1', 'online')]
+        self.assertEqual(('unfinished', 300, True), (
+            unfinished['verdict'], unfinished['timeout'],
+            unfinished['default']))
+        lines = format_report(rows)
+        self.assertEqual(4, len(lines))
+        self.assertTrue(lines[1].startswith('Res_App_c1_CS2_APP1'))
+
+    def test_main(self):
+        """ Procedure:
+            1. Calibrate from copies of an engine log and of the timeouts.
+            ---------
+            Verification:
+            2. Verify the unfinished transition fails the run and the
+               calibration is written.
+            3. Verify a log with every transition in range passes.
+        """
+        log_path = os.path.join(self.tmp_dir, 'engine_A.log')
+        with open(log_path, 'w') as log:
+            log.write('\n'.join(ENGINE_LINES) + '\n')
+        display_path = os.path.join(self.tmp_dir, 'timeouts.txt')
+        with open(display_path, 'w') as display:
+            display.write('\n'.join(DISPLAY_LINES) + '\n')
+        out_path = os.path.join(self.tmp_dir, 'out.json')
+        self.assertEqual(1, main([log_path, '--timeouts', display_path,
+                                  '--json', out_path]))
+        with open(out_path) as out:
+            self.assertEqual(3, len(json.load(out)))
+        with open(log_path, 'w') as log:
+            log.write('\n'.join(ENGINE_LINES[3:6]) + '\n')
+        self.assertEqual(0, main([log_path, '--timeouts', display_path]))
+
+    def test_mixin(self):
+        """ Procedure:
+            1. Calibrate the timeouts of a cluster through the mixin.
+            ---------
+            Verification:
+            2. Verify only the online group is cycled, with hagrp -wait.
+            3. Verify the engine log is read from its size before the
+               cycles and the calibration is kept.
+        """
+        test = Dummy(self)
+        rows = test.calibrate_timeouts('node1', cycles=2, wait_timeout=60)
+        cycles = [cmd.split('hagrp ')[1] for cmd in test.commands
+                  if 'hagrp -' in cmd and not cmd.endswith('-state')]
+        self.assertEqual(['-offline Grp_CS_c1_CS1 -sys node1',
+                          '-wait Grp_CS_c1_CS1 State OFFLINE -sys node1 '
+                          '-time 60',
+                          '-online Grp_CS_c1_CS1 -sys node1',
+                          '-wait Grp_CS_c1_CS1 State ONLINE -sys node1 '
+                          '-time 60'] * 2, cycles)
+        self.assertTrue('/usr/bin/tail -c +2049 ' in ' '.join(test.commands))
+        self.assertEqual([rows], TIMEOUT_CALIBRATION)
+        self.assertEqual(4, test.log.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+from downtime import DowntimeReport, PlanTimeline, plan_states
+from plan_index import LOCK_TASK, UNLOCK_TASK
+from upgrade_benchmark import (UPGRADE_METRICS, UpgradeBenchmarkMixin,
+                               UpgradeRun, format_table, main,
+                               measure_upgrade, parse_probe_log, summarize)
+
+UNITS = ['test-lsb-3994-1', 'test-lsb-3994-2']
+# Description of every task of a rolling upgrade of two nodes
+TASKS = [LOCK_TASK.format('node1'), 'Update package on node "node1"',
+         UNLOCK_TASK.format('node1'), LOCK_TASK.format('node2'),
+         'Update package on node "node2"', UNLOCK_TASK.format('node2')]
+
+
+def _plan(done):
+    """
+    Return a parse_plan_output result of TASKS, one per phase, with the
+    first done tasks successful and the next one running.
+    """
+    return dict((phase, {1: {'DESC': ['/deployments/d1', description],
+                             'STATUS': 'Success' if phase <= done else
+                             'Running' if phase == done + 1 else
+                             'Initial'}})
+                for phase, description in enumerate(TASKS, 1))
+
+
+def _timeline():
+    """
+    Return the timeline of TASKS observed every 10 seconds from 100.
+    """
+    timeline = PlanTimeline()
+    for done in range(len(TASKS) + 1):
+        timeline.observe(100 + 10 * done, plan_states(_plan(done)))
+    return timeline
+
+
+class Dummy(UpgradeBenchmarkMixin):
+    """
+    Test class running a scripted upgrade plan.
+    """
+
+    def __init__(self, case):
+        self.case = case
+        self.log = mock.Mock()
+        self.cli = mock.Mock()
+        self.cli.parse_plan_output.side_effect = lambda stdout: stdout
+        self.plans = [_plan(done) for done in range(len(TASKS) + 1)]
+        self.commands = []
+
+    def execute_cli_showplan_cmd(self, _):
+        """ Returns the next plan """
+        return self.plans.pop(0) if len(self.plans) > 1 \
+            else self.plans[0], [], 0
+
+    def execute_cli_createplan_cmd(self, node):
+        """ Records the call """
+        self.commands.append((node, 'create_plan'))
+
+    def execute_cli_runplan_cmd(self, node):
+        """ Records the call """
+        self.commands.append((node, 'run_plan'))
+
+    def run_command(self, node, cmd, su_root=False):
+        """ Answers the clock, probe and collection commands """
+        self.commands.append((node, cmd.split()[0]))
+        if cmd.startswith('/bin/date'):
+            return ['1000.0'], [], 0
+        if cmd.startswith('/bin/kill'):
+            return ['{0} active active'.format(seen_at)
+                    for seen_at in range(990, 1200, 1)], [], 0
+        return [], [], 0
+
+    def assertTrue(self, expr, msg=None):
+        """ Base assertTrue """
+        self.case.assertTrue(expr, msg)
+
+    def assertEqual(self, first, second, msg=None):
+        """ Base assertEqual """
+        self.case.assertEqual(first, second, msg)
+
+
+class TestUpgradeBenchmark(unittest.TestCase):
+    """
+    Test suite for the rolling upgrade benchmark.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        del UPGRADE_METRICS[:]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_measure_upgrade(self):
+        """ Procedure:
+            1. Measure a rolling upgrade of a one node parallel service
+               that stops while node1 is locked.
+            ---------
+            Verification:
+            2. Verify the plan and task times.
+            3. Verify the lock windows and the gap during the first one.
+        """
+        report = DowntimeReport(interval=1)
+        report.add(UNITS[0], 'node1', [(seen_at, not 112 < seen_at < 125)
+                                       for seen_at in range(95, 170)])
+        run = measure_upgrade('1_node_parallel', 1, _timeline(), report)
+        self.assertEqual(60, run.plan_seconds)
+        self.assertEqual({'lock': 20, 'update': 20, 'unlock': 20},
+                         run.task_seconds)
+        self.assertEqual({'seconds': 30, 'max_gap': 13, 'downtime': 13},
+                         run.lock_windows['node1'])
+        self.assertEqual((30, 1), (run.lock_windows['node2']['seconds'],
+                                   run.lock_windows['node2']['max_gap']))
+        self.assertEqual(13, run.max_gap)
+        self.assertTrue('node1 locked 30.0s max gap 13.0s' in run.summary())
+
+    def test_summary(self):
+        """ Procedure:
+            1. Parse the output of the probes.
+            2. Summarize runs of two configurations, through the command
+               line from a results file.
+            ---------
+            Verification:
+            3. Verify the samples of every unit.
+            4. Verify the medians and worst gaps, in configuration order.
+        """
+        samples = parse_probe_log(['10.5 active inactive', 'garbage',
+                                   '11.5 active active'], UNITS, 0.5)
+        self.assertEqual([(10.0, True), (11.0, True)], samples[UNITS[0]])
+        self.assertEqual([(10.0, False), (11.0, True)], samples[UNITS[1]])
+        windows = {'node1': {'seconds': 30, 'max_gap': 1, 'downtime': 0}}
+        runs = [UpgradeRun('2_node_failover', 10, plan,
+                           {'lock': 5, 'update': plan - 10, 'unlock': 5},
+                           windows) for plan in (100, 120, 140)]
+        runs.append(UpgradeRun('1_node_parallel', 10, 90,
+                               {'lock': 5, 'update': 80, 'unlock': 5},
+                               {'node1': {'seconds': 90, 'max_gap': 80,
+                                          'downtime': 80}}))
+        summary = summarize(runs)
+        self.assertEqual(['1_node_parallel', '2_node_failover'],
+                         [row['configuration'] for row in summary])
+        self.assertEqual((3, 120, 110, 1), (
+            summary[1]['runs'], summary[1]['plan'], summary[1]['update'],
+            summary[1]['max_gap']))
+        self.assertEqual(80, summary[0]['downtime'])
+        self.assertEqual(3, len(format_table(summary)))
+        path = os.path.join(self.tmp_dir, 'results.json')
+        with open(path, 'w') as results:
+            json.dump({'runs': [run.to_dict() for run in runs]}, results)
+        out_path = os.path.join(self.tmp_dir, 'summary.json')
+        self.assertEqual(0, main([path, '--json', out_path]))
+        with open(out_path) as out:
+            self.assertEqual(summary, json.load(out)['summary'])
+
+    def test_benchmark_upgrade(self):
+        """ Procedure:
+            1. Benchmark an upgrade plan through the mixin.
+            ---------
+            Verification:
+            2. Verify the probes are started before the plan runs and
+               collected after it.
+            3. Verify the run is measured and kept, without gaps.
+            4. Verify the kept runs are written to a results file that
+               can be summarized.
+        """
+        test = Dummy(self)
+        with mock.patch.object(test, 'stage_upgrade') as stage_upgrade:
+            run = test.benchmark_upgrade('ms1', '3994', '2_node_failover', 2,
+                                         ['node1', 'node2'], poll=0.01)
+        stage_upgrade.assert_called_once_with('ms1', '3994', 2, '2.0')
+        names = [cmd for _, cmd in test.commands]
+        self.assertEqual(['create_plan', '/bin/date', 'nohup', '/bin/date',
+                          'nohup', 'run_plan'], names[:6])
+        self.assertEqual(['/bin/kill', '/bin/kill'], names[-2:])
+        self.assertEqual([run], UPGRADE_METRICS)
+        self.assertEqual(['node1', 'node2'], sorted(run.lock_windows))
+        self.assertTrue(run.max_gap <= 1, run.max_gap)
+        path = os.path.join(self.tmp_dir, 'upgrade_benchmark.json')
+        test.write_upgrade_results(path)
+        with open(path) as results:
+            self.assertEqual([run.to_dict()], json.load(results)['runs'])
+        self.assertEqual(0, main([path]))
+
+
+if __name__ == '__main__':
+    unittest.main()
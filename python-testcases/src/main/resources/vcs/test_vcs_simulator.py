@@ -0,0 +1,191 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Unittests
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from vcs_simulator import (LocalTransportMixin, SimulatedCluster,
+                           build_cluster, install_commands, run_simulated)
+
+GROUP = 'Grp_CS_c1_CS1'
+PARALLEL = 'Grp_CS_c1_CS2'
+RESOURCE = 'Res_App_c1_CS1_APP1'
+
+
+class Dummy(LocalTransportMixin):
+    """
+    Test class running commands through the local transport.
+    """
+    pass
+
+
+class TestVcsSimulator(unittest.TestCase):
+    """
+    Test suite for the VCS command simulator.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.state_path = os.path.join(self.tmp_dir, 'state.json')
+        self._write_state(build_cluster(2, parallel_every=2, latencies={
+            'online': 10, 'offline': 5, 'fault': 2}))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _write_state(self, state):
+        """ Writes the state file """
+        with open(self.state_path, 'w') as state_file:
+            json.dump(state, state_file)
+
+    def _run(self, cmd, now):
+        """ Runs a command at the given time """
+        args = cmd.split()
+        return run_simulated(self.state_path, args[0], args[1:], now)
+
+    def _state(self, group, system, now):
+        """ Returns the short state of the group on the system """
+        return self._run('hagrp -state {0} -sys {1}'.format(group, system),
+                         now)[0][0]
+
+    def test_queries(self):
+        """ Procedure:
+            1. Query the state of the groups, resources and systems.
+            ---------
+            Verification:
+            2. Verify the failover group is online on its first system
+               and the parallel group on both.
+            3. Verify the output is in VCS table format.
+            4. Verify an unknown group fails.
+        """
+        stdout, stderr, rc = self._run('hagrp -state', 0)
+        self.assertEqual((0, []), (rc, stderr))
+        self.assertTrue(stdout[0].startswith('#Group'))
+        self.assertEqual(
+            [['Grp_CS_c1_CS1', 'State', 'node1', '|ONLINE|'],
+             ['Grp_CS_c1_CS1', 'State', 'node2', '|OFFLINE|'],
+             ['Grp_CS_c1_CS2', 'State', 'node1', '|ONLINE|'],
+             ['Grp_CS_c1_CS2', 'State', 'node2', '|ONLINE|']],
+            [line.split() for line in stdout[1:]])
+        self.assertEqual((['OFFLINE'], [], 0),
+                         self._run('hares -state {0} -sys node2'.format(
+                             RESOURCE), 0))
+        self.assertEqual(['1'], self._run('hagrp -value {0} Parallel'.format(
+            PARALLEL), 0)[0])
+        self.assertEqual(['RUNNING'], self._run('hasys -state node1', 0)[0])
+        self.assertTrue('A  node2' in '\n'.join(
+            self._run('hastatus -sum', 0)[0]))
+        _, stderr, rc = self._run('hagrp -state Grp_none', 0)
+        self.assertEqual(1, rc)
+        self.assertTrue('does not exist' in stderr[0])
+
+    def test_switch(self):
+        """ Procedure:
+            1. Switch the failover group to its second system.
+            ---------
+            Verification:
+            2. Verify both transitional states are shown.
+            3. Verify the group is online on the second system once the
+               offline and online latencies have passed.
+        """
+        self._run('hagrp -switch {0} -to node2'.format(GROUP), 0)
+        self.assertEqual('ONLINE|STOPPING', self._state(GROUP, 'node1', 1))
+        self.assertEqual('OFFLINE|STARTING', self._state(GROUP, 'node2', 1))
+        self.assertEqual('OFFLINE', self._state(GROUP, 'node1', 6))
+        self.assertEqual('OFFLINE|STARTING', self._state(GROUP, 'node2', 14))
+        self.assertEqual('ONLINE', self._state(GROUP, 'node2', 15))
+
+    def test_fault(self):
+        """ Procedure:
+            1. Fault the resource of the failover group.
+            2. Clear the fault.
+            ---------
+            Verification:
+            3. Verify the fault shows after the detection latency.
+            4. Verify the group fails over to the second system.
+            5. Verify the fault is cleared.
+        """
+        self.assertEqual(0, self._run('fault {0} node1'.format(RESOURCE),
+                                      0)[2])
+        self.assertEqual('ONLINE', self._state(GROUP, 'node1', 1))
+        self.assertEqual('OFFLINE|FAULTED', self._state(GROUP, 'node1', 2))
+        self.assertEqual(['FAULTED'], self._run(
+            'hares -state {0} -sys node1'.format(RESOURCE), 2)[0])
+        self.assertEqual('ONLINE', self._state(GROUP, 'node2', 12))
+        self.assertEqual(1, self._run('hagrp -online {0} -sys node1'.format(
+            GROUP), 12)[2])
+        self._run('hagrp -clear {0} -sys node1'.format(GROUP), 12)
+        self.assertEqual('OFFLINE', self._state(GROUP, 'node1', 12))
+
+    def test_crash(self):
+        """ Procedure:
+            1. Crash the first system and boot it again.
+            ---------
+            Verification:
+            2. Verify the groups go offline on it at once.
+            3. Verify the failover group goes online on the second system.
+            4. Verify the parallel group comes back after the boot.
+        """
+        self._run('crash node1', 0)
+        self.assertEqual(['FAULTED'], self._run('hasys -state node1', 0)[0])
+        self.assertEqual('OFFLINE', self._state(GROUP, 'node1', 0))
+        self.assertEqual('OFFLINE', self._state(PARALLEL, 'node1', 0))
+        self.assertEqual('ONLINE', self._state(GROUP, 'node2', 12))
+        self._run('boot node1', 20)
+        self.assertEqual('ONLINE', self._state(PARALLEL, 'node1', 30))
+
+    def test_parallel_restart(self):
+        """ Procedure:
+            1. Fault the resource of a parallel group with a restart limit.
+            ---------
+            Verification:
+            2. Verify the group restarts on the same system.
+        """
+        state = build_cluster(1, parallel_every=1)
+        state['groups'][GROUP]['restart_limit'] = 1
+        cluster = SimulatedCluster(state, now=0)
+        cluster.fault(RESOURCE, 'node1')
+        self.assertEqual('|ONLINE|', cluster.group_state(
+            state['groups'][GROUP]['on']['node1']))
+        self.assertEqual(2, len(state['groups'][GROUP]['on']['node1'][
+            'pending']))
+        self.assertEqual(
+            '|ONLINE|', SimulatedCluster(state, now=1).group_state(
+                state['groups'][GROUP]['on']['node1']))
+        self.assertEqual(None,
+                         state['groups'][GROUP]['on']['node1']['faulted_by'])
+
+    def test_local_transport(self):
+        """ Procedure:
+            1. Run a VCS command and a shell pipeline of the installed
+               commands through the local transport.
+            ---------
+            Verification:
+            2. Verify both answer from the simulated cluster.
+        """
+        self._write_state(build_cluster(3))
+        bin_dir = os.path.join(self.tmp_dir, 'bin')
+        install_commands(self.state_path, bin_dir)
+        test = Dummy()
+        test.vcs_sim_state = self.state_path
+        test.vcs_sim_bin = bin_dir
+        self.assertEqual((['ONLINE'], [], 0), test.run_command(
+            'node1', '/opt/VRTS/bin/hagrp -state {0} -sys node1'.format(
+                GROUP), su_root=True))
+        stdout, _, rc = test.run_command(
+            'node1', '/opt/VRTS/bin/hagrp -state | grep -c ONLINE')
+        self.assertEqual((['3'], 0), (stdout, rc))
+
+
+if __name__ == '__main__':
+    unittest.main()
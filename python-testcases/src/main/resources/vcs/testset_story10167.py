@@ -14,6 +14,8 @@ program(s) have been supplied.
 
 import os
 from litp_generic_test import GenericTest, attr
+from model_cache import CachedModelMixin
+from plan_index import LOCK_TASK, PlanIndex
 import test_constants
 from litp_cli_utils import CLIUtils
 from vcs_utils import VCSUtils
@@ -24,7 +26,7 @@ from test_constants import (PLAN_TASKS_SUCCESS, PLAN_TASKS_INITIAL,
 RPM_SRC_DIR = os.path.dirname(os.path.realpath(__file__)) + '/test_lsb_rpms/'
 
 
-class Story10167(GenericTest):
+class Story10167(CachedModelMixin, GenericTest):
     """
     LITPCDS-10167:
     The "critical-service" property is an optional property at
@@ -402,19 +404,15 @@ class Story10167(GenericTest):
         Returns:
             - Assert error and message if no match.
         """
-        plan_output, _, _ = \
-            self.execute_cli_showplan_cmd(self.management_server)
-        phases_dict = self.cli.parse_plan_output(plan_output)
-        plan_first_lock_msgs = (phases_dict[first_lock_plan[0]]
-                                [first_lock_plan[1]]['DESC'][1])
-        plan_second_lock_msgs = (phases_dict[second_lock_plan[0]]
-                                 [second_lock_plan[1]]['DESC'][1])
-        model_vcs_first_lock = 'Lock VCS on node "{0}"'. \
-            format(first_node)
-        model_vcs_second_lock = 'Lock VCS on node "{0}"'. \
-            format(second_node)
-        self.assertEqual(plan_first_lock_msgs, model_vcs_first_lock)
-        self.assertEqual(plan_second_lock_msgs, model_vcs_second_lock)
+        plan = PlanIndex.from_test(self, self.management_server)
+        model_vcs_first_lock = LOCK_TASK.format(first_node)
+        model_vcs_second_lock = LOCK_TASK.format(second_node)
+        self.assertEqual(first_lock_plan,
+                         plan.position(model_vcs_first_lock))
+        self.assertEqual(second_lock_plan,
+                         plan.position(model_vcs_second_lock))
+        self.assertTrue(plan.in_order(model_vcs_first_lock,
+                                      model_vcs_second_lock))
 
     @attr('all', 'non-revert', 'story10167',
           'story10167_tc01', 'cdb_priority1')
@@ -14,6 +14,7 @@ program(s) have been supplied.
 import os
 from redhat_cmd_utils import RHCmdUtils
 from litp_generic_test import GenericTest, attr
+from dependency_graph import DependencyGraphMixin
 from test_constants import PLAN_COMPLETE, PLAN_TASKS_SUCCESS
 from vcs_utils import VCSUtils
 from generate import load_fixtures, generate_json, apply_options_changes, \
@@ -23,7 +24,7 @@ from generate import load_fixtures, generate_json, apply_options_changes, \
 STORY = '107501'
 
 
-class Story107501(GenericTest):
+class Story107501(DependencyGraphMixin, GenericTest):
     """
     TORF-107501:
         Description:
@@ -279,6 +280,7 @@ class Story107501(GenericTest):
             self.apply_cs_and_apps_sg(self.management_server,
                                       fixtures,
                                       self.rpm_src_dir)
+            engine_log_offset = self.engine_log_size(self.node_1)
 
             # Step 2 - Create/Run plan
             self.execute_cli_createplan_cmd(self.management_server)
@@ -319,6 +321,16 @@ class Story107501(GenericTest):
             self.assertTrue(self.wait_for_plan_state(self.management_server,
                                                  PLAN_COMPLETE,
                                                  plan_timeout_mins))
+            # Verify the online order of the engine log against the
+            # dependency graph of the three CSs
+            graph = self.build_dependency_graph(self.management_server,
+                                                self.vcs_cluster_url)
+            cs_ids = [cs_['vpath'].split('/')[-1]
+                      for cs_ in fixtures['vcs-clustered-service']]
+            graph = graph.subgraph(cs_ids).renamed(
+                lambda cs_id: self.vcs.generate_clustered_service_name(
+                    cs_id, self.cluster_id))
+            self.verify_online_order(self.node_1, graph, engine_log_offset)
         # Step 6: Update CS  ordering list
         # CS1 initial_online_dependency_list set to ""
         self.execute_cli_update_cmd(self.management_server,
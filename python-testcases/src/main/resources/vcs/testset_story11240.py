@@ -14,12 +14,14 @@ program(s) have been supplied.
 """
 
 import os
-import sys
 import time
 import socket
 import exceptions
 import test_constants
 from litp_generic_test import GenericTest, attr
+from polling import PollingMixin
+from reboot import RebootMixin
+from session_pool import SessionPoolMixin
 from redhat_cmd_utils import RHCmdUtils
 from vcs_utils import VCSUtils
 from generate import load_fixtures, generate_json, apply_options_changes
@@ -27,7 +29,8 @@ from generate import load_fixtures, generate_json, apply_options_changes
 STORY = '11240'
 
 
-class Story11240(GenericTest):
+class Story11240(SessionPoolMixin, RebootMixin, PollingMixin,
+                 GenericTest):
     """
     LITPCDS-11240:
     As a LITP User I want a means of disabling the on-lining of VCS Service
@@ -118,117 +121,40 @@ class Story11240(GenericTest):
         """
         super(Story11240, self).tearDown()
 
-    def _up_time(self, node):
-        """
-            Return uptime of node
-        """
-        cmd = self.rhcmd.get_cat_cmd('/proc/uptime')
-        out, err, ret_code = self.run_command(node, cmd, su_root=True)
-        self.assertEqual(0, ret_code)
-        self.assertEqual([], err)
-        self.assertNotEqual([], out)
-        uptime_seconds = float(out[0].split()[0])
-        return uptime_seconds
-
-    def _node_rebooted(self, node):
-        """
-            Verify that a node  has rebooted.
-        """
-        node_restarted = False
-        max_duration = 1800
-        elapsed_sec = 0
-        # uptime before reboot
-        up_time_br = self._up_time(node)
-        while elapsed_sec < max_duration:
-            # if True:
-            try:
-                # uptime after reboot
-                up_time_ar = self._up_time(node)
-                self.log("info", "{0} is up for {1} seconds"
-                         .format(node, str(up_time_ar)))
-
-                if up_time_ar < up_time_br:
-                    self.log("info", "{0} has been rebooted"
-                             .format(node))
-                    node_restarted = True
-                    break
-            except (socket.error, exceptions.AssertionError):
-                self.log("info", "{0} is not up at the moment"
-                         .format(node))
-            except:
-                self.log("error", "Reboot check. Unexpected Exception: {0}"
-                         .format(sys.exc_info()[0]))
-                self.disconnect_all_nodes()
-
-            time.sleep(10)
-            elapsed_sec += 10
-
-        if not node_restarted:
-            self.log("error", "{0} not rebooted in last {1} seconds."
-                     .format(node, str(max_duration)))
-        return node_restarted
-
     def _m_node_up(self, node):
         """
-            Check if managed node is up
+            Check if managed node is up and its clock is synchronised
         """
-        m_node_up = False
-        max_duration = 300
-        elapsed_sec = 0
-        cmd = "/bin/hostname"
-        while elapsed_sec < max_duration:
-            try:
-                # for node in self.mn_nodes:
-                #node = self.mn_nodes[0]
-                _, _, ret_code = self.run_command(node, cmd)
-                self.assertEqual(0, ret_code)
-                if ret_code == 0:
-                    m_node_up = True
-                    break
-                else:
-                    self.log(
-                        "info",
-                        "Node {0} is not up in last {1} seconds.".format(
-                            node, elapsed_sec
-                        )
-                    )
-            except (socket.error, exceptions.AssertionError):
-                self.log(
-                    "info",
-                    "Litp is not up after {0} seconds".format(elapsed_sec)
-                )
-            except:
-                self.log(
-                    "error",
-                    "Unexpected Exception: {0}".format(sys.exc_info()[0])
-                )
-
-            time.sleep(10)
-            elapsed_sec += 10
-
-        if not m_node_up:
-            self.log(
-                "error",
-                "Node {0} is not up in last {1} seconds.".format(
-                    node, str(max_duration)
-                )
-            )
+        m_node_up = self.wait_until(
+            self.command_succeeds(node, "/bin/hostname"), timeout=300,
+            first_interval=2, max_interval=20,
+            retry_on=(Exception,),
+            description='Node {0} up'.format(node)).success
 
         # Wait for NTP to resync times so that mco works again.
-        time.sleep(60)
+        if m_node_up:
+            m_node_up = self.wait_until(
+                self.ntp_synchronised(node), timeout=300, first_interval=2,
+                max_interval=20,
+                retry_on=(socket.error, exceptions.AssertionError),
+                description='NTP sync on {0}'.format(node)).success
         return m_node_up
 
     def reboot_node(self, node):
-        """ Reboot a node and wait for it to come up. """
+        """ Reboot a node and wait for it to come up with a new boot id. """
+        boot_id = self.read_boot_id(node)
         cmd = "/sbin/reboot now"
+        issued_at = time.time()
         out, err, ret_code = self.run_command(node, cmd, su_root=True)
+        # Only the sessions to the rebooted node need a new connection
+        self.reset_node_session(node)
         self.assertTrue(self.is_text_in_list("The system is going down", out))
 
         self.assertEqual([], err)
         self.assertEqual(0, ret_code)
 
-        self.assertTrue(self._node_rebooted(node))
-        time.sleep(5)
+        self.assertTrue(self.wait_for_node_reboot(node, boot_id,
+                                                  issued_at=issued_at).rebooted)
 
     def update_vcs_cluster(self, swtch='on'):
         """
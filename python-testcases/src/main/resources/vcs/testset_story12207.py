@@ -14,13 +14,19 @@ import re
 
 import test_constants
 from litp_generic_test import GenericTest, attr
+from numthreads_benchmark import (NUMTHREADS_METRICS, THREAD_RANGE,
+                                  NumThreadsBenchmarkMixin, format_table,
+                                  recommend, summarize)
+from vcs_utils import VCSUtils
 
 TEST_02_NUMBER_THREADS = "27"
 TEST_03_NUMBER_THREADS = "14"
 VCS_DEFAULT_NUMBER_THREADS = "10"
+BENCHMARK_APP_COUNTS = (10, 50)
+BENCHMARK_THREADS = (1, 5, 10, 20, THREAD_RANGE[1])
 
 
-class Story12207(GenericTest):
+class Story12207(NumThreadsBenchmarkMixin, GenericTest):
     """
     LITPCDS-12207:
     As a LITP User I want to configure the VCS Application Agent NumThreads
@@ -188,3 +194,48 @@ class Story12207(GenericTest):
         # 2nd node should be the same (as cluster-wide), but check to be sure
         number_threads = self._get_application_num_threads(self.secondary_node)
         self.assertEqual(VCS_DEFAULT_NUMBER_THREADS, number_threads)
+
+    @attr('benchmark', 'non-revert', 'story12207', 'story12207_benchmark')
+    def test_05_benchmark_app_agent_num_threads(self):
+        """
+        @tms_id: litpcds_12207_benchmark
+        @tms_requirements_id: LITPCDS-12207
+        @tms_title: benchmark VCS Application NumThreads
+        @tms_description:
+        Measure the bulk offline and online of groups of generated
+        applications for a range of "app_agent_num_threads" values and log
+        the NumThreads recommended per application count
+        @tms_test_steps:
+        @step: Deploy a clustered service with the generated applications
+        @result: The clustered service is online
+        @step: Update "app_agent_num_threads" to every value of the sweep
+               and offline and online the clustered service
+        @result: The bulk offline and online times are measured
+        @step: Remove the clustered services and delete
+               "app_agent_num_threads"
+        @result: The plan completes and the default NumThreads is back
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        vcs = VCSUtils()
+        cluster_id = self.vcs_cluster_url.split('/')[-1]
+        node_url = self.find(self.management_server, self.vcs_cluster_url,
+                             'node')[0]
+        system = self.get_props_from_url(self.management_server, node_url,
+                                         filter_prop='hostname')
+        deployed = []
+        try:
+            for apps in BENCHMARK_APP_COUNTS:
+                story = '12207{0}'.format(apps)
+                deployed.append(self.deploy_benchmark_apps(
+                    self.management_server, story, apps))
+                self.benchmark_num_threads(
+                    self.management_server, self.primary_node, apps,
+                    vcs.generate_clustered_service_name(
+                        'CS_{0}_1'.format(story), cluster_id),
+                    system, BENCHMARK_THREADS)
+        finally:
+            self.remove_benchmark_apps(self.management_server, deployed)
+        summary = summarize(NUMTHREADS_METRICS)
+        for line in format_table(summary, recommend(summary)):
+            self.log('info', line)
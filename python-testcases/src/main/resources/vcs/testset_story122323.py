@@ -14,6 +14,7 @@ program(s) have been supplied.
 import os
 from redhat_cmd_utils import RHCmdUtils
 from litp_generic_test import GenericTest, attr
+from expansion import ExpansionMixin
 from test_constants import PLAN_COMPLETE, PLAN_TASKS_SUCCESS, PP_PKG_REPO_DIR
 from vcs_utils import VCSUtils
 from generate import load_fixtures, generate_json, apply_options_changes
@@ -22,7 +23,7 @@ STORY = '122323'
 RPM_SRC_DIR = os.path.dirname(os.path.realpath(__file__)) + '/test_lsb_rpms/'
 
 
-class Story122323(GenericTest):
+class Story122323(ExpansionMixin, GenericTest):
     """
     LITPCDS-122323:
         Update LITP to allow a service to be identified as critical when
@@ -107,25 +108,7 @@ class Story122323(GenericTest):
         supplied
         :return: Nothing
         """
-        net_hosts_props = {'ip': '10.10.14.4',
-                           'network_name': 'dhcp_network'}
-
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn2.sh',
-                                    cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn3.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn4.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-
-        self.execute_cli_create_cmd(self.management_server,
-                                    self.vcs_cluster_url +
-                                    '/network_hosts/nh21', 'vcs-network-host',
-                                    props='ip={0} network_name={1}'
-                                    .format(net_hosts_props['ip'],
-                                            net_hosts_props['network_name']))
+        self.expand_cluster(self.management_server, add_to_cleanup=True)
 
     def _create_new_service(self, cs_url):
         """
@@ -201,18 +184,8 @@ class Story122323(GenericTest):
         # FO SG is created and listed as a critical service in the same plan
 
         timeout_mins = 60
-        nodes = ['n1', 'n2', 'n3', 'n4']
-        expand_list = []
-        node_list = self.find_children_of_collect(self.management_server,
-                                                  self.vcs_cluster_url +
-                                                  '/nodes/',
-                                                  'node',
-                                                  find_all_collect=True)
-        for items, node in zip(node_list, nodes):
-            expand_list.append((
-                items.split(self.vcs_cluster_url + '/nodes/')[1], node)[0])
         # Check if model is expanded to 4 nodes if not proceed with test
-        if sorted(expand_list) != sorted(nodes):
+        if not self.is_model_expanded():
             self._four_node_expansion()
 
         # Create a FO service group that will be named as a critical service
@@ -248,9 +221,7 @@ class Story122323(GenericTest):
                                                  timeout_mins))
 
         # Step 5: Assert the node count in the litp model
-        for items, node in zip(node_list, nodes):
-            self.assertEqual(items.split(self.vcs_cluster_url + '/nodes/')[1],
-                             node)
+        self.assertTrue(self.is_model_expanded())
 
     @attr('all', 'expansion', 'story122323', 'story122323_tc03')
     def test_03_p_update_3_node_cluster_sg_to_critical_serv_idemp(self):
@@ -288,8 +259,6 @@ class Story122323(GenericTest):
         # a FO cluster service already. If not the litp model will be expanded
         # and a FO service group will be created
 
-        nodes = ['n1', 'n2', 'n3', 'n4']
-        expand_list = []
         timeout_mins = 60
         task_desc = 'Lock VCS on node "{0}"'
 
@@ -299,17 +268,9 @@ class Story122323(GenericTest):
         # Step 1: Define FO service group in model with 3 nodes available
         # Check if the model already has three nodes configured, if not
         # proceed with expansion
-        node_list = self.find_children_of_collect(self.management_server,
-                                                  self.vcs_cluster_url +
-                                                  '/nodes/',
-                                                  'node',
-                                                  find_all_collect=True)
-        for items, node in zip(node_list, nodes):
-            expand_list.append((
-                items.split(self.vcs_cluster_url + '/nodes/')[1], node)[0])
         # If the cluster has three nodes then check if there is a suitable
         # cluster service available
-        if sorted(expand_list) == sorted(nodes):
+        if self.is_model_expanded():
             vcs_sgs = self.get_matching_vcs_cs_in_model(self.management_server,
                                                         apps=1, ha_srv_cfgs=1,
                                                         cs_props_dict={
@@ -18,14 +18,21 @@ from vcs_utils import VCSUtils
 from test_constants import PLAN_COMPLETE, PLAN_TASKS_SUCCESS, \
     VCS_MAIN_CF_FILENAME
 from litp_generic_test import GenericTest, attr
+from expansion import ExpansionMixin
+from baseline_fingerprint import BaselineMixin
+from model_cache import CachedModelMixin
+from downtime import DowntimeMixin, DowntimeReport
 from redhat_cmd_utils import RHCmdUtils
 from generate import load_fixtures, generate_json, apply_options_changes, \
     apply_item_changes
 
 STORY = '124980'
+# Seconds a migrated group may be online on no node at all
+MIGRATION_MAX_GAP = 600
 
 
-class Story124980(GenericTest):
+class Story124980(ExpansionMixin, BaselineMixin, DowntimeMixin,
+                  CachedModelMixin, GenericTest):
     """
     TORF-124980:
         Description:
@@ -176,309 +183,173 @@ class Story124980(GenericTest):
         supplied
         :return: Nothing
         """
-        net_hosts_props = {'ip': '10.10.14.4',
-                           'network_name': 'dhcp_network'}
-
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn2.sh',
-                                    cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn3.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn4.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-
-        self.execute_cli_create_cmd(self.management_server,
-                                    self.vcs_cluster_url +
-                                    '/network_hosts/nh21', 'vcs-network-host',
-                                    props='ip={0} network_name={1}'
-                                    .format(net_hosts_props['ip'],
-                                            net_hosts_props['network_name']))
-
-        timeout_mins = 90
-        self.run_and_check_plan(self.management_server, PLAN_COMPLETE,
-                                timeout_mins)
+        self.expand_cluster(self.management_server, plan_timeout_mins=90,
+                            add_to_cleanup=True)
 
     def _check_cs_in_model_tc01(self):
         """
-        Method that will check for existing service groups in the model for
-        test case 1
+        Method that will deploy the service groups for test case 1, reusing
+        or patching the ones already deployed by deploy_baseline
         :return: vcs_fo_sg (str): FO SG URL
                  vcs_pl_sg (str): PL SG URL
         """
-        vcs_fo_sg = self.get_matching_vcs_cs_in_model(
-                self.management_server, apps=1, ha_srv_cfgs=1,
-                cs_props_dict={'active': '1', 'standby': '1',
-                               'node_list': 'n1,n2'})
-        vcs_pl_sg = self.get_matching_vcs_cs_in_model(
-                self.management_server, apps=1, ha_srv_cfgs=1,
-                cs_props_dict={'active': '2', 'standby': '0',
-                               'node_list': 'n1,n2'})
-        if vcs_fo_sg == [] or vcs_pl_sg == []:
-            self.log('info', 'Creating suitable Service groups for TC01')
-            fixtures = self.baseline(vcs_len=2, app_len=2, hsc_len=2)
-            apply_options_changes(
-                fixtures, 'vcs-clustered-service', 0,
-                {'active': '1', 'standby': '1', 'name': 'CS_124980_1',
-                 'node_list': 'n1,n2'}, overwrite=True)
-            apply_options_changes(
-                fixtures, 'vcs-clustered-service', 1,
-                {'active': '2', 'standby': '0', 'name': 'CS_124980_2',
-                 'node_list': 'n1,n2'}, overwrite=True)
-            apply_item_changes(
-                fixtures, 'ha-service-config', 1,
-                {'parent': "CS_124980_2",
-                 'vpath': self.vcs_cluster_url + '/services/CS_124980_2/'
-                                                 'ha_configs/HSC_124980_2'}
-                )
-            apply_item_changes(fixtures, 'service', 1,
-                               {'parent': "CS_124980_2",
-                                'destination': self.vcs_cluster_url +
-                                               '/services/CS_124980_2/'
-                                               'applications/APP_124980_2'
-                                 })
-            self.apply_cs_and_apps_sg(self.management_server, fixtures,
-                                      self.rpm_src_dir)
-            vcs_fo_sg = self.vcs_cluster_url + '/services/' + \
-                        fixtures['service'][0]['parent']
-            vcs_pl_sg = self.vcs_cluster_url + '/services/' + \
-                        fixtures['service'][1]['parent']
-
-            self.run_and_check_plan(self.management_server, PLAN_COMPLETE, 20,
-                                    add_to_cleanup=False)
-        else:
-            vcs_fo_sg = vcs_fo_sg[-1]
-            vcs_pl_sg = vcs_pl_sg[-1]
-
-        return vcs_fo_sg, vcs_pl_sg
+        self.log('info', 'Deploying suitable Service groups for TC01')
+        fixtures = self.baseline(vcs_len=2, app_len=2, hsc_len=2)
+        apply_options_changes(
+            fixtures, 'vcs-clustered-service', 0,
+            {'active': '1', 'standby': '1', 'name': 'CS_124980_1',
+             'node_list': 'n1,n2'}, overwrite=True)
+        apply_options_changes(
+            fixtures, 'vcs-clustered-service', 1,
+            {'active': '2', 'standby': '0', 'name': 'CS_124980_2',
+             'node_list': 'n1,n2'}, overwrite=True)
+        apply_item_changes(
+            fixtures, 'ha-service-config', 1,
+            {'parent': "CS_124980_2",
+             'vpath': self.vcs_cluster_url + '/services/CS_124980_2/'
+                                             'ha_configs/HSC_124980_2'}
+            )
+        apply_item_changes(fixtures, 'service', 1,
+                           {'parent': "CS_124980_2",
+                            'destination': self.vcs_cluster_url +
+                                           '/services/CS_124980_2/'
+                                           'applications/APP_124980_2'
+                             })
+        self.deploy_baseline(self.management_server, fixtures,
+                             self.rpm_src_dir)
+        return (fixtures['vcs-clustered-service'][0]['vpath'],
+                fixtures['vcs-clustered-service'][1]['vpath'])
 
     def _check_cs_in_model_tc02(self):
         """
-        Method that will check for existing service groups in the model for
-        test case 2
+        Method that will deploy the service groups for test case 2, reusing
+        or patching the ones already deployed by deploy_baseline
         :return: vcs_fo_sg (str): FO SG URL
                  vcs_pl_sg (str): PL SG URL
         """
         vip_props = {'network_name': 'traffic1',
                      'ipaddress': ['172.16.100.10', '172.16.100.12']}
-        vcs_fo_sg = self.get_matching_vcs_cs_in_model(
-                self.management_server, apps=1, ha_srv_cfgs=1,
-                cs_props_dict={'active': '1', 'standby': '1',
-                               'node_list': 'n3,n4',
-                               'name': 'CS_124980_1'})
-        vcs_pl_sg = self.get_matching_vcs_cs_in_model(
-                self.management_server, apps=1, ha_srv_cfgs=1,
-                cs_props_dict={'active': '2', 'standby': '0',
-                               'node_list': 'n3,n4',
-                               'name': 'CS_124980_2'})
-        if vcs_fo_sg == [] or vcs_pl_sg == []:
-            self.log('info', 'Creating suitable Service groups for TC02')
-            fixtures = self.baseline(vcs_len=2, app_len=2, hsc_len=2,
-                                     vips_len=2)
-            apply_options_changes(
-                fixtures, 'vcs-clustered-service', 0,
-                {'active': '1', 'standby': '1', 'name': 'CS_124980_1',
-                 'node_list': 'n3,n4',
-                 'dependency_list': 'CS_124980_2'}, overwrite=True)
-            apply_options_changes(
-                fixtures, 'vcs-clustered-service', 1,
-                {'active': '2', 'standby': '0', 'name': 'CS_124980_2',
-                 'node_list': 'n3,n4'}, overwrite=True)
-            apply_item_changes(
-                fixtures, 'ha-service-config', 1,
-                {'parent': "CS_124980_2",
-                 'vpath': self.vcs_cluster_url + '/services/CS_124980_2/'
-                                                 'ha_configs/HSC_124980_2'}
-                )
-            apply_item_changes(
-                fixtures, 'service', 1,
-                {'parent': "CS_124980_2",
-                 'destination': self.vcs_cluster_url +
-                                '/services/CS_124980_2/applications/'
-                                'APP_124980_2'})
-            apply_item_changes(
-                fixtures, 'vip', 0, {'vpath': self.vcs_cluster_url +
-                                              '/services/CS_124980_2/'
-                                              'ipaddresses/VIP1'}
-            )
-            apply_options_changes(
-                fixtures, 'vip', 0, {
-                    'network_name': '{0}'.format(vip_props['network_name']),
-                    'ipaddress': '{0}'.format(vip_props['ipaddress'][0])},
-                overwrite=True)
-            apply_item_changes(
-                fixtures, 'vip', 1, {'vpath': self.vcs_cluster_url +
-                                              '/services/CS_124980_2/'
-                                              'ipaddresses/VIP2'}
+        self.log('info', 'Deploying suitable Service groups for TC02')
+        fixtures = self.baseline(vcs_len=2, app_len=2, hsc_len=2,
+                                 vips_len=2)
+        apply_options_changes(
+            fixtures, 'vcs-clustered-service', 0,
+            {'active': '1', 'standby': '1', 'name': 'CS_124980_1',
+             'node_list': 'n3,n4',
+             'dependency_list': 'CS_124980_2'}, overwrite=True)
+        apply_options_changes(
+            fixtures, 'vcs-clustered-service', 1,
+            {'active': '2', 'standby': '0', 'name': 'CS_124980_2',
+             'node_list': 'n3,n4'}, overwrite=True)
+        apply_item_changes(
+            fixtures, 'ha-service-config', 1,
+            {'parent': "CS_124980_2",
+             'vpath': self.vcs_cluster_url + '/services/CS_124980_2/'
+                                             'ha_configs/HSC_124980_2'}
             )
-            apply_options_changes(
-                fixtures, 'vip', 1, {
-                    'network_name': '{0}'.format(vip_props['network_name']),
-                     'ipaddress': '{0}'.format(vip_props['ipaddress'][1])},
-                overwrite=True)
-
-            self.apply_cs_and_apps_sg(self.management_server, fixtures,
-                                      self.rpm_src_dir)
-
-            vcs_fo_sg = self.vcs_cluster_url + fixtures['service'][0]['parent']
-            vcs_pl_sg = self.vcs_cluster_url + fixtures['service'][1]['parent']
-
-            self.run_and_check_plan(self.management_server, PLAN_COMPLETE, 20,
-                                    add_to_cleanup=False)
-        else:
-            vcs_fo_sg = vcs_fo_sg[-1]
-            vcs_pl_sg = vcs_pl_sg[-1]
-
-            self.execute_cli_update_cmd(self.management_server, vcs_fo_sg,
-                                        props='dependency_list=CS_124980_2')
-            self.execute_cli_create_cmd(
-                self.management_server, vcs_pl_sg + '/ipaddresses/VIP1',
-                'vip', props='network_name={0} ipaddress={1}'
-                    .format(vip_props['network_name'],
-                            vip_props['ipaddress'][0]), add_to_cleanup=False)
-            self.execute_cli_create_cmd(
-                self.management_server, vcs_pl_sg + '/ipaddresses/VIP2',
-                'vip', props='network_name={0} ipaddress={1}'
-                    .format(vip_props['network_name'],
-                            vip_props['ipaddress'][1]), add_to_cleanup=False)
-            self.run_and_check_plan(self.management_server, PLAN_COMPLETE, 20,
-                                    add_to_cleanup=False)
-        return vcs_fo_sg, vcs_pl_sg
+        apply_item_changes(
+            fixtures, 'service', 1,
+            {'parent': "CS_124980_2",
+             'destination': self.vcs_cluster_url +
+                            '/services/CS_124980_2/applications/'
+                            'APP_124980_2'})
+        apply_item_changes(
+            fixtures, 'vip', 0, {'vpath': self.vcs_cluster_url +
+                                          '/services/CS_124980_2/'
+                                          'ipaddresses/VIP1'}
+        )
+        apply_options_changes(
+            fixtures, 'vip', 0, {
+                'network_name': '{0}'.format(vip_props['network_name']),
+                'ipaddress': '{0}'.format(vip_props['ipaddress'][0])},
+            overwrite=True)
+        apply_item_changes(
+            fixtures, 'vip', 1, {'vpath': self.vcs_cluster_url +
+                                          '/services/CS_124980_2/'
+                                          'ipaddresses/VIP2'}
+        )
+        apply_options_changes(
+            fixtures, 'vip', 1, {
+                'network_name': '{0}'.format(vip_props['network_name']),
+                'ipaddress': '{0}'.format(vip_props['ipaddress'][1])},
+            overwrite=True)
+        self.deploy_baseline(self.management_server, fixtures,
+                             self.rpm_src_dir)
+        return (fixtures['vcs-clustered-service'][0]['vpath'],
+                fixtures['vcs-clustered-service'][1]['vpath'])
 
     def _check_cs_in_model_tc05(self):
         """
-        Method that will check for existing service groups in the model for
-        test case 5
+        Method that will deploy the service group with a trigger for test
+        case 5, reusing or patching the one already deployed by
+        deploy_baseline
         :return: vcs_fo_sg (str): FO SG URL
         """
-        vcs_fo_sg = self.get_matching_vcs_cs_in_model(
-                self.management_server, apps=1, ha_srv_cfgs=1,
-                cs_props_dict={'active': '1', 'standby': '1',
-                               'node_list': 'n2,n1',
-                               'name': 'CS_124980_1'})
-        if vcs_fo_sg == []:
-            self.log('info', 'Creating suitable Service groups for TC05')
-            fixtures = self.baseline(vcs_len=1, app_len=1, hsc_len=1,
-                                     vcs_trig=1)
-            apply_options_changes(
-                fixtures, 'vcs-clustered-service', 0,
-                {'active': '1', 'standby': '1', 'name': 'CS_124980_1',
-                 'node_list': 'n2,n1'}, overwrite=True)
-            apply_item_changes(
-                fixtures, 'service', 0,
-                {'parent': "CS_124980_1",
-                 'destination': self.vcs_cluster_url +
-                                '/services/CS_124980_1/applications/'
-                                'APP_124980_1'})
-            vcs_fo_sg = self.vcs_cluster_url + '/services/' + fixtures[
-                'service'][0]['parent']
-
-            self.apply_cs_and_apps_sg(self.management_server, fixtures,
-                                      self.rpm_src_dir)
-
-            self.run_and_check_plan(self.management_server, PLAN_COMPLETE, 20,
-                                    add_to_cleanup=False)
-        else:
-            vcs_fo_sg = vcs_fo_sg[-1]
-            self.execute_cli_create_cmd(self.management_server, vcs_fo_sg +
-                                        '/triggers/trig1', 'vcs-trigger',
-                                        props='trigger_type=nofailover',
-                                        add_to_cleanup=False)
-
-            self.run_and_check_plan(self.management_server, PLAN_COMPLETE, 20,
-                                    add_to_cleanup=False)
-        return vcs_fo_sg
+        self.log('info', 'Deploying suitable Service groups for TC05')
+        fixtures = self.baseline(vcs_len=1, app_len=1, hsc_len=1,
+                                 vcs_trig=1)
+        apply_options_changes(
+            fixtures, 'vcs-clustered-service', 0,
+            {'active': '1', 'standby': '1', 'name': 'CS_124980_1',
+             'node_list': 'n2,n1'}, overwrite=True)
+        apply_item_changes(
+            fixtures, 'service', 0,
+            {'parent': "CS_124980_1",
+             'destination': self.vcs_cluster_url +
+                            '/services/CS_124980_1/applications/'
+                            'APP_124980_1'})
+        self.deploy_baseline(self.management_server, fixtures,
+                             self.rpm_src_dir)
+        return fixtures['vcs-clustered-service'][0]['vpath']
 
     def _check_cs_in_model_tc06(self):
         """
-        Method that will check for existing service groups in the model for
-        test case 6
+        Method that will deploy the service group for test case 6, reusing
+        or patching the one already deployed by deploy_baseline
         :return: vcs_pl_sg (str): PL SG URL
         """
-        vcs_pl_sg = self.get_matching_vcs_cs_in_model(
-            self.management_server, apps=1, ha_srv_cfgs=1,
-            cs_props_dict={'active': '1', 'standby': '0',
-                           'node_list': 'n4',
-                           'name': 'CS_124980_3'})
-        if vcs_pl_sg == []:
-            self.log('info', 'Creating suitable Service groups for TC06')
-            fixtures = self.baseline(vcs_len=1, app_len=1, hsc_len=1)
-            apply_options_changes(
-                fixtures, 'vcs-clustered-service', 0,
-                {'active': '1', 'standby': '0', 'name': 'CS_124980_3',
-                 'node_list': 'n4'}, overwrite=True)
-
-            self.apply_cs_and_apps_sg(self.management_server, fixtures,
-                                      self.rpm_src_dir)
-            vcs_pl_sg = self.vcs_cluster_url + \
-                          fixtures['service'][0]['parent']
-
-            self.run_and_check_plan(self.management_server, PLAN_COMPLETE, 20,
-                                    add_to_cleanup=False)
-        else:
-            vcs_pl_sg = vcs_pl_sg[-1]
-        return vcs_pl_sg
+        self.log('info', 'Deploying suitable Service groups for TC06')
+        fixtures = self.baseline(vcs_len=1, app_len=1, hsc_len=1)
+        apply_options_changes(
+            fixtures, 'vcs-clustered-service', 0,
+            {'active': '1', 'standby': '0', 'name': 'CS_124980_3',
+             'node_list': 'n4'}, overwrite=True)
+        self.deploy_baseline(self.management_server, fixtures,
+                             self.rpm_src_dir)
+        return fixtures['vcs-clustered-service'][0]['vpath']
 
     def _check_cs_in_model_tc07(self):
         """
-        Method that will check for existing service groups in the model for
-        test case 7
+        Method that will deploy the service group without triggers for test
+        case 7, reusing or patching the one already deployed by
+        deploy_baseline
         :return: vcs_fo_sg (str): FO SG URL
         """
-        vcs_pl_sg = self.get_matching_vcs_cs_in_model(
-            self.management_server, apps=1, ha_srv_cfgs=1,
-            cs_props_dict={'active': '1', 'standby': '1',
-                           'node_list': 'n4,n3',
-                           'name': 'CS_124980_1'})
-        if vcs_pl_sg == []:
-            self.log('info', 'Creating suitable Service groups for TC07')
-            fixtures = self.baseline(vcs_len=1, app_len=1, hsc_len=1)
-            apply_options_changes(
-                fixtures, 'vcs-clustered-service', 0,
-                {'active': '1', 'standby': '1', 'name': 'CS_124980_1',
-                 'node_list': 'n4,n3'}, overwrite=True)
-            self.apply_cs_and_apps_sg(self.management_server, fixtures,
-                                      self.rpm_src_dir)
-            vcs_pl_sg = self.vcs_cluster_url + \
-                        fixtures['service'][0]['parent']
-
-            self.run_and_check_plan(self.management_server, PLAN_COMPLETE, 20,
-                                    add_to_cleanup=False)
-        else:
-            vcs_pl_sg = vcs_pl_sg[-1]
-            self.execute_cli_remove_cmd(self.management_server, vcs_pl_sg +
-                                        '/triggers/trig1')
-        return vcs_pl_sg
+        self.log('info', 'Deploying suitable Service groups for TC07')
+        fixtures = self.baseline(vcs_len=1, app_len=1, hsc_len=1)
+        apply_options_changes(
+            fixtures, 'vcs-clustered-service', 0,
+            {'active': '1', 'standby': '1', 'name': 'CS_124980_1',
+             'node_list': 'n4,n3'}, overwrite=True)
+        self.deploy_baseline(self.management_server, fixtures,
+                             self.rpm_src_dir)
+        return fixtures['vcs-clustered-service'][0]['vpath']
 
     def _check_cs_in_model_tc08(self):
         """
-        Method that will check for existing service groups in the model for
-        test case 7
-        :return: vcs_fo_sg (str): FO SG URL
+        Method that will deploy the service group for test case 8, reusing
+        or patching the one already deployed by deploy_baseline
+        :return: vcs_pl_sg (str): PL SG URL
         """
-        vcs_pl_sg = self.get_matching_vcs_cs_in_model(
-            self.management_server, apps=1, ha_srv_cfgs=1,
-            cs_props_dict={'active': '1', 'standby': '0',
-                           'node_list': 'n3',
-                           'name': 'CS_124980_3'})
-        if vcs_pl_sg == []:
-            self.log('info', 'Creating suitable Service groups for TC08')
-            fixtures = self.baseline(vcs_len=1, app_len=1, hsc_len=1)
-            apply_options_changes(
-                fixtures, 'vcs-clustered-service', 0,
-                {'active': '1', 'standby': '0', 'name': 'CS_124980_3',
-                 'node_list': 'n3'}, overwrite=True)
-            self.apply_cs_and_apps_sg(self.management_server, fixtures,
-                                      self.rpm_src_dir)
-            vcs_pl_sg = \
-                self.vcs_cluster_url + fixtures['service'][0]['parent']
-
-            self.run_and_check_plan(self.management_server, PLAN_COMPLETE, 20,
-                                    add_to_cleanup=False)
-        else:
-            vcs_pl_sg = vcs_pl_sg[-1]
-        return vcs_pl_sg
+        self.log('info', 'Deploying suitable Service groups for TC08')
+        fixtures = self.baseline(vcs_len=1, app_len=1, hsc_len=1)
+        apply_options_changes(
+            fixtures, 'vcs-clustered-service', 0,
+            {'active': '1', 'standby': '0', 'name': 'CS_124980_3',
+             'node_list': 'n3'}, overwrite=True)
+        self.deploy_baseline(self.management_server, fixtures,
+                             self.rpm_src_dir)
+        return fixtures['vcs-clustered-service'][0]['vpath']
 
     def _check_disk_based_fencing(self):
         """
@@ -555,9 +426,8 @@ class Story124980(GenericTest):
         otherwise proceed with test
         :return:
         """
-        nodes = ['n1', 'n2', 'n3', 'n4']
         # Check if model is expanded to 4 nodes if not proceed with test
-        if sorted(nodes) != sorted(self.node_ids):
+        if not self.is_model_expanded():
             self._four_node_expansion()
 
     @attr('all', 'expansion', 'story124980', 'story124980_tc01')
@@ -649,8 +519,11 @@ class Story124980(GenericTest):
             @step: Update CS groups node list attribute to migrate groups to
             different nodes
             @result: Node is in updated state on relevant CS groups
-            @step: Create and run plan
+            @step: Create and run plan while probing the groups on every node
             @result: plan creates and executes successfully
+            @step: Assert the longest time each group was online on no node
+            @result: Each group was never offline everywhere for
+            MIGRATION_MAX_GAP seconds
             @step: Assert Node list after migration
             @result: Node list is updated after plan
             @step: Assert Dependencies and VIPs are maintained after migration
@@ -683,20 +556,41 @@ class Story124980(GenericTest):
 
         self.execute_cli_createplan_cmd(self.management_server)
         self.execute_cli_showplan_cmd(self.management_server)
-        self.execute_cli_runplan_cmd(self.management_server)
 
-        self.log('info', 'Asserting CS is brought back online on other nodes')
-        cs_grp_name = \
-            self.vcs.generate_clustered_service_name(list_of_cs_names[0],
-                                                     self.cluster_id)
+        self.log('info', 'Probing the groups on every node during migration')
+        grp_names = [self.vcs.generate_clustered_service_name(
+            cs_name, self.cluster_id) for cs_name in list_of_cs_names]
+        nodes = self.get_managed_node_filenames()
+        offsets = {}
+        for grp_name in grp_names:
+            offsets[grp_name] = self.start_status_probes(
+                nodes, grp_name, self.vcs.get_hagrp_cmd(
+                    '-state {0} -sys $(/bin/hostname)'.format(grp_name)) +
+                ' | /bin/grep -q ONLINE')
+        report = DowntimeReport()
+        try:
+            self.execute_cli_runplan_cmd(self.management_server)
+            report.timeline = self.record_plan_timeline(
+                self.management_server, timeout=timeout_mins * 60)
+        finally:
+            for grp_name in grp_names:
+                self.collect_status_probes(offsets[grp_name], grp_name,
+                                           report)
 
-        self.wait_for_vcs_service_group_online(self.node_exe[1], cs_grp_name,
+        self.log('info', 'Asserting CS is brought back online on other nodes')
+        self.wait_for_vcs_service_group_online(self.node_exe[1],
+                                               grp_names[0],
                                                online_count=1,
                                                wait_time_mins=15)
 
         self.assertTrue(self.wait_for_plan_state(self.management_server,
                                                  PLAN_COMPLETE,
                                                  timeout_mins))
+        self.log('info', 'Asserting the groups were not offline everywhere '
+                         'for too long')
+        for grp_name in grp_names:
+            self.assert_max_gap(report, MIGRATION_MAX_GAP, service=grp_name)
+
         self.log('info', 'Asserting node list after migration update')
         # Assert node list after migration to other nodes
 
@@ -16,6 +16,8 @@ from vcs_utils import VCSUtils
 from test_constants import PLAN_COMPLETE, PLAN_TASKS_SUCCESS, \
     VCS_MAIN_CF_FILENAME
 from litp_generic_test import GenericTest, attr
+from snapshot_fingerprint import SnapshotMixin
+from expansion import ExpansionMixin
 from redhat_cmd_utils import RHCmdUtils
 from generate import load_fixtures, generate_json, apply_options_changes, \
     apply_item_changes
@@ -27,7 +29,7 @@ DUMMY_FILE = 'dummy_file.txt'
 PID_ID = ''
 
 
-class Story128825(GenericTest):
+class Story128825(SnapshotMixin, ExpansionMixin, GenericTest):
     """
     TORF-128825:
         Description:
@@ -132,41 +134,8 @@ class Story128825(GenericTest):
         Return:
             Nothing
         """
-        net_hosts_props_dhcp = {'ip': '10.10.14.4',
-                                'network_name': 'dhcp_network'}
-        net_hosts_props_mgmt = {'ip': '192.168.0.4',
-                                'network_name': 'mgmt'}
-
-        # Step 1: Expand the litp model to run on three nodes
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn2.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn3.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn4.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-
-        self.execute_cli_create_cmd(
-            self.management_server,
-            self.vcs_cluster_url +
-            '/network_hosts/nh21',
-            'vcs-network-host',
-            props='ip={0} network_name={1}'.format(
-                net_hosts_props_dhcp['ip'],
-                net_hosts_props_dhcp['network_name']),
-            add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(
-            self.management_server,
-            self.vcs_cluster_url +
-            '/network_hosts/nh22',
-            'vcs-network-host',
-            props='ip={0} network_name={1}'.format(
-                net_hosts_props_mgmt['ip'],
-                net_hosts_props_mgmt['network_name']),
-            add_to_cleanup=False)
+        self.expand_cluster(self.management_server,
+                            network_hosts=('nh21', 'nh22'))
 
     def _create_snapshot(self):
         """
@@ -174,10 +143,7 @@ class Story128825(GenericTest):
         based on plugin updates for KGB suite
         :return: Nothing
         """
-
-        self.execute_and_wait_createsnapshot(self.management_server,
-                                             add_to_cleanup=False,
-                                             remove_snapshot=True)
+        self.create_snapshot_if_changed(self.management_server)
 
     def _is_model_expanded(self):
         """
@@ -185,10 +151,8 @@ class Story128825(GenericTest):
         otherwise proceed with test
         :return:
         """
-        nodes = ['n1', 'n2', 'n3', 'n4']
         # Check if model is expanded to 4 nodes if not proceed with test
-
-        if sorted(nodes) != sorted(self.node_ids):
+        if not self.is_model_expanded():
             self._four_node_expansion()
         else:
             self.log('info', 'Model is already expanded')
@@ -198,13 +162,7 @@ class Story128825(GenericTest):
             Method that sets the passwords for newly expanded nodes
         :return: Nothing
         """
-        for node in self.nodes_to_expand:
-            self.assertTrue(self.set_pws_new_node(self.management_server,
-                                                  node),
-                            "Failed to set password")
-
-        stdout, _, _ = self.run_command(self.nodes_to_expand[1], 'hostname')
-        self.assertEqual(stdout[0], self.nodes_to_expand[1])
+        self.prepare_new_nodes(self.management_server, self.nodes_to_expand)
 
     def _check_active_node(self, sg_name):
         """
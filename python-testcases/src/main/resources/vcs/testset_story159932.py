@@ -15,6 +15,8 @@ import os
 from vcs_utils import VCSUtils
 from test_constants import PLAN_COMPLETE, PLAN_TASKS_RUNNING
 from litp_generic_test import GenericTest, attr
+from snapshot_fingerprint import SnapshotMixin
+from expansion import ExpansionMixin
 from redhat_cmd_utils import RHCmdUtils
 from generate import load_fixtures, generate_json, apply_options_changes, \
     apply_item_changes
@@ -22,7 +24,7 @@ from generate import load_fixtures, generate_json, apply_options_changes, \
 STORY = '159932'
 
 
-class Story159932(GenericTest):
+class Story159932(SnapshotMixin, ExpansionMixin, GenericTest):
     """
     TORF-159932:
         Description:
@@ -116,15 +118,7 @@ class Story159932(GenericTest):
         Method that sets the passwords for newly expanded nodes
         :return: Nothing
         """
-        for node in self.nodes_to_expand:
-            self.assertTrue(self.set_pws_new_node(self.management_server,
-                                                  node),
-                            "Failed to set password")
-
-            # Sanity check to prove passwds have been set
-            stdout, _, _ = self.run_command(node, 'hostname')
-
-            self.assertEqual(stdout[0], node)
+        self.prepare_new_nodes(self.management_server, self.nodes_to_expand)
 
     def _four_node_expansion(self):
         """
@@ -132,30 +126,7 @@ class Story159932(GenericTest):
         supplied
         :return: Nothing
         """
-        net_hosts_props = {'ip': '10.10.14.4',
-                           'network_name': 'dhcp_network'}
-
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn2.sh',
-                                    cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn3.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn4.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-
-        self.execute_cli_create_cmd(self.management_server,
-                                    self.vcs_cluster_url +
-                                    '/network_hosts/nh21', 'vcs-network-host',
-                                    props='ip={0} network_name={1}'
-                                    .format(net_hosts_props['ip'],
-                                            net_hosts_props['network_name']),
-                                   add_to_cleanup=False)
-
-        timeout_mins = 90
-        self.run_and_check_plan(self.management_server, PLAN_COMPLETE,
-                                timeout_mins)
+        self.expand_cluster(self.management_server, plan_timeout_mins=90)
 
     def _is_model_expanded(self):
         """
@@ -163,9 +134,8 @@ class Story159932(GenericTest):
         otherwise proceed with test
         :return:
         """
-        nodes = ['n1', 'n2', 'n3', 'n4']
-         # Check if model is expanded to 4 nodes if not proceed with test
-        if sorted(nodes) != sorted(self.node_ids):
+        # Check if model is expanded to 4 nodes if not proceed with test
+        if not self.is_model_expanded():
             self._four_node_expansion()
             # Set passwords of newly added nodes
             self.set_Passwords()
@@ -330,13 +300,11 @@ class Story159932(GenericTest):
         # If the expansion has succeeded we restore_snapshot to bring us
         # back to a one node state again. Note we set the poweroff_nodes value
         # as expanded nodes should be powered off before restoring back.
-        self.execute_and_wait_restore_snapshot(
+        # The restored snapshot is then removed and a new one created for
+        # the next test to have a restore_point
+        self.restore_snapshot_and_recreate(
             self.management_server, poweroff_nodes=self.nodes_to_expand)
 
-        # Create a new snapshot for the next test to have a restore_point
-        self.execute_and_wait_createsnapshot(self.management_server,
-                                             add_to_cleanup=False)
-
         # Reset Passwords for next test case
         self.assertTrue(self.set_pws_new_node(self.management_server,
                                               self.node_exe[0]),
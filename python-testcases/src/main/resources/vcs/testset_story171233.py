@@ -16,16 +16,17 @@ import os
 from generate import load_fixtures, generate_json, apply_options_changes, \
     apply_item_changes
 from litp_generic_test import GenericTest, attr
+from snapshot_fingerprint import SnapshotMixin
+from polling import PollingMixin
 from re import match
 from redhat_cmd_utils import RHCmdUtils
 from test_constants import GABTAB_PATH, PLAN_COMPLETE
-from time import sleep
 from vcs_utils import VCSUtils
 
 STORY = '171233'
 
 
-class Story171233(GenericTest):
+class Story171233(SnapshotMixin, PollingMixin, GenericTest):
     """
     TORF-171233:
         Seeding of VCS clusters
@@ -243,13 +244,11 @@ class Story171233(GenericTest):
         # If the expansion has succeeded we restore_snapshot to bring us
         # back to a one node state again. Note we set the poweroff_nodes value
         # as expanded nodes should be powered off before restoring back.
-        self.execute_and_wait_restore_snapshot(
+        # The restored snapshot is then removed and a new one created for
+        # the next test to have a restore_point
+        self.restore_snapshot_and_recreate(
             self.management_server, poweroff_nodes=self.nodes_to_expand)
 
-        # Create a new snapshot for the next test to have a restore_point
-        self.execute_and_wait_createsnapshot(self.management_server,
-                                             add_to_cleanup=False)
-
         # Reset Passwords for next test case
         self.assertTrue(self.set_pws_new_node(self.management_server,
                                               self.node_exe[0]),
@@ -367,33 +366,39 @@ class Story171233(GenericTest):
 
         :param node: Node on which the check is performed
         :param timeout: Timeout in minutes (default 10 minutes)
+        :param polling: Upper limit of the interval between checks in seconds
         :return: Boolean
         """
         status_cmd = self.rh_cmds.get_systemctl_is_active_cmd("vcs")
 
-        rc = 1
-        time = 0
-
-        # Loop until the output of "service vcs status" says that
+        # Wait until the output of "service vcs status" says that
         # vcs is running
-        while rc != 0:
-            _, _, rc = self.run_command(node, status_cmd, su_root=True)
-
-            time += 1
-
-            if time * polling > timeout * 60:
-                self.log("info",
-                         "wait_vcs_running timeout after {0} minutes"
-                         .format(timeout))
-
-                return False
-
-            sleep(polling)
-
-        # Timeout to allow vcs to connect to the cluster
-        # (The VCS service is now running but it needs a while before it is
-        # back in the cluster)
-        sleep(30)
+        if not self.wait_until(
+                self.command_succeeds(node, status_cmd, su_root=True),
+                timeout=timeout * 60, first_interval=1, max_interval=polling,
+                description='vcs service active on {0}'.format(node)):
+            self.log("info",
+                     "wait_vcs_running timeout after {0} minutes"
+                     .format(timeout))
+            return False
+
+        # The VCS service is now running but it needs a while before it is
+        # back in the cluster, wait for the system to be RUNNING
+        sys_state_cmd = self.vcs.get_hasys_cmd("-state {0}".format(node))
+
+        def system_running():
+            """
+            Return True once VCS reports the system as RUNNING.
+            """
+            stdout, _, ret_code = self.run_command(node, sys_state_cmd,
+                                                   su_root=True)
+            return ret_code == 0 and stdout == ['RUNNING']
+
+        if not self.wait_until(
+                system_running, timeout=timeout * 60, first_interval=1,
+                max_interval=polling,
+                description='VCS system {0} RUNNING'.format(node)):
+            return False
 
         # Get a list of running clustered services on the node_cmd
         hagrp_cmd = self.vcs.get_hagrp_cmd("-list") + " | grep -E " \
@@ -411,27 +416,26 @@ class Story171233(GenericTest):
             hagrp_cmd = self.vcs.get_hagrp_cmd("-state {0} -sys {1}"
                                                .format(service, node))
 
-            status = ""
-            time = 0
-
-            # Ensure every clustered service is "ONLINE" or "OFFLINE"
-            # Not "STOPPING" or "STARTING"
-            while match("^((ONLINE|OFFLINE)(?!\\|(STARTING|STOPPING)))",
-                        status) is None:
+            def group_stable():
+                """
+                Ensure every clustered service is "ONLINE" or "OFFLINE"
+                Not "STOPPING" or "STARTING"
+                """
                 status = ''.join(self.run_command(node, hagrp_cmd,
                                                   su_root=True,
                                                   default_asserts=True)[0])
+                return match("^((ONLINE|OFFLINE)(?!\\|(STARTING|STOPPING)))",
+                             status) is not None
 
-                time += 1
-
-                if time * polling > timeout * 60:
-                    self.log("info",
-                             "Service {0} not started after {1} minutes"
-                             .format(service, timeout))
-
-                    return False
+            if not self.wait_until(
+                    group_stable, timeout=timeout * 60, first_interval=1,
+                    max_interval=polling,
+                    description='{0} stable on {1}'.format(service, node)):
+                self.log("info",
+                         "Service {0} not started after {1} minutes"
+                         .format(service, timeout))
 
-                sleep(polling)
+                return False
 
         return True
 
@@ -15,13 +15,15 @@ import os
 from vcs_utils import VCSUtils
 from test_constants import PLAN_COMPLETE, PLAN_TASKS_SUCCESS
 from litp_generic_test import GenericTest, attr
+from expansion import ExpansionMixin
+from model_cache import CachedModelMixin
 from generate import load_fixtures, generate_json, apply_options_changes, \
     apply_item_changes
 
 STORY = '194459'
 
 
-class Story194459(GenericTest):
+class Story194459(ExpansionMixin, CachedModelMixin, GenericTest):
     """
     TORF-194459:
         Description:
@@ -164,29 +166,8 @@ class Story194459(GenericTest):
         supplied
         :return: Nothing
         """
-        net_hosts_props = {'ip': '10.10.14.4',
-                           'network_name': 'dhcp_network'}
-
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn2.sh',
-                                    cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn3.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.management_server,
-                                   'expand_cloud_c1_mn4.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-
-        self.execute_cli_create_cmd(self.management_server,
-                                    self.vcs_cluster_url +
-                                    '/network_hosts/nh21', 'vcs-network-host',
-                                    props='ip={0} network_name={1}'
-                                    .format(net_hosts_props['ip'],
-                                            net_hosts_props['network_name']))
-
-        timeout_mins = 90
-        self.run_and_check_plan(self.management_server, PLAN_COMPLETE,
-                                timeout_mins)
+        self.expand_cluster(self.management_server, plan_timeout_mins=90,
+                            add_to_cleanup=True)
 
     def _check_cs_in_model_tc01(self):
         """
@@ -359,9 +340,8 @@ class Story194459(GenericTest):
         otherwise proceed with test
         :return:
         """
-        nodes = ['n1', 'n2', 'n3', 'n4']
         # Check if model is expanded to 4 nodes if not proceed with test
-        if sorted(nodes) != sorted(self.node_ids):
+        if not self.is_model_expanded():
             self._four_node_expansion()
 
     @attr('all', 'expansion', 'Story194459', 'Story194459_tc01')
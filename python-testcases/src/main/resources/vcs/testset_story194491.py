@@ -15,6 +15,7 @@ import os
 from vcs_utils import VCSUtils
 from test_constants import PLAN_COMPLETE
 from litp_generic_test import GenericTest, attr
+from model_cache import CachedModelMixin
 from redhat_cmd_utils import RHCmdUtils
 from generate import load_fixtures, generate_json, apply_options_changes, \
     apply_item_changes
@@ -22,7 +23,7 @@ from generate import load_fixtures, generate_json, apply_options_changes, \
 STORY = '194491'
 
 
-class Story194491(GenericTest):
+class Story194491(CachedModelMixin, GenericTest):
     """
     TORF-194491:
         Description:
@@ -13,6 +13,9 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from model_cache import CachedModelMixin
+from model_xml import ModelBatchMixin
+from polling import PollingMixin
 from redhat_cmd_utils import RHCmdUtils
 from vcs_utils import VCSUtils
 import test_constants
@@ -20,7 +23,8 @@ import os
 import time
 
 
-class Story243557(GenericTest):
+class Story243557(ModelBatchMixin, PollingMixin, CachedModelMixin,
+                  GenericTest):
     """
     TORF-243557
     LITP Fails when you try to Upgrade out if SG is in status Frozen.
@@ -112,57 +116,9 @@ class Story243557(GenericTest):
         # Create Clustered-Service in the model
         cs_options = cli_data['cs']['options'] + \
                      " node_list='{0}'".format(",".join(node_vnames))
-        self.execute_cli_create_cmd(self.management_server,
-                                    cli_data['cs']['url'],
-                                    cli_data['cs']['class_type'],
-                                    cs_options,
-                                    add_to_cleanup=False)
-
-        # Create lsb apps in the model
-        self.execute_cli_create_cmd(self.management_server,
-                                    cli_data['apps']['url'],
-                                    cli_data['apps']['class_type'],
-                                    cli_data['apps']['options'],
-                                    add_to_cleanup=False)
-
-        # Create all IPs associated with the lsb-app
-        for ip_data in cli_data['ips']:
-            self.execute_cli_create_cmd(self.management_server,
-                                        ip_data['url'],
-                                        ip_data['class_type'],
-                                        ip_data['options'],
-                                        add_to_cleanup=False)
-
-        # Create all packages associated with lsb-app
-        for pkg_data in cli_data['pkgs']:
-            self.execute_cli_create_cmd(self.management_server,
-                                        pkg_data['url'],
-                                        pkg_data['class_type'],
-                                        pkg_data['options'],
-                                        add_to_cleanup=False)
-
-        # CREATE THE HA SERVICE CONFIG ITEM
-        if len(cli_data['ha_service_config'].keys()) > 0:
-            self.execute_cli_create_cmd(self.management_server,
-                                cli_data['ha_service_config']['url'],
-                                cli_data['ha_service_config']['class_type'],
-                                cli_data['ha_service_config']['options'],
-                                add_to_cleanup=False)
-
-        # Create pkgs under the lsb-app
-        for pkg_link_data in cli_data['pkg_links']:
-            self.execute_cli_inherit_cmd(self.management_server,
-                                         pkg_link_data['child_url'],
-                                         pkg_link_data['parent_url'],
-                                         add_to_cleanup=False)
-
-        # create inherit to the service
-        if app_class in ["service", "vm-service"]:
-            self.execute_cli_inherit_cmd(self.management_server,
-                                         cli_data['apps']
-                                         ['app_url_in_cluster'],
-                                         cli_data['apps']['url'],
-                                         add_to_cleanup=False)
+        # Create the CS, apps, IPs, packages, ha-service-config and links
+        self.create_cs_from_cli_data(self.management_server, cli_data,
+                                     cs_options, app_class)
 
     @staticmethod
     def generate_plan_conf_service(traffic_networks):
@@ -470,34 +426,32 @@ class Story243557(GenericTest):
                              su_root=True, default_asserts=True)
         self.assertEqual([], stdout)
 
-        status = 'string'
-        counter = 0
-        # system needs some time to online.
-        while status != 'ONLINE' and counter < 60:
-            # check if ONLINE
-            has_cmb = self.vcs.get_hastatus_sum_cmd()
-            cmd = "{0} | {1} {2} | {1} {3}".format(has_cmb,
-                                                   self.rh_os.grep_path,
-                                                   cs_group_name,
-                                                   node)
+        has_cmb = self.vcs.get_hastatus_sum_cmd()
+        status_cmd = "{0} | {1} {2} | {1} {3}".format(has_cmb,
+                                                      self.rh_os.grep_path,
+                                                      cs_group_name,
+                                                      node)
+
+        def group_online():
+            """
+            Return True once the group is ONLINE on the node, fail at once
+            if it is FAULTED or FROZEN.
+            """
             stdout, _, _ = \
-                self.run_command(node, cmd,
+                self.run_command(node, status_cmd,
                                  su_root=True, default_asserts=True)
             self.assertNotEqual([], stdout)
             grep_result = ' '.join(stdout)
-            if 'OFFLINE' not in grep_result and 'STARTING' not in grep_result:
-                if 'FAULTED' in grep_result:
-                    status = 'FAULTED'
-                    self.assertNotEqual(status, 'FAULTED')
-                elif 'FROZEN' in grep_result:
-                    status = 'FROZEN'
-                    self.assertNotEqual(status, 'FROZEN')
-                elif 'ONLINE' in grep_result:
-                    if 'ONLINE|' not in grep_result:
-                        status = 'ONLINE'
-            counter += 1
-            time.sleep(10)
-        self.assertEqual(status, 'ONLINE')
+            if 'OFFLINE' in grep_result or 'STARTING' in grep_result:
+                return False
+            self.assertFalse('FAULTED' in grep_result)
+            self.assertFalse('FROZEN' in grep_result)
+            return 'ONLINE' in grep_result and 'ONLINE|' not in grep_result
+
+        # system needs some time to online.
+        self.assertTrue(self.wait_until(
+            group_online, timeout=600, first_interval=1, max_interval=10,
+            description='{0} ONLINE on {1}'.format(cs_group_name, node)))
 
     @attr('all', 'non-revert', 'Bug243557_tc01')
     def test_01_unlock_success_with_temporarily_frozen_group(self):
@@ -595,11 +549,12 @@ class Story243557(GenericTest):
         configuration_service = \
             self.generate_plan_conf_service(self.traffic_networks)
 
-        for cs_name in list_of_cs_names_service:
-            self.generate_execute_cs_cli(configuration_service,
-                                         self.vcs_cluster_url,
-                                         cs_name,
-                                         app_class="service")
+        with self.model_batch(self.management_server):
+            for cs_name in list_of_cs_names_service:
+                self.generate_execute_cs_cli(configuration_service,
+                                             self.vcs_cluster_url,
+                                             cs_name,
+                                             app_class="service")
 
         self.log("info", "Step 2. Deploying Service Clusters. ")
         self.run_and_check_plan(self.management_server,
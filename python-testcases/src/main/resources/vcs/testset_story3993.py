@@ -14,6 +14,7 @@ program(s) have been supplied.
 
 from litp_generic_test import GenericTest, attr
 from vcs_utils import VCSUtils
+from model_snapshot import ModelSnapshot, get_vcs_model_info
 import test_constants
 import os
 import re
@@ -80,40 +81,13 @@ class Story3993(GenericTest):
     def get_vcs_model_info(self):
         """
         Function that returns a dictionary all the vcs clustered service
-        information from the LITP model
+        information from the LITP model. The deployments are read with a
+        single recursive show and queried locally.
         """
-
-        service_groups = []
-
-        prop_dict = {}
-        service_group = {}
-
-        for cluster in self.model['clusters']:
-
-            clus_servs = self.find(self.ms_node, cluster['url'],
-                                   'vcs-clustered-service',
-                                   assert_not_empty=False)
-            for serv in clus_servs:
-                # Check if this clustered service is a vm service
-                vm_service = self.find(self.ms_node, serv, 'vm-service',
-                                  assert_not_empty=False)
-                # Ignore if VM service as it's tested in testset_vcs_vm.py
-                if vm_service:
-                    continue
-
-                prop_dict['url'] = serv
-
-                props = self.get_props_from_url(self.ms_node, serv)
-
-                for prop in props:
-                    prop_dict[prop] = props[prop]
-
-                service_group['vcs-clustered-service'] = prop_dict
-
-                prop_dict = {}
-
-                service_groups.append(service_group)
-                service_group = {}
+        snapshot = ModelSnapshot.from_test(self, self.ms_node)
+        service_groups = get_vcs_model_info(
+            snapshot, [cluster['url'] for cluster in self.model['clusters']],
+            item_types=())
 
         self.log("info", "Printing dict from get_vcs_model_info()")
         self._print_list(0, service_groups)
@@ -14,15 +14,23 @@ program(s) have been supplied.
             Agile: STORY LITPCDS-3994
 """
 from litp_generic_test import GenericTest, attr
+from model_cache import CachedModelMixin
+from node_index import NodeIndexMixin
+from scheduling import requires
 from litp_cli_utils import CLIUtils
+from plan_index import PlanIndex
 from redhat_cmd_utils import RHCmdUtils
+from upgrade_benchmark import (CONFIGURATIONS, PACKAGE_COUNTS,
+                               UpgradeBenchmarkMixin)
 from vcs_utils import VCSUtils
 import test_constants
 import os
 import re
 
 
-class Story3994(GenericTest):
+@requires(after='testset_vcs_setup.py')
+class Story3994(UpgradeBenchmarkMixin, NodeIndexMixin, CachedModelMixin,
+                GenericTest):
     """
     Integration tests for As a LITP User I want my VCS managed
     application packages upgraded so that I can keep my software
@@ -96,7 +104,7 @@ class Story3994(GenericTest):
         super(Story3994, self).tearDown()
 
     def check_node_lock_or_unlock_task_sequence(self, task_regex,
-        node_hostname, unlock=False):
+        node_hostname, unlock=False, plan=None):
         """
         Description:
              Function to check that a node Lock/Unlock is sequenced
@@ -107,62 +115,26 @@ class Story3994(GenericTest):
                                  for locking/unlocking
             unlock (bool): Boolean indicating whether the task being searched
                            for is a node unlock. Defaults to node lock.
+            plan (PlanIndex): Plan to check, read with show_plan if not
+                              given.
         Returns:
             bool. Indicates whether the node lock/unlock was found as expected.
         """
-
-        plan_stdout, _, _ = \
-            self.execute_cli_showplan_cmd(self.management_server)
-        parsed_plan = self.cli.parse_plan_output(plan_stdout)
-
-        subtasks = []
-
-        # Gather all subtasks in a flat array
-        for task in parsed_plan.values():
-            for subtask in task.values():
-                subtasks.append(subtask['DESC'][1].strip())
+        if plan is None:
+            plan = PlanIndex.from_test(self, self.management_server)
 
         # Find the specified task
-        task_idx = None
-        for idx, desc in enumerate(subtasks):
-            if re.match(task_regex, desc):
-                task_idx = idx
-                break
+        task = plan.find(task_regex)
 
         # Make sure the task was found
-        self.assertNotEqual(None, task_idx)
+        self.assertNotEqual(None, task)
 
         if not unlock:
-            #
-            # Ensure LOCK
-            #
-            # Loop from the specified task to the beginning and
-            # make sure it gets locked at some point
-            for idx in reversed(range(0, task_idx)):
-                desc = subtasks[idx]
-                if desc.lower() == \
-                    ('Lock VCS on node "{0}"'.format(node_hostname)).lower():
-                    return True
-                elif desc.lower() == \
-                    ('Unlock VCS on node "{0}"'.format(node_hostname)).lower():
-                    return False
-            return False
-
-        else:
-            #
-            # Ensure UNLOCK
-            #
-            # Loop from the specified task to the end and
-            # make sure it gets unlocked at some point
-            for idx in range(task_idx + 1, len(subtasks)):
-                desc = subtasks[idx]
-                if desc.lower() == \
-                    ('Lock VCS on node "{0}"'.format(node_hostname)).lower():
-                    return False
-                elif desc.lower() == \
-                    ('Unlock VCS on node "{0}"'.format(node_hostname)).lower():
-                    return True
-            return False
+            # Make sure the node gets locked at some point before the task
+            return plan.locked_before(task, node_hostname)
+
+        # Make sure the node gets unlocked at some point after the task
+        return plan.unlocked_after(task, node_hostname)
 
     def compile_cs_active_node_dict(self, conf):
         """
@@ -181,14 +153,7 @@ class Story3994(GenericTest):
         # This piece of code is just retrieving all the hostnames ####
         # for the managed nodes ######################################
         ##############################################################
-        list_of_systems = []
-        for node in self.find(self.management_server, self.vcs_cluster_url,
-                              "node"):
-            list_of_systems.append(str(
-                self.get_props_from_url(
-                    self.management_server,
-                    node,
-                    filter_prop="hostname")))
+        list_of_systems = self.node_index().values('hostname')
 
         # CYCLE THROUGH CLUSTERED SERVICES BASED ON THEIR VCS NAME ENTRY
         # AND COMPILE A DICTIONARY OF ALL THE NODES ON WHICH THEY ARE ACTIVE.
@@ -246,17 +211,7 @@ class Story3994(GenericTest):
         """
         Function to map the node hostnames to their respective filenames
         """
-        node_mapping = {}
-        for node in self.find(self.management_server, self.vcs_cluster_url,
-                              "node"):
-            node_filename = \
-            self.get_node_filename_from_url(self.management_server, node)
-            node_mapping[str(
-                self.get_props_from_url(
-                    self.management_server,
-                    node,
-                    filter_prop="hostname"))] = node_filename
-        return node_mapping
+        return self.node_index().host_to_file()
 
     def check_plan_phases(self, updated_pkg_versions, node_hostnames):
         """
@@ -264,6 +219,7 @@ class Story3994(GenericTest):
         prior to the package installation and that a node unlock occurs
         following the package installation.
         """
+        plan = PlanIndex.from_test(self, self.management_server)
 
         for pkg in updated_pkg_versions:
             for node_hostname in node_hostnames:
@@ -273,12 +229,14 @@ class Story3994(GenericTest):
 
                 lock_found = \
                     self.check_node_lock_or_unlock_task_sequence(
-                        re.escape(find_task), node_hostname, unlock=False)
+                        re.escape(find_task), node_hostname, unlock=False,
+                        plan=plan)
                 self.assertEqual(True, lock_found)
 
                 unlock_found = \
                     self.check_node_lock_or_unlock_task_sequence(
-                        re.escape(find_task), node_hostname, unlock=True)
+                        re.escape(find_task), node_hostname, unlock=True,
+                        plan=plan)
                 self.assertEqual(True, unlock_found)
 
     def get_cs_url(self, cs_name):
@@ -2702,3 +2660,45 @@ class Story3994(GenericTest):
             remote_path = "/tmp/'{0}'".format(old_service_name)
             res = self.remote_path_exists(active_node, remote_path)
             self.assertTrue(res)
+
+    @attr('benchmark', 'non-revert', 'story3994', 'story3994_benchmark')
+    def test_30_benchmark_rolling_upgrade(self):
+        """
+        @tms_id: litpcds_3994_benchmark
+        @tms_requirements_id: LITPCDS-3994
+        @tms_title: benchmark rolling package upgrades
+        @tms_description:
+            This test measures the plan duration, the time spent locking,
+            updating and unlocking, and the service availability while
+            every node is locked, of package upgrades of 1 node parallel,
+            2 node parallel and 2 node failover clustered services with
+            1 to 50 packages.
+        @tms_test_steps:
+        @step: deploy a clustered service of the configuration with the
+               packages at version 1.0
+        @result: clustered service is online
+        @step: upgrade every package to version 2.0 while probing the
+               services on every node
+        @result: plan executes successfully and the run is measured
+        @step: remove the clustered service and its packages
+        @result: plan executes successfully
+        @step: write the runs to the results file
+        @result: the comparison table is logged
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        num = 0
+        for configuration in CONFIGURATIONS:
+            for packages in PACKAGE_COUNTS:
+                num += 1
+                story = '3994{0:02d}'.format(num)
+                fixtures = self.deploy_upgrade_cs(self.management_server,
+                                                  story, configuration,
+                                                  packages)
+                try:
+                    self.benchmark_upgrade(self.management_server, story,
+                                           configuration, packages,
+                                           self.list_managed_nodes)
+                finally:
+                    self.remove_upgrade_cs(self.management_server, fixtures)
+        self.write_upgrade_results()
@@ -13,14 +13,26 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from chaos_soak import ChaosSoakMixin
+from failover_benchmark import APP_KILL, FailoverBenchmarkMixin
+from fault_injection import Fault, FaultInjectionMixin, simultaneous
+from model_cache import CachedModelMixin
+from node_index import NodeIndexMixin
+from scheduling import requires
 from redhat_cmd_utils import RHCmdUtils
 from vcs_utils import VCSUtils
 from litp_cli_utils import CLIUtils
 from networking_utils import NetworkingUtils
 import os
 
+# Seed, duration in seconds and time series file of the chaos soak
+SOAK_SEED = 3995
+SOAK_DURATION = 4 * 3600
+SOAK_SERIES = 'chaos_soak_3995.jsonl'
 
-class Story3995(GenericTest):
+@requires(after='testset_vcs_setup.py')
+class Story3995(FailoverBenchmarkMixin, FaultInjectionMixin, ChaosSoakMixin,
+                NodeIndexMixin, CachedModelMixin, GenericTest):
     """
     LITPCDS-3995:
     As an application designer I want to manage an IPv6 resource so that
@@ -201,14 +213,7 @@ class Story3995(GenericTest):
         # This piece of code is just retrieving all the hostnames ####
         # for the managed nodes ######################################
         ##############################################################
-        list_of_systems = []
-        for node in self.find(self.management_server, self.vcs_cluster_url,
-                              "node"):
-            list_of_systems.append(str(
-                self.get_props_from_url(
-                    self.management_server,
-                    node,
-                    filter_prop="hostname")))
+        list_of_systems = self.node_index().values('hostname')
 
         # CYCLE THROUGH CLUSTERED SERVICES BASED ON THEIR VCS NAME ENTRY
         # AND COMPILE A DICTIONARY OF ALL THE NODES ON WHICH THEY ARE ACTIVE.
@@ -370,16 +375,31 @@ class Story3995(GenericTest):
             conf (dict): Expected model of clustered services
                            and associated IP addresses
         """
-        application = conf["app_per_cs"][clustered_service]
-        service_name = \
-        conf["lsb_app_properties"][application]['name']
-        cmd = self.rh_os.get_service_stop_cmd(service_name)
+        cmd = self.get_service_kill_cmd(clustered_service, conf)
         stdout, stderr, rc = \
         self.run_command(node, cmd, su_root=True)
         self.assertEqual(0, rc)
         self.assertEqual([], stderr)
         self.assertNotEqual([], stdout)
 
+    def get_service_kill_cmd(self, clustered_service, conf):
+        """
+        Function to return the command that kills (stops) the application
+        of the clustered service.
+        Args:
+            clustered_service (Str): Name of the clustered service as it
+                                     appears in the conf dictionary.
+
+            conf (dict): Expected model of clustered services
+                           and associated IP addresses
+        Returns:
+            str. The service stop command.
+        """
+        application = conf["app_per_cs"][clustered_service]
+        service_name = \
+        conf["lsb_app_properties"][application]['name']
+        return self.rh_os.get_service_stop_cmd(service_name)
+
     def issue_grp_repair_cmds(self, clustered_service, hostname_mapping):
         """
         Function to issue the vcs repair command against the specified
@@ -534,6 +554,10 @@ class Story3995(GenericTest):
 
             item (Str): Child object to be killed, defaults to applications.
                         Currently only covers applications and ipaddress
+
+        The kills are fired together on all nodes by inject_faults and the
+        skew between them is logged.
+
         Return:
             dict. A dictionary detailing the C-S's active on each hostname.
             dict. A dictionary detailing the ipaddresses to be killed
@@ -572,6 +596,7 @@ class Story3995(GenericTest):
         # IS FUNCTIONING BEFORE CLEARING THE ADDRESS FROM THAT ALIAS          #
         #######################################################################
         ipkilling_dict = {}
+        faults = []
         for node in node_cs_list.keys():
             if node not in ipkilling_dict.keys():
                 ipkilling_dict[node] = {}
@@ -580,7 +605,10 @@ class Story3995(GenericTest):
             # [CS1, CS2]
             for clustered_service in clustered_services:
                 if item == None:
-                    self.kill_service_on_node(node, clustered_service, conf)
+                    faults.append(Fault(
+                        node, self.get_service_kill_cmd(clustered_service,
+                                                        conf),
+                        name='stop_{0}_{1}'.format(clustered_service, node)))
 
                 if item == "ipaddress":
                     #ipkilling_dict = {}
@@ -592,7 +620,21 @@ class Story3995(GenericTest):
             ipaddresses = ipkilling_dict[node_to_exe]
             for ip_to_kill in ipaddresses:
                 nic = ipkilling_dict[node_to_exe][ip_to_kill]
-                self.kill_ip_address_on_node(node_to_exe, ip_to_kill, nic)
+                faults.append(Fault(
+                    node_to_exe, self.get_ip_kill_cmd(ip_to_kill, nic),
+                    name='clear_{0}_{1}'.format(ip_to_kill, node_to_exe)))
+
+        #######################################################################
+        # FIRE ALL THE KILLS TOGETHER AT A SHARED DEADLINE, SO THAT THE       #
+        # FAILURES COINCIDE INSTEAD OF BEING SPREAD BY THE SSH ROUND-TRIPS    #
+        #######################################################################
+        if faults:
+            report = self.inject_faults(simultaneous(faults))
+            self.assertEqual([], [(fault.name, report.results.get(
+                fault.name)) for fault in report.failed])
+            self.log('info', 'Kill skew across {0} faults: {1:.3f}s (+/-'
+                     '{2:.3f}s)'.format(len(faults), report.skew,
+                                       report.clock_uncertainty))
 
         return hostname_mapping, ipkilling_dict
 
@@ -708,18 +750,29 @@ class Story3995(GenericTest):
 
             nic (Str): NIC on which the ipaddress resides.
         """
-        if ':' in ip_to_kill:
-            cmd = \
-            self.net_utils.get_clear_ip_cmd(ip_to_kill, nic, ip6=True)
-        else:
-            cmd = \
-            self.net_utils.get_clear_ip_cmd(ip_to_kill, nic)
+        cmd = self.get_ip_kill_cmd(ip_to_kill, nic)
         stdout, stderr, rc = \
         self.run_command(node, cmd, su_root=True)
         self.assertEqual(0, rc)
         self.assertEqual([], stderr)
         self.assertEqual([], stdout)
 
+    def get_ip_kill_cmd(self, ip_to_kill, nic):
+        """
+        Function to return the command that kills (deletes) the provided
+        ip address from the provided NIC.
+        Args:
+            ip_to_kill (Str): ip address which is to be killed, including a
+                              /subnet bits ending.
+
+            nic (Str): NIC on which the ipaddress resides.
+        Returns:
+            str. The ip address clear command.
+        """
+        if ':' in ip_to_kill:
+            return self.net_utils.get_clear_ip_cmd(ip_to_kill, nic, ip6=True)
+        return self.net_utils.get_clear_ip_cmd(ip_to_kill, nic)
+
     def map_node_host_to_node_file(self):
         """
         Function to map the node hostnames to their respective filenames
@@ -727,17 +780,7 @@ class Story3995(GenericTest):
             dict. A dictionary mapping the nodes hostname to the node
                   filename.
         """
-        node_mapping = {}
-        for node in self.find(self.management_server, self.vcs_cluster_url,
-                              "node"):
-            node_filename = \
-            self.get_node_filename_from_url(self.management_server, node)
-            node_mapping[str(
-                self.get_props_from_url(
-                    self.management_server,
-                    node,
-                    filter_prop="hostname"))] = node_filename
-        return node_mapping
+        return self.node_index().host_to_file()
 
     def check_ip_res_state(self, ip_resource_dict, ip_resources_list,
                            ipaddress_list):
@@ -1104,3 +1147,113 @@ class Story3995(GenericTest):
         # FAIL
         #######################################################################
         self.wait_for_resources_to_update()
+
+    @attr('benchmark', 'non-revert', 'story3995', 'story3995_benchmark')
+    def test_09_benchmark_app_kill_failover(self):
+        """
+        @tms_id: litpcds_3995_benchmark
+        @tms_requirements_id: LITPCDS-3995
+        @tms_title: benchmark application kill failover
+        @tms_description:
+        This test kills the application of an active standby clustered
+        service repeatedly and measures the fault detection, offline and
+        online times of every failover.
+        @tms_test_steps:
+        @step: Kill the application of the clustered service on its active
+               node
+        @result: The clustered service fails over to its standby node and
+                 the failover is measured
+        @step: Clear the fault and switch the clustered service back
+        @result: The clustered service is online on its active node
+        @step: Write the measured failovers to the results file
+        @result: The failover percentiles are logged
+        @tms_test_precondition:NA
+        @tms_execution_type: Automated
+        """
+        conf = self.vcs.generate_plan_conf_v6(self.traffic_networks)
+        clustered_service = 'CS16'
+        group_name = self.vcs.generate_clustered_service_name(
+            clustered_service, self.cluster_id)
+        cs_active_node_dict = self.compile_cs_active_node_dict(conf)
+        faulted = cs_active_node_dict[clustered_service][0]
+        host_to_file = self.map_node_host_to_node_file()
+        node_list = self.get_props_from_url(
+            self.management_server, '{0}/services/{1}'.format(
+                self.vcs_cluster_url, clustered_service),
+            filter_prop='node_list')
+        standby = [host for host in (self.node_index().hostname(node_id)
+                                     for node_id in node_list.split(','))
+                   if host != faulted][0]
+
+        def recover():
+            """
+            Clear the fault and bring the group back on the faulted node.
+            """
+            for args in ('-clear {0} -sys {1}', '-switch {0} -to {1}',
+                         '-wait {0} State ONLINE -sys {1} -time 300'):
+                _, stderr, return_code = self.run_command(
+                    self.primary_node, self.vcs.get_hagrp_cmd(
+                        args.format(group_name, faulted)), su_root=True)
+                self.assertEqual(0, return_code)
+                self.assertEqual([], stderr)
+
+        runs = self.benchmark_failover(
+            APP_KILL, host_to_file[standby], group_name, faulted, standby,
+            lambda: self.kill_service_on_node(host_to_file[faulted],
+                                              clustered_service, conf),
+            recover, runs=10)
+        self.write_failover_results()
+        self.assertTrue(all(run.failed_over for run in runs))
+        self.wait_for_resources_to_update()
+
+    @attr('soak', 'non-revert', 'story3995', 'story3995_soak')
+    def test_10_soak_app_kill_failover(self):
+        """
+        @tms_id: litpcds_3995_soak
+        @tms_requirements_id: LITPCDS-3995
+        @tms_title: chaos soak of application kills
+        @tms_description:
+        This test kills the applications of active standby and parallel
+        clustered services at random for SOAK_DURATION seconds with a
+        seeded schedule, and checks after every kill that every group
+        recovers without being online on more nodes than at the start.
+        @tms_test_steps:
+        @step: Kill the application of a random clustered service on its
+               active node, clearing the fault of an active standby one
+        @result: Every group is back online on as many nodes as at the
+                 start
+        @step: Write every step to the time series file
+        @result: The soak summary is logged and no violation is found
+        @tms_test_precondition:NA
+        @tms_execution_type: Automated
+        """
+        conf = self.vcs.generate_plan_conf_v6(self.traffic_networks)
+
+        def app_kill(clustered_services, repair):
+            """
+            Return a soak action killing the application of one of the
+            clustered services, chosen by the soak random generator.
+            """
+            def action(rand):
+                """
+                Kill the application and clear the fault when repair is set.
+                """
+                cs_death_conf = {rand.choice(clustered_services): []}
+                hostname_mapping, _ = \
+                    self.kill_provided_clustered_services_children(
+                        cs_death_conf, self.compile_cs_active_node_dict(conf),
+                        conf)
+                if repair:
+                    self.wait_for_resources_to_fault(cs_death_conf, conf)
+                    self.repair_vcs_group_or_resources(cs_death_conf, conf,
+                                                       hostname_mapping)
+            return action
+
+        summary = self.run_soak(
+            {'failover_app_kill': (2, app_kill(['CS16', 'CS17', 'CS18'],
+                                               True)),
+             'parallel_app_kill': (1, app_kill(['CS20', 'CS21'], False))},
+            self.primary_node, self.list_managed_nodes, SOAK_DURATION,
+            SOAK_SERIES, seed=SOAK_SEED)
+        self.wait_for_resources_to_update()
+        self.assertEqual(None, summary['violation'])
@@ -16,6 +16,10 @@ program(s) have been supplied.
             detected
 """
 from litp_generic_test import GenericTest, attr
+from fault_injection import Fault, FaultInjectionMixin, simultaneous
+from model_cache import CachedModelMixin
+from node_index import NodeIndexMixin
+from scheduling import requires
 from litp_cli_utils import CLIUtils
 from redhat_cmd_utils import RHCmdUtils
 from vcs_utils import VCSUtils
@@ -24,7 +28,9 @@ from random import Random
 import time
 
 
-class Story3997(GenericTest):
+@requires(after='testset_vcs_setup.py')
+class Story3997(FaultInjectionMixin, NodeIndexMixin, CachedModelMixin,
+                GenericTest):
     """
     As an application designer I want to set up resource dependencies
     so that my VCS service group can failover when a fault is detected
@@ -93,14 +99,7 @@ class Story3997(GenericTest):
         # This piece of code is just retrieving all the hostnames ####
         # for the managed nodes ######################################
         ##############################################################
-        list_of_systems = []
-        for node in self.find(self.management_server, self.vcs_cluster_url,
-                              "node"):
-            list_of_systems.append(str(
-                self.get_props_from_url(
-                    self.management_server,
-                    node,
-                    filter_prop="hostname")))
+        list_of_systems = self.node_index().values('hostname')
 
         # CYCLE THROUGH CLUSTERED SERVICES BASED ON THEIR VCS NAME ENTRY
         # AND COMPILE A DICTIONARY OF ALL THE NODES ON WHICH THEY ARE ACTIVE.
@@ -239,6 +238,10 @@ class Story3997(GenericTest):
 
             item (Str): Child object to be killed, defaults to applications.
                         Currently only covers applications and ipaddress
+
+        The kills are fired together on all nodes by inject_faults and the
+        skew between them is logged.
+
         Return:
             dict. A dictionary detailing the C-S's active on each hostname.
             dict. A dictionary detailing the ipaddresses to be killed
@@ -277,6 +280,7 @@ class Story3997(GenericTest):
         # IS FUNCTIONING BEFORE CLEARING THE ADDRESS FROM THAT ALIAS          #
         #######################################################################
         ipkilling_dict = {}
+        faults = []
         for node in node_cs_list.keys():
             if node not in ipkilling_dict.keys():
                 ipkilling_dict[node] = {}
@@ -285,7 +289,10 @@ class Story3997(GenericTest):
             # [CS1, CS2]
             for clustered_service in clustered_services:
                 if item == None:
-                    self.kill_service_on_node(node, clustered_service, conf)
+                    faults.append(Fault(
+                        node, self.get_service_kill_cmd(clustered_service,
+                                                        conf),
+                        name='stop_{0}_{1}'.format(clustered_service, node)))
 
                 if item == "ipaddress":
                     #ipkilling_dict = {}
@@ -297,7 +304,21 @@ class Story3997(GenericTest):
             ipaddresses = ipkilling_dict[node_to_exe]
             for ip_to_kill in ipaddresses:
                 nic = ipkilling_dict[node_to_exe][ip_to_kill]
-                self.kill_ip_address_on_node(node_to_exe, ip_to_kill, nic)
+                faults.append(Fault(
+                    node_to_exe, self.get_ip_kill_cmd(ip_to_kill, nic),
+                    name='clear_{0}_{1}'.format(ip_to_kill, node_to_exe)))
+
+        #######################################################################
+        # FIRE ALL THE KILLS TOGETHER AT A SHARED DEADLINE, SO THAT THE       #
+        # FAILURES COINCIDE INSTEAD OF BEING SPREAD BY THE SSH ROUND-TRIPS    #
+        #######################################################################
+        if faults:
+            report = self.inject_faults(simultaneous(faults))
+            self.assertEqual([], [(fault.name, report.results.get(
+                fault.name)) for fault in report.failed])
+            self.log('info', 'Kill skew across {0} faults: {1:.3f}s (+/-'
+                     '{2:.3f}s)'.format(len(faults), report.skew,
+                                       report.clock_uncertainty))
 
         return hostname_mapping, ipkilling_dict
 
@@ -308,17 +329,7 @@ class Story3997(GenericTest):
             dict. A dictionary mapping the nodes hostname to the node
                   filename.
         """
-        node_mapping = {}
-        for node in self.find(self.management_server, self.vcs_cluster_url,
-                              "node"):
-            node_filename = \
-            self.get_node_filename_from_url(self.management_server, node)
-            node_mapping[str(
-                self.get_props_from_url(
-                    self.management_server,
-                    node,
-                    filter_prop="hostname"))] = node_filename
-        return node_mapping
+        return self.node_index().host_to_file()
 
     def map_node_file_to_node_host(self):
         """
@@ -327,13 +338,7 @@ class Story3997(GenericTest):
             dict. A dictionary mapping the nodes filename to the nodes
                   hostname.
         """
-        file_to_host_dict = {}
-        host_to_file_dict = self.map_node_host_to_node_file()
-        for host in host_to_file_dict.keys():
-            # {node1: mn1, node2: mn2}
-            file_name = host_to_file_dict[host]
-            file_to_host_dict[file_name] = host
-        return file_to_host_dict
+        return self.node_index().file_to_host()
 
     @staticmethod
     def map_node_host_to_clustered_services(cs_active_node_dict,
@@ -582,14 +587,27 @@ class Story3997(GenericTest):
 
             nic (Str): NIC on which the ipaddress resides.
         """
-        cmd = \
-        self.net_utils.get_clear_ip_cmd(ip_to_kill, nic)
+        cmd = self.get_ip_kill_cmd(ip_to_kill, nic)
         stdout, stderr, rc = \
         self.run_command(node, cmd, su_root=True)
         self.assertEqual(0, rc)
         self.assertEqual([], stderr)
         self.assertEqual([], stdout)
 
+    def get_ip_kill_cmd(self, ip_to_kill, nic):
+        """
+        Function to return the command that kills (deletes) the provided
+        ip address from the provided NIC.
+        Args:
+            ip_to_kill (Str): ip address which is to be killed, including a
+                              /subnet bits ending.
+
+            nic (Str): NIC on which the ipaddress resides.
+        Returns:
+            str. The ip address clear command.
+        """
+        return self.net_utils.get_clear_ip_cmd(ip_to_kill, nic)
+
     def kill_service_on_node(self, node, clustered_service, conf):
         """
         Function to kill (stop) the clustered service on the provided node.
@@ -602,10 +620,25 @@ class Story3997(GenericTest):
             conf (dict): Expected model of clustered services
                            and associated IP addresses
         """
+        cmd = self.get_service_kill_cmd(clustered_service, conf)
+        self.run_command(node, cmd, su_root=True, default_asserts=True)
+
+    def get_service_kill_cmd(self, clustered_service, conf):
+        """
+        Function to return the command that kills (stops) the application
+        of the clustered service.
+        Args:
+            clustered_service (Str): Name of the clustered service as it
+                                     appears in the conf dictionary.
+
+            conf (dict): Expected model of clustered services
+                           and associated IP addresses
+        Returns:
+            str. The service stop command.
+        """
         application = conf["app_per_cs"][clustered_service]
         service_name = conf["lsb_app_properties"][application]['name']
-        cmd = self.rh_os.get_systemctl_stop_cmd(service_name)
-        self.run_command(node, cmd, su_root=True, default_asserts=True)
+        return self.rh_os.get_systemctl_stop_cmd(service_name)
 
     def map_ip_address_to_nic(self, node, nics, ipaddress):
         """
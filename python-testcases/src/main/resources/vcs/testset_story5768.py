@@ -14,6 +14,9 @@ program(s) have been supplied.
 
 from litp_cli_utils import CLIUtils
 from litp_generic_test import GenericTest, attr
+from model_cache import CachedModelMixin
+from plan_index import PlanIndex
+from scheduling import requires
 from redhat_cmd_utils import RHCmdUtils
 from vcs_utils import VCSUtils
 import test_constants
@@ -21,7 +24,8 @@ import os
 import re
 
 
-class Story5768(GenericTest):
+@requires(after='testset_vcs_setup.py')
+class Story5768(CachedModelMixin, GenericTest):
     """
     LITPCDS-5768
     As a LITP Developer I want to use the service-base item with the VCS plug
@@ -194,7 +198,7 @@ class Story5768(GenericTest):
                                         add_to_cleanup=False)
 
     def check_node_lock_or_unlock_task_sequence(self, task_regex,
-        node_hostname, unlock=False):
+        node_hostname, unlock=False, plan=None):
         """
         Description:
              Function to check that a node Lock/Unlock is sequenced
@@ -205,62 +209,26 @@ class Story5768(GenericTest):
                                  for locking/unlocking
             unlock (bool): Boolean indicating whether the task being searched
                            for is a node unlock. Defaults to node lock.
+            plan (PlanIndex): Plan to check, read with show_plan if not
+                              given.
         Returns:
             bool. Indicates whether the node lock/unlock was found as expected.
         """
-
-        plan_stdout, _, _ = \
-            self.execute_cli_showplan_cmd(self.management_server)
-        parsed_plan = self.cli.parse_plan_output(plan_stdout)
-
-        subtasks = []
-
-        # Gather all subtasks in a flat array
-        for task in parsed_plan.values():
-            for subtask in task.values():
-                subtasks.append(subtask['DESC'][1].strip())
+        if plan is None:
+            plan = PlanIndex.from_test(self, self.management_server)
 
         # Find the specified task
-        task_idx = None
-        for idx, desc in enumerate(subtasks):
-            if re.match(task_regex, desc):
-                task_idx = idx
-                break
+        task = plan.find(task_regex)
 
         # Make sure the task was found
-        self.assertNotEqual(None, task_idx)
+        self.assertNotEqual(None, task)
 
         if not unlock:
-            #
-            # Ensure LOCK
-            #
-            # Loop from the specified task to the beginning and
-            # make sure it gets locked at some point
-            for idx in reversed(range(0, task_idx)):
-                desc = subtasks[idx]
-                if desc.lower() == \
-                    ('Lock VCS on node "{0}"'.format(node_hostname)).lower():
-                    return True
-                elif desc.lower() == \
-                    ('Unlock VCS on node "{0}"'.format(node_hostname)).lower():
-                    return False
-            return False
-
-        else:
-            #
-            # Ensure UNLOCK
-            #
-            # Loop from the specified task to the end and
-            # make sure it gets unlocked at some point
-            for idx in range(task_idx + 1, len(subtasks)):
-                desc = subtasks[idx]
-                if desc.lower() == \
-                    ('Lock VCS on node "{0}"'.format(node_hostname)).lower():
-                    return False
-                elif desc.lower() == \
-                    ('Unlock VCS on node "{0}"'.format(node_hostname)).lower():
-                    return True
-            return False
+            # Make sure the node gets locked at some point before the task
+            return plan.locked_before(task, node_hostname)
+
+        # Make sure the node gets unlocked at some point after the task
+        return plan.unlocked_after(task, node_hostname)
 
     def compile_cs_active_node_dict(self, conf):
         """
@@ -333,6 +301,7 @@ class Story5768(GenericTest):
         prior to the package installation and that a node unlock occurs
         following the package installation.
         """
+        plan = PlanIndex.from_test(self, self.management_server)
 
         for pkg in updated_pkg_versions.keys():
             for node_hostname in node_hostnames:
@@ -341,12 +310,14 @@ class Story5768(GenericTest):
 
                 lock_found = \
                     self.check_node_lock_or_unlock_task_sequence(
-                        re.escape(find_task), node_hostname, unlock=False)
+                        re.escape(find_task), node_hostname, unlock=False,
+                        plan=plan)
                 self.assertEqual(True, lock_found)
 
                 unlock_found = \
                     self.check_node_lock_or_unlock_task_sequence(
-                        re.escape(find_task), node_hostname, unlock=True)
+                        re.escape(find_task), node_hostname, unlock=True,
+                        plan=plan)
                 self.assertEqual(True, unlock_found)
 
     def get_cs_url(self, cs_name):
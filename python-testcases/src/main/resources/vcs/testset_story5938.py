@@ -14,6 +14,8 @@ program(s) have been supplied.
 
 from litp_generic_test import GenericTest, attr
 from vcs_utils import VCSUtils
+from dependency_graph import DependencyGraph, DependencyGraphMixin
+from model_snapshot import ModelSnapshot, get_vcs_model_info
 import re
 from redhat_cmd_utils import RHCmdUtils
 from generate import load_fixtures, generate_json, apply_options_changes, \
@@ -24,7 +26,7 @@ from test_constants import PLAN_TASKS_SUCCESS, PLAN_COMPLETE
 STORY = '5938'
 
 
-class Story5938(GenericTest):
+class Story5938(DependencyGraphMixin, GenericTest):
     """
     LITPCDS-5938
     As an application designer I want to set up dependencies between my VCS
@@ -87,40 +89,13 @@ class Story5938(GenericTest):
     def get_vcs_model_info(self):
         """
         Function that returns a dictionary all the vcs clustered service
-        information from the LITP model
+        information from the LITP model. The deployments are read with a
+        single recursive show and queried locally.
         """
-
-        service_groups = []
-
-        prop_dict = {}
-        service_group = {}
-
-        for cluster in self.model['clusters']:
-
-            clus_servs = self.find(self.ms_node, cluster['url'],
-                                   'vcs-clustered-service',
-                                   assert_not_empty=False)
-            for serv in clus_servs:
-                # Check if this clustered service is a vm service
-                vm_service = self.find(self.ms_node, serv, 'vm-service',
-                                  assert_not_empty=False)
-                # Ignore if VM service as it's tested in testset_vcs_vm.py
-                if vm_service:
-                    continue
-
-                prop_dict['url'] = serv
-
-                props = self.get_props_from_url(self.ms_node, serv)
-
-                for prop in props:
-                    prop_dict[prop] = props[prop]
-
-                service_group['vcs-clustered-service'] = prop_dict
-
-                prop_dict = {}
-
-                service_groups.append(service_group)
-                service_group = {}
+        snapshot = ModelSnapshot.from_test(self, self.ms_node)
+        service_groups = get_vcs_model_info(
+            snapshot, [cluster['url'] for cluster in self.model['clusters']],
+            item_types=())
 
         self.log("info", "Printing dict from get_vcs_model_info()")
         self._print_list(0, service_groups)
@@ -297,31 +272,16 @@ class Story5938(GenericTest):
         @tms_execution_type: Automated
         """
         dep = self._get_online_ordering_dependencies()
-
-        # verify that VCS is configured correctly
-        for parent_cs in dep:
-            parent_cs_grp = self.vcs.generate_clustered_service_name(parent_cs,
-                                                             self.cluster_id)
-
-            cmd = self.vcs.get_hagrp_cmd('-dep ' + parent_cs_grp)
-            stdout, stderr, rc = self.run_command(self.primary_node, cmd,
-                                                  su_root=True)
-            self.assertEqual(0, rc)
-            self.assertEqual([], stderr)
-
-            for child_cs in dep[parent_cs]:
-                child_cs_grp = \
-                            self.vcs.generate_clustered_service_name(child_cs,
-                                                               self.cluster_id)
-                exp_reg_ex = parent_cs_grp + r'\s+' + child_cs_grp +\
-                             r'\s+online\s+(global|local)\s+soft'
-                exp_reg_ex_compiled = re.compile(exp_reg_ex)
-                result = False
-
-                for line in stdout:
-                    if re.search(exp_reg_ex_compiled, line):
-                        result = True
-                self.assertTrue(result)
+        graph = DependencyGraph(dep).renamed(
+            lambda cs_name: self.vcs.generate_clustered_service_name(
+                cs_name, self.cluster_id))
+
+        # verify that VCS is configured correctly, with one hagrp -dep
+        # for all the service groups
+        vcs_deps = self.assert_vcs_dependencies(self.primary_node, graph)
+        for edge in graph.edges():
+            self.assertTrue(re.match(r'online\s+(global|local)\s+soft$',
+                                     vcs_deps[edge]), edge)
 
     # attr('pre-reg', 'non-revert', 'story5938', 'story5938_tc02')
     def obsolete_02_p_verify_dependency_order_after_node_locking(self):
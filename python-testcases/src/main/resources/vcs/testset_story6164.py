@@ -14,6 +14,9 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from model_cache import CachedModelMixin
+from node_index import NodeIndexMixin
+from scheduling import requires
 from redhat_cmd_utils import RHCmdUtils
 from vcs_utils import VCSUtils
 from litp_cli_utils import CLIUtils
@@ -22,7 +25,8 @@ import test_constants
 import os
 
 
-class Story6164(GenericTest):
+@requires(after='testset_vcs_setup.py')
+class Story6164(NodeIndexMixin, CachedModelMixin, GenericTest):
     """
     LITPCDS-6164:
     As a LITP User I want to configure a VCS application attributes so that I
@@ -213,14 +217,7 @@ class Story6164(GenericTest):
         # This piece of code is just retrieving all the hostnames ####
         # for the managed nodes ######################################
         ##############################################################
-        list_of_systems = []
-        for node in self.find(self.management_server, self.vcs_cluster_url,
-                              "node"):
-            list_of_systems.append(str(
-                self.get_props_from_url(
-                    self.management_server,
-                    node,
-                    filter_prop="hostname")))
+        list_of_systems = self.node_index().values('hostname')
 
         # CYCLE THROUGH CLUSTERED SERVICES BASED ON THEIR VCS NAME ENTRY
         # AND COMPILE A DICTIONARY OF ALL THE NODES ON WHICH THEY ARE ACTIVE.
@@ -728,15 +725,7 @@ class Story6164(GenericTest):
             dict. A dictionary mapping the nodes hostname to the node
                   filename.
         """
-        node_mapping = {}
-        for node in self.find(self.management_server, self.vcs_cluster_url,
-                              "node"):
-
-            node_filename = \
-            self.get_node_filename_from_url(self.management_server, node)
-            node_hostname = self.get_node_att(node_filename, "hostname")
-            node_mapping[node_hostname] = node_filename
-        return node_mapping
+        return self.node_index().host_to_file()
 
     def check_ip_res_state(self, ip_resource_dict, ip_resources_list,
                            ipaddress_list):
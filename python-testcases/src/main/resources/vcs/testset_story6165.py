@@ -13,6 +13,8 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from model_cache import CachedModelMixin
+from model_xml import ModelBatchMixin
 from vcs_utils import VCSUtils
 import test_constants
 import time
@@ -21,7 +23,7 @@ import os
 RPM_SRC_DIR = os.path.dirname(os.path.realpath(__file__)) + '/test_lsb_rpms/'
 
 
-class Story6165(GenericTest):
+class Story6165(ModelBatchMixin, CachedModelMixin, GenericTest):
     '''
     As a LITP Developer I want to use the service item along with filesystem
     items with the VCS plug in so that there is a consistent approach to
@@ -411,51 +413,10 @@ class Story6165(GenericTest):
         cs_options = '{0} node_list="{1}"'.format(cli_data['cs']['options'],
                                                   ','.join(node_vnames))
 
-        self.execute_cli_create_cmd(self.ms1,
-                                    cli_data['cs']['url'],
-                                    cli_data['cs']['class_type'],
-                                    cs_options,
-                                    add_to_cleanup=False)
-
-        # Create lsb apps in the model
-        self.execute_cli_create_cmd(self.ms1,
-                                    cli_data['apps']['url'],
-                                    cli_data['apps']['class_type'],
-                                    cli_data['apps']['options'],
-                                    add_to_cleanup=False)
+        # Create the CS, apps, packages, ha-service-config and links
+        self.create_cs_from_cli_data(self.ms1, cli_data, cs_options,
+                                     app_class, with_ips=False)
 
-        # Create all packages associated with lsb-app
-        for pkg_data in cli_data['pkgs']:
-            self.execute_cli_create_cmd(self.ms1,
-                                        pkg_data['url'],
-                                        pkg_data['class_type'],
-                                        pkg_data['options'],
-                                        add_to_cleanup=False)
-
-        # CREATE THE HA SERVICE CONFIG ITEM
-        if cli_data['ha_service_config']:
-            self.execute_cli_create_cmd(self.ms1,
-                                        cli_data['ha_service_config']['url'],
-                                        cli_data['ha_service_config']
-                                        ['class_type'],
-                                        cli_data['ha_service_config']
-                                        ['options'],
-                                        add_to_cleanup=False)
-
-        # Create pkgs under the lsb-app
-        for pkg_link_data in cli_data['pkg_links']:
-            self.execute_cli_inherit_cmd(self.ms1,
-                                         pkg_link_data['child_url'],
-                                         pkg_link_data['parent_url'],
-                                         add_to_cleanup=False)
-
-        # create inherit to the service
-        if app_class in ['service', 'vm-service']:
-            self.execute_cli_inherit_cmd(self.ms1,
-                                         cli_data['apps']
-                                         ['app_url_in_cluster'],
-                                         cli_data['apps']['url'],
-                                         add_to_cleanup=False)
         # Create storage profile, file system and needed inherit
         self.create_strg_prof_file_sys()
 
@@ -15,10 +15,14 @@ program(s) have been supplied.
 from litp_generic_test import GenericTest, attr
 from litp_cli_utils import CLIUtils
 import test_constants
+from timeout_calibration import TimeoutCalibrationMixin
 from vcs_utils import VCSUtils
 
+# Offline and online cycles of every group the calibration observes
+CALIBRATION_CYCLES = 10
 
-class Story8361(GenericTest):
+
+class Story8361(TimeoutCalibrationMixin, GenericTest):
     """
     LITPCDS-8361:
     I can set the following properties for a clustered-service
@@ -323,3 +327,32 @@ class Story8361(GenericTest):
         self.assertEqual(
             online_timeout_model, online_timeout_node
         )
+
+    @attr('benchmark', 'non-revert', 'story8361', 'story8361_benchmark')
+    def test_09_benchmark_timeout_calibration(self):
+        """
+        @tms_id: litpcds_8361_benchmark
+        @tms_requirements_id: LITPCDS-8361
+        @tms_title: calibrate CS offline/online timeouts
+        @tms_description:
+        Cycle the deployed clustered services offline and online, measure
+        the offline and online durations of their application resources
+        from the engine log and report the resources whose timeouts leave
+        too little or too much headroom
+        @tms_test_steps:
+        @step: Offline and online every online service group, waiting with
+               "hagrp -wait"
+        @result: The service groups are online
+        @step: Compare the durations in the engine log with the
+               OnlineTimeout and OfflineTimeout of the resources
+        @result: No transition is unfinished or within half of its timeout
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        node_url = self.find(self.management_server, "/deployments", "node")
+        node_to_exe = self.get_node_filename_from_url(self.management_server,
+                                                      node_url[0])
+        rows = self.calibrate_timeouts(node_to_exe, CALIBRATION_CYCLES)
+        self.assertNotEqual([], rows)
+        self.assertEqual([], [row['resource'] for row in rows
+                              if row['verdict'] in ('tight', 'unfinished')])
@@ -14,11 +14,15 @@ from litp_generic_test import GenericTest, attr
 from redhat_cmd_utils import RHCmdUtils
 from networking_utils import NetworkingUtils
 from vcs_utils import VCSUtils
+from model_snapshot import ModelSnapshot, get_vcs_model_info
+from remote_batch import BatchAgentMixin, query
+from scheduling import requires
+from session_pool import SessionPoolMixin
 from time import sleep
 import test_constants
 
 
-class VCS(GenericTest):
+class VCS(SessionPoolMixin, BatchAgentMixin, GenericTest):
     """
     Test the VCS functionality in LITP.
     Item Types verified are 'vcs-cluster', 'vcs-network-host, 'disk',
@@ -588,59 +592,12 @@ class VCS(GenericTest):
     def get_vcs_model_info(self):
         """
         Function that returns a dictionary all the vcs clustered service
-        information from the LITP model
+        information from the LITP model. The deployments are read with a
+        single recursive show and queried locally.
         """
-
-        service_groups = []
-
-        multi_type_list = ['ha-service-config', 'vip', 'package',
-                           'file-system', 'service', 'lsb-runtime',
-                           'vcs-trigger']
-        prop_dict = {}
-        service_group = {}
-
-        for cluster in self.model['clusters']:
-
-            clus_servs = self.find(self.ms_node, cluster['url'],
-                                   'vcs-clustered-service',
-                                   assert_not_empty=False)
-            for serv in clus_servs:
-                # Check if this clustered service is a vm service
-                vm_service = self.find(self.ms_node, serv, 'vm-service',
-                                  assert_not_empty=False)
-                # Ignore if VM service as it's tested in testset_vcs_vm.py
-                if vm_service:
-                    continue
-
-                prop_dict['url'] = serv
-
-                props = self.get_props_from_url(self.ms_node, serv)
-
-                for prop in props:
-                    prop_dict[prop] = props[prop]
-
-                service_group['vcs-clustered-service'] = prop_dict
-
-                prop_dict = {}
-
-                for itype in multi_type_list:
-                    urls = self.find(self.ms_node, serv, itype,
-                                     assert_not_empty=False)
-                    for url in urls:
-                        props = self.get_props_from_url(self.ms_node, url)
-                        prop_dict['url'] = url
-                        for prop in props:
-                            prop_dict[prop] = props[prop]
-
-                        if itype in service_group:
-                            service_group[itype].append(prop_dict)
-                        else:
-                            service_group[itype] = []
-                            service_group[itype].append(prop_dict)
-                        prop_dict = {}
-
-                service_groups.append(service_group)
-                service_group = {}
+        snapshot = ModelSnapshot.from_test(self, self.ms_node)
+        service_groups = get_vcs_model_info(
+            snapshot, [cluster['url'] for cluster in self.model['clusters']])
 
         self.log("info", "Printing dict from get_vcs_model_info()")
         self._print_list(0, service_groups)
@@ -673,15 +630,21 @@ class VCS(GenericTest):
 
             cluster_packs = cluster["package"]
 
+            queries = dict()
             for package in cluster_packs:
 
                 props = package
 
                 self.assertTrue("name" in props)
 
-                name = [props["name"]]
+                queries[props["name"]] = query('rpm_query', props["name"])
 
-                self.check_pkgs_installed(node_name, name)
+            # Query all the packages in one batch run on the node
+            results = self.batch_run(node_name, queries)
+            for name, result in results.items():
+                self.assertEqual(0, result.rc,
+                                 "Package {0} is not installed on {1}"
+                                 .format(name, node_name))
 
     def _verify_autostart_and_system_list(self, node_name, service_group,
                                          service_props, node_hostnames):
@@ -742,12 +705,24 @@ class VCS(GenericTest):
         self.assertTrue(exp_system_list == \
                             gp_node_list2['SystemList'][0]['VALUE'])
 
-    def _verify_lsbruntime_props(self, cluster, resource, node_name):
+    def _get_res_app_displays(self, node_name, resource):
+        """
+            Description:
+                Display all the Res_App resources of a service group in one
+                batch run on the node, keyed by resource name
+        """
+        res_app_list = [res for res in resource if 'Res_App' in res]
+        return self.hares_display_batch(node_name, res_app_list)
+
+    def _verify_lsbruntime_props(self, cluster, resource, node_name,
+                                 hares_displays=None):
         """
             Description:
                 Verify lsb-runtime item properties
                 Story LITPCDS-4848, LITPCDS-2207
         """
+        if hares_displays is None:
+            hares_displays = self._get_res_app_displays(node_name, resource)
         for config in cluster["lsb-runtime"]:
 
             # Get dictionary of lsb-runtime properties
@@ -778,8 +753,7 @@ class VCS(GenericTest):
                             continue
 
                     # Display resource information for each resource
-                    hares_display = self.run_vcs_hares_display_command(
-                        node_name, res)
+                    hares_display = hares_displays[res]
 
                     self._verify_vcs_timeouts_limits(config, hares_display)
 
@@ -831,12 +805,15 @@ class VCS(GenericTest):
                 config["status_command"],
                 hares_display["MonitorProgram"][0]["VALUE"])
 
-    def _verify_service_props(self, cluster, resource, node_name):
+    def _verify_service_props(self, cluster, resource, node_name,
+                              hares_displays=None):
         """
             Description:
                 Verify service item properties
                 Story LITPCDS-5768
         """
+        if hares_displays is None:
+            hares_displays = self._get_res_app_displays(node_name, resource)
         for config in cluster["service"]:
 
             # Get dictionary of service properties
@@ -869,8 +846,7 @@ class VCS(GenericTest):
                             continue
 
                     # Display resource information for each resource
-                    hares_display = self.run_vcs_hares_display_command(
-                        node_name, res)
+                    hares_display = hares_displays[res]
 
                     # LITPCDS-5768
                     self._verify_vcs_app_commands(config, hares_display)
@@ -1036,12 +1012,15 @@ class VCS(GenericTest):
             self.assertEqual(config["startup_retry_limit"],
                              hares_display["OnlineRetryLimit"][0]["VALUE"])
 
-    def _verify_online_offline_timeout(self, cluster, resource, node_name):
+    def _verify_online_offline_timeout(self, cluster, resource, node_name,
+                                       hares_displays=None):
         """
             Description:
                 Verify online, offline timeout properties
                 Story LITPCDS-8361.
         """
+        if hares_displays is None:
+            hares_displays = self._get_res_app_displays(node_name, resource)
         res_app_list = list()
         for res in resource:
             if 'Res_App' in res:
@@ -1049,8 +1028,7 @@ class VCS(GenericTest):
 
         for res in res_app_list:
             # Display resource information for each resource
-            hares_display = self.run_vcs_hares_display_command(
-                            node_name, res)
+            hares_display = hares_displays[res]
 
             self.log("info", "Checking Online Timeout and Offline "
                                      "Timeout properties from "
@@ -1063,12 +1041,15 @@ class VCS(GenericTest):
                 cluster["vcs-clustered-service"]["offline_timeout"],
                 hares_display["OfflineTimeout"][0]["VALUE"])
 
-    def _verify_haconfig_props(self, cluster, resource, node_name):
+    def _verify_haconfig_props(self, cluster, resource, node_name,
+                               hares_displays=None):
         """
             Description:
                 Verify ha-service-config item properties
                 LITPCDS-6296
         """
+        if hares_displays is None:
+            hares_displays = self._get_res_app_displays(node_name, resource)
         for config in cluster["ha-service-config"]:
 
             # Get dictionary of ha-service-config properties
@@ -1095,8 +1076,7 @@ class VCS(GenericTest):
                             continue
 
                     # Display resource information for each resource
-                    hares_display = self.run_vcs_hares_display_command(
-                        node_name, res)
+                    hares_display = hares_displays[res]
 
                     if "dependency_list" in config:
 
@@ -1737,6 +1717,7 @@ class VCS(GenericTest):
         self._test_nic_service_groups()
 
     @attr('all', 'revert', 'vcs', 'vcs_tc02')
+    @requires(after='testset_vcs_deploy.py')
     def test_02_verify_sg_vcs_clustered_service(self):
         """
         @tms_id: litpcds_vcs_tc02
@@ -1883,21 +1864,28 @@ class VCS(GenericTest):
             res_states = self.run_vcs_hares_display_command(node_name,
                                                             resource[0],
                                                             "State")
+            # Display all Application resources in one batch for the
+            # checks below
+            hares_displays = self._get_res_app_displays(node_name, resource)
+
             # 13. Verify haconfig item
             # ha-service-config item is optional and is not supported in
             # combination with deprecated 'lsb-runtime' item type
             if "ha-service-config" in cluster:
-                self._verify_haconfig_props(cluster, resource, node_name)
+                self._verify_haconfig_props(cluster, resource, node_name,
+                                            hares_displays)
 
             # 14. Verify lsb-runtime item
             # lsb-runtime item is optional and deprecated, but we still need
             # to verify it.
             if "lsb-runtime" in cluster:
-                self._verify_lsbruntime_props(cluster, resource, node_name)
+                self._verify_lsbruntime_props(cluster, resource, node_name,
+                                              hares_displays)
 
             # 15. Verify service item
             if "service" in cluster:
-                self._verify_service_props(cluster, resource, node_name)
+                self._verify_service_props(cluster, resource, node_name,
+                                           hares_displays)
 
             # 15. Verify VCS Application attributes OnlineTimeout and
             # OfflineTimeout are set correctly based on LITP Model online and
@@ -1907,7 +1895,7 @@ class VCS(GenericTest):
             # resources when lsb-runtime is used.
             if "lsb-runtime" not in cluster:
                 self._verify_online_offline_timeout(cluster, resource,
-                                                    node_name)
+                                                    node_name, hares_displays)
 
             # 16. Verify any VXVM volumes under the clustered service
             self._verify_cluster_vxvm_volume(cluster, node_name,
@@ -1941,6 +1929,7 @@ class VCS(GenericTest):
                                          node_name)
 
     @attr('all', 'revert', 'vcs', 'vcs_tc03')
+    @requires(after='testset_vcs_update_1.py')
     def test_03_verify_vcs_sg_after_update_1(self):
         """
         @tms_id: litpcds_vcs_tc03
@@ -2067,16 +2056,18 @@ class VCS(GenericTest):
 
             resource = self.run_vcs_hagrp_resource_command(node_name,
                                                            service_group)
+            hares_displays = self._get_res_app_displays(node_name, resource)
             # 10. Verify haconfig items after update
             # ha-service-config item is optional and is not supported in
             # combination with deprecated 'lsb-runtime' item type
             # LITPCDS-5172-TC1
             if "ha-service-config" in cluster:
-                self._verify_haconfig_props(cluster, resource, node_name)
+                self._verify_haconfig_props(cluster, resource, node_name,
+                                            hares_displays)
 
             if "lsb-runtime" not in cluster:
                 self._verify_online_offline_timeout(cluster, resource,
-                                                    node_name)
+                                                    node_name, hares_displays)
 
             # 11. Verify VCS triggers if any are configured for service groups
             # LITPCDS-13411-TC6
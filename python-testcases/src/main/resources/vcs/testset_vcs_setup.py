@@ -13,13 +13,15 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from model_cache import CachedModelMixin
+from model_xml import ModelBatchMixin
 from redhat_cmd_utils import RHCmdUtils
 from vcs_utils import VCSUtils
 import test_constants
 import os
 
 
-class Vcssetup(GenericTest):
+class Vcssetup(ModelBatchMixin, CachedModelMixin, GenericTest):
     """
     LITPCDS-4377
     As a LITP Developer I want to re-work how the VCS plug-in defines Virtual
@@ -125,56 +127,9 @@ class Vcssetup(GenericTest):
         # Create Clustered-Service in the model
         cs_options = cli_data['cs']['options'] + \
                      " node_list='{0}'".format(",".join(node_vnames))
-        self.execute_cli_create_cmd(self.management_server,
-                                    cli_data['cs']['url'],
-                                    cli_data['cs']['class_type'],
-                                    cs_options,
-                                    add_to_cleanup=False)
-
-        # Create lsb apps in the model
-        self.execute_cli_create_cmd(self.management_server,
-                                    cli_data['apps']['url'],
-                                    cli_data['apps']['class_type'],
-                                    cli_data['apps']['options'],
-                                    add_to_cleanup=False)
-
-        # Create all IPs associated with the lsb-app
-        for ip_data in cli_data['ips']:
-            self.execute_cli_create_cmd(self.management_server,
-                                        ip_data['url'],
-                                        ip_data['class_type'],
-                                        ip_data['options'],
-                                        add_to_cleanup=False)
-
-        # Create all packages associated with lsb-app
-        for pkg_data in cli_data['pkgs']:
-            self.execute_cli_create_cmd(self.management_server,
-                                        pkg_data['url'],
-                                        pkg_data['class_type'],
-                                        pkg_data['options'],
-                                        add_to_cleanup=False)
-
-        # CREATE THE HA SERVICE CONFIG ITEM
-        if len(cli_data['ha_service_config'].keys()) > 0:
-            self.execute_cli_create_cmd(self.management_server,
-                                cli_data['ha_service_config']['url'],
-                                cli_data['ha_service_config']['class_type'],
-                                cli_data['ha_service_config']['options'],
-                                add_to_cleanup=False)
-
-        # Create pkgs under the lsb-app
-        for pkg_link_data in cli_data['pkg_links']:
-            self.execute_cli_inherit_cmd(self.management_server,
-                                        pkg_link_data['child_url'],
-                                        pkg_link_data['parent_url'],
-                                        add_to_cleanup=False)
-
-        # create inherit to the service
-        if app_class in ["service", "vm-service"]:
-            self.execute_cli_inherit_cmd(self.management_server,
-                                        cli_data['apps']['app_url_in_cluster'],
-                                        cli_data['apps']['url'],
-                                        add_to_cleanup=False)
+        # Create the CS, apps, IPs, packages, ha-service-config and links
+        self.create_cs_from_cli_data(self.management_server, cli_data,
+                                     cs_options, app_class)
 
     @attr('all', 'non-revert', 'kgb-other', 'cdb_priority1', 'vcssetup_tc01')
     def test_01_deploy_cdb_cs(self):
@@ -256,27 +211,29 @@ class Vcssetup(GenericTest):
                                                          self.traffic_networks)
         conf_srv_prio_order = self.vcs.generate_plan_conf_priority_order()
 
-        for cs_name in list_of_cs_names_orig:
-            self.generate_execute_cs_cli(configuration_orig,
-                                         vcs_cluster_url,
-                                         cs_name)
-
-        for cs_name in list_of_cs_names_service:
-            self.generate_execute_cs_cli(configuration_service,
-                                         vcs_cluster_url,
-                                         cs_name,
-                                         app_class="service")
-
-        for cs_name in list_of_cs_names_service_vips:
-            self.generate_execute_cs_cli(configuration_service_vips,
-                                         vcs_cluster_url, cs_name,
-                                         app_class="service")
-
-        for cs_name in list_of_cs_name_priority_order:
-            self.generate_execute_cs_cli(conf_srv_prio_order,
-                                         vcs_cluster_url,
-                                         cs_name, app_class="service",
-                                         node_ordering=True)
+        # Create all the CSs with one model load per collection
+        with self.model_batch(self.management_server):
+            for cs_name in list_of_cs_names_orig:
+                self.generate_execute_cs_cli(configuration_orig,
+                                             vcs_cluster_url,
+                                             cs_name)
+
+            for cs_name in list_of_cs_names_service:
+                self.generate_execute_cs_cli(configuration_service,
+                                             vcs_cluster_url,
+                                             cs_name,
+                                             app_class="service")
+
+            for cs_name in list_of_cs_names_service_vips:
+                self.generate_execute_cs_cli(configuration_service_vips,
+                                             vcs_cluster_url, cs_name,
+                                             app_class="service")
+
+            for cs_name in list_of_cs_name_priority_order:
+                self.generate_execute_cs_cli(conf_srv_prio_order,
+                                             vcs_cluster_url,
+                                             cs_name, app_class="service",
+                                             node_ordering=True)
 
         # Create and execute plan
         self.execute_cli_createplan_cmd(self.management_server)
@@ -494,28 +451,30 @@ class Vcssetup(GenericTest):
         configuration_service_ha_config = \
                                 self.vcs.generate_plan_conf_ha_service_config()
 
-        for cs_name in list_of_cs_names_orig:
-            self.generate_execute_cs_cli(configuration_orig,
-                                         vcs_cluster_url,
-                                         cs_name)
-
-        for cs_name in list_of_cs_names_ipv6:
-            self.generate_execute_cs_cli(configuration_ipv6,
-                                         vcs_cluster_url,
-                                         cs_name)
-        for cs_name in list_of_cs_names_service:
-            self.generate_execute_cs_cli(configuration_service,
-                                         vcs_cluster_url,
-                                         cs_name, app_class="service")
-        for cs_name in list_of_cs_names_service_vips:
-            self.generate_execute_cs_cli(configuration_service_vips,
-                                         vcs_cluster_url,
-                                         cs_name, app_class="service")
-
-        for cs_name in list_of_cs_names_serv_ha_conf:
-            self.generate_execute_cs_cli(configuration_service_ha_config,
-                                         vcs_cluster_url,
-                                         cs_name, app_class="service")
+        # Create all the CSs with one model load per collection
+        with self.model_batch(self.management_server):
+            for cs_name in list_of_cs_names_orig:
+                self.generate_execute_cs_cli(configuration_orig,
+                                             vcs_cluster_url,
+                                             cs_name)
+
+            for cs_name in list_of_cs_names_ipv6:
+                self.generate_execute_cs_cli(configuration_ipv6,
+                                             vcs_cluster_url,
+                                             cs_name)
+            for cs_name in list_of_cs_names_service:
+                self.generate_execute_cs_cli(configuration_service,
+                                             vcs_cluster_url,
+                                             cs_name, app_class="service")
+            for cs_name in list_of_cs_names_service_vips:
+                self.generate_execute_cs_cli(configuration_service_vips,
+                                             vcs_cluster_url,
+                                             cs_name, app_class="service")
+
+            for cs_name in list_of_cs_names_serv_ha_conf:
+                self.generate_execute_cs_cli(configuration_service_ha_config,
+                                             vcs_cluster_url,
+                                             cs_name, app_class="service")
         # Create and execute plan
         self.execute_cli_createplan_cmd(self.management_server)
         self.execute_cli_runplan_cmd(self.management_server)
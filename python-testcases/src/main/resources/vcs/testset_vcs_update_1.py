@@ -17,9 +17,11 @@ from litp_generic_test import GenericTest, attr
 import test_constants
 from litp_cli_utils import CLIUtils
 from vcs_utils import VCSUtils
+from scheduling import requires
 from test_constants import PLAN_TASKS_SUCCESS
 
 
+@requires(after='testset_vcs.py:test_02_verify_sg_vcs_clustered_service')
 class Vcsupdate(GenericTest):
     """
     XML Script that will update vcs-clustered-services from a previously
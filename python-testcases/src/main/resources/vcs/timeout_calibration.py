@@ -0,0 +1,309 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Calibration of the online_timeout and offline_timeout of the
+            clustered services from the online and offline durations of
+            their application resources, read from the VCS engine log
+
+Usage:
+    python timeout_calibration.py ENGINE_LOG [ENGINE_LOG ...]
+        [--timeouts HARES_DISPLAY] [--json FILE]
+"""
+import json
+import math
+import optparse
+import re
+import sys
+from cluster_common import (VCS_BIN, NodeReadMixin, log_time,
+                            parse_all_group_states, percentile)
+from generate import LITP_DEFAULT_VALUES
+
+KINDS = ('online', 'offline')
+# A timeout under this multiple of the longest duration seen is too tight
+MIN_HEADROOM = 2.0
+# A timeout over this multiple, and at least MIN_SLACK seconds over the
+# longest duration seen, delays the detection of a hung resource
+MAX_HEADROOM = 10.0
+MIN_SLACK = 60
+# Multiple of the longest duration seen that the suggested timeout gives,
+# rounded up to ROUND_TO seconds
+TARGET_HEADROOM = 3.0
+ROUND_TO = 10
+TIMEOUTS_CMD = (VCS_BIN + 'hares -display -attribute OnlineTimeout '
+                'OfflineTimeout')
+
+_INITIATING_REGEX = re.compile(r'Initiating (Online|Offline) of Resource '
+                               r'(\S+) .*on System (\S+)')
+_REACHED_REGEX = re.compile(r'Resource (\S+) .*is (online|offline) on '
+                            r'(\S+)')
+_ATTRIBUTES = {'OnlineTimeout': 'online', 'OfflineTimeout': 'offline'}
+
+# Calibrations made by the running test run, in order
+TIMEOUT_CALIBRATION = []
+
+
+def parse_engine_log(lines):
+    """
+    Return the (resource, system, kind, started_at, ended_at) of every
+    online and offline of the engine log, from its "Initiating" message to
+    the message of the resource reaching the state. ended_at is None when
+    the state was not reached, e.g. after a timeout or a fault.
+    """
+    pending = {}
+    transitions = []
+    for line in lines:
+        seen_at = log_time(line)
+        if seen_at is None:
+            continue
+        started = _INITIATING_REGEX.search(line)
+        reached = _REACHED_REGEX.search(line)
+        if started:
+            key = (started.group(2), started.group(3))
+            if key in pending:
+                transitions.append(key + pending.pop(key) + (None,))
+            pending[key] = (started.group(1).lower(), seen_at)
+        elif reached:
+            key = (reached.group(1), reached.group(3).rstrip('.'))
+            if key in pending and pending[key][0] == reached.group(2):
+                transitions.append(key + pending.pop(key) + (seen_at,))
+    transitions.extend(key + value + (None,)
+                       for key, value in sorted(pending.items()))
+    return transitions
+
+
+def parse_timeouts(lines):
+    """
+    Return the online and offline timeout of every resource of the
+    TIMEOUTS_CMD output.
+    """
+    timeouts = {}
+    for line in lines:
+        fields = line.split()
+        if len(fields) == 4 and fields[1] in _ATTRIBUTES:
+            try:
+                timeouts.setdefault(fields[0], {})[
+                    _ATTRIBUTES[fields[1]]] = int(fields[3])
+            except ValueError:
+                continue
+    return timeouts
+
+
+def default_timeouts():
+    """
+    Return the online and offline timeout LITP gives a clustered service
+    when the model sets none.
+    """
+    defaults = LITP_DEFAULT_VALUES['vcs-clustered-service']
+    return dict((kind, int(defaults[kind + '_timeout'])) for kind in KINDS)
+
+
+def suggest_timeout(longest):
+    """
+    Return TARGET_HEADROOM times the longest duration, rounded up.
+    """
+    return max(ROUND_TO, int(math.ceil(longest * TARGET_HEADROOM /
+                                       ROUND_TO)) * ROUND_TO)
+
+
+def calibrate(transitions, timeouts=None, defaults=None):
+    """
+    Return a row per resource and kind of the transitions: the number of
+    durations, their median and maximum, the configured timeout, or the
+    LITP default when unknown, its headroom over the maximum, the verdict
+    and the suggested timeout. The verdict is "tight" below MIN_HEADROOM,
+    "oversized" above MAX_HEADROOM, "unfinished" if a transition never
+    completed and "ok" otherwise.
+    """
+    timeouts = timeouts or {}
+    defaults = defaults or default_timeouts()
+    durations = {}
+    unfinished = set()
+    for resource, _, kind, started_at, ended_at in transitions:
+        durations.setdefault((resource, kind), [])
+        if ended_at is None:
+            unfinished.add((resource, kind))
+        else:
+            durations[(resource, kind)].append(ended_at - started_at)
+    rows = []
+    for resource, kind in sorted(durations):
+        values = durations[(resource, kind)]
+        configured = timeouts.get(resource, {}).get(kind)
+        timeout = defaults[kind] if configured is None else configured
+        longest = max(values) if values else None
+        row = {'resource': resource, 'kind': kind, 'samples': len(values),
+               'median': percentile(values, 50), 'max': longest,
+               'timeout': timeout, 'default': configured is None,
+               'headroom': None, 'suggested': None, 'verdict': 'unfinished'}
+        if values:
+            row['headroom'] = timeout / max(longest, 1.0)
+            row['suggested'] = suggest_timeout(longest)
+        if (resource, kind) in unfinished or not values:
+            pass
+        elif timeout < longest * MIN_HEADROOM:
+            row['verdict'] = 'tight'
+        elif timeout > longest * MAX_HEADROOM and \
+                timeout - longest >= MIN_SLACK:
+            row['verdict'] = 'oversized'
+        else:
+            row['verdict'] = 'ok'
+        rows.append(row)
+    return rows
+
+
+def format_report(rows):
+    """
+    Return the lines of a table of the calibrate rows, the resources that
+    need attention first.
+    """
+    order = {'unfinished': 0, 'tight': 1, 'oversized': 2, 'ok': 3}
+    lines = ['{0:<40} {1:<8} {2:>7} {3:>7} {4:>7} {5:>8} {6:>8} '
+             '{7:<10} {8:>9}'.format('resource', 'kind', 'samples', 'median',
+                                     'max', 'timeout', 'headroom',
+                                     'verdict', 'suggested')]
+    for row in sorted(rows, key=lambda item: (order[item['verdict']],
+                                              item['resource'],
+                                              item['kind'])):
+        lines.append('{0:<40} {1:<8} {2:>7} {3:>7} {4:>7} {5:>8} {6:>8} '
+                     '{7:<10} {8:>9}'.format(
+                         row['resource'], row['kind'], row['samples'],
+                         _seconds(row['median']), _seconds(row['max']),
+                         '{0}{1}'.format(row['timeout'],
+                                         '*' if row['default'] else ''),
+                         '-' if row['headroom'] is None else
+                         '{0:.1f}x'.format(row['headroom']),
+                         row['verdict'],
+                         '-' if row['suggested'] is None else
+                         row['suggested']))
+    return lines
+
+
+def _seconds(value):
+    """
+    Format seconds, - when unknown.
+    """
+    return '-' if value is None else '{0:.1f}'.format(value)
+
+
+class TimeoutCalibrationMixin(NodeReadMixin):
+    """
+    GenericTest mixin that cycles the service groups offline and online
+    with event driven waits, "hagrp -wait", and calibrates the timeouts of
+    their resources from the durations the engine log recorded.
+    """
+
+    def read_resource_timeouts(self, node):
+        """
+        Return the parse_timeouts dictionary of the cluster.
+        """
+        stdout, stderr, ret_code = self.run_command(node, TIMEOUTS_CMD,
+                                                    su_root=True)
+        self.assertEqual(0, ret_code, stderr)
+        return parse_timeouts(stdout)
+
+    def _hagrp(self, node, args):
+        """
+        Run hagrp with the arguments and assert it succeeded.
+        """
+        _, stderr, ret_code = self.run_command(
+            node, '{0}hagrp {1}'.format(VCS_BIN, args), su_root=True)
+        self.assertEqual(0, ret_code, 'hagrp {0} failed: {1}'.format(
+            args, stderr))
+
+    def cycle_groups(self, node, targets, cycles, wait_timeout=900):
+        """
+        Take every (group, system) target offline and back online cycles
+        times, waiting for every state with hagrp -wait rather than
+        polling. Each action is sent to all the groups before the first
+        wait, so the groups change state together while the commands run
+        one at a time on the connection of the test.
+        """
+        for _ in range(cycles):
+            for action, state in (('offline', 'OFFLINE'),
+                                  ('online', 'ONLINE')):
+                for group, system in targets:
+                    self._hagrp(node, '-{0} {1} -sys {2}'.format(
+                        action, group, system))
+                for group, system in targets:
+                    self._hagrp(node, '-wait {0} State {1} -sys {2} -time '
+                                '{3}'.format(group, state, system,
+                                             wait_timeout))
+
+    def calibrate_timeouts(self, node, cycles=10, groups=None,
+                           wait_timeout=900):
+        """
+        Cycle every online group, or the given ones, on the first system
+        it is online on, all groups at once, and calibrate the timeouts of
+        their resources.
+
+        Args:
+            node (str): Filename of the node the commands run on and the
+                engine log is read from.
+            cycles (int): Offline and online cycles per group.
+            groups (list): VCS names of the groups, all online ones if
+                not given.
+            wait_timeout (int): Seconds hagrp -wait waits for a state.
+
+        Returns:
+            list. The calibrate rows, also kept in TIMEOUT_CALIBRATION.
+        """
+        stdout, stderr, ret_code = self.run_command(
+            node, '{0}hagrp -state'.format(VCS_BIN), su_root=True)
+        self.assertEqual(0, ret_code, stderr)
+        targets = []
+        for group, systems in sorted(parse_all_group_states(stdout).items()):
+            online = sorted(system for system, state in systems.items()
+                            if state.strip('|') == 'ONLINE')
+            if online and (groups is None or group in groups):
+                targets.append((group, online[0]))
+        offset = self.engine_log_size(node)
+        self.cycle_groups(node, targets, cycles, wait_timeout)
+        rows = calibrate(parse_engine_log(self.read_engine_log(node,
+                                                               offset)),
+                         self.read_resource_timeouts(node))
+        TIMEOUT_CALIBRATION.append(rows)
+        for line in format_report(rows):
+            self.log('info', line)
+        return rows
+
+
+PARSER = optparse.OptionParser(
+    usage='%prog [options] ENGINE_LOG [ENGINE_LOG ...]')
+PARSER.add_option('--timeouts', action='store', dest='timeouts', type='str',
+                  help='file of the "{0}" output, the LITP defaults are '
+                  'used without it'.format(TIMEOUTS_CMD))
+PARSER.add_option('--json', action='store', dest='json', type='str',
+                  help='write the calibration to this file')
+
+
+def main(args=None):
+    """
+    Calibrate the timeouts from copies of engine logs.
+    """
+    opts, paths = PARSER.parse_args(args)
+    if not paths:
+        PARSER.error('at least one engine log is needed')
+    transitions = []
+    for path in paths:
+        with open(path) as log:
+            transitions.extend(parse_engine_log(log))
+    timeouts = {}
+    if opts.timeouts:
+        with open(opts.timeouts) as display:
+            timeouts = parse_timeouts(display)
+    rows = calibrate(transitions, timeouts)
+    print '\n'.join(format_report(rows))
+    if opts.json:
+        with open(opts.json, 'w') as out:
+            json.dump(rows, out, indent=2, sort_keys=True)
+    return 1 if any(row['verdict'] in ('tight', 'unfinished')
+                    for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
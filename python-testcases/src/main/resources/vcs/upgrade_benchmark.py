@@ -0,0 +1,409 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Rolling upgrade benchmark: the plan duration, the time spent in
+            the lock, update and unlock tasks and the service availability
+            during the lock window of every node of package update plans,
+            per clustered service configuration and package count
+
+Usage:
+    python upgrade_benchmark.py RESULTS.json [RESULTS.json ...]
+"""
+import json
+import optparse
+import os
+import sys
+from collections import OrderedDict
+from cluster_common import RPM_DIR, percentile
+from downtime import DowntimeMixin, DowntimeReport
+from plan_index import PlanTask
+
+# Name to the active and standby counts of the clustered service
+CONFIGURATIONS = OrderedDict([('1_node_parallel', (1, 0)),
+                              ('2_node_parallel', (2, 0)),
+                              ('2_node_failover', (1, 1))])
+PACKAGE_COUNTS = (1, 10, 25, 50)
+TASK_KINDS = ('lock', 'update', 'unlock')
+RPM_FILE = 'EXTR-lsbwrapper-{0}-{1}-{2}-1.noarch.rpm'
+PACKAGE_URL = '/software/items/EXTR-lsbwrapper-{0}-{1}'
+SERVICE_UNIT = 'test-lsb-{0}-{1}'
+RESULTS_FILE = 'upgrade_benchmark.json'
+PROBE_PATH = '/tmp/vcs_upgrade_probe.log'
+# One line per probe: the time and the state of every unit, in order
+PROBE_CMD = ("nohup /bin/sh -c 'while :; do echo $(/bin/date +%s.%N) "
+             "$(/usr/bin/systemctl is-active {units}); /bin/sleep "
+             "{interval}; done' > {path} 2>&1 < /dev/null & "
+             "echo $! > {path}.pid")
+COLLECT_CMD = ('/bin/kill $(/bin/cat {path}.pid); /bin/cat {path}; '
+               '/bin/rm -f {path} {path}.pid')
+
+# Upgrade runs measured by the running test run, in order
+UPGRADE_METRICS = []
+
+
+class UpgradeRun(object):
+    """
+    Timings of a single package update plan, in seconds.
+    """
+
+    def __init__(self, configuration, packages, plan_seconds, task_seconds,
+                 lock_windows):
+        self.configuration = configuration
+        self.packages = packages
+        self.plan_seconds = plan_seconds
+        # TASK_KINDS to the seconds spent in the tasks of the kind
+        self.task_seconds = task_seconds
+        # Hostname to the seconds, max_gap and downtime of the lock window
+        self.lock_windows = lock_windows
+
+    @property
+    def max_gap(self):
+        """
+        Longest time without a good probe during any lock window.
+        """
+        return max([window['max_gap'] for window in
+                    self.lock_windows.values()] or [None])
+
+    @property
+    def downtime(self):
+        """
+        Seconds of service outages during all the lock windows.
+        """
+        return sum(window['downtime'] for window in
+                   self.lock_windows.values())
+
+    def to_dict(self):
+        """
+        Return the run as a JSON document.
+        """
+        return {'configuration': self.configuration,
+                'packages': self.packages,
+                'plan_seconds': self.plan_seconds,
+                'task_seconds': self.task_seconds,
+                'lock_windows': self.lock_windows}
+
+    @classmethod
+    def from_dict(cls, doc):
+        """
+        Return the run of a to_dict document.
+        """
+        return cls(doc['configuration'], doc['packages'],
+                   doc['plan_seconds'], doc['task_seconds'],
+                   doc['lock_windows'])
+
+    def summary(self):
+        """
+        Return a one line description of the run for the test log.
+        """
+        return 'Upgrade {0} x{1}: plan {2:.1f}s, {3}, {4}'.format(
+            self.configuration, self.packages, self.plan_seconds or 0,
+            ', '.join('{0} {1:.1f}s'.format(kind, self.task_seconds[kind])
+                      for kind in TASK_KINDS),
+            ', '.join('{0} locked {1:.1f}s max gap {2:.1f}s'.format(
+                node, window['seconds'], window['max_gap'])
+                for node, window in sorted(self.lock_windows.items())))
+
+
+def task_kind(phase, index, description):
+    """
+    Return the TASK_KINDS entry of a plan task.
+    """
+    task = PlanTask(phase, index, 0, '', description)
+    if task.is_lock():
+        return 'lock'
+    return 'unlock' if task.is_unlock() else 'update'
+
+
+def parse_probe_log(lines, units, offset=0.0):
+    """
+    Return the (time, ok) samples of every unit of the PROBE_CMD output,
+    a unit being ok while active.
+    """
+    samples = dict((unit, []) for unit in units)
+    for line in lines:
+        fields = line.split()
+        if len(fields) != len(units) + 1:
+            continue
+        try:
+            seen_at = float(fields[0]) - offset
+        except ValueError:
+            continue
+        for unit, state in zip(units, fields[1:]):
+            samples[unit].append((seen_at, state == 'active'))
+    return samples
+
+
+def measure_upgrade(configuration, packages, timeline, report):
+    """
+    Return the UpgradeRun of a plan timeline and the DowntimeReport of
+    the probes run during it. The lock window of a node lasts from the
+    start of its lock task to the end of its unlock task.
+    """
+    task_seconds = dict((kind, 0.0) for kind in TASK_KINDS)
+    windows = {}
+    for (phase, index), (started_at, ended_at, _, description) in \
+            sorted(timeline.tasks.items()):
+        if started_at is None or ended_at is None:
+            continue
+        kind = task_kind(phase, index, description)
+        task_seconds[kind] += ended_at - started_at
+        node = PlanTask(phase, index, 0, '', description).node
+        if kind == 'lock':
+            windows.setdefault(node, [None, None])[0] = started_at
+        elif kind == 'unlock':
+            windows.setdefault(node, [None, None])[1] = ended_at
+    bounds = [bound for started_at, ended_at, _, _ in timeline.tasks.values()
+              for bound in (started_at, ended_at) if bound is not None]
+    lock_windows = {}
+    for node, (start, end) in windows.items():
+        if start is None or end is None:
+            continue
+        locked = report.within(start, end)
+        lock_windows[node] = {'seconds': end - start,
+                              'max_gap': locked.max_gap(),
+                              'downtime': locked.total_downtime()}
+    return UpgradeRun(configuration, packages,
+                      max(bounds) - min(bounds) if bounds else None,
+                      task_seconds, lock_windows)
+
+
+def summarize(runs):
+    """
+    Return the median plan, lock, update and unlock seconds, the median
+    downtime and the worst max gap of the runs per configuration and
+    package count, in CONFIGURATIONS order.
+    """
+    groups = {}
+    for run in runs:
+        groups.setdefault((run.configuration, run.packages), []).append(run)
+    summary = []
+    for configuration, packages in sorted(groups, key=lambda key: (
+            CONFIGURATIONS.keys().index(key[0]) if key[0] in CONFIGURATIONS
+            else len(CONFIGURATIONS), key)):
+        group = groups[(configuration, packages)]
+        row = {'configuration': configuration, 'packages': packages,
+               'runs': len(group),
+               'plan': percentile([run.plan_seconds for run in group
+                                   if run.plan_seconds is not None], 50),
+               'downtime': percentile([run.downtime for run in group], 50),
+               'max_gap': max([run.max_gap for run in group
+                               if run.max_gap is not None] or [None])}
+        for kind in TASK_KINDS:
+            row[kind] = percentile([run.task_seconds[kind]
+                                    for run in group], 50)
+        summary.append(row)
+    return summary
+
+
+def write_results(runs, path):
+    """
+    Write the runs and their summary to the JSON results file read by
+    main.
+    """
+    with open(path, 'w') as out:
+        json.dump({'runs': [run.to_dict() for run in runs],
+                   'summary': summarize(runs)}, out, indent=2,
+                  sort_keys=True)
+
+
+def format_table(summary):
+    """
+    Return the lines of a table of the summarize output.
+    """
+    columns = ('plan',) + TASK_KINDS + ('downtime', 'max_gap')
+    lines = ['{0:<16} {1:>8} {2:>5} '.format('configuration', 'packages',
+                                             'runs') +
+             ' '.join('{0:>9}'.format(column) for column in columns)]
+    for row in summary:
+        lines.append('{0:<16} {1:>8} {2:>5} '.format(
+            row['configuration'], row['packages'], row['runs']) +
+            ' '.join('{0:>9}'.format('-' if row[column] is None else
+                                     '{0:.1f}'.format(row[column]))
+                     for column in columns))
+    return lines
+
+
+class UpgradeBenchmarkMixin(DowntimeMixin):
+    """
+    GenericTest mixin that measures package update plans of a clustered
+    service of generated packages, as created by deploy_upgrade_cs, while
+    probing the services on every node of the cluster.
+    """
+
+    def deploy_upgrade_cs(self, ms_node, story, configuration, packages,
+                          plan_timeout_mins=60):
+        """
+        Deploy the clustered service CS_<story>_1 of the configuration,
+        with one application and package per number up to packages.
+        """
+        from generate import (apply_options_changes, generate_json,
+                              load_fixtures)
+        from test_constants import PLAN_COMPLETE
+        nodes_urls = self.find(ms_node, self.vcs_cluster_url, 'node')
+        active, standby = CONFIGURATIONS[configuration]
+        fixtures = load_fixtures(story, self.vcs_cluster_url, nodes_urls,
+                                 input_data=generate_json(
+                                     to_file=False, story=story,
+                                     vcs_length=1, app_length=packages,
+                                     hsc_length=packages,
+                                     add_to_cleanup=True))
+        apply_options_changes(fixtures, 'vcs-clustered-service', 0, {
+            'active': str(active), 'standby': str(standby),
+            'name': 'CS_{0}_1'.format(story),
+            'node_list': ','.join(url.split('/')[-1] for url in
+                                  nodes_urls[:active + standby])},
+            overwrite=True)
+        self.apply_cs_and_apps_sg(ms_node, fixtures, RPM_DIR + '/')
+        self.run_and_check_plan(ms_node, PLAN_COMPLETE, plan_timeout_mins)
+        return fixtures
+
+    def remove_upgrade_cs(self, ms_node, fixtures, plan_timeout_mins=60):
+        """
+        Remove the clustered service deployed by deploy_upgrade_cs, with
+        its software services and packages, and run the plan.
+        """
+        from test_constants import PLAN_COMPLETE
+        paths = [service['vpath'] for service
+                 in fixtures['vcs-clustered-service']]
+        for service in fixtures['service']:
+            paths.extend([service['vpath'], service['package_vpath']])
+        for path in paths:
+            self.execute_cli_remove_cmd(ms_node, path, add_to_cleanup=False)
+        self.run_and_check_plan(ms_node, PLAN_COMPLETE, plan_timeout_mins,
+                                add_to_cleanup=False)
+
+    def stage_upgrade(self, ms_node, story, packages, version='2.0'):
+        """
+        Generate the packages at the version, import them into the
+        repository and update the version of their software items.
+        """
+        from rpm_generator import generate_rpm
+        from test_constants import PP_PKG_REPO_DIR
+        rpms = [RPM_FILE.format(story, number, version)
+                for number in range(1, packages + 1)]
+        for number in range(1, packages + 1):
+            generate_rpm(story, number, version=version)
+        self.assertTrue(self.copy_filelist_to(
+            ms_node, [self.get_filelist_dict(os.path.join(RPM_DIR, rpm),
+                                             '/tmp/') for rpm in rpms],
+            add_to_cleanup=False, root_copy=True))
+        for rpm in rpms:
+            self.execute_cli_import_cmd(ms_node, '/tmp/' + rpm,
+                                        PP_PKG_REPO_DIR)
+        for number in range(1, packages + 1):
+            self.execute_cli_update_cmd(
+                ms_node, PACKAGE_URL.format(story, number),
+                props='version={0}-1'.format(version))
+
+    def start_upgrade_probes(self, nodes, units, interval=1):
+        """
+        Start probing the units on every node, returning the clock offset
+        of every node.
+        """
+        offsets = {}
+        for node in nodes:
+            offsets[node] = self.read_clock_offset(node)[0]
+            _, stderr, ret_code = self.run_command(
+                node, PROBE_CMD.format(units=' '.join(units),
+                                       interval=interval, path=PROBE_PATH),
+                su_root=True)
+            self.assertEqual(0, ret_code, stderr)
+        return offsets
+
+    def collect_upgrade_probes(self, offsets, units, report):
+        """
+        Stop the probes and add their samples to the DowntimeReport.
+        """
+        for node, offset in sorted(offsets.items()):
+            stdout, _, _ = self.run_command(
+                node, COLLECT_CMD.format(path=PROBE_PATH), su_root=True)
+            for unit, samples in parse_probe_log(stdout, units,
+                                                 offset).items():
+                report.add(unit, node, samples)
+
+    def benchmark_upgrade(self, ms_node, story, configuration, packages,
+                          nodes, version='2.0', interval=1,
+                          plan_timeout=3600, poll=5):
+        """
+        Upgrade the packages of the clustered service deployed by
+        deploy_upgrade_cs and measure the plan.
+
+        Args:
+            ms_node (str): Filename of the MS.
+            story (str): Story of the generated packages.
+            configuration (str): One of CONFIGURATIONS, used in the report.
+            packages (int): Number of packages of the clustered service.
+            nodes (list): Filenames of the nodes the services are probed on.
+            version (str): Version the packages are upgraded to.
+            interval (float): Seconds between two probes.
+            plan_timeout (int): Seconds the plan may take.
+            poll (float): Seconds between two reads of the plan, the
+                resolution of the task times.
+
+        Returns:
+            UpgradeRun. Also kept in UPGRADE_METRICS.
+        """
+        self.stage_upgrade(ms_node, story, packages, version)
+        self.execute_cli_createplan_cmd(ms_node)
+        units = [SERVICE_UNIT.format(story, number)
+                 for number in range(1, packages + 1)]
+        offsets = self.start_upgrade_probes(nodes, units, interval)
+        report = DowntimeReport(interval=interval)
+        try:
+            self.execute_cli_runplan_cmd(ms_node)
+            report.timeline = self.record_plan_timeline(
+                ms_node, timeout=plan_timeout, interval=poll)
+        finally:
+            self.collect_upgrade_probes(offsets, units, report)
+        run = measure_upgrade(configuration, packages, report.timeline,
+                              report)
+        UPGRADE_METRICS.append(run)
+        self.log('info', run.summary())
+        return run
+
+    def write_upgrade_results(self, path=RESULTS_FILE):
+        """
+        Log the summary of the UPGRADE_METRICS of the test run and write
+        them to the results file, for "python upgrade_benchmark.py
+        RESULTS.json".
+        """
+        for line in format_table(summarize(UPGRADE_METRICS)):
+            self.log('info', line)
+        write_results(UPGRADE_METRICS, path)
+        self.log('info', 'Upgrade runs written to {0}'.format(path))
+
+
+PARSER = optparse.OptionParser(usage='%prog RESULTS.json [RESULTS.json ...]')
+PARSER.add_option('--json', action='store', dest='json', type='str',
+                  help='write the summary to this file')
+
+
+def main(args=None):
+    """
+    Summarize the runs of the given results files, JSON documents with
+    the to_dict of every run under "runs", e.g. of UPGRADE_METRICS.
+    """
+    opts, paths = PARSER.parse_args(args)
+    if not paths:
+        PARSER.error('at least one results file is needed')
+    runs = []
+    for path in paths:
+        with open(path) as results:
+            runs.extend(UpgradeRun.from_dict(doc)
+                        for doc in json.load(results)['runs'])
+    summary = summarize(runs)
+    print '\n'.join(format_table(summary))
+    if opts.json:
+        with open(opts.json, 'w') as out:
+            json.dump({'summary': summary}, out, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,689 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Local simulator of the VCS hagrp, hares, hastatus, hasys,
+            haclus and hatype commands, used to run and profile the VCS
+            helpers of the test sets without a cluster
+
+Usage:
+    python vcs_simulator.py init --state FILE [--groups N] [--systems A,B]
+        [--parallel-every N] [--online S] [--offline S] [--fault S]
+    python vcs_simulator.py install --state FILE BIN_DIR
+    python vcs_simulator.py hagrp|hares|hastatus|hasys|haclus|hatype ARGS
+    python vcs_simulator.py fault RESOURCE SYSTEM
+    python vcs_simulator.py crash|boot SYSTEM
+"""
+import fcntl
+import json
+import optparse
+import os
+import re
+import shlex
+import stat
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from cluster_common import VCS_BIN
+
+STATE_ENV = 'VCS_SIM_STATE'
+COMMANDS = ('hagrp', 'hares', 'hastatus', 'hasys', 'haclus', 'hatype')
+SIM_COMMANDS = ('fault', 'crash', 'boot')
+# Seconds a group takes to go online or offline, and to detect a fault
+DEFAULT_LATENCIES = {'online': 0.0, 'offline': 0.0, 'fault': 0.0}
+TYPE_ATTRIBUTES = (('OnlineTimeout', '300'), ('OfflineTimeout', '300'),
+                   ('MonitorInterval', '60'), ('RestartLimit', '0'))
+# Shell syntax that needs a real shell instead of an in-process run
+SHELL_SYNTAX = re.compile(r'[|;&<>`$]')
+
+ONLINE = 'ONLINE'
+OFFLINE = 'OFFLINE'
+FAULTED = 'FAULTED'
+RUNNING = 'RUNNING'
+
+
+class VcsError(Exception):
+    """
+    A VCS command that fails, printed on stderr with a return code.
+    """
+
+    def __init__(self, message, rc=1):
+        super(VcsError, self).__init__(message)
+        self.rc = rc
+
+
+def build_cluster(groups=1, systems=('node1', 'node2'), parallel_every=0,
+                  resources=1, latencies=None, cluster_id='c1'):
+    """
+    Return the state of a cluster of groups named like the LITP clustered
+    services, every group online on its first system, or on every system
+    for the parallel ones.
+
+    Args:
+        groups (int): Number of groups.
+        systems (tuple): System names, in the SystemList order.
+        parallel_every (int): Make every nth group parallel, none if 0.
+        resources (int): Application resources per group.
+        latencies (dict): Seconds of the DEFAULT_LATENCIES transitions.
+        cluster_id (str): Cluster id used in the group names.
+    """
+    state = {'cluster': 'vcs_cluster_{0}'.format(cluster_id),
+             'latencies': dict(DEFAULT_LATENCIES, **(latencies or {})),
+             'systems': dict((name, {'state': RUNNING})
+                             for name in systems),
+             'groups': {}, 'resources': {}}
+    for num in range(1, groups + 1):
+        name = 'Grp_CS_{0}_CS{1}'.format(cluster_id, num)
+        parallel = bool(parallel_every) and num % parallel_every == 0
+        res_names = ['Res_App_{0}_CS{1}_APP{2}'.format(cluster_id, num, app)
+                     for app in range(1, resources + 1)]
+        state['groups'][name] = {
+            'parallel': parallel, 'systems': list(systems),
+            'restart_limit': 0, 'resources': res_names,
+            'on': dict((system, {
+                'state': ONLINE if parallel or pos == 0 else OFFLINE,
+                'pending': [], 'faulted_by': None})
+                for pos, system in enumerate(systems))}
+        for res_name in res_names:
+            state['resources'][res_name] = {'group': name,
+                                            'type': 'Application'}
+    return state
+
+
+@contextmanager
+def locked_state(path):
+    """
+    Load the state file under an exclusive lock, so that concurrent
+    commands see each other's changes. Changes are saved with save_state
+    before the block ends.
+    """
+    with open(path + '.lock', 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            with open(path) as state_file:
+                yield json.load(state_file)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def save_state(path, state):
+    """
+    Replace the state file with the state.
+    """
+    with open(path + '.tmp', 'w') as state_file:
+        json.dump(state, state_file)
+    os.rename(path + '.tmp', path)
+
+
+def _table(header, rows):
+    """
+    Return the lines of a VCS table: a # header and aligned columns.
+    """
+    lines = ['#' + header[0]] + [row[0] for row in rows]
+    width = max(len(line) for line in lines) + 2
+    out = []
+    for first, row in zip(lines, [header] + list(rows)):
+        out.append(first.ljust(width) +
+                   ''.join(str(col).ljust(22) for col in row[1:]).rstrip())
+    return out
+
+
+class SimulatedCluster(object):
+    """
+    The state machine of the groups, resources and systems of a cluster.
+    Pending transitions are applied when a command reads the state.
+    """
+
+    def __init__(self, state, now=None):
+        self.state = state
+        self.now = time.time() if now is None else now
+        # Whether the state differs from the one that was loaded
+        self.changed = False
+        self.settle()
+
+    @property
+    def latencies(self):
+        """
+        Seconds of every transition.
+        """
+        return self.state['latencies']
+
+    def settle(self):
+        """
+        Apply every pending transition that is due.
+        """
+        for group in self.state['groups'].values():
+            for record in group['on'].values():
+                while record['pending'] and \
+                        record['pending'][0][0] <= self.now:
+                    record['state'] = record['pending'].pop(0)[1]
+                    if record['state'] == ONLINE:
+                        record['faulted_by'] = None
+                    self.changed = True
+
+    def _group(self, name):
+        """
+        Return the group, or fail like VCS for an unknown one.
+        """
+        if name not in self.state['groups']:
+            raise VcsError('VCS WARNING Group {0} does not exist in the '
+                           'local cluster'.format(name))
+        return self.state['groups'][name]
+
+    def _resource(self, name):
+        """
+        Return the resource, or fail like VCS for an unknown one.
+        """
+        if name not in self.state['resources']:
+            raise VcsError('VCS WARNING Resource {0} does not exist in the '
+                           'local cluster'.format(name))
+        return self.state['resources'][name]
+
+    def _record(self, group, system):
+        """
+        Return the state of the group on the system.
+        """
+        if system not in group['on']:
+            raise VcsError('VCS WARNING System {0} is not in the SystemList '
+                           'of the group'.format(system))
+        return group['on'][system]
+
+    def _schedule(self, record, *transitions):
+        """
+        Replace the pending transitions of a record with (delay, state)
+        transitions, delays counted from now.
+        """
+        record['pending'] = [[self.now + delay, target]
+                             for delay, target in transitions]
+        self.changed = True
+
+    @staticmethod
+    def group_state(record):
+        """
+        Return the State of a group on a system as hagrp shows it.
+        """
+        pending = record['pending'][0][1] if record['pending'] else None
+        if record['state'] == FAULTED:
+            return '|OFFLINE|FAULTED|'
+        if record['state'] == ONLINE and pending == OFFLINE:
+            return '|ONLINE|STOPPING|'
+        if record['state'] == OFFLINE and pending == ONLINE:
+            return '|OFFLINE|STARTING|'
+        return '|{0}|'.format(record['state'])
+
+    def resource_state(self, name, system):
+        """
+        Return the State of a resource on a system as hares shows it.
+        """
+        record = self._record(self._group(self._resource(name)['group']),
+                              system)
+        if record['state'] == FAULTED:
+            return FAULTED if record['faulted_by'] == name else OFFLINE
+        return record['state']
+
+    def _online_systems(self, group):
+        """
+        Return the systems the group is online or going online on.
+        """
+        return [system for system in group['systems']
+                if group['on'][system]['state'] == ONLINE or
+                [t for t in group['on'][system]['pending'] if t[1] == ONLINE]]
+
+    def _failover_target(self, group, failed):
+        """
+        Return the next running, not faulted, system of the SystemList
+        after the failed one, or None.
+        """
+        systems = group['systems']
+        start = systems.index(failed)
+        for system in systems[start + 1:] + systems[:start]:
+            if self.state['systems'][system]['state'] == RUNNING and \
+                    group['on'][system]['state'] != FAULTED:
+                return system
+        return None
+
+    def online(self, name, system):
+        """
+        Bring the group online on the system.
+        """
+        group = self._group(name)
+        record = self._record(group, system)
+        if self.state['systems'][system]['state'] != RUNNING:
+            raise VcsError('VCS WARNING System {0} is not up'.format(system))
+        if record['state'] == FAULTED:
+            raise VcsError('VCS WARNING Group {0} is faulted on system '
+                           '{1}'.format(name, system))
+        others = [other for other in self._online_systems(group)
+                  if other != system]
+        if not group['parallel'] and others:
+            raise VcsError('VCS WARNING Group {0} is online on system '
+                           '{1}'.format(name, others[0]))
+        if record['state'] != ONLINE:
+            self._schedule(record, (self.latencies['online'], ONLINE))
+
+    def offline(self, name, system):
+        """
+        Take the group offline on the system.
+        """
+        record = self._record(self._group(name), system)
+        if record['state'] == ONLINE:
+            self._schedule(record, (self.latencies['offline'], OFFLINE))
+
+    def switch(self, name, target):
+        """
+        Move a failover group to the target system.
+        """
+        group = self._group(name)
+        if group['parallel']:
+            raise VcsError('VCS WARNING Group {0} is a parallel '
+                           'group'.format(name))
+        to_record = self._record(group, target)
+        for system in self._online_systems(group):
+            if system != target:
+                self._schedule(group['on'][system],
+                               (self.latencies['offline'], OFFLINE))
+        self._schedule(to_record, (self.latencies['offline'] +
+                                   self.latencies['online'], ONLINE))
+
+    def clear(self, name, system=None):
+        """
+        Clear the faults of the group on the system, or on every system.
+        """
+        group = self._group(name)
+        for sys_name in [system] if system else group['systems']:
+            record = self._record(group, sys_name)
+            if record['state'] == FAULTED:
+                record['state'] = OFFLINE
+                record['faulted_by'] = None
+                self.changed = True
+
+    def fault(self, name, system):
+        """
+        Fault the resource on the system, as when its process dies. The
+        fault is detected after the fault latency. A failover group then
+        goes online on its next system; a parallel group with a restart
+        limit goes online again on the same system.
+        """
+        group = self._group(self._resource(name)['group'])
+        record = self._record(group, system)
+        if record['state'] != ONLINE:
+            raise VcsError('VCS WARNING Resource {0} is not online on '
+                           '{1}'.format(name, system))
+        detect = self.latencies['fault']
+        record['faulted_by'] = name
+        if group['parallel'] and group['restart_limit']:
+            self._schedule(record, (detect, FAULTED),
+                           (detect + self.latencies['online'], ONLINE))
+            return
+        self._schedule(record, (detect, FAULTED))
+        target = None if group['parallel'] else \
+            self._failover_target(group, system)
+        if target:
+            self._schedule(group['on'][target],
+                           (detect + self.latencies['online'], ONLINE))
+
+    def crash(self, system):
+        """
+        Fault the system: its groups go offline at once and the failover
+        groups online there go online on their next system.
+        """
+        self.state['systems'][system]['state'] = FAULTED
+        for group in self.state['groups'].values():
+            if system not in group['on']:
+                continue
+            record = group['on'][system]
+            was_online = system in self._online_systems(group)
+            record['state'] = OFFLINE
+            record['pending'] = []
+            target = self._failover_target(group, system) \
+                if was_online and not group['parallel'] else None
+            if target and target not in self._online_systems(group):
+                self._schedule(group['on'][target],
+                               (self.latencies['fault'] +
+                                self.latencies['online'], ONLINE))
+        self.changed = True
+
+    def boot(self, system):
+        """
+        Bring the system back: its parallel groups go online again.
+        """
+        self.state['systems'][system]['state'] = RUNNING
+        for group in self.state['groups'].values():
+            if group['parallel'] and system in group['on']:
+                self._schedule(group['on'][system],
+                               (self.latencies['online'], ONLINE))
+        self.changed = True
+
+    def hagrp(self, args):
+        """
+        Answer hagrp -state, -value, -list, -resources, -online, -offline,
+        -switch and -clear.
+        """
+        option, args = args[0], args[1:]
+        opts = dict(zip(args[1::2], args[2::2])) if args else {}
+        if option == '-state':
+            names = [args[0]] if args and not args[0].startswith('-') \
+                else sorted(self.state['groups'])
+            system = opts.get('-sys') or (args[1] if args[:1] == ['-sys']
+                                          else None)
+            if system and len(names) == 1:
+                record = self._record(self._group(names[0]), system)
+                return [self.group_state(record).strip('|')]
+            rows = []
+            for name in names:
+                group = self._group(name)
+                rows.extend((name, 'State', sys_name,
+                             self.group_state(group['on'][sys_name]))
+                            for sys_name in group['systems']
+                            if system in (None, sys_name))
+            return _table(('Group', 'Attribute', 'System', 'Value'), rows)
+        if option == '-value':
+            group = self._group(args[0])
+            attribute = args[1]
+            if attribute == 'State':
+                return [self.group_state(self._record(group, args[2]))
+                        if len(args) > 2 else ' '.join(
+                            '{0} {1}'.format(sys_name, self.group_state(
+                                group['on'][sys_name]))
+                            for sys_name in group['systems'])]
+            values = {'Parallel': str(int(group['parallel'])),
+                      'SystemList': ' '.join(
+                          '{0} {1}'.format(sys_name, pos) for pos, sys_name
+                          in enumerate(group['systems'])),
+                      'AutoStartList': ' '.join(group['systems']),
+                      'Frozen': '0', 'TFrozen': '0'}
+            if attribute not in values:
+                raise VcsError('VCS WARNING Attribute {0} is not valid for '
+                               'groups'.format(attribute))
+            return [values[attribute]]
+        if option == '-list':
+            return ['{0}  {1}'.format(name, sys_name)
+                    for name in sorted(self.state['groups'])
+                    for sys_name in self.state['groups'][name]['systems']]
+        if option == '-resources':
+            return list(self._group(args[0])['resources'])
+        if option == '-online':
+            self.online(args[0], opts['-sys'])
+        elif option == '-offline':
+            self.offline(args[0], opts['-sys'])
+        elif option == '-switch':
+            self.switch(args[0], opts['-to'])
+        elif option == '-clear':
+            self.clear(args[0], opts.get('-sys'))
+        else:
+            raise VcsError('VCS WARNING Unknown option hagrp '
+                           '{0}'.format(option))
+        return []
+
+    def hares(self, args):
+        """
+        Answer hares -state, -value, -list and -display, and -clear.
+        """
+        option, args = args[0], args[1:]
+        system = None
+        if '-sys' in args:
+            system = args[args.index('-sys') + 1]
+            args = args[:args.index('-sys')]
+        if option == '-state' and system and len(args) == 1:
+            return [self.resource_state(args[0], system)]
+        if option in ('-state', '-display'):
+            names = args or sorted(self.state['resources'])
+            rows = []
+            for name in names:
+                resource = self._resource(name)
+                group = self._group(resource['group'])
+                if option == '-display':
+                    rows.extend([(name, 'Group', 'global', resource['group']),
+                                 (name, 'Type', 'global', resource['type']),
+                                 (name, 'Enabled', 'global', '1')])
+                rows.extend((name, 'State', sys_name,
+                             self.resource_state(name, sys_name))
+                            for sys_name in group['systems']
+                            if system in (None, sys_name))
+            return _table(('Resource', 'Attribute', 'System', 'Value'),
+                          rows)
+        if option == '-value':
+            resource = self._resource(args[0])
+            attribute = args[1]
+            if attribute == 'State':
+                return [self.resource_state(args[0], args[2])]
+            values = {'Group': resource['group'], 'Type': resource['type'],
+                      'Enabled': '1', 'Probed': '1'}
+            if attribute not in values:
+                raise VcsError('VCS WARNING Attribute {0} is not valid for '
+                               'resources'.format(attribute))
+            return [values[attribute]]
+        if option == '-list':
+            return ['{0}  {1}'.format(name, sys_name)
+                    for name in sorted(self.state['resources'])
+                    for sys_name in self._group(
+                        self.state['resources'][name]['group'])['systems']]
+        if option == '-clear':
+            self.clear(self._resource(args[0])['group'], system)
+            return []
+        raise VcsError('VCS WARNING Unknown option hares {0}'.format(option))
+
+    def hastatus(self, args):
+        """
+        Answer hastatus -sum.
+        """
+        if args[:1] != ['-sum']:
+            raise VcsError('VCS WARNING Only hastatus -sum is simulated')
+        lines = ['', '-- SYSTEM STATE', '-- System               State'
+                 '                Frozen', '']
+        lines.extend('A  {0:<20} {1:<20} 0'.format(name, system['state'])
+                     for name, system in sorted(
+                         self.state['systems'].items()))
+        lines.extend(['', '-- GROUP STATE', '-- Group           System    '
+                      '          Probed     AutoDisabled    State', ''])
+        for name in sorted(self.state['groups']):
+            group = self.state['groups'][name]
+            lines.extend('B  {0:<15} {1:<20} Y          N               '
+                         '{2}'.format(name, sys_name, self.group_state(
+                             group['on'][sys_name]).strip('|'))
+                         for sys_name in group['systems'])
+        return lines
+
+    def hasys(self, args):
+        """
+        Answer hasys -state, -list and -value.
+        """
+        option, args = args[0], args[1:]
+        systems = self.state['systems']
+        if option == '-list':
+            return sorted(systems)
+        if option == '-state':
+            names = args or sorted(systems)
+            if any(name not in systems for name in names):
+                raise VcsError('VCS WARNING System {0} does not exist in '
+                               'the local cluster'.format(names[0]))
+            if args:
+                return [systems[args[0]]['state']]
+            return _table(('System', 'Attribute', 'Value'),
+                          [(name, 'SysState', systems[name]['state'])
+                           for name in names])
+        if option == '-value' and args[1:2] == ['SysState']:
+            return [systems[args[0]]['state']]
+        raise VcsError('VCS WARNING Unknown option hasys {0}'.format(option))
+
+    def haclus(self, args):
+        """
+        Answer haclus -state, -list and -value ClusterName.
+        """
+        name = self.state['cluster']
+        if args[:1] == ['-list']:
+            return [name]
+        if args[:1] == ['-state']:
+            return _table(('Cluster', 'Attribute', 'Value'),
+                          [(name, 'ClusterState', RUNNING)])
+        if args[:2] == ['-value', 'ClusterName']:
+            return [name]
+        raise VcsError('VCS WARNING Unknown option haclus '
+                       '{0}'.format(' '.join(args)))
+
+    def hatype(self, args):
+        """
+        Answer hatype -list, -resources and -display.
+        """
+        types = sorted(set(resource['type'] for resource in
+                           self.state['resources'].values()))
+        if args[:1] == ['-list']:
+            return types
+        if args[:1] == ['-resources']:
+            return sorted(name for name, resource in
+                          self.state['resources'].items()
+                          if resource['type'] == args[1])
+        if args[:1] == ['-display']:
+            return _table(('Type', 'Attribute', 'Value'),
+                          [(res_type, attribute, value)
+                           for res_type in args[1:] or types
+                           for attribute, value in TYPE_ATTRIBUTES])
+        raise VcsError('VCS WARNING Unknown option hatype '
+                       '{0}'.format(' '.join(args)))
+
+    def run(self, command, args):
+        """
+        Run a VCS or simulator command.
+
+        Returns:
+            tuple. stdout lines, stderr lines and return code.
+        """
+        try:
+            if command in SIM_COMMANDS:
+                getattr(self, command)(*args)
+                return [], [], 0
+            if command not in COMMANDS or not args:
+                raise VcsError('VCS WARNING Unknown command {0}'.format(
+                    ' '.join([command] + list(args))))
+            return getattr(self, command)(list(args)), [], 0
+        except VcsError as err:
+            return [], [str(err)], err.rc
+        except (IndexError, KeyError):
+            return [], ['VCS WARNING Incomplete command: {0}'.format(
+                ' '.join([command] + list(args)))], 1
+
+
+def run_simulated(state_path, command, args, now=None):
+    """
+    Run a command against the simulated cluster in the state file.
+
+    Returns:
+        tuple. stdout lines, stderr lines and return code.
+    """
+    with locked_state(state_path) as state:
+        cluster = SimulatedCluster(state, now)
+        result = cluster.run(command, args)
+        if cluster.changed:
+            save_state(state_path, state)
+    return result
+
+
+def install_commands(state_path, bin_dir):
+    """
+    Write hagrp, hares, hastatus, hasys, haclus and hatype executables
+    that run this simulator on the state file into bin_dir.
+    """
+    if not os.path.isdir(bin_dir):
+        os.makedirs(bin_dir)
+    for command in COMMANDS:
+        path = os.path.join(bin_dir, command)
+        with open(path, 'w') as script:
+            script.write('#!/bin/sh\n{0}={1} exec {2} {3} {4} "$@"\n'.format(
+                STATE_ENV, os.path.abspath(state_path), sys.executable,
+                os.path.abspath(__file__), command))
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP |
+                 stat.S_IXOTH)
+
+
+class LocalTransportMixin(object):
+    """
+    Mixin for GenericTest subclasses, or stand-ins of GenericTest, that
+    runs the VCS commands of run_command against the simulator instead
+    of a node. A single VCS command is answered in-process; anything else
+    runs in a local shell with the simulated commands replacing those of
+    /opt/VRTS/bin. Set vcs_sim_state to the state file and vcs_sim_bin to
+    the directory written by install_commands.
+    """
+    vcs_sim_state = None
+    vcs_sim_bin = None
+
+    def run_command(self, node, cmd, su_root=False, default_asserts=False,
+                    **kwargs):
+        """
+        Run the command locally against the simulated cluster.
+        """
+        if not SHELL_SYNTAX.search(cmd):
+            args = shlex.split(cmd)
+            command = os.path.basename(args[0]) if args else ''
+            if command in COMMANDS:
+                return run_simulated(self.vcs_sim_state, command, args[1:])
+        if self.vcs_sim_bin:
+            cmd = cmd.replace(VCS_BIN, self.vcs_sim_bin.rstrip('/') + '/')
+        env = dict(os.environ, **{STATE_ENV: self.vcs_sim_state})
+        if self.vcs_sim_bin:
+            env['PATH'] = self.vcs_sim_bin + os.pathsep + env.get('PATH', '')
+        process = subprocess.Popen(cmd, shell=True, env=env,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE)
+        stdout, stderr = process.communicate()
+        return stdout.splitlines(), stderr.splitlines(), process.returncode
+
+
+INIT_PARSER = optparse.OptionParser(
+    usage='%prog init --state FILE [options]')
+INIT_PARSER.add_option('--state', action='store', dest='state', type='str',
+                       help='state file of the simulated cluster')
+INIT_PARSER.add_option('--groups', action='store', dest='groups', type='int',
+                       default=1, help='number of service groups')
+INIT_PARSER.add_option('--systems', action='store', dest='systems',
+                       type='str', default='node1,node2',
+                       help='comma separated system names')
+INIT_PARSER.add_option('--parallel-every', action='store',
+                       dest='parallel_every', type='int', default=0,
+                       help='make every nth group parallel')
+INIT_PARSER.add_option('--resources', action='store', dest='resources',
+                       type='int', default=1, help='resources per group')
+for _latency in sorted(DEFAULT_LATENCIES):
+    INIT_PARSER.add_option('--' + _latency, action='store', dest=_latency,
+                           type='float', default=DEFAULT_LATENCIES[_latency],
+                           help='seconds to go {0}'.format(_latency))
+
+
+def main(args=None):
+    """
+    Create or install a simulated cluster, or run a command against the
+    one of the VCS_SIM_STATE file.
+    """
+    args = sys.argv[1:] if args is None else args
+    if not args:
+        INIT_PARSER.error('no command given')
+    command, args = args[0], args[1:]
+    if command == 'init':
+        opts = INIT_PARSER.parse_args(args)[0]
+        state = build_cluster(opts.groups, opts.systems.split(','),
+                              opts.parallel_every, opts.resources,
+                              dict((name, getattr(opts, name))
+                                   for name in DEFAULT_LATENCIES))
+        with open(opts.state, 'w') as state_file:
+            json.dump(state, state_file)
+        return 0
+    if command == 'install':
+        opts, rest = INIT_PARSER.parse_args(args)
+        install_commands(opts.state, rest[0])
+        return 0
+    stdout, stderr, rc = run_simulated(os.environ[STATE_ENV], command, args)
+    for line in stdout:
+        print line
+    for line in stderr:
+        print >> sys.stderr, line
+    return rc
+
+
+if __name__ == '__main__':
+    sys.exit(main())